@@ -0,0 +1,97 @@
+"""
+Piloto automático: fuente de entrada que esquiva balas y apunta a los enemigos
+
+Se usa para la demo (--autopilot) y para las pruebas de resistencia
+(soak.py). Solo lee el estado del juego; el movimiento y el disparo pasan por
+los mismos métodos que el teclado y la visión.
+"""
+from config import *
+
+# Movimientos candidatos: quieto primero para no oscilar ante empates
+MOVES = (0, -1, 1)
+
+
+class Autopilot:
+    def __init__(self, lookahead=AUTOPILOT_LOOKAHEAD_FRAMES, margin=AUTOPILOT_DODGE_MARGIN):
+        """Inicializa el piloto
+
+        Args:
+            lookahead: frames hacia adelante en que se anticipan las balas
+            margin: margen horizontal alrededor de la nave al esquivar
+        """
+        self.lookahead = lookahead
+        self.margin = margin
+
+    def decide(self, player, game):
+        """Elige la acción de un jugador para este frame
+
+        Returns:
+            tuple: (dirección, disparar) con dirección -1 izquierda, 0 quieto, 1 derecha
+        """
+        center = player.x + player.width / 2
+        target_x, fire_width = self._target(player, game)
+
+        best_move, best_cost = 0, None
+        for move in MOVES:
+            cost = self._threat(player, move, game.enemy_bullets)
+            if target_x is not None:
+                # Desempate hacia el objetivo (mucho menor que una amenaza)
+                next_center = center + move * player.speed
+                cost += abs(target_x - next_center) / SCREEN_WIDTH
+            if best_cost is None or cost < best_cost:
+                best_move, best_cost = move, cost
+
+        fire = target_x is not None and fire_width > 0 and abs(target_x - center) < fire_width
+        return best_move, fire
+
+    def _threat(self, player, move, bullets):
+        """Suma el peligro de mantener un movimiento durante el horizonte
+
+        Cada bala enemiga que alcanzaría la nave en t frames aporta más
+        cuanto antes llegue.
+        """
+        margin = self.margin
+        min_x, max_x = 0, SCREEN_WIDTH - player.width
+        top = player.y
+        threat = 0.0
+        for bullet in bullets:
+            distance = top - (bullet.y + bullet.height)
+            if distance < -player.height or bullet.speed <= 0:
+                continue  # ya pasó por debajo de la nave, o sube
+            frames = max(distance, 0) / bullet.speed
+            if frames > self.lookahead:
+                continue
+            x = min(max(player.x + move * player.speed * frames, min_x), max_x)
+            # Las balas de los patrones del jefe también se mueven en x
+            bullet_x = bullet.x + bullet.vx * frames
+            if x - margin < bullet_x + bullet.width and bullet_x < x + player.width + margin:
+                threat += self.lookahead + 1 - frames
+        return threat
+
+    def _target(self, player, game):
+        """Retorna (x objetivo, ancho de disparo) o (None, 0) si no hay objetivo
+
+        Prioriza un power-up cercano; si no, el jefe o el enemigo más cercano
+        en horizontal, anticipando el avance de la formación mientras la bala sube.
+        """
+        center = player.x + player.width / 2
+        near_powerups = [p for p in game.powerup_manager.powerups
+                         if player.y - p.y < AUTOPILOT_POWERUP_RANGE]
+        if near_powerups:
+            powerup = min(near_powerups, key=lambda p: abs(p.x + p.width / 2 - center))
+            return powerup.x + powerup.width / 2, 0
+
+        enemies = game.enemies
+        boss = enemies.boss
+        if boss:
+            flight = (player.y - boss.y) / BULLET_SPEED
+            return boss.x + boss.width / 2 + boss.direction * BOSS_SPEED * flight, boss.width / 3
+
+        best_x, best_distance = None, None
+        drift = enemies.speed * enemies.direction / BULLET_SPEED
+        for enemy in enemies.enemies:
+            x = enemy.x + enemy.width / 2 + drift * (player.y - enemy.y)
+            distance = abs(x - center)
+            if best_distance is None or distance < best_distance:
+                best_x, best_distance = x, distance
+        return best_x, ENEMY_WIDTH / 2
@@ -0,0 +1,88 @@
+"""
+Costo de los patrones del jefe con cientos de balas enemigas en pantalla
+
+Uso:
+    python benchmarks/bench_boss_patterns.py
+    python benchmarks/bench_boss_patterns.py --seconds 10
+"""
+import argparse
+import os
+import sys
+import time
+
+# Sin ventana ni audio, y los módulos del juego importables desde la carpeta del proyecto
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+from config import *  # noqa: E402
+from game_random import rng  # noqa: E402
+from game import Game  # noqa: E402
+
+
+def benchmark(seconds=30, seed=0):
+    """Pelea contra el jefe con patrones a ritmo alto y el tope de balas lleno
+
+    Mide la emisión y el tick completo (lógica y dibujado) con cientos de
+    balas enemigas en pantalla, sin cámara ni ventana y con reloj fijo.
+    """
+    rng.seed(seed)
+    game = Game(headless=True)
+    game.use_fixed_step(start_ms=0)
+    game.init_game(level=max(LEVEL_CONFIG), reset_score=True)
+    game.state = STATE_PLAYING
+    # La vida del jefe y de las naves se fija en cada tick: la pelea no termina
+    # durante la medición y recorre las tres fases
+    boss = game.enemies.boss
+    phase_health = (BOSS_HEALTH, BOSS_HEALTH // 2, BOSS_HEALTH // 5)
+    emitter = game.boss_patterns
+    emitter.phases = tuple(dict(phase, interval_ms=phase["interval_ms"] // 6)
+                           for phase in emitter.phases)
+
+    frames = int(seconds * FPS)
+    tick_s, emit_s, counts = [], [], []
+    update = emitter.update
+
+    def timed_update(*args):
+        start = time.perf_counter()
+        result = update(*args)
+        if result is not None:
+            emit_s.append(time.perf_counter() - start)
+        return result
+
+    emitter.update = timed_update
+    for frame in range(frames):
+        boss.health = phase_health[frame * 3 // frames]
+        for player in game.players:
+            player.lives = PLAYER_LIVES
+        start = time.perf_counter()
+        game.update_playing()
+        game.draw()
+        tick_s.append(time.perf_counter() - start)
+        game.sim_time_ms += game.fixed_step_ms
+        counts.append(len(game.enemy_bullets))
+    tick_ms = np.array(tick_s) * 1e3
+    busy = np.array(counts) >= 300
+    print(f"{frames} ticks, balas enemigas: media {np.mean(counts):.0f}, máximo {max(counts)}, "
+          f"emitidas {emitter.emitted}, descartadas por el tope {emitter.dropped}")
+    print(f"emisión: {len(emit_s)} voleas de {emitter.emitted / max(len(emit_s), 1):.1f} balas "
+          f"en promedio, {np.mean(emit_s) * 1e6:.0f} us cada una")
+    print(f"tick completo (lógica + dibujado): media {tick_ms.mean():.2f} ms, "
+          f"p99 {np.percentile(tick_ms, 99):.2f} ms, máximo {tick_ms.max():.2f} ms "
+          f"(presupuesto {1000 / FPS:.1f} ms)")
+    if busy.any():
+        print(f"con 300 balas o más ({busy.sum()} ticks): media {tick_ms[busy].mean():.2f} ms, "
+              f"p99 {np.percentile(tick_ms[busy], 99):.2f} ms")
+
+
+def parse_args():
+    """Lee los argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Patrones de disparo del jefe")
+    parser.add_argument("--seconds", type=float, default=30, help="segundos de juego a simular")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    benchmark(args.seconds)
@@ -0,0 +1,97 @@
+"""
+Tiempo de frame de cada modo de presentación (window, scaled y native)
+
+Cada modo corre en un proceso aparte: SDL no admite recrear un renderer
+SCALED dentro del mismo proceso.
+
+Uso:
+    python benchmarks/bench_display.py
+    python benchmarks/bench_display.py --frames 300
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+# Sin ventana ni audio, y los módulos del juego importables desde la carpeta del proyecto
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+from config import *  # noqa: E402
+from game_random import rng  # noqa: E402
+from display import Display  # noqa: E402  (fija el filtro de escalado antes de importar pygame)
+from game import Game  # noqa: E402
+
+
+def bench_one(mode, internal_scale, size, frames):
+    """Tiempo de frame de una partida con el piloto automático
+
+    Returns:
+        tuple: (descripción, ms por frame, ms de present(), ms del percentil 99)
+    """
+    rng.seed(0)
+    game = Game(autopilot=True, headless=True)
+    game.use_fixed_step(start_ms=0)
+    # El driver dummy no tiene escritorio real: en native se fija el tamaño de la ventana
+    game.display = Display(mode, fullscreen=mode == "scaled", internal_scale=internal_scale,
+                           size=size)
+    game.screen = game.display.surface
+    present = game.display.present
+    present_s = []
+
+    def timed_present():
+        start = time.perf_counter()
+        present()
+        present_s.append(time.perf_counter() - start)
+
+    game.display.present = timed_present
+    frame_s = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        game.step()
+        frame_s.append(time.perf_counter() - start)
+    return (game.display.describe(), np.mean(frame_s) * 1e3, np.mean(present_s) * 1e3,
+            np.percentile(frame_s, 99) * 1e3)
+
+
+def benchmark(frames=600):
+    """Compara los modos, cada uno en un proceso aparte
+
+    Con el driver dummy no hay GPU: en scaled el escalado lo hace el renderer
+    por software de SDL dentro de flip(), así que la cifra es el peor caso;
+    con aceleración ese costo pasa a la GPU.
+    """
+    cases = [("window", 1, None), ("scaled", 1, None), ("scaled", 2, None)]
+    for size in ((1920, 1080), (3840, 2160)):
+        for internal_scale in (1, 2):
+            cases.append(("native", internal_scale, size))
+    print(f"{'modo':<52} {'frame':>8} {'presentar':>10} {'p99 frame':>10}")
+    for mode, internal_scale, size in cases:
+        output = subprocess.run(
+            [sys.executable, __file__, "--case", json.dumps([mode, internal_scale, size]),
+             "--frames", str(frames)],
+            capture_output=True, text=True, check=True).stdout
+        name, frame_ms, present_ms, p99_ms = json.loads(output.splitlines()[-1])
+        print(f"{name:<52} {frame_ms:7.2f}ms {present_ms:9.2f}ms {p99_ms:9.2f}ms")
+
+
+def parse_args():
+    """Lee los argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Tiempo de frame de cada modo de presentación")
+    parser.add_argument("--frames", type=int, default=600, help="frames por modo")
+    parser.add_argument("--case", default=None, help=argparse.SUPPRESS)  # un modo, en el proceso hijo
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.case:
+        mode, internal_scale, size = json.loads(args.case)
+        print(json.dumps([float(v) if i else v for i, v in
+                          enumerate(bench_one(mode, internal_scale, size, args.frames))]))
+    else:
+        benchmark(args.frames)
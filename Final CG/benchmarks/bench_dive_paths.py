@@ -0,0 +1,72 @@
+"""
+Costo de la formación con y sin picadas
+
+Que las tablas terminen en el lugar de la formación y avancen a DIVE_SPEED
+lo comprueban las pruebas (tests/test_dive_paths.py).
+
+Uso:
+    python benchmarks/bench_dive_paths.py
+"""
+import argparse
+import os
+import sys
+import time
+
+# Sin ventana ni audio, y los módulos del juego importables desde la carpeta del proyecto
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import *  # noqa: E402
+from game_random import rng  # noqa: E402
+from dive_paths import DIVE_TABLES, build_tables  # noqa: E402
+from enemy import EnemyGroup  # noqa: E402
+
+
+def benchmark(ticks=3000, seed=0):
+    """Compara EnemyGroup.update() con la formación quieta en su lugar y toda en picada
+
+    Usa la formación más grande del modo infinito (6x10). En la segunda
+    corrida cada enemigo que vuelve a su lugar sale de nuevo en otra picada.
+    """
+    def run(divers):
+        rng.seed(seed)
+        config = dict(LEVEL_CONFIG[1], **dict(ENDLESS_LIMITS, dive_chance=0.0))
+        group = EnemyGroup(level=1, config=config)
+        group.speed = 0.5  # que la formación no llegue abajo durante la medición
+        enemies = group.enemies
+        elapsed = 0.0
+        diving = 0
+        for tick in range(ticks):
+            if divers:
+                for index, enemy in enumerate(enemies):
+                    if enemy.dive < 0:
+                        mirrored = enemy.x + enemy.width / 2 < group.bounds.centerx
+                        enemy.start_dive((index + tick) % len(DIVE_PATHS) * 2 + mirrored)
+            start = time.perf_counter()
+            group.update()
+            elapsed += time.perf_counter() - start
+            diving += group.diving
+        return elapsed / ticks * 1e6, diving / ticks, len(enemies)
+
+    start = time.perf_counter()
+    build_tables()
+    build_ms = (time.perf_counter() - start) * 1e3
+    lengths = [len(xs) for xs, _ in DIVE_TABLES[::2]]
+    print(f"{len(DIVE_PATHS)} trayectorias ({', '.join(map(str, lengths))} ticks a "
+          f"{DIVE_SPEED} px/tick), tablas construidas en {build_ms:.2f} ms")
+    for divers in (False, True, False, True):
+        us, diving, count = run(divers)
+        print(f"update() con {count} enemigos, {diving:.1f} en picada: {us:.1f} us por tick")
+
+
+def parse_args():
+    """Lee los argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Costo de las picadas de los enemigos")
+    parser.add_argument("--ticks", type=int, default=3000, help="ticks por corrida")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    benchmark(args.ticks)
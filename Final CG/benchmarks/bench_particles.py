@@ -0,0 +1,82 @@
+"""
+Costo por frame del sistema de partículas con decenas de miles vivas
+
+Mantiene el sistema lleno (ráfagas nuevas a medida que expiran) y mide
+update() y draw() sobre una superficie de 32 bits, como la del juego, y
+sobre una de 24 bits, que usa el camino de sprites con blits. Que el tope y
+la compactación funcionen lo comprueban las pruebas (tests/test_particles.py).
+
+Uso:
+    python benchmarks/bench_particles.py
+    python benchmarks/bench_particles.py --count 20000 --frames 600
+"""
+import argparse
+import os
+import sys
+import time
+
+# Sin ventana ni audio, y los módulos del juego importables desde la carpeta del proyecto
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+from config import *  # noqa: E402
+from particles import ParticleSystem  # noqa: E402
+
+BURST_COLORS = (RED, ORANGE, YELLOW, CYAN, NEON_PINK, NEON_GREEN)
+
+
+def refill(particles, count, rng):
+    """Emite ráfagas en lugares al azar hasta tener count partículas vivas"""
+    while particles.count < count:
+        x = int(rng.integers(40, SCREEN_WIDTH - 40))
+        y = int(rng.integers(40, SCREEN_HEIGHT - 100))
+        color = BURST_COLORS[int(rng.integers(len(BURST_COLORS)))]
+        particles.emit(x, y, min(PARTICLE_BOSS_DEATH_BURST, count - particles.count), color)
+
+
+def run(screen, count, frames, seed=0):
+    """Promedio de ms por frame de update() y draw() con count partículas vivas"""
+    rng = np.random.default_rng(seed)
+    particles = ParticleSystem(capacity=count, seed=seed)
+    refill(particles, count, rng)
+    update_s = draw_s = 0.0
+    for _ in range(frames):
+        start = time.perf_counter()
+        particles.update()
+        update_s += time.perf_counter() - start
+        refill(particles, count, rng)
+        screen.fill(DARK_BLUE)
+        start = time.perf_counter()
+        particles.draw(screen)
+        draw_s += time.perf_counter() - start
+    return update_s / frames * 1e3, draw_s / frames * 1e3
+
+
+def benchmark(count=PARTICLE_MAX, frames=300):
+    """Imprime el costo por frame frente al presupuesto de 1000 / FPS ms"""
+    pygame.display.init()
+    window = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    budget = 1000 / FPS
+    for name, screen in (("32 bits (buffer de píxeles)", window),
+                         ("24 bits (blits)", pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), depth=24))):
+        update_ms, draw_ms = run(screen, count, frames)
+        total = update_ms + draw_ms
+        print(f"{count} partículas, {name}: update {update_ms:.2f} ms + draw {draw_ms:.2f} ms "
+              f"= {total:.2f} ms ({total / budget:.0%} de un frame a {FPS} FPS)")
+    pygame.display.quit()
+
+
+def parse_args():
+    """Lee los argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Costo del sistema de partículas")
+    parser.add_argument("--count", type=int, default=PARTICLE_MAX, help="partículas vivas")
+    parser.add_argument("--frames", type=int, default=300, help="frames medidos")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    benchmark(args.count, args.frames)
@@ -0,0 +1,97 @@
+"""
+Costo de dibujado de cada nivel de calidad y respuesta del regulador a una
+carga simulada
+
+Uso:
+    python benchmarks/bench_quality.py
+    python benchmarks/bench_quality.py --frames 300
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+# Sin ventana ni audio, y los módulos del juego importables desde la carpeta del proyecto
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import *  # noqa: E402
+from game_random import rng  # noqa: E402
+from game import Game  # noqa: E402
+from powerup import PowerUp  # noqa: E402
+from quality import FEATURES, QualityGovernor  # noqa: E402
+
+
+def draw_cost(tier, frames=600, seed=0):
+    """ms promedio de draw_playing() en una partida con el piloto automático"""
+    rng.seed(seed)
+    game = Game(autopilot=True, headless=True)
+    game.use_fixed_step(start_ms=0)
+    game.quality = QualityGovernor()
+    game.quality._set(tier, 0)
+    game.start_run()
+    # Algunos power-ups en pantalla para que los anillos de brillo pesen
+    powerups = game.powerup_manager.powerups
+    elapsed = 0.0
+    measured = 0
+    for frame in range(frames):
+        while len(powerups) < 4:
+            powerups.append(PowerUp(100 + 150 * len(powerups), 150, POWERUP_SHIELD))
+        game.step()
+        if game.state != STATE_PLAYING:
+            continue  # transición entre niveles
+        start = time.perf_counter()
+        game.draw_playing()
+        elapsed += time.perf_counter() - start
+        measured += 1
+    return elapsed / max(measured, 1) * 1e3
+
+
+def simulate(seconds=60, fps=FPS):
+    """Carga sintética: base liviana, un tramo pesado y vuelta a la calma
+
+    Cada nivel ahorra una parte fija del frame; devuelve los cambios de nivel
+    y los frames que quedaron por encima del presupuesto.
+    """
+    random.seed(0)
+    governor = QualityGovernor(fps=fps)
+    governor.set_features(FEATURES)
+    savings = (0.0, 1.5, 1.0, 0.5, 4.0)  # ms que ahorra entrar a cada nivel
+    budget = 1000 / fps
+    frames = int(seconds * fps)
+    over = 0
+    tiers = []
+    now = 0.0
+    for frame in range(frames):
+        # 0-20 s liviano, 20-40 s pesado, 40-60 s liviano
+        base = 9.0 if frame < frames / 3 or frame >= frames * 2 / 3 else 20.0
+        cost = base - sum(savings[1:governor.tier + 1]) + random.uniform(-1.5, 1.5)
+        over += cost > budget
+        governor.update(cost, now)
+        now += max(cost, budget)
+        tiers.append(governor.tier)
+    return governor.changes, over, frames, tiers
+
+
+def benchmark(frames=600):
+    """Costo de dibujado de cada nivel y respuesta del regulador a una carga simulada"""
+    for tier, settings in enumerate(QUALITY_TIERS):
+        print(f"nivel {tier} {settings['name']:<18} draw_playing(): {draw_cost(tier, frames):.2f} ms")
+    changes, over, total, tiers = simulate()
+    path = [tiers[0]] + [tier for prev, tier in zip(tiers, tiers[1:]) if tier != prev]
+    print(f"carga simulada de {total} frames: {changes} cambios de nivel ({' -> '.join(map(str, path))}), "
+          f"{over} frames sobre el presupuesto")
+
+
+def parse_args():
+    """Lee los argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Calidad automática según el tiempo de frame")
+    parser.add_argument("--frames", type=int, default=600, help="frames por nivel")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    benchmark(args.frames)
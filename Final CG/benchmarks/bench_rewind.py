@@ -0,0 +1,82 @@
+"""
+Costo del anillo de rebobinado: record() por tick, memoria y restore()
+
+Que restaurar y volver a jugar reproduzca la partida lo comprueban las
+pruebas (tests/test_rewind.py).
+
+Uso:
+    python benchmarks/bench_rewind.py
+"""
+import argparse
+import os
+import sys
+import time
+
+# Sin ventana ni audio, y los módulos del juego importables desde la carpeta del proyecto
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+from config import *  # noqa: E402
+from game_random import rng  # noqa: E402
+from game import Game  # noqa: E402
+from rewind import RewindBuffer  # noqa: E402
+
+
+def benchmark(seconds=20, enemy_bullets=400, player_bullets=60, seed=0):
+    """Mide record() en una partida normal y con la formación más grande del
+    modo infinito y enemy_bullets balas en pantalla"""
+    # Partida normal con el piloto automático y reloj fijo
+    rng.seed(seed)
+    game = Game(autopilot=True, headless=True)
+    game.rewind = rewind = RewindBuffer()
+    game.use_fixed_step(start_ms=0)
+    game.start_run()
+    while rewind.records < seconds * FPS:
+        game.step()
+    print(f"record() en partida normal: {rewind.record_s / rewind.records * 1e6:.0f} us promedio")
+
+    # Costo con carga alta
+    game = Game(autopilot=True, headless=True)
+    game.use_fixed_step(start_ms=0)
+    game.endless = True
+    game.start_run()
+    game.level_config = dict(LEVEL_CONFIG[max(LEVEL_CONFIG)], boss_fight=False, **ENDLESS_LIMITS)
+    game.level_transition_start = -game.LEVEL_TRANSITION_MS - 1
+    game.update_level_transition()
+    bullet_class = game.caps.bullet_class
+    game.enemy_bullets.extend(bullet_class(rng.randrange(SCREEN_WIDTH),
+                                           rng.randrange(SCREEN_HEIGHT), -1)
+                              for _ in range(enemy_bullets))
+    game.player_bullets.extend(bullet_class(rng.randrange(SCREEN_WIDTH),
+                                            rng.randrange(SCREEN_HEIGHT), 1)
+                               for _ in range(player_bullets))
+    buffer = RewindBuffer()
+    samples = []
+    for _ in range(buffer.ticks * 2):
+        start = time.perf_counter()
+        buffer.record(game, game.ticks())
+        samples.append(time.perf_counter() - start)
+    start = time.perf_counter()
+    buffer.restore(game, buffer.ticks - 1)
+    restore_s = time.perf_counter() - start
+    print(f"anillo de {buffer.ticks} ticks ({REWIND_SECONDS} s): {buffer.nbytes / 2 ** 20:.1f} MB")
+    print(f"record() con {len(game.enemies.enemies)} enemigos y "
+          f"{len(game.enemy_bullets) + len(game.player_bullets)} balas: "
+          f"{np.mean(samples) * 1e6:.0f} us promedio, p99 {np.percentile(samples, 99) * 1e6:.0f} us "
+          f"({np.mean(samples) * FPS * 100:.1f}% de un segundo de juego)")
+    print(f"restore(): {restore_s * 1e3:.1f} ms")
+
+
+def parse_args():
+    """Lee los argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Costo del anillo de rebobinado")
+    parser.add_argument("--seconds", type=int, default=20, help="segundos de partida normal")
+    parser.add_argument("--enemy-bullets", type=int, default=400, help="balas enemigas en la carga alta")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    benchmark(args.seconds, args.enemy_bullets)
@@ -0,0 +1,116 @@
+"""
+Serialización y ancho de banda de los espectadores con muchas entidades
+
+Que los deltas reconstruyan la instantánea lo comprueban las pruebas
+(tests/test_spectator.py).
+
+Uso:
+    python benchmarks/bench_spectator.py
+    python benchmarks/bench_spectator.py --bullets 200
+"""
+import argparse
+import os
+import sys
+import time
+
+# Sin ventana ni audio, y los módulos del juego importables desde la carpeta del proyecto
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+from config import *  # noqa: E402
+from game_random import rng  # noqa: E402
+from game import Game  # noqa: E402
+from spectator import decode_packet, encode_packet, entity_ids, serialize  # noqa: E402
+
+
+def benchmark(seconds=30, enemy_bullets=400, player_bullets=60, lag=3):
+    """Mide serialización y tamaño de paquete con muchas entidades
+
+    Usa la formación más grande del modo infinito y mantiene enemy_bullets
+    balas enemigas y player_bullets del jugador en pantalla. Las entidades
+    se mueven como en el juego (formación en bloque, balas que salen por el
+    borde y se compactan conservando el orden, balas nuevas al final) pero
+    sin colisiones, para que la carga no baje durante la medición. Compara
+    la instantánea completa, el delta contra la anterior (confirmación al
+    día) y contra la de lag envíos atrás (confirmaciones atrasadas).
+    """
+    rng.seed(0)
+    game = Game(autopilot=True, headless=True)
+    game.use_fixed_step(start_ms=0)
+    game.endless = True
+    game.start_run()
+    game.level_config = dict(LEVEL_CONFIG[max(LEVEL_CONFIG)], boss_fight=False, **ENDLESS_LIMITS)
+    game.level_transition_start = -game.LEVEL_TRANSITION_MS - 1
+    game.update_level_transition()
+    formation = game.enemies
+    formation.speed = 1  # que no baje del todo durante la medición (el delta no depende de la velocidad)
+    bullet_class = game.caps.bullet_class
+
+    every = max(int(round(FPS / SPECTATOR_RATE)), 1)
+    history = []
+    id_history = []
+    serialize_s, encode_s, decode_s = [], [], []
+    sizes = {"completa": [], "delta": [], f"delta (lag {lag})": []}
+    raw = []
+    for frame in range(int(seconds * FPS)):
+        formation.update()
+        for bullets, wanted, direction in ((game.enemy_bullets, enemy_bullets, -1),
+                                           (game.player_bullets, player_bullets, 1)):
+            for bullet in bullets:
+                bullet.update()
+            bullets[:] = [bullet for bullet in bullets if not bullet.is_off_screen()]
+            for _ in range(min(wanted - len(bullets), 16)):  # como mucho 16 disparos por frame
+                shooter = rng.choice(formation.enemies) if direction < 0 else game.players[0]
+                bullets.append(bullet_class(shooter.x + rng.randrange(shooter.width),
+                                            shooter.y, direction))
+        game.sim_time_ms += game.fixed_step_ms
+        if frame % every:
+            continue
+
+        start = time.perf_counter()
+        snapshot = serialize(game)
+        ids = entity_ids(game)
+        serialize_s.append(time.perf_counter() - start)
+        raw.append(len(snapshot))
+        history.append(snapshot)
+        id_history.append(ids)
+        seq = len(history)
+        start = time.perf_counter()
+        packet = encode_packet(seq, snapshot, seq - 1, history[-2] if seq > 1 else None,
+                               ids, id_history[-2] if seq > 1 else None)
+        encode_s.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        decode_packet(packet, {seq - 1: history[-2]} if seq > 1 else {})
+        decode_s.append(time.perf_counter() - start)
+        sizes["delta"].append(len(packet))
+        sizes["completa"].append(len(encode_packet(seq, snapshot)))
+        base = seq - lag
+        lagged = encode_packet(seq, snapshot, base, history[base - 1] if base >= 1 else None,
+                               ids, id_history[base - 1] if base >= 1 else None)
+        sizes[f"delta (lag {lag})"].append(len(lagged))
+
+    print(f"{len(raw)} instantáneas a {SPECTATOR_RATE}/s; enemigos {len(formation.enemies)}, "
+          f"balas enemigas {len(game.enemy_bullets)}, balas jugador {len(game.player_bullets)}")
+    print(f"instantánea sin comprimir: {np.mean(raw):.0f} B promedio")
+    print(f"serializar: {np.mean(serialize_s) * 1e6:.0f} us promedio "
+          f"(p99 {np.percentile(serialize_s, 99) * 1e6:.0f} us); "
+          f"delta + zlib: {np.mean(encode_s) * 1e6:.0f} us; "
+          f"decodificar: {np.mean(decode_s) * 1e6:.0f} us")
+    for name, values in sizes.items():
+        print(f"  {name:<14} {np.mean(values):7.0f} B/paquete  "
+              f"{np.mean(values) * SPECTATOR_RATE / 1024:7.1f} KB/s por espectador")
+
+
+def parse_args():
+    """Lee los argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Serialización y ancho de banda de los espectadores")
+    parser.add_argument("--seconds", type=float, default=30, help="segundos de juego a simular")
+    parser.add_argument("--bullets", type=int, default=400, help="balas enemigas en pantalla")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    benchmark(args.seconds, enemy_bullets=args.bullets)
@@ -0,0 +1,126 @@
+"""
+Costo de la telemetría en el hilo del juego durante un combate intenso
+
+Dos mediciones: log() y flush() con una ráfaga sintética de eventos por
+frame, con el hilo escritor comprimiendo a la par (compite por el GIL), y
+el tiempo que pasa en la telemetría una partida sin ventana con el piloto
+automático y la formación más grande del modo infinito (unos pocos eventos
+por segundo: la ráfaga es cientos de veces más). El objetivo es menos del 1% del
+presupuesto de un frame (1000 / FPS ms). Que los registros se escriban,
+roten y se descarten bien lo comprueban las pruebas (tests/test_telemetry.py).
+
+Uso:
+    python benchmarks/bench_telemetry.py
+    python benchmarks/bench_telemetry.py --events 200 --frames 1200
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Sin ventana ni audio, y los módulos del juego importables desde la carpeta del proyecto
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import *  # noqa: E402
+from game_random import rng  # noqa: E402
+from game import Game  # noqa: E402
+from telemetry import EV_KILL, EV_PLAYER_HIT, EV_SHOT, Telemetry  # noqa: E402
+
+
+def synthetic(directory, events, frames):
+    """ms por frame de log() y flush() con events eventos por frame
+
+    Los frames duran lo mismo que en el juego (1000 / FPS ms): el escritor
+    trabaja en el resto del frame, como cuando el loop espera en clock.tick.
+    """
+    telemetry = Telemetry(directory)
+    kinds = (EV_SHOT, EV_KILL, EV_PLAYER_HIT)
+    frame_s = 1 / FPS
+    elapsed = 0.0
+    next_frame = time.perf_counter()
+    for frame in range(frames):
+        now = frame * frame_s * 1000
+        start = time.perf_counter()
+        for i in range(events):
+            telemetry.log(kinds[i % 3], now, i & 1, i % SCREEN_WIDTH, i % SCREEN_HEIGHT, i)
+        telemetry.flush(now)
+        elapsed += time.perf_counter() - start
+        next_frame += frame_s
+        time.sleep(max(next_frame - time.perf_counter(), 0))
+    telemetry.close()
+    return elapsed / frames * 1e3, telemetry.writer.records, telemetry.dropped
+
+
+def heavy_game(seed, frames):
+    """Partida del modo infinito con la formación más grande y el piloto automático"""
+    rng.seed(seed)
+    game = Game(autopilot=True, headless=True)
+    game.use_fixed_step(start_ms=0)
+    game.endless = True
+    game.start_run()
+    game.level_config = dict(LEVEL_CONFIG[max(LEVEL_CONFIG)], boss_fight=False, **ENDLESS_LIMITS)
+    game.level_transition_start = -game.LEVEL_TRANSITION_MS - 1
+    game.update_level_transition()
+    return game
+
+
+class TimedTelemetry:
+    """Envuelve la telemetría y acumula el tiempo que el juego pasa en ella"""
+
+    def __init__(self, telemetry):
+        self.telemetry = telemetry
+        self.elapsed = 0.0
+
+    def log(self, *args, **kwargs):
+        start = time.perf_counter()
+        self.telemetry.log(*args, **kwargs)
+        self.elapsed += time.perf_counter() - start
+
+    def flush(self, now=None):
+        start = time.perf_counter()
+        self.telemetry.flush(now)
+        self.elapsed += time.perf_counter() - start
+
+    def close(self):
+        self.telemetry.close()
+
+
+def in_game(directory, frames, seed=0):
+    """ms por frame dentro de la telemetría en una partida intensa, y eventos por frame"""
+    game = heavy_game(seed, frames)
+    game.telemetry = timed = TimedTelemetry(Telemetry(directory))
+    start = time.perf_counter()
+    for _ in range(frames):
+        game.step()
+    frame_ms = (time.perf_counter() - start) / frames * 1e3
+    timed.close()
+    return timed.elapsed / frames * 1e3, frame_ms, timed.telemetry.writer.records / frames
+
+
+def benchmark(events=100, frames=600):
+    """Imprime el costo por frame de las dos mediciones frente al presupuesto"""
+    budget = 1000 / FPS
+    with tempfile.TemporaryDirectory() as directory:
+        ms, records, dropped = synthetic(directory, events, frames)
+        print(f"{events} eventos por frame: log() + flush() {ms * 1e3:.0f} us por frame "
+              f"({ms / budget:.2%} de {budget:.1f} ms), {records} escritos, {dropped} descartados")
+        ms, frame_ms, per_frame = in_game(directory, frames * 4)
+        print(f"partida intensa ({per_frame:.2f} eventos por frame): {ms * 1e3:.1f} us por frame "
+              f"en la telemetría ({ms / budget:.2%} de {budget:.1f} ms; el tick sin ventana "
+              f"cuesta {frame_ms:.2f} ms)")
+
+
+def parse_args():
+    """Lee los argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Costo de la telemetría en el hilo del juego")
+    parser.add_argument("--events", type=int, default=100, help="eventos por frame en la ráfaga sintética")
+    parser.add_argument("--frames", type=int, default=600, help="frames medidos (a FPS en la ráfaga sintética)")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    benchmark(args.events, args.frames)
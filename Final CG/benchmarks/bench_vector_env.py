@@ -0,0 +1,64 @@
+"""
+Pasos por segundo de un entorno solo y de varios en paralelo
+
+Uso:
+    python benchmarks/bench_vector_env.py --envs 16 --workers 4 --steps 2000
+"""
+import argparse
+import os
+import sys
+import time
+
+# Sin ventana ni audio, y los módulos del juego importables desde la carpeta del proyecto
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+from config import *  # noqa: E402
+from env import OBS_TYPES, SpaceInvadersEnv  # noqa: E402
+from vector_env import VectorEnv  # noqa: E402
+
+
+def benchmark(num_envs, num_workers, steps, seed=0, **env_kwargs):
+    """Mide pasos por segundo de un entorno solo y del vectorizado"""
+    rng = np.random.default_rng(seed)
+
+    env = SpaceInvadersEnv(seed=seed, **env_kwargs)
+    env.reset()
+    start = time.perf_counter()
+    for action in rng.integers(0, SpaceInvadersEnv.num_actions, steps):
+        _, _, terminated, truncated, _ = env.step(action)
+        if terminated or truncated:
+            env.reset()
+    single = steps / (time.perf_counter() - start)
+    env.close()
+    print(f"1 entorno, 1 proceso: {single:,.0f} pasos/s")
+
+    with VectorEnv(num_envs, num_workers, seed=seed, **env_kwargs) as vector:
+        vector.reset()
+        actions = rng.integers(0, SpaceInvadersEnv.num_actions, (steps, num_envs))
+        start = time.perf_counter()
+        for row in actions:
+            vector.step(row)
+        total = steps * num_envs / (time.perf_counter() - start)
+        workers = vector.num_workers
+    print(f"{num_envs} entornos, {workers} procesos: {total:,.0f} pasos/s "
+          f"({total / workers:,.0f} por núcleo, {total / single:.1f}x)")
+
+
+def parse_args():
+    """Lee los argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Rendimiento de los entornos en paralelo")
+    parser.add_argument("--envs", type=int, default=8, help="entornos en total")
+    parser.add_argument("--workers", type=int, default=None, help="procesos (por defecto núcleos)")
+    parser.add_argument("--steps", type=int, default=2000, help="pasos por entorno")
+    parser.add_argument("--obs", choices=OBS_TYPES, default="symbolic", help="tipo de observación")
+    parser.add_argument("--frame-scale", type=int, default=OBS_FRAME_SCALE,
+                        help="reducción de las observaciones en píxeles")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    benchmark(args.envs, args.workers, args.steps, obs_type=args.obs, frame_scale=args.frame_scale)
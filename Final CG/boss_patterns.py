@@ -0,0 +1,155 @@
+"""
+Patrones de disparo del jefe
+
+Los patrones (abanicos, anillos, espirales, ráfagas apuntadas) son datos en
+config.py (BOSS_PATTERNS) y la fase activa depende de la vida restante del
+jefe (BOSS_PHASES). Cada patrón se programa como una o varias voleas; en cada
+tick las voleas que vencen se emiten juntas: ángulos, posiciones y
+velocidades de todas las balas salen de una sola pasada vectorizada con
+NumPy, y el juego solo crea las balas a partir de esos arreglos.
+
+El costo por tick con cientos de balas se mide con
+python benchmarks/bench_boss_patterns.py.
+"""
+
+import numpy as np
+from config import *
+from game_random import rng
+
+
+def _offsets(pattern):
+    """Ángulos (radianes) de las balas de una volea respecto de su dirección base"""
+    count = pattern["count"]
+    arc = np.radians(pattern.get("arc", 0))
+    if count == 1:
+        return np.zeros(1)
+    if pattern.get("arc", 0) >= 360:
+        # Anillo: sin repetir la primera bala en 360°
+        return np.arange(count) * (arc / count)
+    return np.linspace(-arc / 2, arc / 2, count)
+
+
+class PatternEmitter:
+    def __init__(self, patterns=BOSS_PATTERNS, phases=BOSS_PHASES, max_bullets=BOSS_MAX_BULLETS):
+        """Prepara los ángulos de cada patrón
+
+        Args:
+            patterns: nombre -> patrón (ver BOSS_PATTERNS)
+            phases: fases por vida restante, de mayor a menor (ver BOSS_PHASES)
+            max_bullets: tope de balas enemigas en pantalla
+        """
+        self.patterns = patterns
+        self.phases = phases
+        self.max_bullets = max_bullets
+        self.offsets = {name: _offsets(pattern) for name, pattern in patterns.items()}
+        self.boss = None  # jefe al que pertenece el programa actual
+        self.pending = []  # voleas programadas: (instante, patrón, número de volea, ángulo base)
+        self.next_pattern_ms = 0.0
+        self.emitted = 0
+        self.dropped = 0
+
+    def phase(self, boss):
+        """Fase activa según la vida restante del jefe"""
+        health = boss.health / boss.max_health
+        for phase in self.phases:
+            if health > phase["health"]:
+                return phase
+        return self.phases[-1]
+
+    def _schedule(self, now):
+        """Programa las voleas de un patrón elegido de la fase activa"""
+        phase = self.phase(self.boss)
+        name = rng.choice(phase["patterns"])
+        pattern = self.patterns[name]
+        # Los patrones fijos arrancan hacia abajo o con un giro al azar (anillos)
+        base = rng.uniform(0, 2 * np.pi) if pattern.get("arc", 0) >= 360 else 0.0
+        volley_ms = pattern.get("volley_ms", 0)
+        for volley in range(pattern.get("volleys", 1)):
+            self.pending.append((now + volley * volley_ms, name, volley, base))
+        self.next_pattern_ms = now + phase["interval_ms"]
+
+    def update(self, boss, now, targets, active_bullets=0):
+        """Avanza el programa del jefe y emite las voleas que vencen
+
+        Args:
+            boss: jefe que dispara
+            now: instante actual (ms)
+            targets: naves vivas (las ráfagas apuntan a la más cercana)
+            active_bullets: balas enemigas ya en pantalla (para el tope)
+
+        Returns:
+            tuple: arreglos (x, y, vx, vy) de las balas nuevas, o None
+        """
+        if boss is not self.boss:
+            # Jefe nuevo (u otra partida): se descarta el programa anterior
+            self.boss = boss
+            self.pending = []
+            self.next_pattern_ms = now + BOSS_PATTERN_DELAY_MS
+        if now >= self.next_pattern_ms:
+            self._schedule(now)
+
+        due = [volley for volley in self.pending if volley[0] <= now]
+        if not due:
+            return None
+        self.pending = [volley for volley in self.pending if volley[0] > now]
+
+        origin_x = boss.x + boss.width / 2
+        origin_y = boss.y + boss.height * 0.75
+        aim = None
+        angles, speeds = [], []
+        for _, name, volley, base in due:
+            pattern = self.patterns[name]
+            if pattern.get("aim"):
+                if aim is None:
+                    aim = self._aim(origin_x, origin_y, targets)
+                base = aim
+            offsets = self.offsets[name]
+            angles.append(offsets + (base + np.radians(pattern.get("spin", 0)) * volley))
+            speeds.append(np.full(len(offsets), pattern["speed"]))
+
+        # Una sola pasada para todas las balas de las voleas de este tick
+        angles = np.concatenate(angles)
+        speeds = np.concatenate(speeds)
+        room = max(self.max_bullets - active_bullets, 0)
+        if len(angles) > room:
+            self.dropped += len(angles) - room
+            angles = angles[:room]
+            speeds = speeds[:room]
+            if not room:
+                return None
+        vx = speeds * np.sin(angles)
+        vy = speeds * np.cos(angles)
+        # Las balas salen del borde de un óvalo alrededor del centro del jefe
+        x = origin_x - BULLET_WIDTH / 2 + np.sin(angles) * (boss.width * 0.3)
+        y = origin_y - BULLET_HEIGHT / 2 + np.cos(angles) * (boss.height * 0.25)
+        self.emitted += len(angles)
+        return x, y, vx, vy
+
+    @staticmethod
+    def _aim(origin_x, origin_y, targets):
+        """Ángulo hacia la nave más cercana (0 = hacia abajo si no hay naves)"""
+        best = None
+        for target in targets:
+            dx = target.x + target.width / 2 - origin_x
+            dy = target.y + target.height / 2 - origin_y
+            if best is None or dx * dx + dy * dy < best[0]:
+                best = (dx * dx + dy * dy, dx, dy)
+        if best is None:
+            return 0.0
+        return float(np.arctan2(best[1], best[2]))
+
+    def snapshot(self):
+        """Estado del programa (para el rebobinado), o None sin jefe"""
+        if self.boss is None:
+            return None
+        return self.boss, tuple(self.pending), self.next_pattern_ms
+
+    def restore(self, state, shift=0.0):
+        """Vuelve a un estado de snapshot(); shift corre los instantes guardados"""
+        if state is None:
+            self.boss = None
+            self.pending = []
+            return
+        self.boss, pending, next_pattern_ms = state
+        self.pending = [(due + shift, name, volley, base) for due, name, volley, base in pending]
+        self.next_pattern_ms = next_pattern_ms + shift
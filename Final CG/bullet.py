@@ -1,39 +1,54 @@
-"""
-Clase de proyectiles (balas)
-"""
-import pygame
-from config import *
-
-class Bullet:
-    def __init__(self, x, y, direction=1):
-        """
-        Inicializa una bala
-        direction: 1 = arriba (jugador), -1 = abajo (enemigo)
-        """
-        self.x = x
-        self.y = y
-        self.width = BULLET_WIDTH
-        self.height = BULLET_HEIGHT
-        self.direction = direction
-        self.speed = BULLET_SPEED if direction == 1 else ENEMY_BULLET_SPEED
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
-        
-    def update(self):
-        """Actualiza la posición de la bala"""
-        self.y -= self.speed * self.direction
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
-    
-    def is_off_screen(self):
-        """Verifica si la bala salió de la pantalla"""
-        return self.y < 0 or self.y > SCREEN_HEIGHT
-    
-    def draw(self, screen):
-        """Dibuja la bala"""
-        if self.direction == 1:
-            # Bala del jugador (cyan brillante)
-            pygame.draw.rect(screen, CYAN, self.rect)
-            pygame.draw.rect(screen, WHITE, self.rect, 1)
-        else:
-            # Bala del enemigo (roja)
-            pygame.draw.rect(screen, RED, self.rect)
+"""
+Clase de proyectiles (balas)
+"""
+import pygame
+from config import *
+
+class Bullet:
+    # Sin __dict__: cada bala guarda solo su posición, dirección y rectángulo
+    __slots__ = ("x", "y", "direction", "speed", "vx", "owner", "rect")
+    width = BULLET_WIDTH
+    height = BULLET_HEIGHT
+
+    def __init__(self, x, y, direction=1, owner=0, vx=0.0, speed=None):
+        """
+        Inicializa una bala
+        direction: 1 = arriba (jugador), -1 = abajo (enemigo)
+        owner: índice del jugador que disparó (solo balas del jugador)
+        vx: velocidad horizontal (patrones del jefe)
+        speed: velocidad vertical en el sentido de direction (negativa = el
+            contrario); por defecto la de las balas del jugador o enemigas
+        """
+        self.x = x
+        self.y = y
+        self.direction = direction
+        self.owner = owner
+        self.vx = vx
+        if speed is None:
+            speed = BULLET_SPEED if direction == 1 else ENEMY_BULLET_SPEED
+        self.speed = speed
+        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        
+    def update(self):
+        """Actualiza la posición de la bala (el rectángulo se modifica en el sitio)"""
+        self.y -= self.speed * self.direction
+        self.rect.y = self.y
+        if self.vx:
+            self.x += self.vx
+            self.rect.x = self.x
+    
+    def is_off_screen(self):
+        """Verifica si la bala salió de la pantalla"""
+        return (self.y < -self.height or self.y > SCREEN_HEIGHT
+                or self.x < -self.width or self.x > SCREEN_WIDTH)
+    
+    def draw(self, screen):
+        """Dibuja la bala"""
+        if self.direction == 1:
+            # Bala del jugador (color de su nave)
+            pygame.draw.rect(screen, PLAYER_COLORS[self.owner % len(PLAYER_COLORS)], self.rect)
+            pygame.draw.rect(screen, WHITE, self.rect, 1)
+        else:
+            # Bala del enemigo (roja)
+            pygame.draw.rect(screen, RED, self.rect)
             pygame.draw.rect(screen, YELLOW, self.rect, 1)
\ No newline at end of file
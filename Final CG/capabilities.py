@@ -0,0 +1,463 @@
+"""
+Resolución de subsistemas opcionales al arrancar
+
+Cada módulo del juego se importa una sola vez aquí. Si falta o falla, se
+reporta una vez y se enlaza un objeto nulo con la misma interfaz, de modo que
+el loop principal no necesita try/except ni getattr en cada tick.
+"""
+import pygame
+from config import *
+
+
+# -----------------------
+# Objetos nulos
+# -----------------------
+class NullPlayer:
+    """Jugador inerte: se usa si player.py no está disponible"""
+    width = PLAYER_WIDTH
+    height = PLAYER_HEIGHT
+    speed = 0
+
+    def __init__(self, x, y, index=0):
+        self.x = x
+        self.y = y
+        self.index = index
+        self.color = PLAYER_COLORS[index % len(PLAYER_COLORS)]
+        self.lives = 0
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.has_shield = False
+        self.invulnerable_timer = 0
+        self.double_shot_until = 0
+        self.last_shot_time = 0
+        self.prev_hand_closed = False
+
+    def move_left(self):
+        pass
+
+    def move_right(self):
+        pass
+
+    def set_position_normalized(self, normalized_x):
+        pass
+
+    def update_rect(self):
+        pass
+
+    def update(self, current_time):
+        pass
+
+    def draw(self, screen):
+        pass
+
+    def hit(self):
+        return False
+
+    def is_alive(self):
+        return self.lives > 0
+
+    def add_life(self):
+        pass
+
+    def activate_shield(self):
+        pass
+
+    def deactivate_shield(self):
+        pass
+
+
+class NullEnemyGroup:
+    """Formación vacía que nunca termina el nivel"""
+
+    def __init__(self, level=1, config=None):
+        self.enemies = []
+        self.boss = None
+        self.bounds = pygame.Rect(0, 0, 0, 0)
+        self.columns = []
+        self.needs_compact = False
+        self.direction = 1
+        self.level = level
+        self.level_config = config or LEVEL_CONFIG.get(level, LEVEL_CONFIG[1])
+        self.speed = 0
+        self.dive_chance = 0.0
+        self.max_divers = 0
+        self.diving = 0
+
+    def create_formation(self):
+        pass
+
+    def create_boss(self):
+        pass
+
+    def update(self):
+        pass
+
+    def launch_dive(self):
+        pass
+
+    def update_bounds(self):
+        pass
+
+    def draw(self, screen):
+        pass
+
+    def get_random_shooter(self):
+        return None
+
+    def find_hit(self, rect):
+        return None
+
+    def remove_enemy(self, enemy):
+        return 0
+
+    def compact(self):
+        pass
+
+    def damage_boss(self):
+        return False, 0
+
+    def is_empty(self):
+        return False
+
+    def reached_bottom(self):
+        return False
+
+
+class NullBullet:
+    """Bala que desaparece en el primer tick"""
+    width = BULLET_WIDTH
+    height = BULLET_HEIGHT
+
+    def __init__(self, x, y, direction=1, owner=0, vx=0.0, speed=None):
+        self.x = x
+        self.y = y
+        self.direction = direction
+        self.owner = owner
+        self.vx = vx
+        self.speed = speed or ENEMY_BULLET_SPEED
+        self.rect = pygame.Rect(0, 0, 0, 0)
+
+    def update(self):
+        pass
+
+    def is_off_screen(self):
+        return True
+
+    def draw(self, screen):
+        pass
+
+
+class NullPowerUpManager:
+    """Gestor de power-ups sin power-ups"""
+
+    def __init__(self):
+        self.powerups = []
+        self.active_powerups = {}
+
+    def spawn_powerup(self, x, y):
+        pass
+
+    def update(self, current_time):
+        pass
+
+    def draw(self, screen, glow_rings=3):
+        pass
+
+    def check_collision(self, player_rects, current_time):
+        return []
+
+    def is_active(self, powerup_type):
+        return False
+
+    def get_remaining_time(self, powerup_type, current_time):
+        return 0
+
+    def clear(self):
+        pass
+
+
+class NullParticleSystem:
+    """Sistema de partículas que no emite nada"""
+
+    def __init__(self):
+        self.count = 0
+
+    def emit(self, x, y, count, color, speed=PARTICLE_SPEED, life=PARTICLE_LIFETIME):
+        return 0
+
+    def update(self):
+        pass
+
+    def draw(self, screen):
+        pass
+
+    def clear(self):
+        pass
+
+
+class NullHandDetector:
+    """Visión ausente: las manos quedan centradas y abiertas"""
+
+    def update(self):
+        return None
+
+    def set_parked(self, parked):
+        pass
+
+    def set_max_hands(self, max_hands):
+        pass
+
+    def get_position(self, index=0):
+        return 0.5
+
+    def is_hand_closed(self, index=0):
+        return False
+
+    def is_detected(self, index=0):
+        return False
+
+    def get_preview_surface(self):
+        return None
+
+    def set_inference_interval(self, frames):
+        pass
+
+    def release(self):
+        pass
+
+
+class NullSoundManager:
+    """Gestor de audio sin mixer"""
+
+    def is_available(self):
+        return False
+
+    def register(self, name, sound, max_voices=None, priority=None):
+        pass
+
+    def begin_tick(self):
+        pass
+
+    def play(self, name):
+        return False
+
+    def play_music(self, sound, loops=-1):
+        return False
+
+    def stop_all(self):
+        pass
+
+
+class NullRecorder:
+    """Grabación deshabilitada"""
+
+    def is_recording(self):
+        return False
+
+    def capture(self, screen, now):
+        pass
+
+    def toggle_recording(self, now=0):
+        pass
+
+    def save_replay(self, now=0):
+        return None
+
+    def draw_status(self, screen, now):
+        pass
+
+    def close(self):
+        pass
+
+
+class NullTelemetry:
+    """Telemetría deshabilitada"""
+
+    def log(self, kind, now, arg=0, x=0, y=0, value=0):
+        pass
+
+    def flush(self, now=None):
+        pass
+
+    def close(self):
+        pass
+
+
+class NullAutopilot:
+    """Piloto automático ausente: la nave queda quieta y no dispara"""
+
+    def decide(self, player, game):
+        return 0, False
+
+
+class NullScoreKeeper:
+    """Puntajes sin guardar"""
+
+    def __init__(self, db_path=None, leaderboard_url=None):
+        pass
+
+    def submit(self, score, wave, players, endless, outcome):
+        pass
+
+    def best(self):
+        return 0
+
+    def top(self):
+        return []
+
+    def close(self):
+        pass
+
+
+class NullSpectatorServer:
+    """Sin espectadores en red"""
+
+    def __init__(self, port=SPECTATOR_PORT):
+        pass
+
+    def update(self, game, now):
+        pass
+
+    def close(self):
+        pass
+
+
+class NullRewind:
+    """Rebobinado deshabilitado"""
+    scrubbing = False
+
+    def record(self, game, now):
+        pass
+
+    def clear(self):
+        pass
+
+    def handle_key(self, game, key, mods):
+        return False
+
+    def draw_status(self, screen, now):
+        pass
+
+
+class NullPatternEmitter:
+    """Jefe sin patrones de disparo"""
+
+    def update(self, boss, now, targets, active_bullets=0):
+        return None
+
+    def snapshot(self):
+        return None
+
+    def restore(self, state, shift=0.0):
+        pass
+
+
+class NullDisplay:
+    """Sin ventana: el juego dibuja en una superficie fuera de pantalla"""
+
+    def present(self):
+        pass
+
+    def to_world(self, pos):
+        return pos
+
+
+class PlainDisplay:
+    """Ventana fija de 800x600 sin escalado: se usa si display.py no está disponible"""
+
+    def __init__(self, mode=DISPLAY_MODE, fullscreen=False, internal_scale=1,
+                 caption="Space Invaders"):
+        self.surface = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.display.set_caption(caption)
+
+    def present(self):
+        pygame.display.flip()
+
+    def to_world(self, pos):
+        return pos
+
+
+class NullQualityGovernor:
+    """Calidad fija en el nivel más alto (sin ventana no hay frames que cuidar)"""
+    tier = 0
+    settings = QUALITY_TIERS[0]
+
+    def set_features(self, features):
+        pass
+
+    def update(self, frame_ms, now):
+        return False
+
+    def draw_status(self, screen, x, y):
+        pass
+
+
+# -----------------------
+# Resolución
+# -----------------------
+class Capabilities:
+    def __init__(self):
+        """Clases concretas (o nulas) para cada subsistema"""
+        self.player_class = NullPlayer
+        self.enemy_group_class = NullEnemyGroup
+        self.bullet_class = NullBullet
+        self.powerup_manager_class = NullPowerUpManager
+        self.particle_system_class = NullParticleSystem
+        self.autopilot_class = NullAutopilot
+        self.score_keeper_class = NullScoreKeeper
+        self.spectator_server_class = NullSpectatorServer
+        self.rewind_class = NullRewind
+        self.display_class = PlainDisplay
+        self.pattern_emitter_class = NullPatternEmitter
+        self.quality_governor_class = NullQualityGovernor
+        self.missing = []  # [(subsistema, motivo)]
+
+    def report(self):
+        """Imprime una sola vez los subsistemas que quedaron deshabilitados"""
+        for name, reason in self.missing:
+            print(f"{name} no disponible ({reason}): se usa un sustituto nulo.")
+
+
+def _resolve(caps, attr, module_name, class_name):
+    try:
+        module = __import__(module_name)
+        setattr(caps, attr, getattr(module, class_name))
+    except Exception as e:
+        caps.missing.append((f"{module_name}.py", e))
+
+
+def resolve_capabilities():
+    """Importa los módulos del juego y enlaza sus clases o sustitutos nulos"""
+    caps = Capabilities()
+    _resolve(caps, "player_class", "player", "Player")
+    _resolve(caps, "enemy_group_class", "enemy", "EnemyGroup")
+    _resolve(caps, "bullet_class", "bullet", "Bullet")
+    _resolve(caps, "powerup_manager_class", "powerup", "PowerUpManager")
+    _resolve(caps, "particle_system_class", "particles", "ParticleSystem")
+    # Subsistemas opcionales (varios dependen de NumPy)
+    _resolve(caps, "autopilot_class", "autopilot", "Autopilot")
+    _resolve(caps, "score_keeper_class", "scores", "ScoreKeeper")
+    _resolve(caps, "spectator_server_class", "spectator", "SpectatorServer")
+    _resolve(caps, "rewind_class", "rewind", "RewindBuffer")
+    _resolve(caps, "display_class", "display", "Display")
+    _resolve(caps, "pattern_emitter_class", "boss_patterns", "PatternEmitter")
+    _resolve(caps, "quality_governor_class", "quality", "QualityGovernor")
+    caps.report()
+    return caps
+
+
+def resolve_sound_manager():
+    """Retorna un SoundManager si el mixer está disponible, o uno nulo"""
+    if not pygame.mixer.get_init():
+        return NullSoundManager()
+    from sound_manager import SoundManager
+    return SoundManager()
+
+
+def resolve_recorder(directory):
+    """Retorna un Recorder si OpenCV está disponible, o uno nulo"""
+    try:
+        from recorder import Recorder
+        return Recorder(directory)
+    except ImportError as e:
+        print(f"Grabación no disponible ({e}): se usa un sustituto nulo.")
+        return NullRecorder()
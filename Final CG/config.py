@@ -1,133 +1,374 @@
-"""
-Configuración y constantes del juego Space Invaders
-"""
-
-# Configuración de pantalla
-SCREEN_WIDTH = 800
-SCREEN_HEIGHT = 600
-FPS = 60
-
-# Colores
-BLACK = (0, 0, 0)
-WHITE = (255, 255, 255)
-RED = (255, 0, 0)
-GREEN = (0, 255, 0)
-BLUE = (0, 100, 255)
-YELLOW = (255, 255, 0)
-CYAN = (0, 255, 255)
-PURPLE = (200, 0, 255)
-DARK_BLUE = (10, 10, 50)
-NEON_GREEN = (57, 255, 20)
-NEON_PINK = (255, 16, 240)
-ORANGE = (255, 165, 0)
-GRAY = (128, 128, 128)
-
-# Estados del juego
-STATE_SPLASH = "splash"
-STATE_MENU = "menu"
-STATE_OPTIONS = "options"
-STATE_INSTRUCTIONS = "instructions"
-STATE_PLAYING = "playing"
-STATE_PAUSED = "paused"
-STATE_LEVEL_TRANSITION = "level_transition"
-STATE_GAME_OVER = "game_over"
-
-# Configuración del jugador
-PLAYER_WIDTH = 50
-PLAYER_HEIGHT = 40
-PLAYER_SPEED = 8
-PLAYER_LIVES = 3
-
-# Configuración de enemigos por nivel
-ENEMY_WIDTH = 40
-ENEMY_HEIGHT = 30
-ENEMY_ROWS = 4
-ENEMY_COLS = 8
-ENEMY_DROP_DISTANCE = 30
-
-# Configuración de niveles
-LEVEL_CONFIG = {
-    1: {
-        "name": "Invasión Inicial",
-        "difficulty": "Fácil",
-        "enemy_speed": 1,
-        "enemy_shoot_chance": 0.1,
-        "enemy_shoot_interval": 1500,
-        "rows": 3,
-        "cols": 6,
-        "advanced_enemy_chance": 0.0
-    },
-    2: {
-        "name": "Oleada Alienígena",
-        "difficulty": "Media",
-        "enemy_speed": 1.5,
-        "enemy_shoot_chance": 0.2,
-        "enemy_shoot_interval": 1200,
-        "rows": 4,
-        "cols": 7,
-        "advanced_enemy_chance": 0.2
-    },
-    3: {
-        "name": "Amenaza Avanzada",
-        "difficulty": "Difícil",
-        "enemy_speed": 2,
-        "enemy_shoot_chance": 0.3,
-        "enemy_shoot_interval": 1000,
-        "rows": 4,
-        "cols": 8,
-        "advanced_enemy_chance": 0.3
-    },
-    4: {
-        "name": "Jefe Final",
-        "difficulty": "Muy Difícil",
-        "enemy_speed": 2.5,
-        "enemy_shoot_chance": 0.4,
-        "enemy_shoot_interval": 800,
-        "rows": 0,
-        "cols": 0,
-        "advanced_enemy_chance": 0.0,
-        "boss_fight": True
-    }
-}
-
-# Configuración de balas
-BULLET_WIDTH = 4
-BULLET_HEIGHT = 15
-BULLET_SPEED = 10
-ENEMY_BULLET_SPEED = 5
-
-# Configuración de visión por computadora
-HAND_DETECTION_CONFIDENCE = 0.7
-CAMERA_WIDTH = 640
-CAMERA_HEIGHT = 480
-
-# Puntuación
-POINTS_COMMON_ENEMY = 10
-POINTS_ADVANCED_ENEMY = 20
-POINTS_BOSS = 100
-
-# Power-ups
-POWERUP_DROP_CHANCE = 0.15  # 15% de probabilidad
-POWERUP_FALL_SPEED = 3
-POWERUP_WIDTH = 30
-POWERUP_HEIGHT = 30
-POWERUP_DURATION = 10000  # 10 segundos en milisegundos
-
-# Tipos de power-ups
-POWERUP_DOUBLE_SHOT = "double_shot"
-POWERUP_SHIELD = "shield"
-POWERUP_EXTRA_LIFE = "extra_life"
-
-# Jefe final
-BOSS_WIDTH = 150
-BOSS_HEIGHT = 100
-BOSS_HEALTH = 20
-BOSS_SPEED = 2
-
-# Audio
-AUDIO_ENABLED = True  # Estado inicial del audio
-
-# Configuración de opciones (valores por defecto)
-CONTROL_MODE = "vision"  # "vision" o "keyboard"
-DIFFICULTY_MULTIPLIER = 1.0  # 0.5 (fácil), 1.0 (normal), 1.5 (difícil)
+"""
+Configuración y constantes del juego Space Invaders
+"""
+
+# Configuración de pantalla
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 600
+FPS = 60
+
+# Colores
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+RED = (255, 0, 0)
+GREEN = (0, 255, 0)
+BLUE = (0, 100, 255)
+YELLOW = (255, 255, 0)
+CYAN = (0, 255, 255)
+PURPLE = (200, 0, 255)
+DARK_BLUE = (10, 10, 50)
+NEON_GREEN = (57, 255, 20)
+NEON_PINK = (255, 16, 240)
+ORANGE = (255, 165, 0)
+GRAY = (128, 128, 128)
+
+# Estados del juego
+STATE_SPLASH = "splash"
+STATE_MENU = "menu"
+STATE_OPTIONS = "options"
+STATE_INSTRUCTIONS = "instructions"
+STATE_PLAYING = "playing"
+STATE_PAUSED = "paused"
+STATE_LEVEL_TRANSITION = "level_transition"
+STATE_GAME_OVER = "game_over"
+
+# Política de refresco por estado: FPS máximos, o None para los estados
+# estáticos, que solo se redibujan ante eventos de entrada o temporizadores
+STATE_FRAME_POLICY = {
+    STATE_SPLASH: FPS,
+    STATE_MENU: None,
+    STATE_OPTIONS: None,
+    STATE_INSTRUCTIONS: None,
+    STATE_PLAYING: FPS,
+    STATE_PAUSED: None,
+    STATE_LEVEL_TRANSITION: None,
+    STATE_GAME_OVER: None,
+}
+IDLE_WAKE_MS = 1000  # Máximo tiempo dormido en un estado estático
+IDLE_LOADING_WAKE_MS = 200  # Idem mientras visión o audio siguen cargando
+
+# Configuración del jugador
+PLAYER_WIDTH = 50
+PLAYER_HEIGHT = 40
+PLAYER_SPEED = 8
+PLAYER_LIVES = 3
+PLAYER_SHOT_COOLDOWN_MS = 150  # Tiempo mínimo entre disparos de una nave
+PLAYER_COLORS = [CYAN, NEON_GREEN]  # Color de la nave de cada jugador
+
+# Modo cooperativo (dos jugadores, una mano cada uno)
+COOP_ENABLED = False  # Estado inicial; se alterna con la tecla C en el menú
+COOP_PLAYERS = 2
+COOP_HAND_ASSIGNMENT = "screen_half"  # "screen_half" o "handedness"
+# Teclas por jugador: (izquierda, derecha, disparo) como nombres de pygame
+PLAYER_KEYS = [("left", "right", "space"), ("a", "d", "w")]
+
+# Configuración de enemigos por nivel
+ENEMY_WIDTH = 40
+ENEMY_HEIGHT = 30
+ENEMY_ROWS = 4
+ENEMY_COLS = 8
+ENEMY_DROP_DISTANCE = 30
+ENEMY_GRID_CELL = 60  # Ancho (px) de las columnas con que find_hit descarta enemigos
+
+# Configuración de niveles
+LEVEL_CONFIG = {
+    1: {
+        "name": "Invasión Inicial",
+        "difficulty": "Fácil",
+        "enemy_speed": 1,
+        "enemy_shoot_chance": 0.1,
+        "enemy_shoot_interval": 1500,
+        "rows": 3,
+        "cols": 6,
+        "advanced_enemy_chance": 0.0,
+        "dive_chance": 0.003,
+        "max_divers": 1
+    },
+    2: {
+        "name": "Oleada Alienígena",
+        "difficulty": "Media",
+        "enemy_speed": 1.5,
+        "enemy_shoot_chance": 0.2,
+        "enemy_shoot_interval": 1200,
+        "rows": 4,
+        "cols": 7,
+        "advanced_enemy_chance": 0.2,
+        "dive_chance": 0.006,
+        "max_divers": 2
+    },
+    3: {
+        "name": "Amenaza Avanzada",
+        "difficulty": "Difícil",
+        "enemy_speed": 2,
+        "enemy_shoot_chance": 0.3,
+        "enemy_shoot_interval": 1000,
+        "rows": 4,
+        "cols": 8,
+        "advanced_enemy_chance": 0.3,
+        "dive_chance": 0.01,
+        "max_divers": 3
+    },
+    4: {
+        "name": "Jefe Final",
+        "difficulty": "Muy Difícil",
+        "enemy_speed": 2.5,
+        "enemy_shoot_chance": 0.4,
+        "enemy_shoot_interval": 800,
+        "rows": 0,
+        "cols": 0,
+        "advanced_enemy_chance": 0.0,
+        "dive_chance": 0.0,
+        "max_divers": 0,
+        "boss_fight": True
+    }
+}
+
+# Modo infinito: oleadas generadas a partir de LEVEL_CONFIG
+ENDLESS_ENABLED = False  # Estado inicial; se alterna con la tecla E en el menú
+ENDLESS_BOSS_EVERY = 5  # Cada cuántas oleadas aparece un jefe
+ENDLESS_GROWTH = 0.5  # Fracción del incremento medio entre niveles que se suma por oleada
+# Límites de dificultad de las oleadas generadas
+ENDLESS_LIMITS = {
+    "enemy_speed": 4.0,
+    "enemy_shoot_chance": 0.6,
+    "enemy_shoot_interval": 500,  # mínimo
+    "rows": 6,
+    "cols": 10,
+    "advanced_enemy_chance": 0.8,
+    "dive_chance": 0.03,
+    "max_divers": 6,
+}
+
+# Configuración de balas
+BULLET_WIDTH = 4
+BULLET_HEIGHT = 15
+BULLET_SPEED = 10
+ENEMY_BULLET_SPEED = 5
+
+# Configuración de visión por computadora
+HAND_DETECTION_CONFIDENCE = 0.7
+CAMERA_WIDTH = 640
+CAMERA_HEIGHT = 480
+VISION_MAX_HANDS = 2  # Manos que el detector puede seguir (una por jugador)
+CAMERA_PREVIEW = True  # Mostrar la vista previa de la cámara en el HUD
+VISION_FRAME_WIDTH = 160  # Tamaño de la vista previa que llega al juego
+VISION_FRAME_HEIGHT = 120
+
+# Visión en un proceso separado (memoria compartida, sin pickling)
+VISION_OUT_OF_PROCESS = False
+VISION_RING_SLOTS = 3  # Ranuras del buffer circular de frames y resultados
+VISION_WORKER_CPU = None  # Núcleo para el proceso de visión (None = el último)
+VISION_STARTUP_TIMEOUT_S = 30  # Espera máxima a que el proceso cargue MediaPipe
+VISION_HEARTBEAT_TIMEOUT_MS = 3000  # Sin latido en este tiempo se reinicia el proceso
+VISION_RESTART_DELAY_MS = 1000  # Espera antes de relanzar un proceso caído
+
+# Umbrales de gestos con histéresis (entrada / salida)
+# Extensión de un dedo = distancia punta-muñeca / distancia nudillo-muñeca
+GESTURE_FIST_ENTER = 1.15  # Puño: extensión media por debajo de este valor
+GESTURE_FIST_EXIT = 1.35
+GESTURE_PINCH_ENTER = 0.25  # Pinza: pulgar-índice relativo a la palma
+GESTURE_PINCH_EXIT = 0.35
+GESTURE_OPEN_ENTER = 1.6  # Palma abierta: todos los dedos por encima
+GESTURE_OPEN_EXIT = 1.45
+
+# Puntuación
+POINTS_COMMON_ENEMY = 10
+POINTS_ADVANCED_ENEMY = 20
+POINTS_BOSS = 100
+
+# Power-ups
+POWERUP_DROP_CHANCE = 0.15  # 15% de probabilidad
+POWERUP_FALL_SPEED = 3
+POWERUP_WIDTH = 30
+POWERUP_HEIGHT = 30
+POWERUP_DURATION = 10000  # 10 segundos en milisegundos
+
+# Tipos de power-ups
+POWERUP_DOUBLE_SHOT = "double_shot"
+POWERUP_SHIELD = "shield"
+POWERUP_EXTRA_LIFE = "extra_life"
+
+# Partículas (explosiones e impactos)
+# Tope global de partículas vivas; las que excedan no se emiten. Con el sistema
+# lleno, update() y draw() cuestan unos 5 ms por frame (ver benchmarks/bench_particles.py)
+PARTICLE_MAX = 30000
+PARTICLE_LIFETIME = 45  # Vida en frames
+PARTICLE_SPEED = 4.0  # Velocidad inicial máxima (px/frame)
+PARTICLE_DRAG = 0.95  # Amortiguación de la velocidad por frame
+PARTICLE_GRAVITY = 0.06  # Aceleración hacia abajo (px/frame²)
+PARTICLE_FADE_STEPS = 8  # Sprites precalculados por color (de brillante a apagado)
+PARTICLE_ENEMY_BURST = 40  # Partículas al destruir un enemigo
+PARTICLE_BOSS_HIT_BURST = 25  # Partículas por impacto en el jefe
+PARTICLE_PLAYER_HIT_BURST = 15  # Partículas por impacto en un jugador
+PARTICLE_BOSS_DEATH_BURST = 600  # Partículas al derrotar al jefe
+
+# Jefe final
+BOSS_WIDTH = 150
+BOSS_HEIGHT = 100
+BOSS_HEALTH = 20
+BOSS_SPEED = 2
+
+# Audio
+AUDIO_ENABLED = True  # Estado inicial del audio
+AUDIO_NUM_CHANNELS = 16  # Canales del mixer (el canal 0 se reserva para la música)
+
+# Límite de voces simultáneas y prioridad por sonido: {nombre: (max_voces, prioridad)}
+# Un sonido nuevo puede robar la voz de otro con prioridad menor o igual
+SOUND_VOICE_LIMITS = {
+    "shoot": (3, 1),
+    "explosion": (4, 2),
+    "hit": (2, 3),
+    "victory": (1, 4),
+    "game_over": (1, 4),
+}
+
+# Piloto automático (demo y pruebas de resistencia)
+AUTOPILOT_LOOKAHEAD_FRAMES = 40  # Frames hacia adelante en que se anticipan las balas
+AUTOPILOT_DODGE_MARGIN = 6  # Margen horizontal (px) alrededor de la nave al esquivar
+AUTOPILOT_POWERUP_RANGE = 250  # Distancia vertical a la que persigue un power-up
+
+# Prueba de resistencia (soak.py)
+SOAK_SAMPLE_INTERVAL_S = 60  # Segundos entre muestras
+SOAK_WARMUP_S = 600  # Segundos iniciales excluidos del análisis (el RSS tarda en estabilizarse)
+SOAK_MIN_TREND_SAMPLES = 5  # Muestras necesarias (tras el calentamiento) para evaluar tendencias
+SOAK_MAX_RSS_GROWTH_MB_PER_HOUR = 8.0
+SOAK_MAX_TRACED_GROWTH_MB_PER_HOUR = 4.0
+SOAK_MAX_FRAME_SLOWDOWN_PER_HOUR = 0.10  # Crecimiento relativo del p95 del tiempo de frame
+SOAK_TOP_ALLOCATORS = 10  # Líneas de tracemalloc reportadas
+
+# Entorno de simulación para agentes (env.py, vector_env.py)
+ENV_MAX_STEPS = 10000  # Pasos por episodio antes de truncarlo
+ENV_FRAME_SKIP = 1  # Frames de juego por paso (la acción se repite)
+ENV_REWARD_PER_POINT = 0.1  # Recompensa por punto de puntuación
+ENV_LIFE_PENALTY = 5.0  # Penalización por vida perdida
+ENV_WAVE_BONUS = 10.0  # Bonificación por oleada superada
+OBS_ENEMY_BULLETS = 8  # Balas enemigas más cercanas incluidas en la observación
+OBS_ENEMIES = 8  # Enemigos más cercanos incluidos en la observación
+OBS_POWERUPS = 2  # Power-ups más cercanos incluidos en la observación
+OBS_FRAME_SCALE = 4  # Reducción por promedio de área de la observación en píxeles (800x600 -> 200x150)
+OBS_GRAY_WEIGHTS = (0.299, 0.587, 0.114)  # Pesos RGB de la conversión a escala de grises
+
+# Grabación de video (recorder.py, --record)
+RECORD_DIR = "grabaciones"  # Carpeta de los videos
+RECORD_FPS = 30  # Frames capturados por segundo de juego
+RECORD_SCALE = 2  # Reducción de la resolución del video (800x600 -> 400x300)
+RECORD_REPLAY_SECONDS = 10  # Duración de la repetición instantánea (F10)
+RECORD_FOURCC = "mp4v"  # Códec de cv2.VideoWriter
+RECORD_MESSAGE_MS = 2500  # Tiempo en pantalla de los avisos de grabación
+RECORD_CLOSE_TIMEOUT_S = 10  # Espera máxima al cerrar por los videos pendientes
+
+# Telemetría de eventos (telemetry.py, --telemetry)
+TELEMETRY_DIR = "telemetria"  # Carpeta de los archivos
+TELEMETRY_HANDOFF_MS = 250  # Cada cuánto el juego entrega eventos al escritor
+TELEMETRY_HANDOFF_EVENTS = 256  # ...o antes, si se acumulan tantos
+TELEMETRY_QUEUE_BATCHES = 64  # Lotes en espera antes de descartar
+TELEMETRY_WRITE_BYTES = 64 * 1024  # Tamaño de lote que dispara una escritura
+TELEMETRY_FLUSH_S = 1.0  # Escritura mínima aunque el lote no se llene
+TELEMETRY_ROTATE_BYTES = 4 * 1024 * 1024  # Bytes sin comprimir por archivo
+TELEMETRY_MAX_FILES = 50  # Archivos conservados (se borran los más viejos)
+TELEMETRY_COMPRESSLEVEL = 6  # Nivel de gzip
+TELEMETRY_CLOSE_TIMEOUT_S = 5  # Espera máxima al cerrar
+
+# Puntajes y leaderboard (scores.py)
+SCORES_ENABLED = True  # Guardar los puntajes en la base local
+SCORES_DB = "puntajes.db"  # Base SQLite de puntajes
+SCORES_TOP = 10  # Récords que se mantienen en memoria
+SCORES_CLOSE_TIMEOUT_S = 5  # Espera máxima al cerrar
+LEADERBOARD_URL = None  # URL del leaderboard (None = sin sincronizar; ver --leaderboard)
+LEADERBOARD_BATCH_SIZE = 50  # Puntajes por envío
+LEADERBOARD_TIMEOUT_S = 5  # Tiempo máximo de cada petición HTTP
+LEADERBOARD_RETRY_BASE_S = 2  # Primera espera tras un envío fallido (se duplica)
+LEADERBOARD_RETRY_MAX_S = 300  # Espera máxima entre reintentos
+LEADERBOARD_MACHINE_ID = None  # Identificador del equipo (None = nombre del host)
+
+# Espectadores en red (ver spectator.py y --spectate)
+SPECTATOR_PORT = 50507  # Puerto UDP donde el juego publica
+SPECTATOR_RATE = 20  # Instantáneas por segundo de juego
+SPECTATOR_HISTORY = 64  # Instantáneas guardadas como base de los deltas
+SPECTATOR_CLIENT_TIMEOUT_S = 5  # Sin mensajes en este tiempo el espectador se olvida
+SPECTATOR_HELLO_S = 1.0  # Cada cuánto el cliente saluda (mantiene la suscripción)
+SPECTATOR_INTERP_DELAY_MS = 100  # Retraso de la imagen del espectador para interpolar
+SPECTATOR_BUFFERED_STATES = 16  # Instantáneas decodificadas que guarda el cliente
+SPECTATOR_ZLIB_LEVEL = 1  # Compresión de los paquetes
+SPECTATOR_MAX_PACKET = 60000  # Paquetes más grandes no se envían (límite de UDP)
+
+# Rebobinado de depuración (ver rewind.py): F6 congela y recorre los últimos segundos
+REWIND_ENABLED = True  # Guardar cada tick jugado en el anillo
+REWIND_SECONDS = 10  # Segundos de juego que se conservan
+REWIND_MAX_ENEMIES = 64  # Capacidad por tick (ENDLESS_LIMITS llega a 6x10)
+REWIND_MAX_BULLETS = 512  # Capacidad por tick de cada lista de balas
+REWIND_MAX_POWERUPS = 16
+REWIND_RANDOM_KEYFRAME_TICKS = 60  # Cada cuántos ticks se copia el estado completo de rng
+
+# Pantalla (ver display.py): el juego siempre dibuja a SCREEN_WIDTH x SCREEN_HEIGHT
+DISPLAY_MODE = "window"  # "window" (800x600), "scaled" (escala SDL/GPU) o "native" (escala en CPU)
+DISPLAY_FULLSCREEN = False  # Pantalla completa en los modos scaled y native
+DISPLAY_INTERNAL_SCALE = 1  # 2 = resolución interna de 400x300 para equipos débiles
+DISPLAY_INTEGER_SCALE = False  # native: solo factores enteros (con bordes negros)
+
+# Picadas (ver dive_paths.py): enemigos que dejan la formación y vuelven a su lugar.
+# Cada nivel define "dive_chance" (probabilidad por tick de lanzar una) y "max_divers"
+DIVE_SPEED = 4.0  # Píxeles por tick a lo largo de la trayectoria
+# Puntos de control relativos al lugar en la formación, para un enemigo de la
+# mitad derecha (en la izquierda se reflejan); todas terminan en (0, 0)
+DIVE_PATHS = (
+    # lazo: sube, se abre hacia afuera, baja cruzando y vuelve en curva
+    ((0, 0), (20, -25), (55, -10), (70, 40), (40, 140), (-30, 230), (-90, 260),
+     (-120, 200), (-80, 110), (-30, 40), (0, 0)),
+    # picada: cae casi en vertical hasta la altura de las naves y remonta
+    ((0, 0), (15, -20), (40, 0), (20, 120), (-20, 260), (10, 330), (60, 290),
+     (50, 170), (20, 60), (0, 0)),
+)
+
+# Patrones de disparo del jefe (ver boss_patterns.py). Ángulos en grados, 0 = hacia abajo
+# y positivo hacia la derecha; velocidades en píxeles por tick
+BOSS_PATTERNS = {
+    # abanico fijo hacia abajo
+    "spread": {"count": 7, "arc": 70, "speed": 3.5},
+    # ráfaga apuntada: cada volea vuelve a apuntar al jugador más cercano
+    "aimed_burst": {"count": 3, "arc": 14, "speed": 5.0, "aim": True, "volleys": 4, "volley_ms": 120},
+    # anillo completo
+    "ring": {"count": 20, "arc": 360, "speed": 2.8},
+    # espiral: brazos de un anillo que giran entre voleas
+    "spiral": {"count": 4, "arc": 360, "speed": 3.2, "volleys": 24, "volley_ms": 60, "spin": 11},
+}
+# Fases según la vida restante (fracción de BOSS_HEALTH): rige la primera cuya
+# "health" sea menor que la del jefe
+BOSS_PHASES = (
+    {"health": 0.66, "interval_ms": 1600, "patterns": ("spread", "aimed_burst")},
+    {"health": 0.33, "interval_ms": 1300, "patterns": ("spread", "ring", "aimed_burst")},
+    {"health": 0.0, "interval_ms": 1100, "patterns": ("spiral", "ring", "aimed_burst")},
+)
+BOSS_PATTERN_DELAY_MS = 1000  # Espera antes del primer patrón de cada jefe
+BOSS_MAX_BULLETS = 400  # Tope de balas enemigas en pantalla durante la pelea
+
+# Colisiones de balas contra enemigos y jefe: máscaras al píxel tras el descarte por rectángulo
+PIXEL_COLLISIONS = True  # False = solo rectángulos (el área transparente también cuenta)
+
+# Calidad automática (ver quality.py): si el tiempo de frame promedio se pasa del
+# presupuesto de FPS se baja un nivel; con margen sostenido se vuelve a subir.
+# Cada nivel recorta una cosa más, en este orden. La resolución interna no está:
+# en scaled la fija SDL al abrir la ventana y en native no ahorra (--low-res)
+QUALITY_AUTO = True
+QUALITY_TIERS = (
+    {"name": "ALTA", "stars": 80, "glow_rings": 3, "camera_preview": True, "inference_every": 1},
+    {"name": "MENOS ESTRELLAS", "stars": 30, "glow_rings": 3, "camera_preview": True,
+     "inference_every": 1},
+    {"name": "SIN BRILLO", "stars": 30, "glow_rings": 0, "camera_preview": True,
+     "inference_every": 1},
+    {"name": "SIN VISTA PREVIA", "stars": 30, "glow_rings": 0, "camera_preview": False,
+     "inference_every": 1},
+    {"name": "VISIÓN 1/2", "stars": 30, "glow_rings": 0, "camera_preview": False,
+     "inference_every": 2},
+)
+QUALITY_WINDOW = 60  # Frames del promedio móvil
+QUALITY_DOWN_RATIO = 0.9  # Bajar si el promedio supera esta fracción del presupuesto
+QUALITY_UP_RATIO = 0.6  # Subir si queda por debajo de esta fracción...
+QUALITY_UP_HOLD_MS = 3000  # ...durante este tiempo
+QUALITY_UP_HOLD_MAX_MS = 30000  # Tope de la espera (se duplica si una subida no se sostiene)
+QUALITY_SETTLE_MS = 500  # Tras un cambio, tiempo sin decidir mientras se mide el nivel nuevo
+
+# Configuración de opciones (valores por defecto)
+CONTROL_MODE = "vision"  # "vision" o "keyboard"
+DIFFICULTY_MULTIPLIER = 1.0  # 0.5 (fácil), 1.0 (normal), 1.5 (difícil)
 HAND_SENSITIVITY = 1.0  # 0.5 a 2.0
\ No newline at end of file
@@ -0,0 +1,136 @@
+"""
+Presentación en pantalla: resolución interna fija y escalado a la ventana
+
+El juego siempre dibuja en una superficie de SCREEN_WIDTH x SCREEN_HEIGHT
+(el "mundo"); Display decide cómo llega eso a la pantalla, con un único
+escalado por frame:
+
+    window   ventana de 800x600 sin escalar (como siempre)
+    scaled   pygame.SCALED: SDL escala la superficie en la GPU al hacer flip,
+             con vecino más cercano; en pantalla completa usa la resolución
+             del escritorio sin cambiar el modo de video
+    native   ventana o pantalla completa a la resolución del escritorio; el
+             frame se escala en CPU (vecino más cercano, por un factor
+             entero con DISPLAY_INTEGER_SCALE) directamente sobre la ventana
+
+Con internal_scale > 1 (equipos débiles) la resolución interna baja a
+800/n x 600/n: el mundo se reduce una vez por frame y lo que se sube a la
+GPU o se escala es n² veces más chico.
+
+Uso:
+    python main.py --fullscreen                 # scaled a pantalla completa
+    python main.py --display native --low-res
+    python benchmarks/bench_display.py          # tiempo de frame de cada modo
+"""
+import os
+
+from config import *
+
+# Con SCALED, SDL escala con este filtro; vecino más cercano mantiene los bordes nítidos
+os.environ.setdefault("SDL_RENDER_SCALE_QUALITY", "nearest")
+
+import pygame  # noqa: E402  (después de fijar el filtro de escalado de SDL)
+
+DISPLAY_MODES = ("window", "scaled", "native")
+
+
+def fit_rect(size, area, integer=False):
+    """Rectángulo centrado en area donde cabe size escalado sin deformar
+
+    Args:
+        integer: solo factores enteros (si no cabe ni 1x, se reduce igual)
+    """
+    width, height = size
+    scale = min(area[0] / width, area[1] / height)
+    if integer and scale >= 1:
+        scale = int(scale)
+    rect = pygame.Rect(0, 0, int(width * scale), int(height * scale))
+    rect.center = (area[0] // 2, area[1] // 2)
+    return rect
+
+
+class Display:
+    def __init__(self, mode=DISPLAY_MODE, fullscreen=DISPLAY_FULLSCREEN,
+                 internal_scale=DISPLAY_INTERNAL_SCALE, caption="Space Invaders", size=None):
+        """Abre la ventana
+
+        Args:
+            mode: "window", "scaled" o "native"
+            fullscreen: pantalla completa (modos scaled y native)
+            internal_scale: divisor de la resolución interna (1 = 800x600)
+            size: tamaño de la ventana en native (por defecto el escritorio, o lo
+                que entra en el 90% del escritorio si no es pantalla completa)
+        """
+        if mode not in DISPLAY_MODES:
+            raise ValueError(f"modo de pantalla desconocido: {mode}")
+        self.mode = mode
+        self.fullscreen = fullscreen and mode != "window"
+        self.internal_scale = 1 if mode == "window" else max(int(internal_scale), 1)
+        world_size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.internal_size = (SCREEN_WIDTH // self.internal_scale,
+                              SCREEN_HEIGHT // self.internal_scale)
+
+        if mode == "window":
+            self.window = pygame.display.set_mode(world_size)
+        elif mode == "scaled":
+            flags = pygame.SCALED | (pygame.FULLSCREEN if self.fullscreen else 0)
+            self.window = pygame.display.set_mode(self.internal_size, flags)
+        elif self.fullscreen:
+            desktop = pygame.display.get_desktop_sizes()[0]
+            self.window = pygame.display.set_mode(size or desktop, pygame.FULLSCREEN)
+        else:
+            if size is None:
+                desktop = pygame.display.get_desktop_sizes()[0]
+                size = fit_rect(world_size, (desktop[0] * 9 // 10, desktop[1] * 9 // 10),
+                                DISPLAY_INTEGER_SCALE).size
+            self.window = pygame.display.set_mode(size)
+        pygame.display.set_caption(caption)
+
+        # Superficie donde dibuja el juego: la ventana misma si no hace falta escalar
+        if self.window.get_size() == world_size:
+            self.world = self.window
+        else:
+            self.world = pygame.Surface(world_size).convert(self.window)
+        # Resolución interna: la ventana lógica en scaled, una superficie aparte en native
+        if self.internal_size == world_size:
+            self.internal = self.world
+        elif mode == "scaled":
+            self.internal = self.window
+        else:
+            self.internal = pygame.Surface(self.internal_size).convert(self.window)
+        # Región de la ventana donde se presenta el frame (native); el resto queda negro
+        self.target = None
+        if mode == "native":
+            self.window.fill(BLACK)
+            rect = fit_rect(self.internal_size, self.window.get_size(), DISPLAY_INTEGER_SCALE)
+            self.target = self.window.subsurface(rect)
+
+    @property
+    def surface(self):
+        """Superficie de SCREEN_WIDTH x SCREEN_HEIGHT donde se dibuja cada frame"""
+        return self.world
+
+    def present(self):
+        """Lleva el frame dibujado a la pantalla"""
+        if self.internal is not self.world:
+            pygame.transform.scale(self.world, self.internal_size, self.internal)
+        if self.target is not None:
+            pygame.transform.scale(self.internal, self.target.get_size(), self.target)
+        pygame.display.flip()
+
+    def to_world(self, pos):
+        """Convierte una posición del mouse a coordenadas del mundo"""
+        x, y = pos
+        if self.target is not None:
+            offset = self.target.get_abs_offset()
+            width, height = self.target.get_size()
+            return ((x - offset[0]) * SCREEN_WIDTH // width,
+                    (y - offset[1]) * SCREEN_HEIGHT // height)
+        # scaled: SDL ya entrega el mouse en coordenadas de la ventana lógica
+        return x * self.internal_scale, y * self.internal_scale
+
+    def describe(self):
+        window = "x".join(map(str, self.window.get_size()))
+        internal = "x".join(map(str, self.internal_size))
+        screen = "pantalla completa" if self.fullscreen else "ventana"
+        return f"{self.mode}, {screen} {window}, interna {internal}"
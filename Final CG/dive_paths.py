@@ -0,0 +1,67 @@
+"""
+Trayectorias de picada de los enemigos (estilo Galaga)
+
+Cada trayectoria de DIVE_PATHS es una spline Catmull-Rom que pasa por puntos
+de control relativos al lugar del enemigo en la formación. Se muestrea una
+sola vez al importar y se reparametriza por longitud de arco: la tabla
+guarda un desplazamiento por tick a DIVE_SPEED píxeles por tick, así que
+mover un enemigo en picada es leer la tabla en su paso actual y sumarle su
+lugar en la formación (que sigue marchando mientras tanto). Cada trayectoria
+tiene además su versión reflejada para los enemigos de la mitad izquierda.
+
+El costo de la formación con y sin picadas se mide con
+python benchmarks/bench_dive_paths.py.
+"""
+import numpy as np
+from config import *
+
+SAMPLES_PER_SEGMENT = 32  # Muestras de la spline entre dos puntos de control
+
+
+def catmull_rom(points, samples=SAMPLES_PER_SEGMENT):
+    """Muestrea la spline Catmull-Rom que pasa por todos los puntos
+
+    Returns:
+        np.ndarray: puntos (n, 2), del primero al último punto de control
+    """
+    points = np.asarray(points, dtype=np.float64)
+    # Los extremos se repiten para que la curva pase por el primero y el último
+    padded = np.vstack([points[:1], points, points[-1:]])
+    t = np.linspace(0, 1, samples, endpoint=False)[:, None]
+    t2, t3 = t * t, t * t * t
+    segments = []
+    for p0, p1, p2, p3 in zip(padded, padded[1:], padded[2:], padded[3:]):
+        segments.append(0.5 * (2 * p1 + (p2 - p0) * t + (2 * p0 - 5 * p1 + 4 * p2 - p3) * t2
+                               + (3 * p1 - p0 - 3 * p2 + p3) * t3))
+    segments.append(points[-1:])
+    return np.vstack(segments)
+
+
+def arc_length_table(curve, step=DIVE_SPEED):
+    """Reparametriza la curva por longitud de arco
+
+    Returns:
+        tuple: (lista de x, lista de y), un punto cada step píxeles de
+            recorrido; el último es exactamente el final de la curva
+    """
+    lengths = np.hypot(*np.diff(curve, axis=0).T)
+    distance = np.concatenate([[0.0], np.cumsum(lengths)])
+    targets = np.append(np.arange(step, distance[-1], step), distance[-1])
+    xs = np.interp(targets, distance, curve[:, 0])
+    ys = np.interp(targets, distance, curve[:, 1])
+    xs[-1], ys[-1] = curve[-1]
+    # Listas de Python: indexarlas en el bucle por tick es más barato que un arreglo
+    return xs.tolist(), ys.tolist()
+
+
+def build_tables(paths=DIVE_PATHS, step=DIVE_SPEED):
+    """Tablas de todas las trayectorias: índice 2 * n para la n-ésima, 2 * n + 1 reflejada"""
+    tables = []
+    for points in paths:
+        xs, ys = arc_length_table(catmull_rom(points), step)
+        tables.append((xs, ys))
+        tables.append(([-x for x in xs], ys))
+    return tables
+
+
+DIVE_TABLES = build_tables()
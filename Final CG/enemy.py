@@ -1,285 +1,494 @@
-"""
-Clase de enemigos (invasores espaciales)
-"""
-import pygame
-import random
-from config import *
-
-class Enemy:
-    def __init__(self, x, y, enemy_type="common"):
-        """Inicializa un enemigo
-        
-        Args:
-            x: posición x
-            y: posición y
-            enemy_type: "common" o "advanced"
-        """
-        self.x = x
-        self.y = y
-        self.width = ENEMY_WIDTH
-        self.height = ENEMY_HEIGHT
-        self.type = enemy_type
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
-        self.animation_frame = 0
-        
-        # Propiedades según tipo
-        if enemy_type == "advanced":
-            self.points = POINTS_ADVANCED_ENEMY
-            self.color = PURPLE
-            self.can_shoot = True
-        else:
-            self.points = POINTS_COMMON_ENEMY
-            self.color = RED
-            self.can_shoot = False
-        
-    def update_rect(self):
-        """Actualiza el rectángulo de colisión"""
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
-    
-    def draw(self, screen):
-        """Dibuja el enemigo con diseño alienígena"""
-        # Color según tipo
-        color = self.color
-        
-        # Cuerpo principal
-        pygame.draw.rect(screen, color, 
-                        (self.x + 5, self.y + 5, self.width - 10, self.height - 10))
-        
-        # Ojos
-        eye_offset = 2 if self.animation_frame % 20 < 10 else 0
-        pygame.draw.circle(screen, WHITE, 
-                         (self.x + 12, self.y + 12 + eye_offset), 4)
-        pygame.draw.circle(screen, WHITE, 
-                         (self.x + self.width - 12, self.y + 12 + eye_offset), 4)
-        pygame.draw.circle(screen, BLACK, 
-                         (self.x + 12, self.y + 12 + eye_offset), 2)
-        pygame.draw.circle(screen, BLACK, 
-                         (self.x + self.width - 12, self.y + 12 + eye_offset), 2)
-        
-        # Antenas
-        pygame.draw.line(screen, color, 
-                        (self.x + 8, self.y + 5), 
-                        (self.x + 8, self.y), 2)
-        pygame.draw.line(screen, color, 
-                        (self.x + self.width - 8, self.y + 5), 
-                        (self.x + self.width - 8, self.y), 2)
-        pygame.draw.circle(screen, NEON_PINK, (self.x + 8, self.y), 3)
-        pygame.draw.circle(screen, NEON_PINK, (self.x + self.width - 8, self.y), 3)
-        
-        # Indicador de enemigo avanzado
-        if self.type == "advanced":
-            pygame.draw.rect(screen, YELLOW, 
-                           (self.x + self.width // 2 - 3, self.y + self.height - 8, 6, 4))
-        
-        self.animation_frame += 1
-
-
-class Boss:
-    def __init__(self, x, y):
-        """Inicializa el jefe final"""
-        self.x = x
-        self.y = y
-        self.width = BOSS_WIDTH
-        self.height = BOSS_HEIGHT
-        self.health = BOSS_HEALTH
-        self.max_health = BOSS_HEALTH
-        self.speed = BOSS_SPEED
-        self.direction = 1
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
-        self.animation_frame = 0
-        self.shoot_timer = 0
-        self.points = POINTS_BOSS
-        
-    def update(self):
-        """Actualiza la posición del jefe"""
-        self.x += self.speed * self.direction
-        
-        # Cambiar dirección en los bordes
-        if self.x <= 50 or self.x >= SCREEN_WIDTH - self.width - 50:
-            self.direction *= -1
-        
-        self.update_rect()
-        self.animation_frame += 1
-    
-    def update_rect(self):
-        """Actualiza el rectángulo de colisión"""
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
-    
-    def take_damage(self):
-        """El jefe recibe daño"""
-        self.health -= 1
-        return self.health <= 0
-    
-    def draw(self, screen):
-        """Dibuja el jefe final"""
-        # Cuerpo principal grande
-        pygame.draw.rect(screen, NEON_PINK, 
-                        (self.x + 10, self.y + 10, self.width - 20, self.height - 20))
-        pygame.draw.rect(screen, PURPLE, 
-                        (self.x + 10, self.y + 10, self.width - 20, self.height - 20), 3)
-        
-        # Ojos grandes
-        eye_size = 12
-        eye_offset = 3 if self.animation_frame % 30 < 15 else 0
-        pygame.draw.circle(screen, WHITE, 
-                         (self.x + 40, self.y + 35 + eye_offset), eye_size)
-        pygame.draw.circle(screen, WHITE, 
-                         (self.x + self.width - 40, self.y + 35 + eye_offset), eye_size)
-        pygame.draw.circle(screen, RED, 
-                         (self.x + 40, self.y + 35 + eye_offset), eye_size // 2)
-        pygame.draw.circle(screen, RED, 
-                         (self.x + self.width - 40, self.y + 35 + eye_offset), eye_size // 2)
-        
-        # Antenas múltiples
-        for i in range(3):
-            x_pos = self.x + 30 + i * 45
-            pygame.draw.line(screen, NEON_GREEN, 
-                           (x_pos, self.y + 10), 
-                           (x_pos, self.y - 10), 3)
-            pygame.draw.circle(screen, YELLOW, (x_pos, self.y - 10), 5)
-        
-        # Barra de vida
-        health_bar_width = self.width - 40
-        health_bar_height = 8
-        health_bar_x = self.x + 20
-        health_bar_y = self.y - 20
-        
-        # Fondo de la barra
-        pygame.draw.rect(screen, GRAY, 
-                        (health_bar_x, health_bar_y, health_bar_width, health_bar_height))
-        
-        # Barra de vida actual
-        current_health_width = int((self.health / self.max_health) * health_bar_width)
-        health_color = GREEN if self.health > self.max_health * 0.5 else (YELLOW if self.health > self.max_health * 0.25 else RED)
-        pygame.draw.rect(screen, health_color, 
-                        (health_bar_x, health_bar_y, current_health_width, health_bar_height))
-        
-        # Borde de la barra
-        pygame.draw.rect(screen, WHITE, 
-                        (health_bar_x, health_bar_y, health_bar_width, health_bar_height), 1)
-
-
-class EnemyGroup:
-    def __init__(self, level=1):
-        """Inicializa un grupo de enemigos
-        
-        Args:
-            level: nivel actual del juego (1-4)
-        """
-        self.enemies = []
-        self.boss = None
-        self.direction = 1  # 1 = derecha, -1 = izquierda
-        self.level = level
-        self.level_config = LEVEL_CONFIG.get(level, LEVEL_CONFIG[1])
-        self.speed = self.level_config["enemy_speed"]
-        
-        # Crear formación o jefe según el nivel
-        if self.level_config.get("boss_fight", False):
-            self.create_boss()
-        else:
-            self.create_formation()
-        
-    def create_formation(self):
-        """Crea la formación de enemigos según el nivel"""
-        self.enemies = []
-        rows = self.level_config["rows"]
-        cols = self.level_config["cols"]
-        advanced_chance = self.level_config["advanced_enemy_chance"]
-        
-        start_x = 100
-        start_y = 80
-        spacing_x = 60
-        spacing_y = 50
-        
-        for row in range(rows):
-            for col in range(cols):
-                x = start_x + col * spacing_x
-                y = start_y + row * spacing_y
-                
-                # Determinar tipo de enemigo
-                enemy_type = "advanced" if random.random() < advanced_chance else "common"
-                
-                enemy = Enemy(x, y, enemy_type)
-                self.enemies.append(enemy)
-    
-    def create_boss(self):
-        """Crea el jefe final"""
-        boss_x = SCREEN_WIDTH // 2 - BOSS_WIDTH // 2
-        boss_y = 100
-        self.boss = Boss(boss_x, boss_y)
-    
-    def update(self):
-        """Actualiza la posición de todos los enemigos o del jefe"""
-        if self.boss:
-            self.boss.update()
-            return
-        
-        # Verificar si algún enemigo toca el borde
-        should_drop = False
-        for enemy in self.enemies:
-            if enemy.x <= 0 or enemy.x >= SCREEN_WIDTH - enemy.width:
-                should_drop = True
-                break
-        
-        if should_drop:
-            self.direction *= -1
-            for enemy in self.enemies:
-                enemy.y += ENEMY_DROP_DISTANCE
-        
-        # Mover todos los enemigos
-        for enemy in self.enemies:
-            enemy.x += self.speed * self.direction
-            enemy.update_rect()
-    
-    def draw(self, screen):
-        """Dibuja todos los enemigos o el jefe"""
-        if self.boss:
-            self.boss.draw(screen)
-        else:
-            for enemy in self.enemies:
-                enemy.draw(screen)
-    
-    def get_random_shooter(self):
-        """Retorna un enemigo aleatorio para disparar"""
-        if self.boss:
-            return self.boss
-        
-        # Filtrar enemigos que pueden disparar
-        shooters = [e for e in self.enemies if e.type == "advanced" or random.random() < 0.3]
-        if shooters:
-            return random.choice(shooters)
-        return None
-    
-    def remove_enemy(self, enemy):
-        """Elimina un enemigo"""
-        if enemy in self.enemies:
-            self.enemies.remove(enemy)
-            return enemy.points
-        return 0
-    
-    def damage_boss(self):
-        """Daña al jefe y retorna True si fue derrotado"""
-        if self.boss:
-            is_defeated = self.boss.take_damage()
-            if is_defeated:
-                points = self.boss.points
-                self.boss = None
-                return True, points
-            return False, 0
-        return False, 0
-    
-    def is_empty(self):
-        """Verifica si no quedan enemigos"""
-        if self.boss:
-            return False
-        return len(self.enemies) == 0
-    
-    def reached_bottom(self):
-        """Verifica si algún enemigo llegó al fondo"""
-        if self.boss:
-            return False
-        
-        for enemy in self.enemies:
-            if enemy.y + enemy.height >= SCREEN_HEIGHT - 100:
-                return True
+"""
+Clase de enemigos (invasores espaciales)
+"""
+import pygame
+from config import *
+from game_random import rng
+
+# Las trayectorias de las picadas se calculan con NumPy; sin dive_paths la
+# formación no pica y el resto del nivel sigue igual
+try:
+    from dive_paths import DIVE_TABLES
+except ImportError as e:
+    print(f"dive_paths.py no disponible ({e}): los enemigos no pican.")
+    DIVE_TABLES = ()
+
+# Tablas de colisión al píxel, construidas una vez por sprite, fase de animación
+# y tamaño de bala
+_HIT_TABLES = {}
+
+
+def _hit_table(template, size):
+    """Tabla de colisión de un sprite dibujado por código contra un rectángulo lleno
+
+    template es una copia en (0, 0) con el tipo y la fase de animación a
+    cubrir: se dibuja una sola vez en una superficie transparente del tamaño
+    de su rectángulo de colisión, así la máscara no se aparta del dibujo.
+    La convolución con un rectángulo lleno de tamaño size marca, para cada
+    desplazamiento en el que los dos rectángulos se tocan, si comparten algún
+    píxel; cada consulta es después un solo get_at.
+    """
+    surface = pygame.Surface((template.width, template.height), pygame.SRCALPHA)
+    template.draw(surface)
+    return pygame.mask.from_surface(surface).convolve(pygame.Mask(size, fill=True))
+
+
+def _pixel_hit(sprite_rect, rect, key, template):
+    """Colisión al píxel de rect con un sprite cuyo rectángulo ya se solapa con rect"""
+    if not PIXEL_COLLISIONS:
+        return True
+    x, y, width, height = rect
+    table = _HIT_TABLES.get((key, width, height))
+    if table is None:
+        table = _HIT_TABLES[(key, width, height)] = _hit_table(template(), (width, height))
+    # El bit (i, j) corresponde a rect con su esquina inferior derecha en (i, j)
+    return table.get_at((x - sprite_rect.x + width - 1, y - sprite_rect.y + height - 1)) == 1
+
+
+class Enemy:
+    __slots__ = ("x", "y", "type", "rect", "animation_frame", "alive",
+                 "points", "color", "can_shoot", "home_x", "home_y", "dive", "dive_step")
+    width = ENEMY_WIDTH
+    height = ENEMY_HEIGHT
+
+    def __init__(self, x, y, enemy_type="common"):
+        """Inicializa un enemigo
+        
+        Args:
+            x: posición x
+            y: posición y
+            enemy_type: "common" o "advanced"
+        """
+        self.x = x
+        self.y = y
+        self.type = enemy_type
+        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        self.animation_frame = 0
+        self.alive = True  # False cuando fue destruido y espera la compactación
+        # Picada: índice en DIVE_TABLES (-1 = en la formación), paso actual y
+        # lugar en la formación, que sigue marchando mientras el enemigo pica
+        self.dive = -1
+        self.dive_step = 0
+        self.home_x = x
+        self.home_y = y
+        
+        # Propiedades según tipo
+        if enemy_type == "advanced":
+            self.points = POINTS_ADVANCED_ENEMY
+            self.color = PURPLE
+            self.can_shoot = True
+        else:
+            self.points = POINTS_COMMON_ENEMY
+            self.color = RED
+            self.can_shoot = False
+        
+    def update_rect(self):
+        """Actualiza el rectángulo de colisión en el sitio"""
+        self.rect.x = self.x
+        self.rect.y = self.y
+
+    def start_dive(self, table):
+        """Deja la formación siguiendo DIVE_TABLES[table] desde su lugar actual"""
+        self.home_x = self.x
+        self.home_y = self.y
+        self.dive = table
+        self.dive_step = 0
+
+    def template(self):
+        """Copia en (0, 0) con el tipo y la fase de parpadeo actuales"""
+        template = Enemy(0, 0, self.type)
+        template.animation_frame = self.animation_frame
+        return template
+
+    def touches(self, rect):
+        """Verifica si rect toca un píxel dibujado del enemigo
+
+        Se llama solo después de que self.rect.colliderect(rect) descartó el
+        caso común, así la prueba de rectángulo sigue en línea en los bucles.
+        """
+        key = ("enemy", self.type, self.animation_frame % 20 < 10)
+        return _pixel_hit(self.rect, rect, key, self.template)
+    
+    def draw(self, screen):
+        """Dibuja el enemigo con diseño alienígena"""
+        # Color según tipo
+        color = self.color
+        
+        # Cuerpo principal
+        pygame.draw.rect(screen, color, 
+                        (self.x + 5, self.y + 5, self.width - 10, self.height - 10))
+        
+        # Ojos
+        eye_offset = 2 if self.animation_frame % 20 < 10 else 0
+        pygame.draw.circle(screen, WHITE, 
+                         (self.x + 12, self.y + 12 + eye_offset), 4)
+        pygame.draw.circle(screen, WHITE, 
+                         (self.x + self.width - 12, self.y + 12 + eye_offset), 4)
+        pygame.draw.circle(screen, BLACK, 
+                         (self.x + 12, self.y + 12 + eye_offset), 2)
+        pygame.draw.circle(screen, BLACK, 
+                         (self.x + self.width - 12, self.y + 12 + eye_offset), 2)
+        
+        # Antenas
+        pygame.draw.line(screen, color, 
+                        (self.x + 8, self.y + 5), 
+                        (self.x + 8, self.y), 2)
+        pygame.draw.line(screen, color, 
+                        (self.x + self.width - 8, self.y + 5), 
+                        (self.x + self.width - 8, self.y), 2)
+        pygame.draw.circle(screen, NEON_PINK, (self.x + 8, self.y), 3)
+        pygame.draw.circle(screen, NEON_PINK, (self.x + self.width - 8, self.y), 3)
+        
+        # Indicador de enemigo avanzado
+        if self.type == "advanced":
+            pygame.draw.rect(screen, YELLOW, 
+                           (self.x + self.width // 2 - 3, self.y + self.height - 8, 6, 4))
+
+
+
+class Boss:
+    __slots__ = ("x", "y", "health", "direction", "rect", "animation_frame",
+                 "shoot_timer")
+    width = BOSS_WIDTH
+    height = BOSS_HEIGHT
+    max_health = BOSS_HEALTH
+    speed = BOSS_SPEED
+    points = POINTS_BOSS
+
+    def __init__(self, x, y):
+        """Inicializa el jefe final"""
+        self.x = x
+        self.y = y
+        self.health = BOSS_HEALTH
+        self.direction = 1
+        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        self.animation_frame = 0
+        self.shoot_timer = 0
+        
+    def update(self):
+        """Actualiza la posición del jefe"""
+        self.x += self.speed * self.direction
+        
+        # Cambiar dirección en los bordes
+        if self.x <= 50 or self.x >= SCREEN_WIDTH - self.width - 50:
+            self.direction *= -1
+        
+        self.update_rect()
+        self.animation_frame = (self.animation_frame + 1) % 30
+    
+    def update_rect(self):
+        """Actualiza el rectángulo de colisión en el sitio"""
+        self.rect.x = self.x
+        self.rect.y = self.y
+
+    def template(self):
+        """Copia en (0, 0) con la fase de animación actual"""
+        template = Boss(0, 0)
+        template.animation_frame = self.animation_frame
+        return template
+
+    def touches(self, rect):
+        """Verifica si rect, que ya se solapa con self.rect, toca un píxel dibujado del jefe
+
+        La máscara solo cubre el rectángulo del jefe: entre las antenas y
+        alrededor del cuerpo no hay píxeles, así que esos disparos pasan de largo.
+        """
+        key = ("boss", self.animation_frame % 30 < 15)
+        return _pixel_hit(self.rect, rect, key, self.template)
+    
+    def take_damage(self):
+        """El jefe recibe daño"""
+        self.health -= 1
+        return self.health <= 0
+    
+    def draw(self, screen):
+        """Dibuja el jefe final"""
+        # Cuerpo principal grande
+        pygame.draw.rect(screen, NEON_PINK, 
+                        (self.x + 10, self.y + 10, self.width - 20, self.height - 20))
+        pygame.draw.rect(screen, PURPLE, 
+                        (self.x + 10, self.y + 10, self.width - 20, self.height - 20), 3)
+        
+        # Ojos grandes
+        eye_size = 12
+        eye_offset = 3 if self.animation_frame % 30 < 15 else 0
+        pygame.draw.circle(screen, WHITE, 
+                         (self.x + 40, self.y + 35 + eye_offset), eye_size)
+        pygame.draw.circle(screen, WHITE, 
+                         (self.x + self.width - 40, self.y + 35 + eye_offset), eye_size)
+        pygame.draw.circle(screen, RED, 
+                         (self.x + 40, self.y + 35 + eye_offset), eye_size // 2)
+        pygame.draw.circle(screen, RED, 
+                         (self.x + self.width - 40, self.y + 35 + eye_offset), eye_size // 2)
+        
+        # Antenas múltiples
+        for i in range(3):
+            x_pos = self.x + 30 + i * 45
+            pygame.draw.line(screen, NEON_GREEN, 
+                           (x_pos, self.y + 10), 
+                           (x_pos, self.y - 10), 3)
+            pygame.draw.circle(screen, YELLOW, (x_pos, self.y - 10), 5)
+        
+        # Barra de vida
+        health_bar_width = self.width - 40
+        health_bar_height = 8
+        health_bar_x = self.x + 20
+        health_bar_y = self.y - 20
+        
+        # Fondo de la barra
+        pygame.draw.rect(screen, GRAY, 
+                        (health_bar_x, health_bar_y, health_bar_width, health_bar_height))
+        
+        # Barra de vida actual
+        current_health_width = int((self.health / self.max_health) * health_bar_width)
+        health_color = GREEN if self.health > self.max_health * 0.5 else (YELLOW if self.health > self.max_health * 0.25 else RED)
+        pygame.draw.rect(screen, health_color, 
+                        (health_bar_x, health_bar_y, current_health_width, health_bar_height))
+        
+        # Borde de la barra
+        pygame.draw.rect(screen, WHITE, 
+                        (health_bar_x, health_bar_y, health_bar_width, health_bar_height), 1)
+
+
+class EnemyGroup:
+    def __init__(self, level=1, config=None):
+        """Inicializa un grupo de enemigos
+        
+        Args:
+            level: nivel actual del juego (1-4, u oleada en modo infinito)
+            config: configuración de la oleada; por defecto LEVEL_CONFIG[level]
+        """
+        self.enemies = []
+        self.boss = None
+        self.bounds = pygame.Rect(0, 0, 0, 0)  # Rectángulo que envuelve la formación
+        # Por columna de ENEMY_GRID_CELL px, índices (en orden) de los enemigos que la ocupan
+        self.columns = [[] for _ in range(SCREEN_WIDTH // ENEMY_GRID_CELL + 1)]
+        self.needs_compact = False
+        self.direction = 1  # 1 = derecha, -1 = izquierda
+        self.level = level
+        self.level_config = config or LEVEL_CONFIG.get(level, LEVEL_CONFIG[1])
+        self.speed = self.level_config["enemy_speed"]
+        self.dive_chance = self.level_config.get("dive_chance", 0.0)
+        self.max_divers = self.level_config.get("max_divers", 0)
+        self.diving = 0  # enemigos en picada tras el último update()
+        
+        # Crear formación o jefe según el nivel
+        if self.level_config.get("boss_fight", False):
+            self.create_boss()
+        else:
+            self.create_formation()
+        
+    def create_formation(self):
+        """Crea la formación de enemigos según el nivel"""
+        self.enemies = []
+        rows = self.level_config["rows"]
+        cols = self.level_config["cols"]
+        advanced_chance = self.level_config["advanced_enemy_chance"]
+        
+        start_x = 100
+        start_y = 80
+        spacing_x = 60
+        spacing_y = 50
+        
+        for row in range(rows):
+            for col in range(cols):
+                x = start_x + col * spacing_x
+                y = start_y + row * spacing_y
+                
+                # Determinar tipo de enemigo
+                enemy_type = "advanced" if rng.random() < advanced_chance else "common"
+                
+                enemy = Enemy(x, y, enemy_type)
+                self.enemies.append(enemy)
+        self.update_bounds()
+    
+    def create_boss(self):
+        """Crea el jefe final"""
+        boss_x = SCREEN_WIDTH // 2 - BOSS_WIDTH // 2
+        boss_y = 100
+        self.boss = Boss(boss_x, boss_y)
+    
+    def update(self):
+        """Actualiza la posición de todos los enemigos o del jefe"""
+        if self.boss:
+            self.boss.update()
+            return
+        
+        # Verificar si algún enemigo toca el borde (los que pican, por su lugar)
+        should_drop = False
+        for enemy in self.enemies:
+            x = enemy.x if enemy.dive < 0 else enemy.home_x
+            if x <= 0 or x >= SCREEN_WIDTH - enemy.width:
+                should_drop = True
+                break
+        
+        if should_drop:
+            self.direction *= -1
+            for enemy in self.enemies:
+                if enemy.dive < 0:
+                    enemy.y += ENEMY_DROP_DISTANCE
+                else:
+                    enemy.home_y += ENEMY_DROP_DISTANCE
+        
+        # Mover todos los enemigos; los que pican leen su tabla desde su lugar
+        step = self.speed * self.direction
+        diving = 0
+        for enemy in self.enemies:
+            if enemy.dive < 0:
+                enemy.x += step
+            else:
+                enemy.home_x += step
+                xs, ys = DIVE_TABLES[enemy.dive]
+                i = enemy.dive_step
+                enemy.x = enemy.home_x + xs[i]
+                enemy.y = enemy.home_y + ys[i]
+                i += 1
+                if i == len(xs):
+                    enemy.dive = -1  # la tabla termina en (0, 0): ya está en su lugar
+                else:
+                    enemy.dive_step = i
+                    diving += 1
+            enemy.update_rect()
+            # El parpadeo avanza acá y no al dibujar, así la máscara de colisión
+            # de este frame es la misma que se dibuja (también en headless)
+            enemy.animation_frame = (enemy.animation_frame + 1) % 20
+        self.diving = diving
+        if diving < self.max_divers and rng.random() < self.dive_chance:
+            self.launch_dive()
+        self.update_bounds()
+
+    def launch_dive(self):
+        """Manda a picar a un enemigo al azar de los que están en la formación
+
+        Los de la mitad izquierda usan la trayectoria reflejada, así siempre
+        se abren hacia su lado.
+        """
+        candidates = [enemy for enemy in self.enemies if enemy.alive and enemy.dive < 0]
+        if not candidates or not DIVE_TABLES:
+            return None
+        enemy = rng.choice(candidates)
+        mirrored = enemy.x + enemy.width / 2 < self.bounds.centerx
+        enemy.start_dive(rng.randrange(len(DIVE_PATHS)) * 2 + mirrored)
+        self.diving += 1
+        return enemy
+    
+    def update_bounds(self):
+        """Recalcula el rectángulo que envuelve la formación y las columnas
+
+        Se llama cada vez que los enemigos se mueven o cambia la lista, así
+        los índices de self.columns siempre apuntan a self.enemies.
+        """
+        columns = self.columns
+        for column in columns:
+            column.clear()
+        last = len(columns) - 1
+        for i, enemy in enumerate(self.enemies):
+            rect = enemy.rect
+            first = min(max(rect.left // ENEMY_GRID_CELL, 0), last)
+            end = min(max((rect.right - 1) // ENEMY_GRID_CELL, 0), last)
+            for col in range(first, end + 1):
+                columns[col].append(i)
+        if self.enemies:
+            self.bounds = self.enemies[0].rect.unionall([e.rect for e in self.enemies])
+        else:
+            self.bounds = pygame.Rect(0, 0, 0, 0)
+    
+    def find_hit(self, rect):
+        """Retorna el primer enemigo vivo que colisiona con rect, o None
+        
+        Descarta primero contra el rectángulo de la formación y después solo
+        recorre las columnas que rect cruza, así cada bala mira unos pocos
+        enemigos y no la formación entera. La tabla de la máscara solo se
+        consulta ante un solapamiento de rectángulos.
+        """
+        if not self.bounds.colliderect(rect):
+            return None
+        columns = self.columns
+        last = len(columns) - 1
+        first = min(max(rect.left // ENEMY_GRID_CELL, 0), last)
+        end = min(max((rect.right - 1) // ENEMY_GRID_CELL, 0), last)
+        enemies = self.enemies
+        # Si rect cruza dos columnas gana el de menor índice, como al recorrer la lista
+        best = -1
+        for col in range(first, end + 1):
+            for i in columns[col]:
+                if best >= 0 and i >= best:
+                    break
+                enemy = enemies[i]
+                if enemy.alive and enemy.rect.colliderect(rect) and enemy.touches(rect):
+                    best = i
+                    break
+        return enemies[best] if best >= 0 else None
+
+    def draw(self, screen):
+        """Dibuja todos los enemigos o el jefe"""
+        if self.boss:
+            self.boss.draw(screen)
+        else:
+            for enemy in self.enemies:
+                enemy.draw(screen)
+    
+    def get_random_shooter(self):
+        """Retorna un enemigo aleatorio para disparar"""
+        if self.boss:
+            return self.boss
+        
+        # Filtrar enemigos que pueden disparar
+        shooters = [e for e in self.enemies if e.type == "advanced" or rng.random() < 0.3]
+        if shooters:
+            return rng.choice(shooters)
+        return None
+    
+    def remove_enemy(self, enemy):
+        """Marca un enemigo como destruido y retorna sus puntos
+        
+        La lista no se modifica aquí: compact() la limpia en una sola pasada.
+        """
+        if not enemy.alive:
+            return 0
+        enemy.alive = False
+        self.needs_compact = True
+        return enemy.points
+    
+    def compact(self):
+        """Quita de la lista, en una sola pasada, los enemigos destruidos"""
+        if not self.needs_compact:
+            return
+        enemies = self.enemies
+        write = 0
+        for enemy in enemies:
+            if enemy.alive:
+                enemies[write] = enemy
+                write += 1
+        del enemies[write:]
+        self.needs_compact = False
+        self.update_bounds()
+    
+    def damage_boss(self):
+        """Daña al jefe y retorna True si fue derrotado"""
+        if self.boss:
+            is_defeated = self.boss.take_damage()
+            if is_defeated:
+                points = self.boss.points
+                self.boss = None
+                return True, points
+            return False, 0
+        return False, 0
+    
+    def is_empty(self):
+        """Verifica si no quedan enemigos"""
+        if self.boss:
+            return False
+        return len(self.enemies) == 0
+    
+    def reached_bottom(self):
+        """Verifica si algún enemigo llegó al fondo"""
+        if self.boss:
+            return False
+        
+        for enemy in self.enemies:
+            # Una picada no es una invasión: cuenta el lugar en la formación
+            y = enemy.y if enemy.dive < 0 else enemy.home_y
+            if y + enemy.height >= SCREEN_HEIGHT - 100:
+                return True
         return False
\ No newline at end of file
@@ -0,0 +1,198 @@
+"""
+Entorno estilo Gym sobre la lógica real del juego
+
+Envuelve un Game sin ventana, audio ni cámara (headless) con reloj de paso
+fijo. Cada step() ejecuta Game.update_playing con la acción del agente como
+fuente de entrada, igual que el piloto automático. Con la misma semilla y las
+mismas acciones el episodio es idéntico.
+
+    env = SpaceInvadersEnv(seed=0)
+    obs, info = env.reset()
+    obs, reward, terminated, truncated, info = env.step(action)
+
+La observación por defecto es el vector simbólico; con obs_type="pixels" o
+"gray" es el frame dibujado, reducido frame_scale veces por promedio de área.
+"""
+import os
+
+# Sin ventana ni audio: debe fijarse antes de importar pygame
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+from config import *
+from game_random import CountingRandom, rng
+from capabilities import NullParticleSystem
+from observation import OBS_SIZE, FrameObserver, symbolic_observation
+
+# Acciones discretas: (dirección, disparar)
+ACTIONS = (
+    (0, False),  # 0: quieto
+    (-1, False),  # 1: izquierda
+    (1, False),  # 2: derecha
+    (0, True),  # 3: disparar
+    (-1, True),  # 4: izquierda y disparar
+    (1, True),  # 5: derecha y disparar
+)
+
+
+OBS_TYPES = ("symbolic", "pixels", "gray")
+
+
+def observation_spec(obs_type="symbolic", frame_scale=OBS_FRAME_SCALE):
+    """Forma y tipo de la observación, sin crear el juego
+
+    Returns:
+        tuple: (forma, dtype de NumPy)
+    """
+    if obs_type == "symbolic":
+        return (OBS_SIZE,), np.float32
+    if obs_type not in OBS_TYPES:
+        raise ValueError(f"obs_type desconocido: {obs_type!r} (opciones: {OBS_TYPES})")
+    shape = (SCREEN_HEIGHT // frame_scale, SCREEN_WIDTH // frame_scale)
+    return (shape if obs_type == "gray" else shape + (3,)), np.uint8
+
+
+class ActionInput:
+    """Fuente de entrada con la interfaz de Autopilot que devuelve la acción del agente"""
+
+    def __init__(self):
+        self.action = 0
+
+    def decide(self, player, game):
+        return ACTIONS[self.action]
+
+
+class SpaceInvadersEnv:
+    num_actions = len(ACTIONS)
+
+    def __init__(self, seed=None, endless=True, max_steps=ENV_MAX_STEPS,
+                 frame_skip=ENV_FRAME_SKIP, particles=False, obs_type="symbolic",
+                 frame_scale=OBS_FRAME_SCALE):
+        """Crea el juego sin ventana
+
+        Args:
+            seed: semilla del episodio (None = aleatoria)
+            endless: oleadas infinitas (False = campaña de 4 niveles)
+            max_steps: pasos antes de truncar el episodio
+            frame_skip: frames de juego por paso
+            particles: simular partículas (solo hacen falta para dibujar)
+            obs_type: "symbolic", "pixels" (RGB) o "gray"
+            frame_scale: reducción de las observaciones en píxeles
+        """
+        self.observation_shape, self.observation_dtype = observation_spec(obs_type, frame_scale)
+        from game import Game
+        self.game = Game(headless=True)
+        self.game.endless = endless
+        self.input = ActionInput()
+        # El agente entra por el mismo punto que el piloto automático
+        self.game.autopilot = self.input
+        if not particles:
+            self.game.particles = NullParticleSystem()
+
+        self.max_steps = max_steps
+        self.frame_skip = frame_skip
+        self.steps = 0
+        self.obs_type = obs_type
+        self.observation = np.zeros(OBS_SIZE, dtype=np.float32)
+        self.frames = None
+        if obs_type != "symbolic":
+            self.frames = FrameObserver(self.game, frame_scale, grayscale=obs_type == "gray")
+        # Estado aleatorio propio: varios entornos en un proceso no se mezclan
+        self._random_state = CountingRandom(seed).getstate()
+        self._outer_state = None
+
+    # El juego usa un generador compartido (game_random.rng); cada entorno lo
+    # sustituye por su propio estado mientras simula
+    def _enter(self):
+        self._outer_state = rng.getstate()
+        rng.setstate(self._random_state)
+
+    def _exit(self):
+        self._random_state = rng.getstate()
+        rng.setstate(self._outer_state)
+
+    def _finish_transition(self):
+        """Construye la oleada siguiente sin esperar la pantalla de transición"""
+        game = self.game
+        game.level_transition_start = game.ticks() - game.LEVEL_TRANSITION_MS - 1
+        game.update_level_transition()
+
+    def _lives(self):
+        return sum(player.lives for player in self.game.players)
+
+    def _info(self):
+        game = self.game
+        return {"score": game.score, "wave": game.current_level, "lives": self._lives(),
+                "steps": self.steps}
+
+    def _observe(self):
+        """Observación del estado actual (buffer reutilizado en cada paso)"""
+        if self.frames is not None:
+            self.observation = self.frames.render()
+            return self.observation
+        return symbolic_observation(self.game, out=self.observation)
+
+    def reset(self, seed=None):
+        """Empieza un episodio nuevo
+
+        Returns:
+            tuple: (observación, info)
+        """
+        if seed is not None:
+            self._random_state = CountingRandom(seed).getstate()
+        game = self.game
+        self._enter()
+        try:
+            game.use_fixed_step(start_ms=0)
+            game.coop = False
+            game.start_run()
+            self._finish_transition()
+        finally:
+            self._exit()
+        self.steps = 0
+        return self._observe(), self._info()
+
+    def step(self, action):
+        """Aplica una acción durante frame_skip frames
+
+        Returns:
+            tuple: (observación, recompensa, terminado, truncado, info)
+        """
+        game = self.game
+        self.input.action = int(action)
+        reward = 0.0
+        terminated = False
+        self._enter()
+        try:
+            for _ in range(self.frame_skip):
+                score = game.score
+                lives = self._lives()
+                game.update_playing()
+                game.sim_time_ms += game.fixed_step_ms
+
+                reward += (game.score - score) * ENV_REWARD_PER_POINT
+                reward -= max(lives - self._lives(), 0) * ENV_LIFE_PENALTY
+                if game.state == STATE_LEVEL_TRANSITION:
+                    reward += ENV_WAVE_BONUS
+                    self._finish_transition()
+                if game.state == STATE_GAME_OVER:
+                    terminated = True
+                    break
+        finally:
+            self._exit()
+
+        self.steps += 1
+        truncated = not terminated and self.steps >= self.max_steps
+        return self._observe(), reward, terminated, truncated, self._info()
+
+    def close(self):
+        """Libera los recursos de este entorno
+
+        pygame queda inicializado: otros entornos del mismo proceso lo comparten.
+        """
+        if self.game is None:
+            return
+        self.game.close()
+        self.game = None
+        self.frames = None
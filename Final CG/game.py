@@ -1,827 +1,1093 @@
-"""
-game.py - Lógica principal del juego Space Invaders 
-
-"""
-import pygame
-import random
-import sys
-import traceback
-from config import *
-
-# Importar módulos del proyecto (algunos pueden no existir; se controlan con try/except)
-try:
-    from player import Player
-except Exception:
-    Player = None
-
-try:
-    from enemy import EnemyGroup
-except Exception:
-    EnemyGroup = None
-
-try:
-    from bullet import Bullet
-except Exception:
-    Bullet = None
-
-try:
-    from powerup import PowerUpManager
-except Exception:
-    PowerUpManager = None
-
-try:
-    from hand_detector import HandDetector
-except Exception:
-    HandDetector = None
-
-try:
-    from sound_generator import SoundGenerator
-except Exception:
-    SoundGenerator = None
-
-
-class Game:
-    LEVEL_TRANSITION_MS = 1800  # Duración de la transición entre niveles
-
-    def __init__(self):
-        pygame.init()
-        # Mixer puede fallar en algunos entornos; envolver en try
-        try:
-            pygame.mixer.init()
-        except Exception:
-            print("Advertencia: pygame.mixer no pudo inicializarse (audio deshabilitado).")
-
-        # Ventana y reloj
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Space Invaders - Control por Visión")
-        self.clock = pygame.time.Clock()
-
-        # Estados del juego
-        self.state = STATE_SPLASH
-        self.running = True
-        self.paused = False
-        self.audio_enabled = AUDIO_ENABLED
-
-        # Fuentes
-        self.title_font = pygame.font.Font(None, 72)
-        self.menu_font = pygame.font.Font(None, 48)
-        self.hud_font = pygame.font.Font(None, 32)
-        self.small_font = pygame.font.Font(None, 20)
-
-        # Detector de manos
-        if HandDetector:
-            try:
-                self.hand_detector = HandDetector()
-            except Exception:
-                print("hand_detector.py cargado pero produjo error al inicializar. Usando control por teclado.")
-                self.hand_detector = None
-        else:
-            self.hand_detector = None
-            print("hand_detector.py no encontrado: control por teclado habilitado.")
-
-        # Sonidos 
-        if SoundGenerator:
-            try:
-                self.sound_generator = SoundGenerator()
-            except Exception:
-                print("sound_generator.py presente pero error al inicializar; sonidos deshabilitados.")
-                self.sound_generator = None
-        else:
-            self.sound_generator = None
-
-        # Inicializar sonidos
-        self._create_sounds()
-
-        # Manager de power-ups
-        self.powerup_manager = PowerUpManager() if PowerUpManager else None
-        if not self.powerup_manager:
-            print("powerup.py no encontrado: power-ups deshabilitados.")
-
-        # Variables del juego (se inicializan con init_game)
-        self.player = None
-        self.enemies = None
-        self.player_bullets = []
-        self.enemy_bullets = []
-        self.score = 0
-        self.current_level = 1
-        self.level_transition_start = None
-        self.game_over_timer = None
-        self.last_shot_time = 0
-        self.last_enemy_shot_time = 0
-        self.prev_hand_closed = False
-
-        # Música de fondo 
-        self.background_music = None
-        self.music_playing = False
-
-        # Start music if possible
-        self.start_background_music()
-
-    # -----------------------
-    # Sonidos 
-    # -----------------------
-    def _create_sounds(self):
-        
-        self.shoot_sound = None
-        self.explosion_sound = None
-        self.hit_sound = None
-        self.victory_sound = None
-        self.game_over_sound = None
-        self.background_music = None
-
-        if not self.sound_generator:
-            return
-
-        try:
-            self.shoot_sound = self.sound_generator.generate_shoot_sound()
-            self.explosion_sound = self.sound_generator.generate_explosion_sound()
-            self.hit_sound = self.sound_generator.generate_hit_sound()
-            self.victory_sound = self.sound_generator.generate_victory_sound()
-            self.game_over_sound = self.sound_generator.generate_game_over_sound()
-            self.background_music = self.sound_generator.generate_background_music()
-            if self.background_music:
-                try:
-                    self.background_music.set_volume(0.25)
-                except Exception:
-                    pass
-        except Exception as e:
-            print("Error al crear sonidos:", e)
-            traceback.print_exc()
-
-    def toggle_audio(self):
-        self.audio_enabled = not self.audio_enabled
-        if not self.audio_enabled:
-            try:
-                pygame.mixer.stop()
-            except Exception:
-                pass
-            self.music_playing = False
-        else:
-            self.start_background_music()
-
-    def start_background_music(self):
-        if self.audio_enabled and self.background_music and not self.music_playing:
-            try:
-                self.background_music.play(loops=-1)
-                self.music_playing = True
-            except Exception:
-                pass
-
-    def play_sound(self, sound):
-        if self.audio_enabled and sound:
-            try:
-                sound.play()
-            except Exception:
-                pass
-
-    # -----------------------
-    # Inicialización y niveles
-    # -----------------------
-    def init_game(self, level=1, reset_score=False):
-        """Inicia o reinicia la partida en el nivel indicado."""
-        # Mantener score si no se quiere reiniciar
-        if reset_score:
-            self.score = 0
-
-        # Crear jugador
-        if Player:
-            self.player = Player(SCREEN_WIDTH // 2 - PLAYER_WIDTH // 2,
-                                 SCREEN_HEIGHT - 80)
-            # atributo runtime para doble disparo (se puede crear dinámicamente)
-            self.player.double_shot_until = 0
-        else:
-            self.player = None
-            print("player.py no disponible: el juego no funcionará correctamente.")
-
-        # Crear enemigos con configuración del nivel
-        if EnemyGroup:
-            # EnemyGroup acepta parámetro level en su constructor en tu enemy.py
-            try:
-                self.enemies = EnemyGroup(level=level)
-            except TypeError:
-                # si el constructor tenia otra firma, intentar sin argumentos
-                self.enemies = EnemyGroup()
-        else:
-            self.enemies = None
-            print("enemy.py no encontrado: no habrá enemigos.")
-
-        # Reset balas y power-ups
-        self.player_bullets = []
-        self.enemy_bullets = []
-        if self.powerup_manager:
-            try:
-                self.powerup_manager.clear()
-            except Exception:
-                pass
-
-        self.current_level = level
-        self.level_transition_start = None
-        self.game_over_timer = None
-        self.last_shot_time = 0
-        self.last_enemy_shot_time = 0
-        self.prev_hand_closed = False
-
-    # -----------------------
-    # Eventos
-    # -----------------------
-    def handle_events(self):
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-
-            # Navegar entre estados
-            if self.state == STATE_SPLASH:
-                if event.type == pygame.KEYDOWN:
-                    self.state = STATE_MENU
-                    self.start_background_music()
-
-            elif self.state == STATE_MENU:
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    self.handle_menu_click(event.pos)
-
-            elif self.state == STATE_INSTRUCTIONS:
-                if event.type == pygame.KEYDOWN or event.type == pygame.MOUSEBUTTONDOWN:
-                    self.state = STATE_MENU
-
-            elif self.state == STATE_PLAYING:
-                # Pausa
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_p:
-                        self.paused = not self.paused
-                    elif event.key == pygame.K_SPACE:
-                        # disparo por teclado
-                        self._player_shoot_by_input()
-                    elif event.key == pygame.K_m:
-                        self.toggle_audio()
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    # permitir click para disparar si se desea
-                    if event.button == 1:  # botón izquierdo
-                        self._player_shoot_by_input()
-
-    def handle_menu_click(self, pos):
-        x, y = pos
-        # Jugar
-        if 250 <= x <= 550 and 200 <= y <= 260:
-            # iniciar nivel 1
-            self.init_game(level=1, reset_score=True)
-            # pasar a transición para que el jugador vea mensaje
-            self.state = STATE_LEVEL_TRANSITION
-            self.level_transition_start = pygame.time.get_ticks()
-        # Instrucciones
-        elif 250 <= x <= 550 and 290 <= y <= 350:
-            self.state = STATE_INSTRUCTIONS
-        # Salir
-        elif 250 <= x <= 550 and 380 <= y <= 440:
-            self.running = False
-        # Mute/Unmute
-        elif SCREEN_WIDTH - 120 <= x <= SCREEN_WIDTH - 20 and 20 <= y <= 70:
-            self.toggle_audio()
-
-    # -----------------------
-    # Lógica principal por estado
-    # -----------------------
-    def update_splash(self):
-        self.splash_timer = getattr(self, "splash_timer", 0) + 1
-        if self.splash_timer > FPS * 3:  # 3 segundos
-            self.state = STATE_MENU
-            self.start_background_music()
-
-    def update_level_transition(self):
-        """Gestiona la pantalla de transición entre niveles."""
-        if not self.level_transition_start:
-            self.level_transition_start = pygame.time.get_ticks()
-        now = pygame.time.get_ticks()
-        if now - self.level_transition_start > self.LEVEL_TRANSITION_MS:
-            # Iniciar el nivel (current_level ya fue incrementado por update_playing cuando terminó anterior)
-            # Si se empieza desde menú, current_level debería estar en 1
-            self.init_game(level=self.current_level, reset_score=False)
-            self.state = STATE_PLAYING
-
-    def update_playing(self):
-        """Lógica principal del juego cuando se está jugando."""
-        if self.paused:
-            return  # no actualizar nada si está en pausa
-
-        now = pygame.time.get_ticks()
-
-        # Asegurar música
-        self.start_background_music()
-
-        # Actualizar estado del jugador (timers internos si aplica)
-        if self.player:
-            try:
-                self.player.update(now)
-            except Exception:
-                # player.update puede no existir; ignorar si falla
-                pass
-
-        # Detección de manos (si aplica)
-        hand_x = 0.5
-        hand_closed = False
-        if self.hand_detector:
-            try:
-                frame = self.hand_detector.update()
-                hand_x = self.hand_detector.get_position()
-                hand_closed = self.hand_detector.is_hand_closed()
-            except Exception:
-                hand_x = 0.5
-                hand_closed = False
-
-        # Control del jugador
-        if self.player:
-            if CONTROL_MODE == "vision" and self.hand_detector:
-                try:
-                    self.player.set_position_normalized(hand_x)
-                except Exception:
-                    pass
-            else:
-                # control por teclado
-                keys = pygame.key.get_pressed()
-                if keys[pygame.K_LEFT]:
-                    self.player.move_left()
-                if keys[pygame.K_RIGHT]:
-                    self.player.move_right()
-
-        # Disparo por gesto (mano cerrada) - gestionar debounce
-        if hand_closed and not self.prev_hand_closed:
-            if now - self.last_shot_time > 300:
-                self._player_shoot_by_input()
-                self.last_shot_time = now
-        self.prev_hand_closed = hand_closed
-
-        # Actualizar enemigos
-        if self.enemies:
-            try:
-                self.enemies.update()
-            except Exception:
-                pass
-
-        # Enemigos disparan según configuración de nivel
-        lvl_cfg = LEVEL_CONFIG.get(self.current_level, LEVEL_CONFIG[1])
-        enemy_shoot_interval = lvl_cfg.get("enemy_shoot_interval", 1200)
-        enemy_shoot_chance = lvl_cfg.get("enemy_shoot_chance", 0.2)
-        if now - self.last_enemy_shot_time > enemy_shoot_interval:
-            self.last_enemy_shot_time = now
-            if self.enemies:
-                try:
-                    shooter = self.enemies.get_random_shooter()
-                except Exception:
-                    shooter = None
-                if shooter and random.random() < enemy_shoot_chance:
-                    # Shooter puede ser Boss o Enemy
-                    sx = shooter.x + getattr(shooter, "width", BULLET_WIDTH) // 2
-                    sy = shooter.y + getattr(shooter, "height", BULLET_HEIGHT)
-                    # Crear bala enemiga (direccion -1 hacia abajo en tu Bullet)
-                    if Bullet:
-                        try:
-                            b = Bullet(sx, sy, -1)
-                            self.enemy_bullets.append(b)
-                        except Exception:
-                            # fallback sencillo
-                            pass
-
-        # Actualizar balas del jugador
-        for bullet in self.player_bullets[:]:
-            try:
-                bullet.update()
-            except Exception:
-                # fallback: mover hacia arriba
-                bullet.y -= BULLET_SPEED
-                bullet.rect = pygame.Rect(bullet.x, bullet.y, bullet.width, bullet.height)
-
-            if bullet.is_off_screen():
-                if bullet in self.player_bullets:
-                    self.player_bullets.remove(bullet)
-                continue
-
-            # Colisión con enemigos o jefe
-            if self.enemies:
-                # Si hay un boss
-                if getattr(self.enemies, "boss", None):
-                    boss = self.enemies.boss
-                    if bullet.rect.colliderect(boss.rect):
-                        # daño al boss
-                        try:
-                            defeated, pts = self.enemies.damage_boss()
-                        except Exception:
-                            defeated, pts = (boss.take_damage(), getattr(boss, "points", POINTS_BOSS))
-                            if defeated:
-                                # eliminar boss
-                                try:
-                                    self.enemies.boss = None
-                                except Exception:
-                                    pass
-                        # sumar puntos si se devolvieron
-                        try:
-                            self.score += pts
-                        except Exception:
-                            self.score += POINTS_BOSS
-                        if bullet in self.player_bullets:
-                            self.player_bullets.remove(bullet)
-                        self.play_sound(self.explosion_sound)
-                        # posible drop
-                        if self.powerup_manager and random.random() < POWERUP_DROP_CHANCE:
-                            try:
-                                self.powerup_manager.spawn_powerup(bullet.x, bullet.y)
-                            except Exception:
-                                pass
-                        # si boss derrotado, desencadenar transición/fin
-                        if defeated:
-                            # si quedan más niveles
-                            if self.current_level < max(LEVEL_CONFIG.keys()):
-                                self.current_level += 1
-                                self.state = STATE_LEVEL_TRANSITION
-                                self.level_transition_start = pygame.time.get_ticks()
-                            else:
-                                self.state = STATE_GAME_OVER
-                                self.game_over_timer = pygame.time.get_ticks()
-                                self.play_sound(self.victory_sound)
-                        continue  # seguir con siguientes balas
-
-                # Colisión con enemigos normales
-                for enemy in list(getattr(self.enemies, "enemies", [])):
-                    try:
-                        if bullet.rect.colliderect(enemy.rect):
-                            # Remover bala y enemigo, sumar puntos según enemy.remove_enemy
-                            if bullet in self.player_bullets:
-                                self.player_bullets.remove(bullet)
-                            try:
-                                pts = self.enemies.remove_enemy(enemy)
-                                # enemy.remove_enemy en tu enemy.py devuelve puntos (enemy.points)
-                                self.score += pts if pts else 0
-                            except Exception:
-                                # fallback: quitar de la lista directamente
-                                try:
-                                    self.enemies.enemies.remove(enemy)
-                                except Exception:
-                                    pass
-                                # añadir puntos según tipo
-                                etype = getattr(enemy, "type", "common")
-                                if etype == "advanced":
-                                    self.score += POINTS_ADVANCED_ENEMY
-                                else:
-                                    self.score += POINTS_COMMON_ENEMY
-                            self.play_sound(self.explosion_sound)
-                            # spawn powerup
-                            if self.powerup_manager and random.random() < POWERUP_DROP_CHANCE:
-                                try:
-                                    self.powerup_manager.spawn_powerup(enemy.x, enemy.y)
-                                except Exception:
-                                    pass
-                            break
-                    except Exception:
-                        continue
-
-        # Actualizar balas enemigas
-        for bullet in self.enemy_bullets[:]:
-            try:
-                bullet.update()
-            except Exception:
-                bullet.y += ENEMY_BULLET_SPEED
-                bullet.rect = pygame.Rect(bullet.x, bullet.y, bullet.width, bullet.height)
-
-            if bullet.is_off_screen():
-                if bullet in self.enemy_bullets:
-                    self.enemy_bullets.remove(bullet)
-                continue
-
-            # Colisión con el jugador
-            if self.player and bullet.rect.colliderect(self.player.rect):
-                if bullet in self.enemy_bullets:
-                    self.enemy_bullets.remove(bullet)
-                died = self.player.hit()
-                self.play_sound(self.hit_sound)
-                if died:
-                    self.state = STATE_GAME_OVER
-                    self.game_over_timer = pygame.time.get_ticks()
-                    self.play_sound(self.game_over_sound)
-
-        # Actualizar power-ups: caída y colisiones
-        if self.powerup_manager:
-            try:
-                self.powerup_manager.update(now)
-                powerup_type, collected = self.powerup_manager.check_collision(self.player.rect if self.player else pygame.Rect(0,0,0,0), now)
-                if powerup_type:
-                    # aplicar efecto
-                    if powerup_type == POWERUP_EXTRA_LIFE:
-                        if self.player:
-                            self.player.add_life()
-                    elif powerup_type == POWERUP_SHIELD:
-                        if self.player:
-                            self.player.activate_shield()
-                    elif powerup_type == POWERUP_DOUBLE_SHOT:
-                        if self.player:
-                            self.player.double_shot_until = now + POWERUP_DURATION
-                    # reproducir sonido de recogida
-                    self.play_sound(self.explosion_sound)
-            except Exception:
-                pass
-
-        # Verificar condiciones de fin de nivel o derrota
-        if self.enemies:
-            try:
-                if self.enemies.reached_bottom():
-                    # derrota inmediata
-                    self.state = STATE_GAME_OVER
-                    self.game_over_timer = pygame.time.get_ticks()
-                    self.play_sound(self.game_over_sound)
-                elif self.enemies.is_empty():
-                    # nivel completado
-                    if self.current_level < max(LEVEL_CONFIG.keys()):
-                        self.current_level += 1
-                        self.state = STATE_LEVEL_TRANSITION
-                        self.level_transition_start = pygame.time.get_ticks()
-                        self.play_sound(self.victory_sound)
-                    else:
-                        # completó todos los niveles
-                        self.state = STATE_GAME_OVER
-                        self.game_over_timer = pygame.time.get_ticks()
-                        self.play_sound(self.victory_sound)
-            except Exception:
-                pass
-
-    # -----------------------
-    # Disparo del jugador 
-    # -----------------------
-    def _player_shoot_by_input(self):
-        """Crea balas según estado (doble disparo si está activo)"""
-        if not self.player or not Bullet:
-            return
-
-        now = pygame.time.get_ticks()
-        # cooldown simple
-        if now - self.last_shot_time < 150:
-            return
-        self.last_shot_time = now
-
-        double_active = getattr(self.player, "double_shot_until", 0) > now
-        if double_active:
-            # dos balas con ligero offset
-            left_x = self.player.x + 8
-            right_x = self.player.x + self.player.width - 8
-            try:
-                b1 = Bullet(left_x, self.player.y, 1)
-                b2 = Bullet(right_x, self.player.y, 1)
-                self.player_bullets.append(b1)
-                self.player_bullets.append(b2)
-            except Exception:
-                # fallback: un único disparo
-                b = Bullet(self.player.x + self.player.width // 2, self.player.y, 1)
-                self.player_bullets.append(b)
-        else:
-            b = Bullet(self.player.x + self.player.width // 2, self.player.y, 1)
-            self.player_bullets.append(b)
-
-        self.play_sound(self.shoot_sound)
-
-    # -----------------------
-    # Dibujado por estado
-    # -----------------------
-    def draw_audio_button(self):
-        button_rect = pygame.Rect(SCREEN_WIDTH - 120, 20, 100, 50)
-        if self.audio_enabled:
-            color = NEON_GREEN
-            text = "🔊 ON"
-        else:
-            color = RED
-            text = "🔇 OFF"
-        mouse_pos = pygame.mouse.get_pos()
-        if button_rect.collidepoint(mouse_pos):
-            pygame.draw.rect(self.screen, color, button_rect)
-            pygame.draw.rect(self.screen, WHITE, button_rect, 3)
-        else:
-            pygame.draw.rect(self.screen, color, button_rect, 2)
-        text_surface = self.small_font.render(text, True, WHITE)
-        text_rect = text_surface.get_rect(center=button_rect.center)
-        self.screen.blit(text_surface, text_rect)
-
-    def draw_splash(self):
-        self.screen.fill(DARK_BLUE)
-        self.splash_timer = getattr(self, "splash_timer", 0)
-        # simple starfield
-        for i in range(40):
-            x = (i * 137) % SCREEN_WIDTH
-            y = (i * 219 + (self.splash_timer * 3)) % SCREEN_HEIGHT
-            pygame.draw.circle(self.screen, WHITE, (x, y), (i % 3) + 1)
-        title = self.title_font.render("SPACE INVADERS", True, NEON_GREEN)
-        self.screen.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, 160)))
-        sub = self.menu_font.render("Control por Visión", True, YELLOW)
-        self.screen.blit(sub, sub.get_rect(center=(SCREEN_WIDTH // 2, 240)))
-        if (self.splash_timer // 30) % 2 == 0:
-            press = self.small_font.render("Presiona cualquier tecla", True, WHITE)
-            self.screen.blit(press, press.get_rect(center=(SCREEN_WIDTH // 2, 420)))
-        self.splash_timer += 1
-
-    def draw_menu(self):
-        self.screen.fill(DARK_BLUE)
-        title_surface = self.title_font.render("SPACE INVADERS", True, NEON_GREEN)
-        self.screen.blit(title_surface, title_surface.get_rect(center=(SCREEN_WIDTH // 2, 100)))
-        # botones
-        mouse_pos = pygame.mouse.get_pos()
-        buttons = [("JUGAR", 230), ("INSTRUCCIONES", 320), ("SALIR", 410)]
-        for text, y in buttons:
-            rect = pygame.Rect(250, y, 300, 60)
-            if rect.collidepoint(mouse_pos):
-                pygame.draw.rect(self.screen, NEON_PINK, rect)
-                pygame.draw.rect(self.screen, WHITE, rect, 3)
-            else:
-                pygame.draw.rect(self.screen, BLUE, rect)
-                pygame.draw.rect(self.screen, CYAN, rect, 2)
-            surf = self.menu_font.render(text, True, WHITE)
-            self.screen.blit(surf, surf.get_rect(center=rect.center))
-        # audio button and hint
-        self.draw_audio_button()
-        hint = self.small_font.render("Presiona M o clic arriba para silenciar", True, GRAY)
-        self.screen.blit(hint, hint.get_rect(center=(SCREEN_WIDTH // 2, 560)))
-
-    def draw_instructions(self):
-        self.screen.fill(DARK_BLUE)
-        title = self.menu_font.render("INSTRUCCIONES", True, NEON_GREEN)
-        self.screen.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, 50)))
-        lines = [
-            "OBJETIVO:",
-            "Destruye todos los invasores antes de que lleguen al fondo",
-            "",
-            "CONTROLES:",
-            "- Mueve tu mano para mover la nave (modo visión)",
-            "- Cierra el puño para disparar",
-            "- También puedes usar las FLECHAS y ESPACIO",
-            "- Presiona P para pausar",
-            "- Presiona M para silenciar",
-            "",
-            "PUNTUACIÓN:",
-            f"- Enemigo común: {POINTS_COMMON_ENEMY} pts",
-            f"- Enemigo avanzado: {POINTS_ADVANCED_ENEMY} pts",
-            f"- Jefe: {POINTS_BOSS} pts",
-            f"- Vidas iniciales: {PLAYER_LIVES}"
-        ]
-        y = 120
-        for line in lines:
-            color = WHITE
-            if line.endswith(":"):
-                color = YELLOW
-            surf = self.small_font.render(line, True, color)
-            self.screen.blit(surf, (50, y))
-            y += 28
-        self.draw_audio_button()
-
-    def draw_playing(self):
-        # fondo y estrellas
-        self.screen.fill(DARK_BLUE)
-        frame = pygame.time.get_ticks() // 50
-        for i in range(80):
-            x = (i * 137) % SCREEN_WIDTH
-            y = ((i * 219) + frame) % SCREEN_HEIGHT
-            pygame.draw.circle(self.screen, WHITE, (x, y), (i % 3) + 1)
-
-        # dibujar player
-        if self.player:
-            self.player.draw(self.screen)
-
-        # dibujar enemigos
-        if self.enemies:
-            self.enemies.draw(self.screen)
-
-        # dibujar balas
-        for b in self.player_bullets:
-            try:
-                b.draw(self.screen)
-            except Exception:
-                pass
-        for b in self.enemy_bullets:
-            try:
-                b.draw(self.screen)
-            except Exception:
-                pass
-
-        # dibujar power-ups (caídos)
-        if self.powerup_manager:
-            try:
-                self.powerup_manager.draw(self.screen)
-            except Exception:
-                pass
-
-        # HUD: score y vidas
-        score_surface = self.hud_font.render(f"PUNTOS: {self.score}", True, YELLOW)
-        self.screen.blit(score_surface, (10, 10))
-        lives = self.player.lives if self.player else 0
-        lives_surface = self.hud_font.render(f"VIDAS: {lives}", True, RED)
-        self.screen.blit(lives_surface, (10, 45))
-
-        # power-ups activos en HUD
-        if self.powerup_manager:
-            x = 10
-            now = pygame.time.get_ticks()
-            for ptype in list(self.powerup_manager.active_powerups.keys()):
-                remaining = self.powerup_manager.get_remaining_time(ptype, now)
-                text = f"{ptype}: {remaining}s"
-                surf = self.small_font.render(text, True, CYAN)
-                self.screen.blit(surf, (x, SCREEN_HEIGHT - 30))
-                x += 180
-
-        # hand detector indicator
-        hand_status = "MANO DETECTADA" if self.hand_detector and getattr(self.hand_detector, "hand_x", 0.5) != 0.5 else "SIN MANO"
-        hand_color = NEON_GREEN if self.hand_detector and getattr(self.hand_detector, "hand_x", 0.5) != 0.5 else RED
-        hand_surface = self.small_font.render(hand_status, True, hand_color)
-        self.screen.blit(hand_surface, (SCREEN_WIDTH - 240, 10))
-
-        # audio indicator
-        audio_surface = self.small_font.render("🔊" if self.audio_enabled else "🔇", True, WHITE)
-        self.screen.blit(audio_surface, (SCREEN_WIDTH - 240, 40))
-
-        # pausa overlay
-        if self.paused:
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 150))
-            self.screen.blit(overlay, (0, 0))
-            paused_surf = self.title_font.render("PAUSA", True, NEON_PINK)
-            self.screen.blit(paused_surf, paused_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)))
-
-    def draw_level_transition(self):
-        self.screen.fill(DARK_BLUE)
-        text = f"Nivel {self.current_level} - {LEVEL_CONFIG.get(self.current_level, {}).get('name', '')}"
-        surf = self.menu_font.render(text, True, CYAN)
-        self.screen.blit(surf, surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)))
-        instr = self.small_font.render("Preparando la siguiente oleada...", True, WHITE)
-        self.screen.blit(instr, instr.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 60)))
-
-    def draw_game_over(self):
-        self.screen.fill(DARK_BLUE)
-        # mensaje de victoria o derrota
-        won = False
-        try:
-            if self.enemies and self.enemies.is_empty():
-                won = True
-        except Exception:
-            won = False
-        if won:
-            msg = "¡VICTORIA!"
-            color = NEON_GREEN
-        else:
-            msg = "GAME OVER"
-            color = RED
-        title = self.title_font.render(msg, True, color)
-        self.screen.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, 160)))
-        score_s = self.menu_font.render(f"Puntuación: {self.score}", True, YELLOW)
-        self.screen.blit(score_s, score_s.get_rect(center=(SCREEN_WIDTH // 2, 260)))
-        sub = self.small_font.render("Volviendo al menú principal...", True, WHITE)
-        self.screen.blit(sub, sub.get_rect(center=(SCREEN_WIDTH // 2, 340)))
-
-    # -----------------------
-    # Loop principal
-    # -----------------------
-    def run(self):
-        # Inicializar timers
-        self.splash_timer = 0
-
-        while self.running:
-            self.handle_events()
-
-            # Actualizar según estado
-            if self.state == STATE_SPLASH:
-                self.update_splash()
-            elif self.state == STATE_MENU:
-                # asegurar música
-                self.start_background_music()
-            elif self.state == STATE_LEVEL_TRANSITION:
-                self.update_level_transition()
-            elif self.state == STATE_PLAYING:
-                self.update_playing()
-            elif self.state == STATE_GAME_OVER:
-                # Después de mostrar game over por N segundos, volver al menú
-                if not self.game_over_timer:
-                    self.game_over_timer = pygame.time.get_ticks()
-                elif pygame.time.get_ticks() - self.game_over_timer > 3000:
-                    self.state = STATE_MENU
-
-            # Dibujar según estado
-            if self.state == STATE_SPLASH:
-                self.draw_splash()
-            elif self.state == STATE_MENU:
-                self.draw_menu()
-            elif self.state == STATE_INSTRUCTIONS:
-                self.draw_instructions()
-            elif self.state == STATE_LEVEL_TRANSITION:
-                self.draw_level_transition()
-            elif self.state == STATE_PLAYING:
-                self.draw_playing()
-            elif self.state == STATE_GAME_OVER:
-                self.draw_game_over()
-
-            pygame.display.flip()
-            self.clock.tick(FPS)
-
-        # Salida limpia
-        if self.hand_detector:
-            try:
-                self.hand_detector.release()
-            except Exception:
-                pass
-        pygame.quit()
-        sys.exit()
-
-
-if __name__ == "__main__":
-    g = Game()
-    g.run()
-
+"""
+game.py - Lógica principal del juego Space Invaders 
+
+"""
+import pygame
+import sys
+import time
+import traceback
+from config import *
+from game_random import rng
+from loader import BackgroundLoader, STATUS_LOADING, STATUS_READY
+from startup_profiler import profiler
+from waves import campaign_waves, endless_waves
+from telemetry import (EV_BOSS_DEFEATED, EV_BOSS_HIT, EV_GAME_OVER, EV_KILL, EV_PLAYER_HIT,
+                       EV_POWERUP, EV_QUALITY, EV_RUN_START, EV_SHOT, EV_WAVE, GAME_OVER_INVASION,
+                       GAME_OVER_LIVES, GAME_OVER_VICTORY, POWERUP_CODES, Telemetry)
+
+# Los módulos del proyecto se resuelven una sola vez; los que falten se
+# sustituyen por objetos nulos (ver capabilities.py)
+from capabilities import (NullDisplay, NullHandDetector, NullQualityGovernor, NullRecorder,
+                          NullRewind, NullScoreKeeper, NullSoundManager, NullSpectatorServer, NullTelemetry,
+                          resolve_capabilities, resolve_recorder, resolve_sound_manager)
+
+
+# Visión (cv2 + mediapipe) y audio (scipy) se importan en hilos de fondo para
+# que la pantalla de inicio aparezca de inmediato
+def _load_vision():
+    """Importa hand_detector y abre la cámara (en este proceso o en uno aparte)"""
+    if VISION_OUT_OF_PROCESS:
+        from vision_worker import VisionProcess
+        return VisionProcess()
+    from hand_detector import HandDetector
+    return HandDetector()
+
+
+def _load_audio():
+    """Importa sound_generator y sintetiza todos los sonidos"""
+    from sound_generator import SoundGenerator
+    generator = SoundGenerator()
+    with profiler.stage("sound_synthesis"):
+        return {
+            "shoot": generator.generate_shoot_sound(),
+            "explosion": generator.generate_explosion_sound(),
+            "hit": generator.generate_hit_sound(),
+            "victory": generator.generate_victory_sound(),
+            "game_over": generator.generate_game_over_sound(),
+            "music": generator.generate_background_music(),
+        }
+
+
+class Game:
+    LEVEL_TRANSITION_MS = 1800  # Duración de la transición entre niveles
+    GAME_OVER_MS = 3000  # Tiempo en pantalla de fin de juego antes de volver al menú
+
+    def __init__(self, start_time=None, profile_startup=False, autopilot=False, headless=False,
+                 record_dir=None, telemetry_dir=None, leaderboard_url=None, spectator_port=None,
+                 display_mode=DISPLAY_MODE, fullscreen=DISPLAY_FULLSCREEN,
+                 internal_scale=DISPLAY_INTERNAL_SCALE):
+        # Instante de arranque para medir el tiempo hasta el primer frame
+        self.start_time = start_time if start_time is not None else time.perf_counter()
+        self.first_frame_ms = None
+        # Con perfilado de arranque el juego termina en cuanto todo está cargado
+        self.profile_startup = profile_startup
+        # Reloj del juego: el de pygame, o uno simulado que avanza un paso
+        # fijo por frame (ver use_fixed_step)
+        self.fixed_step_ms = None
+        self.sim_time_ms = 0.0
+        # Sin ventana, audio ni cámara: núcleo para simulación y entrenamiento (ver env.py)
+        self.headless = headless
+
+        with profiler.stage("pygame.init"):
+            pygame.init()
+        if headless:
+            self.sound_manager = NullSoundManager()
+        else:
+            # Mixer puede fallar en algunos entornos; envolver en try
+            with profiler.stage("mixer_init"):
+                try:
+                    pygame.mixer.init()
+                except Exception:
+                    print("Advertencia: pygame.mixer no pudo inicializarse (audio deshabilitado).")
+            self.sound_manager = resolve_sound_manager()
+
+        # Clases concretas (o nulas) de jugador, enemigos, balas, power-ups y
+        # subsistemas opcionales
+        self.caps = resolve_capabilities()
+        # Con piloto automático las partidas empiezan solas y no se usa la cámara
+        self.autopilot = self.caps.autopilot_class() if autopilot else None
+
+        # Ventana (o superficie fuera de pantalla) y reloj; se dibuja siempre a 800x600
+        if headless:
+            self.display = NullDisplay()
+            self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        else:
+            with profiler.stage("display_set_mode"):
+                self.display = self.caps.display_class(display_mode, fullscreen, internal_scale,
+                                       "Space Invaders - Control por Visión")
+            self.screen = self.display.surface
+        self.clock = pygame.time.Clock()
+        # Calidad automática según el tiempo de frame (sin ventana queda fija)
+        if QUALITY_AUTO and not headless:
+            self.quality = self.caps.quality_governor_class()
+        else:
+            self.quality = NullQualityGovernor()
+
+        # Estados del juego
+        self.state = STATE_SPLASH
+        self.running = True
+        self.paused = False
+        self.audio_enabled = AUDIO_ENABLED
+
+        # Fuentes
+        with profiler.stage("font_loading"):
+            self.title_font = pygame.font.Font(None, 72)
+            self.menu_font = pygame.font.Font(None, 48)
+            self.hud_font = pygame.font.Font(None, 32)
+            self.small_font = pygame.font.Font(None, 20)
+
+        # Detector de manos y sonidos: se cargan en segundo plano
+        self.hand_detector = NullHandDetector()
+        self.use_vision = False
+        self._create_sounds()
+        self.loader = BackgroundLoader()
+        if self.autopilot is None and not headless:
+            self.loader.start("vision", _load_vision)
+        if not headless:
+            self.loader.start("audio", _load_audio)
+        # Niveles de calidad aplicables hasta que cargue la visión
+        self.quality.set_features(self._quality_features())
+
+        # Grabación de video (--record): F9 inicia o detiene, F10 guarda la repetición
+        self.recorder = resolve_recorder(record_dir) if record_dir else NullRecorder()
+        # Telemetría de eventos (--telemetry)
+        self.telemetry = Telemetry(telemetry_dir) if telemetry_dir else NullTelemetry()
+        # Récords locales y leaderboard (no cuentan las partidas del piloto
+        # automático ni las de --profile-startup, que no deben crear la base)
+        if SCORES_ENABLED and not headless and self.autopilot is None and not profile_startup:
+            self.scores = self.caps.score_keeper_class(SCORES_DB, leaderboard_url or LEADERBOARD_URL)
+        else:
+            self.scores = NullScoreKeeper()
+        self.new_record = False
+        # Espectadores en red (--spectate): instantáneas con deltas por UDP
+        self.spectators = (self.caps.spectator_server_class(spectator_port) if spectator_port is not None
+                           else NullSpectatorServer())
+        # Anillo de ticks para rebobinar (F6); sin ventana no hay quien lo recorra
+        self.rewind = self.caps.rewind_class() if REWIND_ENABLED and not headless else NullRewind()
+
+        # Patrones de disparo del jefe
+        self.boss_patterns = self.caps.pattern_emitter_class()
+
+        # Manager de power-ups
+        self.powerup_manager = self.caps.powerup_manager_class()
+
+        # Partículas de explosiones e impactos
+        self.particles = self.caps.particle_system_class()
+
+        # Modo cooperativo, modo infinito y teclas de cada jugador
+        self.coop = COOP_ENABLED
+        self.endless = ENDLESS_ENABLED
+        self.player_keys = [tuple(pygame.key.key_code(name) for name in keys)
+                            for keys in PLAYER_KEYS]
+
+        # Variables del juego (se inicializan con init_game)
+        self.players = []
+        self.enemies = None
+        self.player_bullets = []
+        self.enemy_bullets = []
+        self.score = 0
+        self.current_level = 1
+        self.level_config = LEVEL_CONFIG[1]
+        self.waves = None  # Generador de configuraciones de oleada de la partida
+        self.next_enemies = None  # Oleada construida durante la transición
+        self.level_transition_start = None
+        self.game_over_timer = None
+        self.last_enemy_shot_time = 0
+        self.splash_timer = 0
+
+        # Música de fondo (arranca cuando el audio termina de cargar)
+        self.music_playing = False
+
+    # -----------------------
+    # Reloj
+    # -----------------------
+    def ticks(self):
+        """Milisegundos de juego transcurridos"""
+        if self.fixed_step_ms is None:
+            return pygame.time.get_ticks()
+        return int(self.sim_time_ms)
+
+    def use_fixed_step(self, step_ms=1000 / FPS, start_ms=None):
+        """Hace avanzar el reloj del juego step_ms por frame, sin importar el tiempo real
+
+        Los temporizadores (cadencia de disparo, power-ups, transiciones)
+        quedan ligados al número de frames, como el movimiento.
+
+        Args:
+            start_ms: instante inicial (por defecto el reloj de pygame);
+                fijarlo hace la simulación reproducible
+        """
+        self.fixed_step_ms = step_ms
+        self.sim_time_ms = float(pygame.time.get_ticks() if start_ms is None else start_ms)
+
+    # -----------------------
+    # Carga en segundo plano
+    # -----------------------
+    def _poll_loader(self):
+        """Instala los subsistemas que terminaron de cargar en segundo plano"""
+        for name, value, error in self.loader.poll():
+            if name == "vision":
+                if value is not None:
+                    self.hand_detector = value
+                    self.hand_detector.set_max_hands(self.num_players())
+                    self.use_vision = CONTROL_MODE == "vision"
+                    self.quality.set_features(self._quality_features())
+                    self._apply_quality()
+                else:
+                    print("hand_detector no disponible (%s): control por teclado habilitado." % error)
+            elif name == "audio":
+                if value is not None:
+                    self._create_sounds(value)
+                    self.start_background_music()
+                else:
+                    print("Error al crear sonidos (%s): sonidos deshabilitados." % error)
+
+    # -----------------------
+    # Calidad automática
+    # -----------------------
+    def _quality_features(self):
+        """Opciones de QUALITY_TIERS que tienen efecto en este equipo"""
+        features = {"stars", "glow_rings"}
+        if self.use_vision:
+            features.add("inference_every")
+            if CAMERA_PREVIEW:
+                features.add("camera_preview")
+        return features
+
+    def _apply_quality(self):
+        """Aplica a la visión el nivel de calidad actual
+
+        Estrellas, brillo y vista previa se leen de quality.settings al dibujar.
+        """
+        self.hand_detector.set_inference_interval(self.quality.settings["inference_every"])
+
+    def draw_loading_status(self, y):
+        """Muestra el estado de carga de visión y audio"""
+        labels = (("vision", "Visión"), ("audio", "Audio"))
+        x = SCREEN_WIDTH // 2 - 150
+        for name, label in labels:
+            status = self.loader.get_status(name)
+            if status == STATUS_LOADING:
+                text, color = f"{label}: cargando...", YELLOW
+            elif status == STATUS_READY:
+                text, color = f"{label}: lista", NEON_GREEN
+            else:
+                text, color = f"{label}: no disponible", GRAY
+            surf = self.small_font.render(text, True, color)
+            self.screen.blit(surf, surf.get_rect(center=(x, y)))
+            x += 300
+
+    # -----------------------
+    # Sonidos 
+    # -----------------------
+    def _create_sounds(self, sounds=None):
+        """Instala los sonidos sintetizados por el cargador"""
+        sounds = sounds or {}
+        self.shoot_sound = sounds.get("shoot")
+        self.explosion_sound = sounds.get("explosion")
+        self.hit_sound = sounds.get("hit")
+        self.victory_sound = sounds.get("victory")
+        self.game_over_sound = sounds.get("game_over")
+        self.background_music = sounds.get("music")
+
+        if not sounds:
+            return
+
+        try:
+            if self.background_music:
+                try:
+                    self.background_music.set_volume(0.25)
+                except Exception:
+                    pass
+            # Registrar efectos en el gestor de voces
+            for name, sound in sounds.items():
+                if name != "music":
+                    self.sound_manager.register(name, sound)
+        except Exception as e:
+            print("Error al crear sonidos:", e)
+            traceback.print_exc()
+
+    def toggle_audio(self):
+        self.audio_enabled = not self.audio_enabled
+        if not self.audio_enabled:
+            self.sound_manager.stop_all()
+            self.music_playing = False
+        else:
+            self.start_background_music()
+
+    def start_background_music(self):
+        if self.audio_enabled and self.background_music and not self.music_playing:
+            self.music_playing = self.sound_manager.play_music(self.background_music)
+
+    def play_sound(self, name):
+        """Reproduce un efecto por nombre a través del gestor de voces"""
+        if self.audio_enabled:
+            self.sound_manager.play(name)
+
+    # -----------------------
+    # Inicialización y niveles
+    # -----------------------
+    def num_players(self):
+        """Número de jugadores (y de manos a seguir) del modo actual"""
+        return COOP_PLAYERS if self.coop else 1
+
+    def toggle_coop(self):
+        """Alterna entre un jugador y cooperativo"""
+        self.coop = not self.coop
+        # Una sola mano en modo individual: la inferencia no paga la segunda
+        self.hand_detector.set_max_hands(self.num_players())
+
+    def toggle_endless(self):
+        """Alterna entre la campaña de niveles y el modo infinito"""
+        self.endless = not self.endless
+
+    def start_run(self):
+        """Empieza una partida nueva desde la primera oleada"""
+        self.waves = endless_waves() if self.endless else campaign_waves()
+        self.score = 0
+        self.players = []
+        self.current_level = 0
+        self.rewind.clear()
+        self.telemetry.log(EV_RUN_START, self.ticks(), value=self.num_players())
+        self.next_wave()
+
+    def next_wave(self):
+        """Pide la siguiente oleada al generador y pasa a la transición
+
+        Si el generador se agotó (fin de la campaña) la partida termina con victoria.
+        """
+        config = next(self.waves, None)
+        if config is None:
+            self.end_run(GAME_OVER_VICTORY)
+            return
+        self.current_level += 1
+        self.telemetry.log(EV_WAVE, self.ticks(), value=self.current_level)
+        self.level_config = config
+        self.next_enemies = None
+        self.state = STATE_LEVEL_TRANSITION
+        self.level_transition_start = self.ticks()
+
+    def end_run(self, reason):
+        """Termina la partida: pantalla de fin, telemetría y registro del puntaje
+
+        Args:
+            reason: GAME_OVER_LIVES, GAME_OVER_INVASION o GAME_OVER_VICTORY
+        """
+        self.state = STATE_GAME_OVER
+        self.game_over_timer = self.ticks()
+        self.telemetry.log(EV_GAME_OVER, self.game_over_timer, reason, value=self.score)
+        # El récord se compara antes de encolar: la tabla se actualiza en otro hilo
+        self.new_record = self.score > 0 and self.score > self.scores.best()
+        self.scores.submit(self.score, self.current_level, self.num_players(), self.endless, reason)
+        self.play_sound("victory" if reason == GAME_OVER_VICTORY else "game_over")
+
+    def init_game(self, level=1, reset_score=False, enemies=None):
+        """Inicia o reinicia la partida en el nivel indicado.
+
+        Args:
+            enemies: oleada ya construida; si es None se crea la del nivel de LEVEL_CONFIG
+        """
+        # Mantener score si no se quiere reiniciar
+        if reset_score:
+            self.score = 0
+
+        # Crear jugadores repartidos a lo ancho de la pantalla; en modo
+        # infinito conservan vidas y power-ups de una oleada a la siguiente
+        if not (self.endless and self.players):
+            count = self.num_players()
+            self.players = [
+                self.caps.player_class(SCREEN_WIDTH * (i + 1) // (count + 1) - PLAYER_WIDTH // 2,
+                                       SCREEN_HEIGHT - 80, index=i)
+                for i in range(count)
+            ]
+
+        # Soltar la oleada anterior antes de crear la siguiente
+        self.enemies = None
+        if enemies is None:
+            self.level_config = LEVEL_CONFIG.get(level, LEVEL_CONFIG[1])
+            enemies = self.caps.enemy_group_class(level=level, config=self.level_config)
+        self.enemies = enemies
+
+        # Reset balas y power-ups (las listas se vacían en el sitio)
+        del self.player_bullets[:]
+        del self.enemy_bullets[:]
+        self.powerup_manager.clear()
+        self.particles.clear()
+
+        self.current_level = level
+        self.level_transition_start = None
+        self.game_over_timer = None
+        self.last_enemy_shot_time = 0
+
+    # -----------------------
+    # Eventos
+    # -----------------------
+    def handle_events(self):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F9:
+                self.recorder.toggle_recording(self.ticks())
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F10:
+                self.recorder.save_replay(self.ticks())
+            elif event.type == pygame.KEYDOWN and self.rewind.handle_key(self, event.key, event.mod):
+                continue
+
+            # Navegar entre estados
+            if self.state == STATE_SPLASH:
+                if event.type == pygame.KEYDOWN:
+                    self.state = STATE_MENU
+                    self.start_background_music()
+
+            elif self.state == STATE_MENU:
+                if event.type == pygame.MOUSEBUTTONDOWN:
+                    self.handle_menu_click(self.display.to_world(event.pos))
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_c:
+                    self.toggle_coop()
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_e:
+                    self.toggle_endless()
+
+            elif self.state == STATE_INSTRUCTIONS:
+                if event.type == pygame.KEYDOWN or event.type == pygame.MOUSEBUTTONDOWN:
+                    self.state = STATE_MENU
+
+            elif self.state == STATE_PLAYING and not self.rewind.scrubbing:
+                # Pausa
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_p:
+                        self.paused = not self.paused
+                    elif event.key == pygame.K_m:
+                        self.toggle_audio()
+                    else:
+                        # disparo por teclado (tecla de disparo de cada jugador)
+                        for player in self.players:
+                            if event.key == self.player_keys[player.index][2] and player.is_alive():
+                                self._player_shoot_by_input(player)
+                elif event.type == pygame.MOUSEBUTTONDOWN:
+                    # permitir click para disparar si se desea (jugador 1)
+                    if event.button == 1 and self.players[0].is_alive():  # botón izquierdo
+                        self._player_shoot_by_input(self.players[0])
+
+    def handle_menu_click(self, pos):
+        x, y = pos
+        # Jugar
+        if 250 <= x <= 550 and 200 <= y <= 260:
+            # iniciar desde la primera oleada, pasando por la transición
+            # para que el jugador vea el mensaje
+            self.start_run()
+        # Instrucciones
+        elif 250 <= x <= 550 and 290 <= y <= 350:
+            self.state = STATE_INSTRUCTIONS
+        # Salir
+        elif 250 <= x <= 550 and 380 <= y <= 440:
+            self.running = False
+        # Mute/Unmute
+        elif SCREEN_WIDTH - 120 <= x <= SCREEN_WIDTH - 20 and 20 <= y <= 70:
+            self.toggle_audio()
+
+    # -----------------------
+    # Lógica principal por estado
+    # -----------------------
+    def update_splash(self):
+        self.splash_timer += 1
+        if self.splash_timer > FPS * 3:  # 3 segundos
+            self.state = STATE_MENU
+            self.start_background_music()
+
+    def update_level_transition(self):
+        """Gestiona la pantalla de transición entre niveles."""
+        if not self.level_transition_start:
+            self.level_transition_start = self.ticks()
+        # La oleada se construye mientras se muestra la transición
+        if self.next_enemies is None:
+            self.next_enemies = self.caps.enemy_group_class(level=self.current_level,
+                                                            config=self.level_config)
+        now = self.ticks()
+        if now - self.level_transition_start > self.LEVEL_TRANSITION_MS:
+            # Iniciar el nivel (current_level ya fue incrementado por next_wave)
+            enemies, self.next_enemies = self.next_enemies, None
+            self.init_game(level=self.current_level, reset_score=False, enemies=enemies)
+            self.state = STATE_PLAYING
+
+    def update_playing(self):
+        """Lógica principal del juego cuando se está jugando."""
+        if self.paused:
+            return  # no actualizar nada si está en pausa
+
+        now = self.ticks()
+
+        # Asegurar música
+        self.start_background_music()
+
+        # Detección de manos (el detector nulo deja la mano centrada y abierta);
+        # un solo frame y una sola inferencia para todos los jugadores
+        self.hand_detector.update()
+        keys = None if self.use_vision else pygame.key.get_pressed()
+
+        # Jugadores vivos y sus rectángulos: las pasadas de colisión los prueban todos a la vez
+        alive = [player for player in self.players if player.is_alive()]
+        for player in alive:
+            # Actualizar estado del jugador (timers internos)
+            player.update(now)
+            index = player.index
+
+            # Control del jugador: piloto automático, su mano o sus teclas
+            if self.autopilot is not None:
+                move, fire = self.autopilot.decide(player, self)
+                if move < 0:
+                    player.move_left()
+                elif move > 0:
+                    player.move_right()
+                if fire:
+                    self._player_shoot_by_input(player)
+            elif self.use_vision:
+                player.set_position_normalized(self.hand_detector.get_position(index))
+            else:
+                left, right, _ = self.player_keys[index]
+                if keys[left]:
+                    player.move_left()
+                if keys[right]:
+                    player.move_right()
+
+            # Disparo por gesto (mano cerrada) - gestionar debounce
+            hand_closed = self.hand_detector.is_hand_closed(index)
+            if hand_closed and not player.prev_hand_closed:
+                if now - player.last_shot_time > 300:
+                    self._player_shoot_by_input(player)
+                    player.last_shot_time = now
+            player.prev_hand_closed = hand_closed
+        player_rects = [player.rect for player in alive]
+
+        # Actualizar enemigos
+        self.enemies.update()
+        if self.enemies.diving:
+            self._diver_collisions(now, alive, player_rects)
+
+        # El jefe dispara sus patrones; la formación, según configuración de nivel
+        lvl_cfg = self.level_config
+        enemy_shoot_interval = lvl_cfg.get("enemy_shoot_interval", 1200)
+        enemy_shoot_chance = lvl_cfg.get("enemy_shoot_chance", 0.2)
+        boss = self.enemies.boss
+        if boss:
+            volley = self.boss_patterns.update(boss, now, alive, len(self.enemy_bullets))
+            if volley is not None:
+                bullet_class = self.caps.bullet_class
+                self.enemy_bullets.extend(
+                    bullet_class(x, y, -1, 0, vx, vy)
+                    for x, y, vx, vy in zip(*(column.tolist() for column in volley)))
+        elif now - self.last_enemy_shot_time > enemy_shoot_interval:
+            self.last_enemy_shot_time = now
+            shooter = self.enemies.get_random_shooter()
+            if shooter and rng.random() < enemy_shoot_chance:
+                # Shooter puede ser Boss o Enemy
+                sx = shooter.x + shooter.width // 2
+                sy = shooter.y + shooter.height
+                # Crear bala enemiga (direccion -1 hacia abajo)
+                self.enemy_bullets.append(self.caps.bullet_class(sx, sy, -1))
+
+        # Actualizar balas del jugador: una sola pasada, compactando la lista en el sitio
+        bullets = self.player_bullets
+        write = 0
+        for bullet in bullets:
+            bullet.update()
+            if bullet.is_off_screen() or self._player_bullet_hit(bullet):
+                continue
+            bullets[write] = bullet
+            write += 1
+        del bullets[write:]
+        # Los enemigos destruidos se quitan de la formación una vez por tick
+        self.enemies.compact()
+
+        # Actualizar balas enemigas
+        bullets = self.enemy_bullets
+        write = 0
+        for bullet in bullets:
+            bullet.update()
+            if bullet.is_off_screen():
+                continue
+
+            # Colisión con cualquiera de los jugadores vivos
+            index = bullet.rect.collidelist(player_rects)
+            if index >= 0:
+                player = alive[index]
+                player.hit()
+                self.particles.emit(bullet.x, bullet.y, PARTICLE_PLAYER_HIT_BURST, player.color)
+                self.telemetry.log(EV_PLAYER_HIT, now, player.index, bullet.x, bullet.y, player.lives)
+                self.play_sound("hit")
+                continue
+            bullets[write] = bullet
+            write += 1
+        del bullets[write:]
+
+        # Derrota cuando ya no queda ningún jugador con vidas
+        if not any(player.is_alive() for player in alive):
+            self.end_run(GAME_OVER_LIVES)
+            return
+
+        # Partículas: integración y expiración vectorizadas
+        self.particles.update()
+
+        # Actualizar power-ups: caída y colisiones
+        self.powerup_manager.update(now)
+        for index, powerup_type in self.powerup_manager.check_collision(player_rects, now):
+            # aplicar efecto al jugador que lo recogió
+            player = alive[index]
+            if powerup_type == POWERUP_EXTRA_LIFE:
+                player.add_life()
+            elif powerup_type == POWERUP_SHIELD:
+                player.activate_shield()
+            elif powerup_type == POWERUP_DOUBLE_SHOT:
+                player.double_shot_until = now + POWERUP_DURATION
+            self.telemetry.log(EV_POWERUP, now, player.index, player.x, player.y,
+                               POWERUP_CODES.get(powerup_type, 0))
+            # reproducir sonido de recogida
+            self.play_sound("explosion")
+
+        # Verificar condiciones de fin de nivel o derrota
+        if self.enemies.reached_bottom():
+            # derrota inmediata
+            self.end_run(GAME_OVER_INVASION)
+        elif self.enemies.is_empty():
+            # nivel completado (también al derrotar al jefe): siguiente
+            # oleada, o victoria si la campaña terminó
+            self.play_sound("victory")
+            self.next_wave()
+
+    def _diver_collisions(self, now, alive, player_rects):
+        """Un enemigo en picada que choca con una nave la daña y se destruye"""
+        for enemy in self.enemies.enemies:
+            if enemy.dive < 0 or not enemy.alive:
+                continue
+            index = enemy.rect.collidelist(player_rects)
+            if index < 0:
+                continue
+            player = alive[index]
+            player.hit()
+            self.enemies.remove_enemy(enemy)
+            self.particles.emit(enemy.x + enemy.width // 2, enemy.y + enemy.height // 2,
+                                PARTICLE_ENEMY_BURST, enemy.color)
+            self.telemetry.log(EV_PLAYER_HIT, now, player.index, enemy.x, enemy.y, player.lives)
+            self.play_sound("hit")
+
+    def _player_bullet_hit(self, bullet):
+        """Resuelve la colisión de una bala del jugador con el jefe o la formación
+
+        Returns:
+            bool: True si la bala impactó y debe desaparecer
+        """
+        # Si hay un boss
+        boss = self.enemies.boss
+        if boss:
+            if not (bullet.rect.colliderect(boss.rect) and boss.touches(bullet.rect)):
+                return False
+            # daño al boss
+            defeated, pts = self.enemies.damage_boss()
+            self.score += pts
+            self.particles.emit(bullet.x, bullet.y, PARTICLE_BOSS_HIT_BURST, ORANGE)
+            now = self.ticks()
+            self.telemetry.log(EV_BOSS_HIT, now, bullet.owner, bullet.x, bullet.y, boss.health)
+            if defeated:
+                self.telemetry.log(EV_BOSS_DEFEATED, now, bullet.owner, boss.x, boss.y, pts)
+                self.particles.emit(boss.x + boss.width // 2, boss.y + boss.height // 2,
+                                    PARTICLE_BOSS_DEATH_BURST, YELLOW,
+                                    speed=PARTICLE_SPEED * 2, life=PARTICLE_LIFETIME * 2)
+            self.play_sound("explosion")
+            # posible drop
+            if rng.random() < POWERUP_DROP_CHANCE:
+                self.powerup_manager.spawn_powerup(bullet.x, bullet.y)
+            # la derrota del jefe deja la oleada vacía: el fin de nivel se
+            # resuelve al final del tick como en cualquier oleada
+            return True
+
+        # Colisión con enemigos normales (marcados y compactados al final del tick)
+        enemy = self.enemies.find_hit(bullet.rect)
+        if enemy is None:
+            return False
+        points = self.enemies.remove_enemy(enemy)
+        self.score += points
+        self.telemetry.log(EV_KILL, self.ticks(), bullet.owner, enemy.x, enemy.y, points)
+        self.particles.emit(enemy.x + enemy.width // 2, enemy.y + enemy.height // 2,
+                            PARTICLE_ENEMY_BURST, enemy.color)
+        self.play_sound("explosion")
+        # spawn powerup
+        if rng.random() < POWERUP_DROP_CHANCE:
+            self.powerup_manager.spawn_powerup(enemy.x, enemy.y)
+        return True
+
+    # -----------------------
+    # Disparo del jugador 
+    # -----------------------
+    def _player_shoot_by_input(self, player):
+        """Crea balas del jugador según su estado (doble disparo si está activo)"""
+        now = self.ticks()
+        # cooldown simple
+        if now - player.last_shot_time < PLAYER_SHOT_COOLDOWN_MS:
+            return
+        player.last_shot_time = now
+
+        bullet_class = self.caps.bullet_class
+        double_active = player.double_shot_until > now
+        if double_active:
+            # dos balas con ligero offset
+            left_x = player.x + 8
+            right_x = player.x + player.width - 8
+            self.player_bullets.append(bullet_class(left_x, player.y, 1, player.index))
+            self.player_bullets.append(bullet_class(right_x, player.y, 1, player.index))
+        else:
+            b = bullet_class(player.x + player.width // 2, player.y, 1, player.index)
+            self.player_bullets.append(b)
+        self.telemetry.log(EV_SHOT, now, player.index, player.x + player.width // 2, player.y,
+                           2 if double_active else 1)
+
+        self.play_sound("shoot")
+
+    # -----------------------
+    # Dibujado por estado
+    # -----------------------
+    def draw_audio_button(self):
+        button_rect = pygame.Rect(SCREEN_WIDTH - 120, 20, 100, 50)
+        if self.audio_enabled:
+            color = NEON_GREEN
+            text = "🔊 ON"
+        else:
+            color = RED
+            text = "🔇 OFF"
+        mouse_pos = self.display.to_world(pygame.mouse.get_pos())
+        if button_rect.collidepoint(mouse_pos):
+            pygame.draw.rect(self.screen, color, button_rect)
+            pygame.draw.rect(self.screen, WHITE, button_rect, 3)
+        else:
+            pygame.draw.rect(self.screen, color, button_rect, 2)
+        text_surface = self.small_font.render(text, True, WHITE)
+        text_rect = text_surface.get_rect(center=button_rect.center)
+        self.screen.blit(text_surface, text_rect)
+
+    def draw_splash(self):
+        self.screen.fill(DARK_BLUE)
+        # simple starfield
+        for i in range(40):
+            x = (i * 137) % SCREEN_WIDTH
+            y = (i * 219 + (self.splash_timer * 3)) % SCREEN_HEIGHT
+            pygame.draw.circle(self.screen, WHITE, (x, y), (i % 3) + 1)
+        title = self.title_font.render("SPACE INVADERS", True, NEON_GREEN)
+        self.screen.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, 160)))
+        sub = self.menu_font.render("Control por Visión", True, YELLOW)
+        self.screen.blit(sub, sub.get_rect(center=(SCREEN_WIDTH // 2, 240)))
+        if (self.splash_timer // 30) % 2 == 0:
+            press = self.small_font.render("Presiona cualquier tecla", True, WHITE)
+            self.screen.blit(press, press.get_rect(center=(SCREEN_WIDTH // 2, 420)))
+        self.draw_loading_status(500)
+
+    def draw_menu(self):
+        self.screen.fill(DARK_BLUE)
+        title_surface = self.title_font.render("SPACE INVADERS", True, NEON_GREEN)
+        self.screen.blit(title_surface, title_surface.get_rect(center=(SCREEN_WIDTH // 2, 100)))
+        # botones
+        mouse_pos = self.display.to_world(pygame.mouse.get_pos())
+        buttons = [("JUGAR", 230), ("INSTRUCCIONES", 320), ("SALIR", 410)]
+        for text, y in buttons:
+            rect = pygame.Rect(250, y, 300, 60)
+            if rect.collidepoint(mouse_pos):
+                pygame.draw.rect(self.screen, NEON_PINK, rect)
+                pygame.draw.rect(self.screen, WHITE, rect, 3)
+            else:
+                pygame.draw.rect(self.screen, BLUE, rect)
+                pygame.draw.rect(self.screen, CYAN, rect, 2)
+            surf = self.menu_font.render(text, True, WHITE)
+            self.screen.blit(surf, surf.get_rect(center=rect.center))
+        # audio button and hint
+        self.draw_audio_button()
+        hint = self.small_font.render("Presiona M o clic arriba para silenciar", True, GRAY)
+        self.screen.blit(hint, hint.get_rect(center=(SCREEN_WIDTH // 2, 560)))
+        mode = "COOPERATIVO (2 jugadores)" if self.coop else "1 JUGADOR"
+        run = "INFINITO" if self.endless else "CAMPAÑA"
+        mode_surf = self.small_font.render(f"Modo: {mode} (C) - {run} (E)", True, YELLOW)
+        self.screen.blit(mode_surf, mode_surf.get_rect(center=(SCREEN_WIDTH // 2, 190)))
+        best = self.scores.best()
+        if best:
+            best_surf = self.small_font.render(f"Récord: {best}", True, CYAN)
+            self.screen.blit(best_surf, best_surf.get_rect(center=(SCREEN_WIDTH // 2, 490)))
+        if not self.loader.is_done():
+            self.draw_loading_status(520)
+
+    def draw_instructions(self):
+        self.screen.fill(DARK_BLUE)
+        title = self.menu_font.render("INSTRUCCIONES", True, NEON_GREEN)
+        self.screen.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, 50)))
+        lines = [
+            "OBJETIVO:",
+            "Destruye todos los invasores antes de que lleguen al fondo",
+            "",
+            "CONTROLES:",
+            "- Mueve tu mano para mover la nave (modo visión)",
+            "- Cierra el puño para disparar",
+            "- También puedes usar las FLECHAS y ESPACIO",
+            "- Cooperativo (C en el menú): una mano por jugador; J2 usa A, D y W",
+            "- Modo infinito (E en el menú): oleadas sin fin, cada vez más difíciles",
+            "- Presiona P para pausar",
+            "- Presiona M para silenciar",
+            "",
+            "PUNTUACIÓN:",
+            f"- Enemigo común: {POINTS_COMMON_ENEMY} pts",
+            f"- Enemigo avanzado: {POINTS_ADVANCED_ENEMY} pts",
+            f"- Jefe: {POINTS_BOSS} pts",
+            f"- Vidas iniciales: {PLAYER_LIVES}"
+        ]
+        y = 120
+        for line in lines:
+            color = WHITE
+            if line.endswith(":"):
+                color = YELLOW
+            surf = self.small_font.render(line, True, color)
+            self.screen.blit(surf, (50, y))
+            y += 28
+        self.draw_audio_button()
+
+    def draw_playing(self):
+        # fondo y estrellas
+        self.screen.fill(DARK_BLUE)
+        frame = self.ticks() // 50
+        settings = self.quality.settings
+        for i in range(settings["stars"]):
+            x = (i * 137) % SCREEN_WIDTH
+            y = ((i * 219) + frame) % SCREEN_HEIGHT
+            pygame.draw.circle(self.screen, WHITE, (x, y), (i % 3) + 1)
+
+        # dibujar jugadores
+        for player in self.players:
+            if player.is_alive():
+                player.draw(self.screen)
+
+        # dibujar enemigos
+        self.enemies.draw(self.screen)
+
+        # dibujar partículas
+        self.particles.draw(self.screen)
+
+        # dibujar balas
+        for b in self.player_bullets:
+            b.draw(self.screen)
+        for b in self.enemy_bullets:
+            b.draw(self.screen)
+
+        # dibujar power-ups (caídos)
+        self.powerup_manager.draw(self.screen, settings["glow_rings"])
+
+        # HUD: score y vidas
+        score_surface = self.hud_font.render(f"PUNTOS: {self.score}", True, YELLOW)
+        self.screen.blit(score_surface, (10, 10))
+        if len(self.players) == 1:
+            lives_surface = self.hud_font.render(f"VIDAS: {self.players[0].lives}", True, RED)
+            self.screen.blit(lives_surface, (10, 45))
+        else:
+            x = 10
+            for player in self.players:
+                lives_surface = self.hud_font.render(f"J{player.index + 1}: {player.lives}",
+                                                     True, player.color)
+                self.screen.blit(lives_surface, (x, 45))
+                x += lives_surface.get_width() + 20
+
+        # power-ups activos en HUD
+        x = 10
+        now = self.ticks()
+        for ptype in self.powerup_manager.active_powerups:
+            remaining = self.powerup_manager.get_remaining_time(ptype, now)
+            text = f"{ptype}: {remaining}s"
+            surf = self.small_font.render(text, True, CYAN)
+            self.screen.blit(surf, (x, SCREEN_HEIGHT - 30))
+            x += 180
+
+        # hand detector indicator (uno por jugador)
+        x = SCREEN_WIDTH - 240
+        for player in self.players:
+            hand_detected = self.hand_detector.is_detected(player.index)
+            if len(self.players) == 1:
+                hand_status = "MANO DETECTADA" if hand_detected else "SIN MANO"
+            else:
+                hand_status = f"J{player.index + 1}: {'MANO' if hand_detected else 'SIN MANO'}"
+            hand_color = NEON_GREEN if hand_detected else RED
+            hand_surface = self.small_font.render(hand_status, True, hand_color)
+            self.screen.blit(hand_surface, (x, 10))
+            x += hand_surface.get_width() + 15
+
+        # vista previa de la cámara
+        if CAMERA_PREVIEW and self.use_vision and settings["camera_preview"]:
+            preview = self.hand_detector.get_preview_surface()
+            if preview:
+                preview_pos = (SCREEN_WIDTH - VISION_FRAME_WIDTH - 10,
+                               SCREEN_HEIGHT - VISION_FRAME_HEIGHT - 10)
+                self.screen.blit(preview, preview_pos)
+                pygame.draw.rect(self.screen, CYAN, (*preview_pos, VISION_FRAME_WIDTH, VISION_FRAME_HEIGHT), 1)
+
+        # audio indicator
+        audio_surface = self.small_font.render("🔊" if self.audio_enabled else "🔇", True, WHITE)
+        self.screen.blit(audio_surface, (SCREEN_WIDTH - 240, 40))
+
+        # nivel de calidad automática
+        self.quality.draw_status(self.screen, SCREEN_WIDTH - 240, 65)
+
+        # pausa overlay
+        if self.paused:
+            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, 150))
+            self.screen.blit(overlay, (0, 0))
+            paused_surf = self.title_font.render("PAUSA", True, NEON_PINK)
+            self.screen.blit(paused_surf, paused_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)))
+
+    def draw_level_transition(self):
+        self.screen.fill(DARK_BLUE)
+        text = f"Nivel {self.current_level} - {self.level_config.get('name', '')}"
+        surf = self.menu_font.render(text, True, CYAN)
+        self.screen.blit(surf, surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)))
+        instr = self.small_font.render("Preparando la siguiente oleada...", True, WHITE)
+        self.screen.blit(instr, instr.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 60)))
+
+    def draw_game_over(self):
+        self.screen.fill(DARK_BLUE)
+        # mensaje de victoria o derrota
+        if self.enemies.is_empty():
+            msg = "¡VICTORIA!"
+            color = NEON_GREEN
+        else:
+            msg = "GAME OVER"
+            color = RED
+        title = self.title_font.render(msg, True, color)
+        self.screen.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, 160)))
+        score_s = self.menu_font.render(f"Puntuación: {self.score}", True, YELLOW)
+        self.screen.blit(score_s, score_s.get_rect(center=(SCREEN_WIDTH // 2, 260)))
+        if self.new_record:
+            record_s = self.hud_font.render("¡NUEVO RÉCORD!", True, NEON_PINK)
+        else:
+            record_s = self.hud_font.render(f"Récord: {self.scores.best()}", True, CYAN)
+        self.screen.blit(record_s, record_s.get_rect(center=(SCREEN_WIDTH // 2, 300)))
+        sub = self.small_font.render("Volviendo al menú principal...", True, WHITE)
+        self.screen.blit(sub, sub.get_rect(center=(SCREEN_WIDTH // 2, 340)))
+
+    # -----------------------
+    # Ritmo de frames por estado
+    # -----------------------
+    def _frame_rate(self):
+        """FPS del estado actual, o None si solo se redibuja ante eventos"""
+        if self.state == STATE_PLAYING and self.paused:
+            return None
+        return STATE_FRAME_POLICY.get(self.state, FPS)
+
+    def _idle_timeout(self):
+        """Milisegundos hasta el próximo temporizador del estado actual"""
+        if self.loader.is_done():
+            timeout = IDLE_WAKE_MS
+        else:
+            timeout = IDLE_LOADING_WAKE_MS
+        now = self.ticks()
+        if self.state == STATE_GAME_OVER and self.game_over_timer:
+            timeout = min(timeout, self.game_over_timer + self.GAME_OVER_MS - now + 1)
+        elif self.state == STATE_LEVEL_TRANSITION and self.level_transition_start:
+            timeout = min(timeout, self.level_transition_start + self.LEVEL_TRANSITION_MS - now + 1)
+        return max(1, timeout)
+
+    def _wait_next_frame(self):
+        """Espera al siguiente frame según la política del estado
+
+        Los estados animados avanzan a su FPS; los estáticos duermen en
+        pygame.event.wait hasta que llega un evento o vence un temporizador.
+        """
+        if self._frame_rate() is None:
+            event = pygame.event.wait(self._idle_timeout())
+            if event.type != pygame.NOEVENT:
+                # Devolver el evento a la cola para que lo procese handle_events
+                pygame.event.post(event)
+            self.clock.tick(FPS)
+        else:
+            self.clock.tick(self._frame_rate())
+
+    # -----------------------
+    # Loop principal
+    # -----------------------
+    def step(self):
+        """Ejecuta un frame completo: eventos, lógica y dibujado, sin esperar"""
+        start = time.perf_counter()
+        self.sound_manager.begin_tick()
+        self._poll_loader()
+        self.handle_events()
+        # La cámara solo hace inferencia mientras se juega
+        self.hand_detector.set_parked(self.state != STATE_PLAYING or self.paused)
+
+        # El piloto automático empieza una partida nueva desde el menú
+        if self.autopilot is not None and self.state in (STATE_SPLASH, STATE_MENU):
+            self.start_run()
+
+        # Actualizar según estado
+        if self.state == STATE_SPLASH:
+            self.update_splash()
+        elif self.state == STATE_MENU:
+            # asegurar música
+            self.start_background_music()
+        elif self.state == STATE_LEVEL_TRANSITION:
+            self.update_level_transition()
+        elif self.state == STATE_PLAYING:
+            # Mientras se rebobina el juego queda congelado en el tick mostrado
+            if not self.rewind.scrubbing:
+                self.update_playing()
+                if self.state == STATE_PLAYING and not self.paused:
+                    self.rewind.record(self, self.ticks())
+        elif self.state == STATE_GAME_OVER:
+            # Después de mostrar game over por N segundos, volver al menú
+            if not self.game_over_timer:
+                self.game_over_timer = self.ticks()
+            elif self.ticks() - self.game_over_timer > self.GAME_OVER_MS:
+                self.state = STATE_MENU
+
+        # Dibujar según estado; el frame se copia para el video antes de los avisos de grabación
+        self.draw()
+        self.recorder.capture(self.screen, self.ticks())
+        self.recorder.draw_status(self.screen, self.ticks())
+        self.rewind.draw_status(self.screen, self.ticks())
+        # Los eventos pasan al escritor de telemetría por lotes
+        self.telemetry.flush(self.ticks())
+        self.spectators.update(self, self.ticks())
+
+        self.display.present()
+        # Solo los frames de juego cuentan para la calidad (los menús son livianos)
+        if self.state == STATE_PLAYING and not self.paused and not self.rewind.scrubbing:
+            frame_ms = (time.perf_counter() - start) * 1000
+            if self.quality.update(frame_ms, pygame.time.get_ticks()):
+                self._apply_quality()
+                self.telemetry.log(EV_QUALITY, self.ticks(), self.quality.tier,
+                                   value=self.quality.decided_ms * 10)
+        if self.fixed_step_ms is not None and not self.rewind.scrubbing:
+            self.sim_time_ms += self.fixed_step_ms
+
+    def draw(self):
+        """Dibuja la pantalla del estado actual en self.screen"""
+        if self.state == STATE_SPLASH:
+            self.draw_splash()
+        elif self.state == STATE_MENU:
+            self.draw_menu()
+        elif self.state == STATE_INSTRUCTIONS:
+            self.draw_instructions()
+        elif self.state == STATE_LEVEL_TRANSITION:
+            self.draw_level_transition()
+        elif self.state == STATE_PLAYING:
+            self.draw_playing()
+        elif self.state == STATE_GAME_OVER:
+            self.draw_game_over()
+
+    def run(self):
+        # Inicializar timers
+        self.splash_timer = 0
+
+        while self.running:
+            self.step()
+            if self.first_frame_ms is None:
+                self.first_frame_ms = (time.perf_counter() - self.start_time) * 1000
+                profiler.record("first_frame", self.first_frame_ms / 1000)
+                print(f"Tiempo hasta el primer frame: {self.first_frame_ms:.0f} ms")
+            if self.profile_startup and self.loader.is_done():
+                profiler.record("fully_loaded", time.perf_counter() - self.start_time)
+                self.running = False
+            self._wait_next_frame()
+
+        # Salida limpia
+        self.close()
+        pygame.quit()
+        sys.exit()
+
+    def close(self):
+        """Libera los recursos propios de este juego (cámara, archivos, sockets)
+
+        No cierra pygame: otros juegos del mismo proceso pueden seguir usándolo.
+        """
+        try:
+            self.hand_detector.release()
+        except Exception:
+            pass
+        self.recorder.close()
+        self.telemetry.close()
+        self.scores.close()
+        self.spectators.close()
+
+
+if __name__ == "__main__":
+    g = Game()
+    g.run()
+
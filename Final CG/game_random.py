@@ -0,0 +1,56 @@
+"""
+Generador aleatorio de la lógica de juego
+
+La formación, los disparos enemigos, los power-ups y los patrones del jefe
+sacan sus números de rng y no del módulo random global. rng es un
+random.Random que además cuenta las palabras de 32 bits que consume su
+Mersenne Twister: con esa posición, el rebobinado guarda por tick un solo
+entero y una copia completa del estado (625 enteros) solo de vez en cuando;
+para volver a un tick restaura la copia anterior y avanza la diferencia.
+"""
+import random
+
+
+class CountingRandom(random.Random):
+    """random.Random que lleva la cuenta de las palabras consumidas
+
+    random() consume dos palabras y getrandbits(k) una por cada 32 bits; el
+    resto de los métodos (choice, randrange, uniform...) pasan por alguno de
+    esos dos. getstate() incluye la cuenta, así que setstate() la restaura.
+    """
+
+    def __init__(self, seed=None):
+        self.words = 0  # palabras consumidas desde la última semilla
+        self.generation = 0  # cambia con cada seed() o setstate()
+        super().__init__(seed)
+
+    def seed(self, a=None, version=2):
+        super().seed(a, version)
+        self.words = 0
+        self.generation += 1
+
+    def random(self):
+        self.words += 2
+        return super().random()
+
+    def getrandbits(self, k):
+        self.words += (k + 31) // 32
+        return super().getrandbits(k)
+
+    def getstate(self):
+        return super().getstate(), self.words
+
+    def setstate(self, state):
+        state, words = state
+        super().setstate(state)
+        self.words = words
+        self.generation += 1
+
+    def skip(self, words):
+        """Avanza words palabras, como si se hubieran sacado esos números"""
+        if words > 0:
+            super().getrandbits(32 * words)
+            self.words += words
+
+
+rng = CountingRandom()
@@ -0,0 +1,97 @@
+"""
+Motor de gestos: landmarks de MediaPipe en un arreglo NumPy y rasgos vectorizados
+"""
+import math
+import numpy as np
+from config import *
+
+# Índices de landmarks de MediaPipe Hands
+WRIST = 0
+THUMB_TIP = 4
+INDEX_TIP = 8
+MIDDLE_MCP = 9
+FINGER_MCPS = np.array([5, 9, 13, 17])  # índice, medio, anular, meñique
+FINGER_TIPS = np.array([8, 12, 16, 20])
+NUM_LANDMARKS = 21
+
+
+class GestureEngine:
+    def __init__(self):
+        """Inicializa el motor con todos los buffers preasignados"""
+        self.landmarks = np.zeros((NUM_LANDMARKS, 3), dtype=np.float32)
+        self.xy = self.landmarks[:, :2]  # vista sin copia de las coordenadas x, y
+
+        # Buffers intermedios (se reutilizan en cada inferencia)
+        self._tip_vec = np.zeros((4, 2), dtype=np.float32)
+        self._mcp_vec = np.zeros((4, 2), dtype=np.float32)
+        self._tip_dist = np.zeros(4, dtype=np.float32)
+        self._mcp_dist = np.zeros(4, dtype=np.float32)
+        self.extension = np.zeros(4, dtype=np.float32)  # punta/MCP respecto a la muñeca
+
+        self.palm_scale = 1.0
+        self.pinch_distance = 1.0  # pulgar-índice normalizado por la palma
+
+        # Estado con histéresis
+        self.is_fist = False
+        self.is_pinching = False
+        self.is_open_palm = False
+
+    def load(self, hand_landmarks):
+        """Copia los 21 landmarks de MediaPipe al arreglo preasignado"""
+        self.landmarks[:] = [(lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark]
+
+    def update(self, hand_landmarks=None):
+        """Calcula los rasgos del gesto y actualiza los estados con histéresis
+
+        Args:
+            hand_landmarks: landmarks de MediaPipe; si es None se usan los ya cargados
+        """
+        if hand_landmarks is not None:
+            self.load(hand_landmarks)
+        xy = self.xy
+        wrist = xy[WRIST]
+        wrist_x, wrist_y = float(wrist[0]), float(wrist[1])
+
+        # Escala de la palma: muñeca -> nudillo del dedo medio
+        self.palm_scale = max(math.hypot(float(xy[MIDDLE_MCP, 0]) - wrist_x,
+                                         float(xy[MIDDLE_MCP, 1]) - wrist_y), 1e-6)
+
+        # Extensión de cada dedo (curl): distancia punta-muñeca / MCP-muñeca
+        np.take(xy, FINGER_TIPS, axis=0, out=self._tip_vec)
+        np.take(xy, FINGER_MCPS, axis=0, out=self._mcp_vec)
+        np.subtract(self._tip_vec, wrist, out=self._tip_vec)
+        np.subtract(self._mcp_vec, wrist, out=self._mcp_vec)
+        np.hypot(self._tip_vec[:, 0], self._tip_vec[:, 1], out=self._tip_dist)
+        np.hypot(self._mcp_vec[:, 0], self._mcp_vec[:, 1], out=self._mcp_dist)
+        np.maximum(self._mcp_dist, 1e-6, out=self._mcp_dist)
+        np.divide(self._tip_dist, self._mcp_dist, out=self.extension)
+
+        # Pinza: pulgar-índice normalizado por la escala de la palma
+        self.pinch_distance = math.hypot(
+            float(xy[THUMB_TIP, 0]) - float(xy[INDEX_TIP, 0]),
+            float(xy[THUMB_TIP, 1]) - float(xy[INDEX_TIP, 1])) / self.palm_scale
+
+        mean_extension = float(self.extension.mean())
+        min_extension = float(self.extension.min())
+
+        # Histéresis: umbral de entrada y de salida distintos para evitar parpadeos
+        if self.is_fist:
+            self.is_fist = mean_extension < GESTURE_FIST_EXIT
+        else:
+            self.is_fist = mean_extension < GESTURE_FIST_ENTER
+
+        if self.is_pinching:
+            self.is_pinching = self.pinch_distance < GESTURE_PINCH_EXIT
+        else:
+            self.is_pinching = self.pinch_distance < GESTURE_PINCH_ENTER
+
+        if self.is_open_palm:
+            self.is_open_palm = min_extension > GESTURE_OPEN_EXIT
+        else:
+            self.is_open_palm = min_extension > GESTURE_OPEN_ENTER
+
+    def reset(self):
+        """Olvida el gesto actual (p. ej. cuando se pierde la mano)"""
+        self.is_fist = False
+        self.is_pinching = False
+        self.is_open_palm = False
@@ -1,77 +1,196 @@
-"""
-Detector de manos usando MediaPipe y OpenCV
-"""
-import cv2
-import mediapipe as mp
-from config import HAND_DETECTION_CONFIDENCE, CAMERA_WIDTH, CAMERA_HEIGHT
-
-class HandDetector:
-    def __init__(self):
-        """Inicializa el detector de manos"""
-        self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=1,
-            min_detection_confidence=HAND_DETECTION_CONFIDENCE,
-            min_tracking_confidence=0.5
-        )
-        self.mp_draw = mp.solutions.drawing_utils
-        
-        # Inicializar cámara
-        self.cap = cv2.VideoCapture(0)
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, CAMERA_WIDTH)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, CAMERA_HEIGHT)
-        
-        self.hand_x = 0.5  # Posición normalizada (0-1)
-        self.is_closed = False  # Mano cerrada para disparar
-        
-    def update(self):
-        """Actualiza la detección de manos"""
-        success, frame = self.cap.read()
-        if not success:
-            return None
-            
-        # Voltear horizontalmente para efecto espejo
-        frame = cv2.flip(frame, 1)
-        
-        # Convertir a RGB
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        
-        # Procesar frame
-        results = self.hands.process(rgb_frame)
-        
-        # Dibujar landmarks si se detecta mano
-        if results.multi_hand_landmarks:
-            for hand_landmarks in results.multi_hand_landmarks:
-                self.mp_draw.draw_landmarks(
-                    frame, 
-                    hand_landmarks, 
-                    self.mp_hands.HAND_CONNECTIONS
-                )
-                
-                # Obtener posición de la muñeca (landmark 0)
-                wrist = hand_landmarks.landmark[0]
-                self.hand_x = wrist.x
-                
-                # Detectar si la mano está cerrada (puño)
-                # Comparar distancia entre punta del dedo índice y palma
-                index_tip = hand_landmarks.landmark[8]
-                palm = hand_landmarks.landmark[0]
-                
-                distance = ((index_tip.x - palm.x)**2 + (index_tip.y - palm.y)**2)**0.5
-                self.is_closed = distance < 0.15
-        
-        return frame
-    
-    def get_position(self):
-        """Retorna la posición normalizada de la mano (0-1)"""
-        return self.hand_x
-    
-    def is_hand_closed(self):
-        """Retorna True si la mano está cerrada (para disparar)"""
-        return self.is_closed
-    
-    def release(self):
-        """Libera recursos de la cámara"""
-        self.cap.release()
-        cv2.destroyAllWindows()
\ No newline at end of file
+"""
+Detector de manos usando MediaPipe y OpenCV
+"""
+import cv2
+import mediapipe as mp
+import numpy as np
+from config import (HAND_DETECTION_CONFIDENCE, CAMERA_WIDTH, CAMERA_HEIGHT,
+                    VISION_FRAME_WIDTH, VISION_FRAME_HEIGHT, VISION_MAX_HANDS,
+                    COOP_HAND_ASSIGNMENT)
+from gestures import GestureEngine, WRIST
+from startup_profiler import profiler
+
+
+class HandTrack:
+    """Estado de una mano asignada a un jugador"""
+
+    def __init__(self):
+        self.hand_x = 0.5  # Posición normalizada (0-1)
+        self.is_closed = False  # Mano cerrada para disparar
+        self.detected = False  # Hubo mano en el último frame procesado
+        self.gestures = GestureEngine()  # Landmarks (21, 3) y rasgos del gesto
+
+
+class HandDetector:
+    def __init__(self, max_hands=1):
+        """Inicializa el detector de manos
+
+        Args:
+            max_hands: manos a seguir (1 = un jugador, 2 = cooperativo)
+        """
+        self.mp_hands = mp.solutions.hands
+        self.max_hands = max_hands
+        with profiler.stage("mediapipe_model_load"):
+            self.hands = self._create_model(max_hands)
+        self.mp_draw = mp.solutions.drawing_utils
+
+        # Inicializar cámara
+        with profiler.stage("camera_open"):
+            self.cap = cv2.VideoCapture(0)
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, CAMERA_WIDTH)
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, CAMERA_HEIGHT)
+
+        # Una pista por jugador; la pista 0 es la del modo de un jugador
+        self.tracks = [HandTrack() for _ in range(VISION_MAX_HANDS)]
+
+        # Vista previa reducida en RGB (buffers preasignados)
+        self.preview_bgr = np.zeros((VISION_FRAME_HEIGHT, VISION_FRAME_WIDTH, 3), dtype=np.uint8)
+        self.preview = np.zeros((VISION_FRAME_HEIGHT, VISION_FRAME_WIDTH, 3), dtype=np.uint8)
+        self.preview_surface = None
+        self.parked = False  # Sin inferencia mientras el juego está en menús
+        self.inference_every = 1  # Inferencia en 1 de cada N frames (calidad reducida)
+        self.frame_count = 0
+
+    def _create_model(self, max_hands):
+        # En modo video MediaPipe solo ejecuta el detector de palmas cuando
+        # pierde una mano; mientras tanto sigue cada mano en su propia ROI
+        return self.mp_hands.Hands(
+            static_image_mode=False,
+            max_num_hands=max_hands,
+            min_detection_confidence=HAND_DETECTION_CONFIDENCE,
+            min_tracking_confidence=0.5
+        )
+
+    def set_max_hands(self, max_hands):
+        """Cambia el número de manos a seguir (recrea el modelo si cambia)"""
+        max_hands = max(1, min(max_hands, len(self.tracks)))
+        if max_hands == self.max_hands:
+            return
+        self.hands.close()
+        self.hands = self._create_model(max_hands)
+        self.max_hands = max_hands
+        for track in self.tracks:
+            track.detected = False
+            track.is_closed = False
+            track.gestures.reset()
+
+    def _assign_tracks(self, hand_list, handedness):
+        """Asigna cada mano detectada a la pista de un jugador
+
+        Con una sola pista todo va a la 0. En cooperativo se asigna por
+        lateralidad (izquierda -> jugador 1) si ambas manos difieren, o por
+        mitad de pantalla según la muñeca.
+        """
+        if self.max_hands == 1:
+            return [0] * len(hand_list)
+
+        if COOP_HAND_ASSIGNMENT == "handedness" and handedness:
+            labels = [h.classification[0].label for h in handedness]
+            if len(set(labels)) == len(labels):
+                return [0 if label == "Left" else 1 for label in labels]
+
+        wrist_x = [hand.landmark[WRIST].x for hand in hand_list]
+        if len(hand_list) == 1:
+            return [0 if wrist_x[0] < 0.5 else 1]
+        order = sorted(range(len(hand_list)), key=lambda i: wrist_x[i])
+        assignment = [0] * len(hand_list)
+        for track_index, hand_index in enumerate(order):
+            assignment[hand_index] = min(track_index, self.max_hands - 1)
+        return assignment
+
+    def update(self):
+        """Actualiza la detección de manos"""
+        if self.parked:
+            return None
+        self.frame_count += 1
+        if self.frame_count % self.inference_every:
+            # Frame salteado: se descarta sin decodificar para no acumular atraso
+            self.cap.grab()
+            return None
+        success, frame = self.cap.read()
+        if not success:
+            return None
+
+        # Preprocesado compartido por todas las manos: espejo y RGB una sola vez
+        frame = cv2.flip(frame, 1)
+        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+        # Procesar frame
+        results = self.hands.process(rgb_frame)
+        hand_list = results.multi_hand_landmarks or []
+        assignment = self._assign_tracks(hand_list, results.multi_handedness)
+
+        for track in self.tracks:
+            track.detected = False
+
+        # Dibujar landmarks de cada mano y actualizar su pista
+        for hand_landmarks, track_index in zip(hand_list, assignment):
+            self.mp_draw.draw_landmarks(
+                frame,
+                hand_landmarks,
+                self.mp_hands.HAND_CONNECTIONS
+            )
+
+            # Copiar los 21 landmarks una sola vez y calcular el gesto
+            track = self.tracks[track_index]
+            track.gestures.update(hand_landmarks)
+            track.detected = True
+
+            # Posición de la muñeca (landmark 0)
+            track.hand_x = float(track.gestures.landmarks[WRIST, 0])
+
+            # Mano cerrada (puño) según la extensión media de los dedos
+            track.is_closed = track.gestures.is_fist
+
+        for track in self.tracks:
+            if not track.detected:
+                track.gestures.reset()
+                track.is_closed = False
+
+        # Vista previa para el HUD
+        cv2.resize(frame, (VISION_FRAME_WIDTH, VISION_FRAME_HEIGHT), dst=self.preview_bgr,
+                   interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(self.preview_bgr, cv2.COLOR_BGR2RGB, dst=self.preview)
+
+        return frame
+
+    def set_parked(self, parked):
+        """Suspende (True) o reanuda (False) la inferencia"""
+        self.parked = parked
+
+    def set_inference_interval(self, frames):
+        """Infiere en un frame de cada `frames`; en los demás las pistas conservan el último resultado"""
+        self.inference_every = max(int(frames), 1)
+
+    def get_position(self, index=0):
+        """Retorna la posición normalizada de la mano de un jugador (0-1)"""
+        return self.tracks[index].hand_x
+
+    def is_hand_closed(self, index=0):
+        """Retorna True si la mano del jugador está cerrada (para disparar)"""
+        return self.tracks[index].is_closed
+
+    def is_detected(self, index=0):
+        """Retorna True si la mano del jugador se vio en el último frame"""
+        return self.tracks[index].detected
+
+    def get_preview_surface(self):
+        """Retorna una superficie de pygame que comparte memoria con la vista previa"""
+        if self.preview_surface is None:
+            import pygame
+            self.preview_surface = pygame.image.frombuffer(
+                self.preview, (VISION_FRAME_WIDTH, VISION_FRAME_HEIGHT), "RGB")
+        return self.preview_surface
+
+    def is_pinching(self, index=0):
+        """Retorna True si el pulgar y el índice están juntos"""
+        return self.tracks[index].gestures.is_pinching
+
+    def is_open_palm(self, index=0):
+        """Retorna True si todos los dedos están extendidos"""
+        return self.tracks[index].gestures.is_open_palm
+
+    def release(self):
+        """Libera recursos de la cámara"""
+        self.cap.release()
+        cv2.destroyAllWindows()
@@ -0,0 +1,71 @@
+"""
+Carga diferida de subsistemas pesados (visión y audio) en hilos de fondo
+"""
+import queue
+import threading
+import time
+import traceback
+
+STATUS_LOADING = "loading"
+STATUS_READY = "ready"
+STATUS_FAILED = "failed"
+
+
+class BackgroundLoader:
+    def __init__(self):
+        """Inicializa el cargador de subsistemas"""
+        self.status = {}  # {nombre: estado}
+        self.elapsed = {}  # {nombre: segundos que tomó la carga}
+        self.results = queue.Queue()
+
+    def start(self, name, factory):
+        """Lanza la carga de un subsistema en un hilo daemon
+
+        Args:
+            name: nombre del subsistema ("vision", "audio", ...)
+            factory: función sin argumentos que importa e inicializa el subsistema
+        """
+        self.status[name] = STATUS_LOADING
+        thread = threading.Thread(target=self._run, args=(name, factory),
+                                  name=f"loader-{name}", daemon=True)
+        thread.start()
+
+    def _run(self, name, factory):
+        start = time.perf_counter()
+        try:
+            value = factory()
+            error = None
+        except ImportError as e:
+            # Dependencia opcional ausente: basta con el mensaje
+            value = None
+            error = e
+        except Exception as e:
+            value = None
+            error = e
+            traceback.print_exc()
+        self.results.put((name, value, error, time.perf_counter() - start))
+
+    def poll(self):
+        """Retorna los subsistemas que terminaron de cargar desde la última llamada
+
+        Returns:
+            list: tuplas (nombre, valor, error); valor es None si falló
+        """
+        finished = []
+        while True:
+            try:
+                name, value, error, elapsed = self.results.get_nowait()
+            except queue.Empty:
+                break
+            self.status[name] = STATUS_FAILED if error or value is None else STATUS_READY
+            self.elapsed[name] = elapsed
+            finished.append((name, value, error))
+        return finished
+
+    def get_status(self, name):
+        """Retorna el estado de un subsistema (None si nunca se lanzó)"""
+        return self.status.get(name)
+
+    def is_done(self):
+        """True si ningún subsistema sigue cargando"""
+        return all(status != STATUS_LOADING for status in self.status.values())
@@ -1,28 +1,99 @@
-"""
-Space Invaders con Control por Visión
-Proyecto Final - Computación Gráfica 2025-2
-
-Autores: Lina María Calvo Castro - Juan Manuel Diaz Torres
-Tecnología: Python + Pygame + MediaPipe + OpenCV
-"""
-
-from game import Game
-
-def main():
-    """Función principal"""
-    print("=" * 50)
-    print("SPACE INVADERS - CONTROL POR VISIÓN")
-    print("=" * 50)
-    print("\nIniciando juego...")
-    print("Asegúrate de tener una cámara conectada.")
-    print("\nControles:")
-    print("- Mueve tu mano para controlar la nave")
-    print("- Cierra el puño para disparar")
-    print("- También puedes usar flechas y ESPACIO\n")
-    
-    game = Game()
-    game.run()
-
-if __name__ == "__main__":
-
-    main()
+"""
+Space Invaders con Control por Visión
+Proyecto Final - Computación Gráfica 2025-2
+
+Autores: Lina María Calvo Castro - Juan Manuel Diaz Torres
+Tecnología: Python + Pygame + MediaPipe + OpenCV
+"""
+import argparse
+import importlib
+import time
+
+# Se toma antes de importar el juego para medir el arranque completo
+START_TIME = time.perf_counter()
+
+from config import (DISPLAY_FULLSCREEN, DISPLAY_INTERNAL_SCALE, DISPLAY_MODE, RECORD_DIR,
+                    SPECTATOR_PORT, TELEMETRY_DIR)
+from startup_profiler import profiler
+
+# Módulos pesados cuyo tiempo de importación se mide con --profile-startup
+PROFILED_IMPORTS = ["numpy", "pygame", "cv2", "mediapipe", "scipy.signal"]
+
+
+def parse_args():
+    """Lee los argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Space Invaders con control por visión")
+    parser.add_argument("--profile-startup", nargs="?", const="startup_profile.json",
+                        default=None, metavar="JSON",
+                        help="mide el arranque, imprime el desglose y lo guarda en JSON")
+    parser.add_argument("--autopilot", action="store_true",
+                        help="modo demo: la nave juega sola (sin cámara)")
+    parser.add_argument("--record", nargs="?", const=RECORD_DIR, default=None, metavar="DIR",
+                        help="graba la sesión en DIR (F9 detiene o reanuda, F10 guarda la repetición)")
+    parser.add_argument("--telemetry", nargs="?", const=TELEMETRY_DIR, default=None, metavar="DIR",
+                        help="registra los eventos de juego en archivos comprimidos en DIR")
+    parser.add_argument("--leaderboard", default=None, metavar="URL",
+                        help="envía los puntajes a un leaderboard (p. ej. http://localhost:8765/scores)")
+    parser.add_argument("--spectate", nargs="?", type=int, const=SPECTATOR_PORT, default=None,
+                        metavar="PORT",
+                        help="publica la partida por UDP para espectadores (python spectator.py --connect)")
+    parser.add_argument("--display", choices=("window", "scaled", "native"), default=DISPLAY_MODE,
+                        help="presentación: 800x600, escalado por SDL/GPU o escalado en CPU")
+    parser.add_argument("--fullscreen", action="store_true", default=DISPLAY_FULLSCREEN,
+                        help="pantalla completa (con --display window usa scaled)")
+    parser.add_argument("--low-res", action="store_true", default=DISPLAY_INTERNAL_SCALE > 1,
+                        help="resolución interna de 400x300 para equipos débiles")
+    return parser.parse_args()
+
+
+def profile_imports():
+    """Importa los módulos pesados uno a uno midiendo cada importación"""
+    for module_name in PROFILED_IMPORTS:
+        start = time.perf_counter()
+        try:
+            importlib.import_module(module_name)
+            name = f"import {module_name}"
+        except ImportError:
+            name = f"import {module_name} (no disponible)"
+        profiler.record(name, time.perf_counter() - start)
+
+
+def main():
+    """Función principal"""
+    args = parse_args()
+    if args.profile_startup:
+        profiler.enable()
+        profile_imports()
+
+    from game import Game
+
+    print("=" * 50)
+    print("SPACE INVADERS - CONTROL POR VISIÓN")
+    print("=" * 50)
+    print("\nIniciando juego...")
+    print("Asegúrate de tener una cámara conectada.")
+    print("\nControles:")
+    print("- Mueve tu mano para controlar la nave")
+    print("- Cierra el puño para disparar")
+    print("- También puedes usar flechas y ESPACIO\n")
+
+    game = Game(start_time=START_TIME, profile_startup=bool(args.profile_startup),
+                autopilot=args.autopilot, record_dir=args.record,
+                telemetry_dir=args.telemetry, leaderboard_url=args.leaderboard,
+                spectator_port=args.spectate,
+                display_mode="scaled" if args.fullscreen and args.display == "window" else args.display,
+                fullscreen=args.fullscreen,
+                internal_scale=max(DISPLAY_INTERNAL_SCALE, 2) if args.low_res else 1)
+    if args.record:
+        game.recorder.toggle_recording()
+    try:
+        game.run()
+    finally:
+        if args.profile_startup:
+            profiler.report()
+            profiler.write_json(args.profile_startup)
+            print(f"Perfil de arranque guardado en {args.profile_startup}")
+
+if __name__ == "__main__":
+
+    main()
@@ -0,0 +1,190 @@
+"""
+Observaciones del juego para agentes
+
+Dos formas de observar una partida:
+- symbolic_observation: vector de tamaño fijo construido directamente del
+  estado de las entidades, sin rasterizar nada. Todas las magnitudes van
+  normalizadas a aproximadamente [-1, 1].
+- FrameObserver: el frame que dibuja el juego como arreglo NumPy, sin
+  ventana ni PNG de por medio, a resolución completa o reducido por
+  promedio de área (en color o escala de grises).
+"""
+import numpy as np
+import pygame
+from config import *
+
+# Disposición del vector
+O_PLAYER = 0  # x, vidas, escudo, doble disparo, disparo listo
+O_FORMATION = 5  # enemigos restantes, caja (x, y, ancho, alto), dirección, velocidad
+O_BOSS = 12  # presente, x, y, vida
+O_ENEMY_BULLETS = 16  # por bala: dx, dy, presente
+O_ENEMIES = O_ENEMY_BULLETS + 3 * OBS_ENEMY_BULLETS  # por enemigo: dx, dy, presente
+O_POWERUPS = O_ENEMIES + 3 * OBS_ENEMIES  # por power-up: dx, dy, presente
+OBS_SIZE = O_POWERUPS + 3 * OBS_POWERUPS
+
+MAX_FORMATION = ENDLESS_LIMITS["rows"] * ENDLESS_LIMITS["cols"]
+
+
+def _nearest(out, offset, k, xs, ys, cx, cy):
+    """Escribe (dx, dy, presente) de los k puntos más cercanos a (cx, cy), en orden"""
+    block = out[offset:offset + 3 * k].reshape(k, 3)
+    block[:] = 0.0
+    if not xs:
+        return
+    dx = (np.asarray(xs, dtype=np.float32) - cx) / SCREEN_WIDTH
+    dy = (np.asarray(ys, dtype=np.float32) - cy) / SCREEN_HEIGHT
+    distance = dx * dx + dy * dy
+    if len(distance) > k:
+        nearest = np.argpartition(distance, k - 1)[:k]
+        nearest = nearest[np.argsort(distance[nearest])]
+    else:
+        nearest = np.argsort(distance)
+    n = len(nearest)
+    block[:n, 0] = dx[nearest]
+    block[:n, 1] = dy[nearest]
+    block[:n, 2] = 1.0
+
+
+def symbolic_observation(game, player=None, out=None):
+    """Construye el vector de observación de un jugador
+
+    Args:
+        game: instancia de Game en STATE_PLAYING
+        player: jugador observado (por defecto el primero)
+        out: arreglo float32 de OBS_SIZE a reutilizar (se crea si es None)
+
+    Returns:
+        numpy.ndarray: el vector (el mismo objeto que out si se pasó)
+    """
+    if out is None:
+        out = np.zeros(OBS_SIZE, dtype=np.float32)
+    if player is None:
+        player = game.players[0]
+    now = game.ticks()
+    cx = player.x + player.width / 2
+    cy = player.y
+
+    # Jugador
+    out[O_PLAYER] = cx / SCREEN_WIDTH
+    out[O_PLAYER + 1] = player.lives / PLAYER_LIVES
+    out[O_PLAYER + 2] = 1.0 if player.has_shield else 0.0
+    out[O_PLAYER + 3] = 1.0 if player.double_shot_until > now else 0.0
+    out[O_PLAYER + 4] = 1.0 if now - player.last_shot_time >= PLAYER_SHOT_COOLDOWN_MS else 0.0
+
+    # Formación
+    enemies = game.enemies
+    bounds = enemies.bounds if enemies.enemies else None
+    out[O_FORMATION] = len(enemies.enemies) / MAX_FORMATION
+    if bounds is not None:
+        out[O_FORMATION + 1] = bounds.x / SCREEN_WIDTH
+        out[O_FORMATION + 2] = bounds.y / SCREEN_HEIGHT
+        out[O_FORMATION + 3] = bounds.width / SCREEN_WIDTH
+        out[O_FORMATION + 4] = bounds.height / SCREEN_HEIGHT
+    else:
+        out[O_FORMATION + 1:O_FORMATION + 5] = 0.0
+    out[O_FORMATION + 5] = enemies.direction
+    out[O_FORMATION + 6] = enemies.speed / ENDLESS_LIMITS["enemy_speed"]
+
+    # Jefe
+    boss = enemies.boss
+    if boss:
+        out[O_BOSS] = 1.0
+        out[O_BOSS + 1] = (boss.x + boss.width / 2 - cx) / SCREEN_WIDTH
+        out[O_BOSS + 2] = (boss.y + boss.height / 2 - cy) / SCREEN_HEIGHT
+        out[O_BOSS + 3] = boss.health / boss.max_health
+    else:
+        out[O_BOSS:O_BOSS + 4] = 0.0
+
+    # Entidades más cercanas, relativas a la nave
+    bullets = game.enemy_bullets
+    _nearest(out, O_ENEMY_BULLETS, OBS_ENEMY_BULLETS,
+             [b.x + b.width / 2 for b in bullets], [b.y + b.height for b in bullets], cx, cy)
+    formation = enemies.enemies
+    _nearest(out, O_ENEMIES, OBS_ENEMIES,
+             [e.x + e.width / 2 for e in formation], [e.y + e.height / 2 for e in formation], cx, cy)
+    powerups = game.powerup_manager.powerups
+    _nearest(out, O_POWERUPS, OBS_POWERUPS,
+             [p.x + p.width / 2 for p in powerups], [p.y + p.height / 2 for p in powerups], cx, cy)
+    return out
+
+
+class FrameObserver:
+    """Dibuja el juego en una superficie propia y la expone como arreglo
+
+    La superficie sustituye a game.screen solo mientras se dibuja, así que
+    funciona igual con un juego con ventana que sin ella. Los arreglos
+    devueltos son siempre de forma (alto, ancho[, 3]) en uint8 y viven hasta
+    el siguiente render().
+    """
+
+    def __init__(self, game, scale=1, grayscale=False):
+        """Prepara las superficies y los buffers
+
+        Args:
+            game: instancia de Game
+            scale: factor entero de reducción (1 = resolución completa)
+            grayscale: devolver un solo canal de luminancia
+        """
+        if SCREEN_WIDTH % scale or SCREEN_HEIGHT % scale:
+            raise ValueError(f"scale={scale} no divide {SCREEN_WIDTH}x{SCREEN_HEIGHT}")
+        self.game = game
+        self.scale = scale
+        self.grayscale = grayscale
+        self.surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), depth=32)
+        self.size = (SCREEN_WIDTH // scale, SCREEN_HEIGHT // scale)
+        # Con factor entero smoothscale promedia bloques de scale x scale (filtro de caja)
+        self.small = pygame.Surface(self.size, depth=32) if scale > 1 else None
+        self._views = {}
+
+        width, height = self.size
+        self.shape = (height, width) if grayscale else (height, width, 3)
+        # Buffers de la conversión a grises, reutilizados en cada frame
+        self._gray = np.zeros((height, width), dtype=np.float32)
+        self._channel = np.zeros((height, width), dtype=np.float32)
+        self.frame = np.zeros((height, width), dtype=np.uint8) if grayscale else None
+
+    def _view(self, surface):
+        """Vista sin copia (alto, ancho, 3) de una superficie; la bloquea hasta render()"""
+        view = self._views.get(surface)
+        if view is None:
+            view = pygame.surfarray.pixels3d(surface).transpose(1, 0, 2)
+            self._views[surface] = view
+        return view
+
+    def pixels(self):
+        """Vista sin copia (alto, ancho, 3) del último frame a resolución completa"""
+        return self._view(self.surface)
+
+    def render(self):
+        """Dibuja el estado actual y retorna la observación
+
+        Las vistas de frames anteriores dejan de ser válidas: no hay que
+        guardarlas (bloquean la superficie y el dibujado fallaría).
+
+        Returns:
+            numpy.ndarray: en color, una vista sin copia de la superficie
+                (completa o reducida); en grises, self.frame
+        """
+        self._views.clear()  # soltar los bloqueos antes de dibujar
+        game = self.game
+        screen, game.screen = game.screen, self.surface
+        try:
+            game.draw()
+        finally:
+            game.screen = screen
+
+        if self.small is not None:
+            pygame.transform.smoothscale(self.surface, self.size, self.small)
+            view = self._view(self.small)
+        else:
+            view = self.pixels()
+        if not self.grayscale:
+            return view
+
+        gray, channel = self._gray, self._channel
+        np.multiply(view[..., 0], OBS_GRAY_WEIGHTS[0], out=gray)
+        for c in (1, 2):
+            np.multiply(view[..., c], OBS_GRAY_WEIGHTS[c], out=channel)
+            gray += channel
+        np.copyto(self.frame, gray, casting="unsafe")
+        return self.frame
@@ -0,0 +1,234 @@
+"""
+Sistema de partículas para explosiones e impactos
+
+Posiciones, velocidades, vidas y colores viven en arreglos NumPy de capacidad
+fija: emitir, integrar y expirar son operaciones vectorizadas. En superficies
+de 32 bits el dibujado escribe los píxeles directo en el buffer, un índice
+vectorizado por píxel de la forma; las partículas que tocan el borde y las
+superficies de otro formato usan sprites precalculados en una sola llamada a
+Surface.blits. Con decenas de miles de partículas el costo se mide con
+python benchmarks/bench_particles.py.
+"""
+import numpy as np
+import pygame
+from config import *
+
+# Los sprites son de 5x5 px; el destino se desplaza para centrarlos
+SPRITE_SIZE = 5
+SPRITE_HALF = SPRITE_SIZE // 2
+
+
+def _radius(level):
+    """Radio del círculo según el nivel de vida (las que se apagan son más chicas)"""
+    return 1 if level < PARTICLE_FADE_STEPS // 2 else 2
+
+
+def _stamp(radius):
+    """Desplazamientos (dx, dy) de los píxeles que pinta el sprite de ese radio"""
+    sprite = pygame.Surface((SPRITE_SIZE, SPRITE_SIZE))
+    sprite.fill(BLACK)
+    pygame.draw.circle(sprite, WHITE, (SPRITE_HALF, SPRITE_HALF), radius)
+    return [(x - SPRITE_HALF, y - SPRITE_HALF)
+            for y in range(SPRITE_SIZE) for x in range(SPRITE_SIZE)
+            if sprite.get_at((x, y)) != BLACK]
+
+
+def _fade(color, level):
+    """Mezcla el color hacia el fondo según el nivel (0 = apagado)"""
+    t = (level + 1) / PARTICLE_FADE_STEPS
+    return tuple(int(bg + (c - bg) * t) for c, bg in zip(color, DARK_BLUE))
+
+
+class ParticleSystem:
+    def __init__(self, capacity=PARTICLE_MAX, seed=None):
+        """Inicializa el sistema con todos los arreglos preasignados
+
+        Args:
+            capacity: máximo de partículas vivas a la vez
+            seed: semilla del generador aleatorio (None = aleatoria)
+        """
+        self.capacity = capacity
+        self.count = 0  # Las partículas vivas ocupan [0, count)
+        self.dropped = 0  # Partículas no emitidas por alcanzar el tope
+
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.int32)  # frames restantes
+        self.color = np.zeros(capacity, dtype=np.int32)  # índice en la paleta
+
+        # Buffers de dibujado
+        self._level = np.zeros(capacity, dtype=np.int32)
+        self._sprite_index = np.zeros(capacity, dtype=np.int32)
+        self._dest = np.zeros((capacity, 2), dtype=np.int32)
+        self._offset = np.zeros(capacity, dtype=np.int64)  # posición en el buffer de píxeles
+        self._inside = np.zeros(capacity, dtype=bool)
+        self._big = np.zeros(capacity, dtype=bool)
+
+        self.rng = np.random.default_rng(seed)
+        self._palette = {}  # color RGB -> índice en la paleta
+        self._sprites = []  # índice de paleta * PARTICLE_FADE_STEPS + nivel -> Surface
+        self._colors = []  # mismo índice -> color RGB del sprite
+        # Formas chica y grande como desplazamientos desde el centro
+        self._stamps = (_stamp(_radius(0)), _stamp(_radius(PARTICLE_FADE_STEPS - 1)))
+        self._mapped = None  # colores en el formato de la última superficie
+        self._mapped_key = None
+
+    def _color_index(self, color):
+        """Retorna el índice de paleta del color, creando sus sprites la primera vez"""
+        index = self._palette.get(color)
+        if index is not None:
+            return index
+        index = len(self._palette)
+        self._palette[color] = index
+        for level in range(PARTICLE_FADE_STEPS):
+            sprite = pygame.Surface((SPRITE_SIZE, SPRITE_SIZE))
+            sprite.fill(BLACK)
+            faded = _fade(color, level)
+            pygame.draw.circle(sprite, faded, (SPRITE_HALF, SPRITE_HALF), _radius(level))
+            self._colors.append(faded)
+            sprite.set_colorkey(BLACK, pygame.RLEACCEL)
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert()
+            self._sprites.append(sprite)
+        return index
+
+    def emit(self, x, y, count, color, speed=PARTICLE_SPEED, life=PARTICLE_LIFETIME):
+        """Emite una ráfaga radial de partículas
+
+        Args:
+            x, y: centro de la ráfaga
+            count: partículas pedidas (se recortan al tope global)
+            color: color RGB de la ráfaga
+            speed: velocidad inicial máxima
+            life: vida máxima en frames
+
+        Returns:
+            int: partículas emitidas
+        """
+        n = min(count, self.capacity - self.count)
+        self.dropped += count - max(n, 0)
+        if n <= 0:
+            return 0
+
+        start, end = self.count, self.count + n
+        angle = self.rng.uniform(0.0, 2.0 * np.pi, n)
+        magnitude = self.rng.uniform(0.2, 1.0, n) * speed
+        self.vel[start:end, 0] = np.cos(angle) * magnitude
+        self.vel[start:end, 1] = np.sin(angle) * magnitude
+        self.pos[start:end] = (x, y)
+        self.life[start:end] = self.rng.integers(life // 2, life + 1, n)
+        self.color[start:end] = self._color_index(color)
+        self.count = end
+        return n
+
+    def update(self):
+        """Integra un frame y elimina las partículas expiradas o fuera de pantalla"""
+        n = self.count
+        if n == 0:
+            return
+        pos = self.pos[:n]
+        vel = self.vel[:n]
+        life = self.life[:n]
+
+        pos += vel
+        vel *= PARTICLE_DRAG
+        vel[:, 1] += PARTICLE_GRAVITY
+        life -= 1
+
+        alive = life > 0
+        alive &= pos[:, 0] > -SPRITE_SIZE
+        alive &= pos[:, 0] < SCREEN_WIDTH + SPRITE_SIZE
+        alive &= pos[:, 1] < SCREEN_HEIGHT + SPRITE_SIZE
+        keep = np.flatnonzero(alive)
+        k = len(keep)
+        if k == n:
+            return
+
+        # Compactar las vivas al inicio de los arreglos
+        self.pos[:k] = pos[keep]
+        self.vel[:k] = vel[keep]
+        self.life[:k] = life[keep]
+        self.color[:k] = self.color[:n][keep]
+        self.count = k
+
+    def draw(self, screen):
+        """Dibuja todas las partículas
+
+        En superficies de 32 bits las que caen enteras dentro se pintan en el
+        buffer de píxeles; el resto va en una sola llamada a blits.
+        """
+        n = self.count
+        if n == 0:
+            return
+
+        # Sprite según color y vida restante
+        level = self._level[:n]
+        np.multiply(self.life[:n], PARTICLE_FADE_STEPS, out=level)
+        level //= PARTICLE_LIFETIME
+        np.minimum(level, PARTICLE_FADE_STEPS - 1, out=level)
+        sprite = self._sprite_index[:n]
+        np.multiply(self.color[:n], PARTICLE_FADE_STEPS, out=sprite)
+        sprite += level
+
+        dest = self._dest[:n]
+        np.copyto(dest, self.pos[:n], casting="unsafe")
+
+        if screen.get_bytesize() == 4:
+            rest = self._draw_pixels(screen, level, sprite, dest)
+            if len(rest) == 0:
+                return
+            dest = dest[rest]
+            sprite = sprite[rest]
+
+        dest -= SPRITE_HALF
+        sprites = self._sprites
+        screen.blits(zip(map(sprites.__getitem__, sprite.tolist()), dest.tolist()),
+                     doreturn=False)
+
+    def _draw_pixels(self, screen, level, sprite, dest):
+        """Pinta en el buffer de screen las partículas que caen enteras dentro
+
+        Por cada píxel de la forma hay una asignación vectorizada sobre todas
+        las partículas de ese tamaño, sin un objeto de Python por partícula.
+
+        Returns:
+            ndarray: índices de las partículas que quedan para blits (en el borde)
+        """
+        n = len(level)
+        width, height = screen.get_size()
+        row = screen.get_pitch() // 4
+
+        key = (screen.get_masks(), screen.get_shifts(), len(self._colors))
+        if key != self._mapped_key:
+            self._mapped = np.array([screen.map_rgb(color) for color in self._colors],
+                                    dtype=np.uint32)
+            self._mapped_key = key
+        colors = self._mapped[sprite]
+
+        x = dest[:, 0]
+        y = dest[:, 1]
+        inside = self._inside[:n]
+        np.greater_equal(x, SPRITE_HALF, out=inside)
+        inside &= x < width - SPRITE_HALF
+        inside &= y >= SPRITE_HALF
+        inside &= y < height - SPRITE_HALF
+        big = self._big[:n]
+        np.greater_equal(level, PARTICLE_FADE_STEPS // 2, out=big)
+        offset = self._offset[:n]
+        np.multiply(y, row, out=offset)
+        offset += x
+
+        # El arreglo comparte memoria con la superficie mientras exista
+        pixels = np.frombuffer(screen.get_buffer(), dtype=np.uint32)
+        for shape, stamp in ((~big & inside, self._stamps[0]), (big & inside, self._stamps[1])):
+            chosen = np.flatnonzero(shape)
+            base = offset[chosen]
+            chosen_colors = colors[chosen]
+            for dx, dy in stamp:
+                pixels[base + (dy * row + dx)] = chosen_colors
+        del pixels
+        return np.flatnonzero(~inside)
+
+    def clear(self):
+        """Elimina todas las partículas"""
+        self.count = 0
@@ -0,0 +1,162 @@
+"""
+Calidad automática según el tiempo de frame
+
+QualityGovernor promedia el tiempo de trabajo de los últimos QUALITY_WINDOW
+frames (lógica, dibujado y presentación, sin la espera de clock.tick) y lo
+compara con el presupuesto de 1000 / FPS ms. Si se pasa, baja un nivel de
+QUALITY_TIERS: menos estrellas, sin anillos de brillo en los power-ups, sin
+vista previa de la cámara y, por último, inferencia de visión en frames
+alternos. Para volver a subir hace falta margen
+sostenido (QUALITY_UP_RATIO durante QUALITY_UP_HOLD_MS); si una subida no se
+sostiene, la espera siguiente se duplica, así la calidad no oscila entre dos
+niveles.
+
+Los niveles que solo cambian cosas que el equipo no tiene (vista previa e
+inferencia sin cámara) se saltean. La resolución interna queda fuera: en
+scaled la fija el renderer de SDL al abrir la ventana y en native el
+escalado en CPU depende del tamaño de la ventana, así que bajarla no ahorra
+(ver python benchmarks/bench_display.py). Si ni el nivel más bajo alcanza, el HUD lo
+marca en rojo y conviene arrancar con --low-res.
+
+El costo de dibujado de cada nivel y la respuesta a una carga simulada se
+miden con python benchmarks/bench_quality.py.
+"""
+import pygame
+from config import *
+
+# Opciones que cada nivel puede cambiar
+FEATURES = ("stars", "glow_rings", "camera_preview", "inference_every")
+
+
+class QualityGovernor:
+    def __init__(self, tiers=QUALITY_TIERS, fps=FPS, window=QUALITY_WINDOW):
+        """Arranca en el nivel más alto
+
+        Args:
+            tiers: niveles de mayor a menor calidad (ver QUALITY_TIERS)
+            fps: FPS objetivo; el presupuesto es 1000 / fps ms por frame
+            window: frames del promedio móvil
+        """
+        self.tiers = tiers
+        self.tier = 0
+        self.settings = tiers[0]
+        self.budget_ms = 1000 / fps
+        # Opciones que el juego puede aplicar (ver set_features)
+        self.features = {"stars", "glow_rings"}
+        # Promedio móvil sobre un anillo de tiempos de frame
+        self.samples = [0.0] * window
+        self.index = 0
+        self.count = 0
+        self.total = 0.0
+        self.hold_until = 0  # sin decisiones hasta este instante (ms)
+        self.headroom_since = None  # desde cuándo sobra margen para subir
+        self.up_hold_ms = QUALITY_UP_HOLD_MS
+        self.last_up_ms = None
+        self.changes = 0
+        self.saturated = False  # sobre el presupuesto sin niveles más bajos
+        self.hinted = False
+        self.decided_ms = 0.0  # promedio que motivó el último cambio
+        self.font = None
+        self.label = None
+
+    @property
+    def average_ms(self):
+        """Tiempo de frame promedio de la ventana actual (0 si está vacía)"""
+        return self.total / self.count if self.count else 0.0
+
+    def set_features(self, features):
+        """Opciones que el juego puede aplicar ahora (cambia al cargar la visión)"""
+        self.features = set(features)
+
+    def update(self, frame_ms, now):
+        """Registra el tiempo de trabajo de un frame y decide el nivel
+
+        Args:
+            frame_ms: ms de trabajo del frame
+            now: instante actual (ms, reloj real)
+
+        Returns:
+            bool: True si cambió el nivel (hay que aplicar settings)
+        """
+        samples = self.samples
+        self.total += frame_ms - samples[self.index]
+        samples[self.index] = frame_ms
+        self.index = (self.index + 1) % len(samples)
+        if self.count < len(samples):
+            self.count += 1
+            return False
+        if now < self.hold_until:
+            return False
+
+        average = self.total / self.count
+        if average > self.budget_ms * QUALITY_DOWN_RATIO:
+            self.headroom_since = None
+            tier = self._lower(self.tier)
+            if tier == self.tier:
+                if not self.saturated:
+                    self.saturated = True
+                    self.label = None
+                    if not self.hinted:
+                        self.hinted = True
+                        print("Ni con la calidad más baja se llega a los FPS: "
+                              "probar --low-res o --display window.")
+                return False
+            if self.last_up_ms is not None and now - self.last_up_ms < self.up_hold_ms:
+                # La última subida no se sostuvo: esperar el doble antes de intentar otra
+                self.up_hold_ms = min(self.up_hold_ms * 2, QUALITY_UP_HOLD_MAX_MS)
+            return self._set(tier, now, average)
+        if average < self.budget_ms * QUALITY_UP_RATIO and self.saturated:
+            self.saturated = False
+            self.label = None
+        if average < self.budget_ms * QUALITY_UP_RATIO and self.tier > 0:
+            if self.headroom_since is None:
+                self.headroom_since = now
+            elif now - self.headroom_since >= self.up_hold_ms:
+                self.last_up_ms = now
+                return self._set(self._higher(self.tier), now, average)
+            return False
+        self.headroom_since = None
+        return False
+
+    def _differs(self, a, b):
+        """True si los niveles a y b difieren en alguna opción aplicable"""
+        return any(self.tiers[a][key] != self.tiers[b][key] for key in self.features)
+
+    def _lower(self, tier):
+        """Siguiente nivel más bajo que cambia algo, o el mismo si no queda ninguno"""
+        for lower in range(tier + 1, len(self.tiers)):
+            if self._differs(tier, lower):
+                return lower
+        return tier
+
+    def _higher(self, tier):
+        """Nivel más alto equivalente al primero que recupera algo"""
+        higher = tier - 1
+        while higher > 0 and not self._differs(higher - 1, higher):
+            higher -= 1
+        return higher
+
+    def _set(self, tier, now, average=0.0):
+        self.tier = tier
+        self.decided_ms = average
+        self.settings = self.tiers[tier]
+        self.changes += 1
+        self.label = None
+        # El promedio empieza de nuevo para medir el nivel recién aplicado
+        self.count = 0
+        self.total = 0.0
+        self.samples[:] = [0.0] * len(self.samples)
+        self.hold_until = now + QUALITY_SETTLE_MS
+        self.headroom_since = None
+        return True
+
+    def draw_status(self, screen, x, y):
+        """Nivel actual y tiempo de frame promedio en el HUD"""
+        if self.font is None:
+            self.font = pygame.font.Font(None, 20)
+        if self.label is None:
+            color = RED if self.saturated else NEON_GREEN if self.tier == 0 else YELLOW
+            self.label = self.font.render(f"CALIDAD: {self.settings['name']}", True, color)
+        screen.blit(self.label, (x, y))
+        average = self.font.render(f"{self.average_ms:.1f} ms", True, GRAY)
+        screen.blit(average, (x + self.label.get_width() + 8, y))
@@ -0,0 +1,236 @@
+"""
+Grabación de partidas sin frenar el loop
+
+El loop solo copia los bytes crudos de cada frame a un anillo de buffers
+preasignado; hilos codificadores con cv2.VideoWriter leen del anillo y
+escriben el video. Si un codificador se queda atrás, los frames nuevos se
+descartan en lugar de detener el juego. El mismo anillo conserva los
+últimos RECORD_REPLAY_SECONDS segundos para la repetición instantánea.
+"""
+import os
+import threading
+import time
+
+import numpy as np
+import pygame
+from config import *
+
+
+class FrameRing:
+    """Anillo de frames BGRA con números de secuencia
+
+    El frame seq vive en la ranura seq % slots. Cada lector avanza su propia
+    secuencia; push() descarta el frame nuevo si sobrescribiría uno que algún
+    lector todavía no ha leído. Solo el hilo del juego escribe y agrega lectores.
+    """
+
+    def __init__(self, slots, width, height):
+        self.slots = slots
+        self.frames = np.zeros((slots, height, width, 4), dtype=np.uint8)
+        self.write_seq = 0  # secuencia del próximo frame
+        self.readers = []
+        self.lock = threading.Lock()
+        self.new_frame = threading.Condition(self.lock)
+
+    def oldest_seq(self):
+        """Primer frame que se puede leer sin que push() lo esté sobrescribiendo"""
+        return max(self.write_seq - self.slots + 1, 0)
+
+    def push(self, surface):
+        """Copia una superficie de 32 bits del mismo tamaño al anillo
+
+        Returns:
+            bool: False si el frame se descartó porque un lector va atrasado
+        """
+        seq = self.write_seq
+        with self.lock:
+            if any(seq - reader.read_seq >= self.slots for reader in self.readers):
+                return False
+        # Copia de bytes crudos, fuera del lock: los lectores no tocan esta ranura
+        raw = np.frombuffer(surface.get_buffer(), dtype=np.uint8)
+        np.copyto(self.frames[seq % self.slots].reshape(-1), raw)
+        del raw  # suelta el bloqueo de la superficie
+        with self.new_frame:
+            self.write_seq = seq + 1
+            self.new_frame.notify_all()
+        return True
+
+    def attach(self, reader):
+        with self.lock:
+            self.readers.append(reader)
+
+    def detach(self, reader):
+        with self.new_frame:
+            if reader in self.readers:
+                self.readers.remove(reader)
+
+
+class VideoEncoder(threading.Thread):
+    """Hilo que lee frames del anillo y los escribe con cv2.VideoWriter"""
+
+    def __init__(self, ring, path, fps, start_seq, stop_seq=None):
+        """Prepara la codificación
+
+        Args:
+            ring: FrameRing de origen
+            path: archivo de video
+            fps: cuadros por segundo del video
+            start_seq: primer frame a escribir
+            stop_seq: frame donde termina (None = hasta llamar a stop())
+        """
+        super().__init__(name=f"encoder-{os.path.basename(path)}", daemon=True)
+        self.ring = ring
+        self.path = path
+        self.fps = fps
+        self.read_seq = start_seq
+        self.stop_seq = stop_seq
+        self.stopping = False
+        self.written = 0
+        ring.attach(self)
+
+    def stop(self):
+        """Termina después de escribir los frames ya capturados"""
+        with self.ring.new_frame:
+            self.stopping = True
+            self.ring.new_frame.notify_all()
+
+    def _next_frame(self):
+        """Espera el siguiente frame; retorna False cuando ya no habrá más"""
+        ring = self.ring
+        if self.stop_seq is not None:
+            return self.read_seq < self.stop_seq
+        with ring.new_frame:
+            while self.read_seq >= ring.write_seq and not self.stopping:
+                ring.new_frame.wait()
+            return self.read_seq < ring.write_seq
+
+    def run(self):
+        import cv2
+        ring = self.ring
+        height, width = ring.frames.shape[1:3]
+        writer = cv2.VideoWriter(self.path, cv2.VideoWriter_fourcc(*RECORD_FOURCC),
+                                 self.fps, (width, height))
+        try:
+            if not writer.isOpened():
+                print(f"Advertencia: no se pudo abrir {self.path} para escribir video.")
+                return
+            bgr = np.empty((height, width, 3), dtype=np.uint8)
+            while self._next_frame():
+                cv2.cvtColor(ring.frames[self.read_seq % ring.slots], cv2.COLOR_BGRA2BGR, dst=bgr)
+                writer.write(bgr)
+                self.written += 1
+                with ring.lock:
+                    self.read_seq += 1
+        finally:
+            writer.release()
+            ring.detach(self)
+
+
+class Recorder:
+    def __init__(self, directory=RECORD_DIR, fps=RECORD_FPS, scale=RECORD_SCALE,
+                 replay_seconds=RECORD_REPLAY_SECONDS):
+        """Reserva el anillo de frames
+
+        Args:
+            directory: carpeta de los videos
+            fps: frames capturados por segundo de juego
+            scale: factor de reducción de la resolución
+            replay_seconds: duración de la repetición instantánea
+        """
+        import cv2  # noqa: F401  (sin OpenCV no hay grabación: falla aquí y no en un hilo)
+        self.directory = directory
+        self.fps = fps
+        self.size = (SCREEN_WIDTH // scale, SCREEN_HEIGHT // scale)
+        self.surface = pygame.Surface(self.size, depth=32)
+        self.ring = FrameRing(int(replay_seconds * fps) + 1, *self.size)
+        self.interval_ms = 1000 / fps
+        self.next_capture_ms = None
+        self.session = None  # codificador de la grabación en curso
+        self.encoders = []
+        self.captured = 0
+        self.dropped = 0
+        self.font = pygame.font.Font(None, 24)
+        self.message = None
+        self.message_until = 0
+
+    def _path(self, prefix):
+        os.makedirs(self.directory, exist_ok=True)
+        return os.path.join(self.directory, f"{prefix}_{time.strftime('%Y%m%d_%H%M%S')}.mp4")
+
+    def _start_encoder(self, path, start_seq, stop_seq=None):
+        self.encoders = [encoder for encoder in self.encoders if encoder.is_alive()]
+        encoder = VideoEncoder(self.ring, path, self.fps, start_seq, stop_seq)
+        encoder.start()
+        self.encoders.append(encoder)
+        return encoder
+
+    def _show(self, message, now):
+        self.message = message
+        self.message_until = now + RECORD_MESSAGE_MS
+
+    def is_recording(self):
+        return self.session is not None
+
+    def capture(self, screen, now):
+        """Copia el frame dibujado al anillo, a RECORD_FPS según el reloj del juego"""
+        if self.next_capture_ms is not None and now < self.next_capture_ms:
+            return
+        # Si el juego se atrasó no se intenta recuperar los frames perdidos
+        self.next_capture_ms = max((self.next_capture_ms or now) + self.interval_ms, now)
+
+        source = screen
+        if (screen.get_size() != self.size or screen.get_pitch() != self.surface.get_pitch()
+                or screen.get_masks() != self.surface.get_masks()):
+            if screen.get_size() == self.size:
+                self.surface.blit(screen, (0, 0))
+            else:
+                pygame.transform.smoothscale(screen, self.size, self.surface)
+            source = self.surface
+        if self.ring.push(source):
+            self.captured += 1
+        else:
+            self.dropped += 1
+
+    def toggle_recording(self, now=0):
+        """Empieza o termina la grabación de la sesión"""
+        if self.session is not None:
+            self.session.stop()
+            self._show(f"Video guardado: {self.session.path}", now)
+            self.session = None
+        else:
+            self.session = self._start_encoder(self._path("sesion"), self.ring.write_seq)
+            self._show("Grabando", now)
+
+    def save_replay(self, now=0):
+        """Escribe en segundo plano los últimos segundos capturados
+
+        Returns:
+            str: ruta del video, o None si todavía no hay frames
+        """
+        ring = self.ring
+        if ring.write_seq == 0:
+            return None
+        path = self._path("repeticion")
+        self._start_encoder(path, ring.oldest_seq(), ring.write_seq)
+        self._show(f"Repetición guardada: {path}", now)
+        return path
+
+    def draw_status(self, screen, now):
+        """Indicador de grabación y avisos (se dibuja después de capturar, no sale en el video)"""
+        if self.session is not None:
+            pygame.draw.circle(screen, RED, (SCREEN_WIDTH // 2 - 30, 20), 7)
+            text = "REC" if not self.dropped else f"REC ({self.dropped} descartados)"
+            screen.blit(self.font.render(text, True, RED), (SCREEN_WIDTH // 2 - 18, 12))
+        if self.message and now < self.message_until:
+            surface = self.font.render(self.message, True, WHITE)
+            screen.blit(surface, surface.get_rect(midbottom=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 40)))
+
+    def close(self):
+        """Termina la sesión y espera a que los videos pendientes se escriban"""
+        if self.session is not None:
+            self.session.stop()
+            self.session = None
+        deadline = time.monotonic() + RECORD_CLOSE_TIMEOUT_S
+        for encoder in self.encoders:
+            encoder.join(timeout=max(deadline - time.monotonic(), 0))
+        self.encoders = []
@@ -0,0 +1,382 @@
+"""
+Rebobinado: anillo de instantáneas del estado de juego, una por tick
+
+Cada tick jugado se copia a arreglos NumPy preasignados (una fila por tick,
+una columna por entidad), sin copiar objetos Enemy o Bullet: solo sus
+números. Con F6 el juego se congela y las flechas recorren los últimos
+REWIND_SECONDS segundos tick a tick (Shift: de a un segundo); F6 otra vez
+reanuda desde el tick mostrado y descarta los posteriores. Sirve para
+reproducir un pico de frame o una colisión sin volver a jugar desde el
+principio.
+
+Se restauran también el estado de rng (game_random.py) y el generador de
+oleadas, así que con reloj fijo (use_fixed_step) la partida continúa
+exactamente igual que la original. Del generador se guarda por tick solo la
+cantidad de palabras consumidas; la copia completa de su estado (625
+enteros) se toma cada REWIND_RANDOM_KEYFRAME_TICKS ticks o cuando alguien lo
+vuelve a sembrar, y restaurar un tick avanza desde la copia anterior.
+
+El costo por tick y la memoria del anillo se miden con
+python benchmarks/bench_rewind.py.
+"""
+import time
+from operator import attrgetter
+
+import numpy as np
+import pygame
+from config import *
+from game_random import rng
+from waves import campaign_waves, endless_waves
+
+# Columnas por tipo de entidad: (atributo, dtype)
+# Las posiciones van en float64: con float32 la formación (velocidad fraccionaria)
+# no vuelve exactamente al mismo lugar y la partida reanudada diverge
+PLAYER_FIELDS = (("x", np.float64), ("y", np.float64), ("lives", np.int16),
+                 ("has_shield", np.bool_), ("invulnerable_timer", np.int16),
+                 ("double_shot_until", np.float64), ("last_shot_time", np.float64),
+                 ("prev_hand_closed", np.bool_))
+ENEMY_FIELDS = (("x", np.float64), ("y", np.float64), ("alive", np.bool_),
+                ("animation_frame", np.int16), ("home_x", np.float64), ("home_y", np.float64),
+                ("dive", np.int8), ("dive_step", np.int16))
+BOSS_FIELDS = (("x", np.float64), ("y", np.float64), ("health", np.int16),
+               ("direction", np.int8), ("animation_frame", np.int16), ("shoot_timer", np.int32))
+# Las balas enemigas guardan también su velocidad (patrones del jefe)
+BULLET_FIELDS = (("x", np.float64), ("y", np.float64), ("owner", np.int8))
+ENEMY_BULLET_FIELDS = (("x", np.float64), ("y", np.float64), ("vx", np.float64),
+                       ("speed", np.float64))
+POWERUP_FIELDS = (("x", np.float64), ("y", np.float64), ("animation_frame", np.int16))
+
+ENEMY_TYPES = ("common", "advanced")
+POWERUP_TYPES = (POWERUP_DOUBLE_SHOT, POWERUP_SHIELD, POWERUP_EXTRA_LIFE)
+
+
+class EntityTable:
+    """Columnas preasignadas (ticks x capacidad) de un tipo de entidad"""
+
+    def __init__(self, ticks, capacity, fields, kinds=None):
+        """
+        Args:
+            fields: columnas (atributo, dtype)
+            kinds: valores posibles de .type; se guarda su índice
+        """
+        self.capacity = capacity
+        self.fields = fields
+        self.getters = [attrgetter(name) for name, _ in fields]
+        self.columns = {name: np.zeros((ticks, capacity), dtype=dtype) for name, dtype in fields}
+        self.counts = np.zeros(ticks, dtype=np.int32)
+        self.kinds = kinds
+        if kinds is not None:
+            self.kind_codes = {kind: code for code, kind in enumerate(kinds)}
+            self.types = np.zeros((ticks, capacity), dtype=np.uint8)
+
+    def store(self, row, items):
+        """Copia los atributos de items a la fila row
+
+        Returns:
+            bool: False si había más entidades que capacidad (se guardan las primeras)
+        """
+        n = len(items)
+        fits = n <= self.capacity
+        if not fits:
+            items = items[:self.capacity]
+            n = self.capacity
+        self.counts[row] = n
+        for (name, _), getter in zip(self.fields, self.getters):
+            self.columns[name][row, :n] = np.fromiter(map(getter, items), dtype=np.float64, count=n)
+        if self.kinds is not None:
+            codes = self.kind_codes
+            self.types[row, :n] = np.fromiter((codes[item.type] for item in items),
+                                              dtype=np.uint8, count=n)
+        return fits
+
+    def load(self, row, i, obj):
+        """Escribe en obj los atributos guardados de la entidad i"""
+        for name, _ in self.fields:
+            setattr(obj, name, self.columns[name][row, i].item())
+
+    def kind(self, row, i):
+        return self.kinds[self.types[row, i]]
+
+    @property
+    def nbytes(self):
+        total = self.counts.nbytes + sum(column.nbytes for column in self.columns.values())
+        return total + (self.types.nbytes if self.kinds is not None else 0)
+
+
+class RewindBuffer:
+    def __init__(self, seconds=REWIND_SECONDS, fps=FPS):
+        """Reserva el anillo
+
+        Args:
+            seconds: segundos de juego que se conservan
+            fps: ticks por segundo
+        """
+        self.ticks = int(seconds * fps)
+        self.fps = fps
+        ticks = self.ticks
+        self.players = EntityTable(ticks, COOP_PLAYERS, PLAYER_FIELDS)
+        self.boss = EntityTable(ticks, 1, BOSS_FIELDS)
+        self.enemies = EntityTable(ticks, REWIND_MAX_ENEMIES, ENEMY_FIELDS, ENEMY_TYPES)
+        self.enemy_bullets = EntityTable(ticks, REWIND_MAX_BULLETS, ENEMY_BULLET_FIELDS)
+        self.player_bullets = EntityTable(ticks, REWIND_MAX_BULLETS, BULLET_FIELDS)
+        self.powerups = EntityTable(ticks, REWIND_MAX_POWERUPS, POWERUP_FIELDS, POWERUP_TYPES)
+        self.tables = (self.players, self.boss, self.enemies, self.enemy_bullets,
+                       self.player_bullets, self.powerups)
+        # Escalares del juego por tick
+        self.time_ms = np.zeros(ticks, dtype=np.float64)
+        self.score = np.zeros(ticks, dtype=np.int64)
+        self.level = np.zeros(ticks, dtype=np.int32)
+        self.last_enemy_shot = np.zeros(ticks, dtype=np.float64)
+        self.direction = np.zeros(ticks, dtype=np.int8)  # de la formación
+        self.speed = np.zeros(ticks, dtype=np.float64)
+        self.complete = np.zeros(ticks, dtype=np.bool_)  # False si alguna tabla se desbordó
+        # Referencias (no copias): la oleada, su jefe y su configuración, y lo que no es
+        # numérico. El jefe se guarda aparte porque al derrotarlo la oleada lo suelta
+        self.groups = np.empty(ticks, dtype=object)
+        self.bosses = np.empty(ticks, dtype=object)
+        self.level_configs = np.empty(ticks, dtype=object)
+        self.active_powerups = np.empty(ticks, dtype=object)
+        self.boss_patterns = np.empty(ticks, dtype=object)
+        # Generador: palabras consumidas por tick y la copia completa de la que parten.
+        # Se toma a lo sumo una copia por tick, así que con un anillo de copias del
+        # mismo largo ninguna se pisa mientras alguna fila la use
+        self.random_words = np.zeros(ticks, dtype=np.int64)
+        self.random_key = np.zeros(ticks, dtype=np.int32)
+        self.random_keyframes = np.empty(ticks, dtype=object)
+        self.key_head = 0  # próxima copia
+        self.key_age = 0  # ticks desde la última copia
+        self.key_generation = None  # generación de rng de la última copia
+
+        self.count = 0  # ticks guardados (hasta self.ticks)
+        self.head = 0  # fila del próximo tick
+        self.scrubbing = False
+        self.cursor = 0  # ticks hacia atrás desde el último guardado
+        self.record_s = 0.0  # tiempo total de record(), para el promedio
+        self.records = 0
+        self.font = None
+
+    @property
+    def nbytes(self):
+        scalars = (self.time_ms, self.score, self.level, self.last_enemy_shot, self.direction,
+                   self.speed, self.complete, self.random_words, self.random_key)
+        return sum(table.nbytes for table in self.tables) + sum(a.nbytes for a in scalars)
+
+    def _row(self, back):
+        """Fila del tick guardado back ticks antes del último"""
+        return (self.head - 1 - back) % self.ticks
+
+    # -----------------------
+    # Captura
+    # -----------------------
+    def record(self, game, now):
+        """Guarda el tick actual (se llama al final de cada tick jugado)"""
+        if self.scrubbing:
+            return
+        start = time.perf_counter()
+        row = self.head
+        group = game.enemies
+        boss = group.boss
+        complete = self.players.store(row, game.players)
+        complete &= self.boss.store(row, [boss] if boss else ())
+        complete &= self.enemies.store(row, group.enemies)
+        complete &= self.enemy_bullets.store(row, game.enemy_bullets)
+        complete &= self.player_bullets.store(row, game.player_bullets)
+        complete &= self.powerups.store(row, game.powerup_manager.powerups)
+        self.complete[row] = complete
+        # Con reloj fijo se guarda el valor exacto (ticks() lo redondea)
+        self.time_ms[row] = game.sim_time_ms if game.fixed_step_ms is not None else now
+        self.score[row] = game.score
+        self.level[row] = game.current_level
+        self.last_enemy_shot[row] = game.last_enemy_shot_time
+        self.direction[row] = group.direction
+        self.speed[row] = group.speed
+        self.groups[row] = group
+        self.bosses[row] = boss
+        self.level_configs[row] = game.level_config
+        active = game.powerup_manager.active_powerups
+        self.active_powerups[row] = dict(active) if active else None
+        self.boss_patterns[row] = game.boss_patterns.snapshot()
+        # Copia completa del generador solo de vez en cuando o si se volvió a sembrar
+        # (seed o setstate): las palabras contadas parten de esa semilla
+        if rng.generation != self.key_generation or self.key_age >= REWIND_RANDOM_KEYFRAME_TICKS:
+            self.random_keyframes[self.key_head] = rng.getstate()
+            self.key_generation = rng.generation
+            self.random_key[row] = self.key_head
+            self.key_head = (self.key_head + 1) % self.ticks
+            self.key_age = 0
+        else:
+            self.random_key[row] = (self.key_head - 1) % self.ticks
+        self.key_age += 1
+        self.random_words[row] = rng.words
+
+        self.head = (row + 1) % self.ticks
+        self.count = min(self.count + 1, self.ticks)
+        self.record_s += time.perf_counter() - start
+        self.records += 1
+
+    def clear(self):
+        """Olvida los ticks guardados (al empezar otra partida)"""
+        self.count = 0
+        self.head = 0
+        self.scrubbing = False
+        self.groups[:] = None  # no retener oleadas viejas
+        self.bosses[:] = None
+        self.level_configs[:] = None
+        self.active_powerups[:] = None
+        self.boss_patterns[:] = None
+        self.random_keyframes[:] = None
+        self.key_head = 0
+        self.key_generation = None
+
+    # -----------------------
+    # Restauración
+    # -----------------------
+    def restore(self, game, back):
+        """Devuelve el juego al tick guardado back ticks antes del último"""
+        row = self._row(back)
+        # El próximo tick tiene que ocurrir un frame después del guardado
+        next_tick = self.time_ms[row] + (game.fixed_step_ms or 1000 / self.fps)
+        if game.fixed_step_ms is not None:
+            game.sim_time_ms = next_tick
+            shift = 0.0
+        else:
+            # El reloj de pygame no retrocede: los instantes guardados se corren a "ahora"
+            shift = game.ticks() - next_tick
+
+        game.score = int(self.score[row])
+        game.current_level = int(self.level[row])
+        game.level_config = self.level_configs[row]
+        game.last_enemy_shot_time = self.last_enemy_shot[row] + shift
+        game.state = STATE_PLAYING
+        rng.setstate(self.random_keyframes[self.random_key[row]])
+        rng.skip(int(self.random_words[row]) - rng.words)
+        # Las oleadas dependen solo de su número: se recrea el generador y se
+        # adelanta hasta la oleada restaurada
+        game.waves = endless_waves() if game.endless else campaign_waves()
+        for _ in range(game.current_level):
+            next(game.waves, None)
+
+        # Naves: se reutilizan los objetos (el número de jugadores no cambia en una partida)
+        for i in range(self.players.counts[row]):
+            player = game.players[i]
+            self.players.load(row, i, player)
+            player.double_shot_until += shift
+            player.last_shot_time += shift
+            player.update_rect()
+
+        group = self.groups[row]
+        group.direction = int(self.direction[row])
+        group.speed = self.speed[row]
+        # El jefe vuelve aunque haya sido derrotado después del tick restaurado
+        group.boss = self.bosses[row]
+        if group.boss is not None:
+            self.boss.load(row, 0, group.boss)
+            group.boss.update_rect()
+        enemies = []
+        enemy_class = _enemy_class() if self.enemies.counts[row] else None
+        for i in range(self.enemies.counts[row]):
+            enemy = enemy_class(0, 0, self.enemies.kind(row, i))
+            self.enemies.load(row, i, enemy)
+            enemy.update_rect()
+            enemies.append(enemy)
+        group.enemies = enemies
+        group.needs_compact = not all(enemy.alive for enemy in enemies)
+        group.update_bounds()
+        game.enemies = group
+        game.next_enemies = None
+
+        bullet_class = game.caps.bullet_class
+        for table, bullets, direction in ((self.enemy_bullets, game.enemy_bullets, -1),
+                                          (self.player_bullets, game.player_bullets, 1)):
+            del bullets[:]
+            columns = table.columns
+            xs, ys = columns["x"][row], columns["y"][row]
+            for i in range(table.counts[row]):
+                if direction > 0:
+                    bullet = bullet_class(xs[i].item(), ys[i].item(), direction,
+                                          int(columns["owner"][row, i]))
+                else:
+                    bullet = bullet_class(xs[i].item(), ys[i].item(), direction, 0,
+                                          columns["vx"][row, i].item(),
+                                          columns["speed"][row, i].item())
+                bullets.append(bullet)
+
+        manager = game.powerup_manager
+        del manager.powerups[:]
+        powerup_class = _powerup_class()
+        for i in range(self.powerups.counts[row]):
+            powerup = powerup_class(0, 0, self.powerups.kind(row, i))
+            self.powerups.load(row, i, powerup)
+            powerup.rect.x, powerup.rect.y = powerup.x, powerup.y
+            manager.powerups.append(powerup)
+        active = self.active_powerups[row] or {}
+        manager.active_powerups = {kind: until + shift for kind, until in active.items()}
+        game.boss_patterns.restore(self.boss_patterns[row], shift)
+        game.particles.clear()
+
+    # -----------------------
+    # Controles de depuración
+    # -----------------------
+    def toggle(self, game):
+        """F6: congela y empieza a recorrer, o reanuda desde el tick mostrado"""
+        if self.scrubbing:
+            # Se restaura otra vez para que el reloj retome desde el tick mostrado,
+            # y los ticks posteriores se descartan
+            self.restore(game, self.cursor)
+            self.head = (self.head - self.cursor) % self.ticks
+            self.count -= self.cursor
+            self.scrubbing = False
+        elif self.count and game.state == STATE_PLAYING and not game.paused:
+            self.scrubbing = True
+            self.cursor = 0
+
+    def step(self, game, ticks):
+        """Mueve el cursor ticks hacia adelante (positivo) o atrás y restaura ese tick"""
+        if not self.scrubbing:
+            return
+        self.cursor = min(max(self.cursor - ticks, 0), self.count - 1)
+        self.restore(game, self.cursor)
+
+    def handle_key(self, game, key, mods):
+        """Atiende las teclas de rebobinado; retorna True si la tecla se usó"""
+        if key == pygame.K_F6:
+            self.toggle(game)
+            return True
+        if not self.scrubbing:
+            return False
+        amount = self.fps if mods & pygame.KMOD_SHIFT else 1
+        if key == pygame.K_LEFT:
+            self.step(game, -amount)
+        elif key == pygame.K_RIGHT:
+            self.step(game, amount)
+        return True  # mientras se recorre, las demás teclas no llegan al juego
+
+    def draw_status(self, screen, now):
+        """Barra del rebobinado mientras se recorre"""
+        if not self.scrubbing:
+            return
+        if self.font is None:
+            self.font = pygame.font.Font(None, 24)
+        row = self._row(self.cursor)
+        warning = "" if self.complete[row] else "  (incompleto)"
+        text = (f"REBOBINADO  tick -{self.cursor} ({self.cursor / self.fps:.2f} s){warning}   "
+                "<-/->: tick  Shift: 1 s  F6: reanudar")
+        surface = self.font.render(text, True, YELLOW)
+        rect = surface.get_rect(midtop=(SCREEN_WIDTH // 2, 50))
+        pygame.draw.rect(screen, BLACK, rect.inflate(16, 8))
+        screen.blit(surface, rect)
+        # Posición del cursor dentro del anillo
+        bar = pygame.Rect(100, rect.bottom + 10, SCREEN_WIDTH - 200, 6)
+        pygame.draw.rect(screen, GRAY, bar, 1)
+        filled = bar.width * (self.count - self.cursor) // max(self.ticks, 1)
+        pygame.draw.rect(screen, YELLOW, (bar.x, bar.y, filled, bar.height))
+
+
+def _enemy_class():
+    from enemy import Enemy
+    return Enemy
+
+
+def _powerup_class():
+    from powerup import PowerUp
+    return PowerUp
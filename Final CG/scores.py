@@ -0,0 +1,340 @@
+"""
+Puntajes: récords locales y sincronización opcional con un leaderboard
+
+Los puntajes se guardan en SQLite en modo WAL (sobrevive a un cierre
+abrupto sin corromper la base). Todo el trabajo de disco y red lo hace un
+hilo aparte: el juego solo encola el puntaje y lee la tabla de récords ya
+cargada en memoria. Los puntajes no enviados quedan marcados en la base y
+son la cola de reintentos, así que tampoco se pierden entre sesiones.
+
+Uso:
+    python scores.py                               # récords locales
+    python scores.py --serve --port 8765           # leaderboard local de prueba
+    python scores.py --serve --fail-rate 0.5       # ...que falla la mitad de las veces
+    python scores.py --serve --drop-rate 0.2       # ...o corta la conexión sin responder
+    python main.py --leaderboard http://localhost:8765/scores
+"""
+import argparse
+import http.client
+import json
+import queue
+import random
+import socket
+import sqlite3
+import threading
+import time
+import urllib.parse
+import uuid
+
+from config import *
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id TEXT PRIMARY KEY,
+    score INTEGER NOT NULL,
+    wave INTEGER NOT NULL,
+    players INTEGER NOT NULL,
+    mode TEXT NOT NULL,
+    outcome INTEGER NOT NULL,
+    played_at REAL NOT NULL,
+    synced INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS scores_by_score ON scores (score DESC);
+CREATE INDEX IF NOT EXISTS scores_unsynced ON scores (synced) WHERE synced = 0;
+"""
+FIELDS = ("id", "score", "wave", "players", "mode", "outcome", "played_at")
+
+_STOP = None  # marca de fin en la cola
+
+
+class ScoreStore:
+    """Tabla de puntajes en SQLite (usar desde un solo hilo)"""
+
+    def __init__(self, path=SCORES_DB):
+        self.db = sqlite3.connect(path)
+        # WAL: cada commit es atómico y un cierre abrupto no deja la base a medias;
+        # NORMAL evita un fsync por commit sin arriesgar la consistencia
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+
+    def add(self, entry):
+        with self.db:
+            self.db.execute(f"INSERT OR IGNORE INTO scores ({', '.join(FIELDS)}) "
+                            f"VALUES ({', '.join('?' * len(FIELDS))})",
+                            [entry[field] for field in FIELDS])
+
+    def top(self, limit=SCORES_TOP):
+        rows = self.db.execute(f"SELECT {', '.join(FIELDS)} FROM scores "
+                               "ORDER BY score DESC, played_at LIMIT ?", (limit,))
+        return [dict(zip(FIELDS, row)) for row in rows]
+
+    def unsynced(self, limit=LEADERBOARD_BATCH_SIZE):
+        rows = self.db.execute(f"SELECT {', '.join(FIELDS)} FROM scores WHERE synced = 0 "
+                               "ORDER BY played_at LIMIT ?", (limit,))
+        return [dict(zip(FIELDS, row)) for row in rows]
+
+    def mark_synced(self, ids):
+        with self.db:
+            self.db.executemany("UPDATE scores SET synced = 1 WHERE id = ?", [(i,) for i in ids])
+
+    def close(self):
+        self.db.close()
+
+
+class LeaderboardError(Exception):
+    pass
+
+
+class LeaderboardClient:
+    """Cliente HTTP con una conexión persistente (keep-alive) reutilizada entre envíos"""
+
+    def __init__(self, url, timeout=LEADERBOARD_TIMEOUT_S):
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"URL de leaderboard no soportada: {url}")
+        self.scheme = parts.scheme
+        self.host = parts.netloc
+        self.path = parts.path or "/"
+        self.timeout = timeout
+        self.connection = None
+
+    def _connect(self):
+        if self.connection is None:
+            connection_class = (http.client.HTTPSConnection if self.scheme == "https"
+                                else http.client.HTTPConnection)
+            self.connection = connection_class(self.host, timeout=self.timeout)
+        return self.connection
+
+    def upload(self, entries):
+        """Envía un lote de puntajes; lanza LeaderboardError si no se aceptó"""
+        body = json.dumps({"scores": entries}).encode("utf-8")
+        try:
+            connection = self._connect()
+            connection.request("POST", self.path, body,
+                               {"Content-Type": "application/json"})
+            response = connection.getresponse()
+            response.read()  # vaciar la respuesta para reutilizar la conexión
+        except (OSError, http.client.HTTPException) as e:
+            self.close()  # la próxima vez se abre una conexión nueva
+            raise LeaderboardError(str(e)) from e
+        if response.status >= 300:
+            raise LeaderboardError(f"HTTP {response.status}")
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+class ScoreKeeper(threading.Thread):
+    """Hilo dueño de la base y del cliente; el juego solo encola y lee la caché"""
+
+    def __init__(self, path=SCORES_DB, url=None):
+        super().__init__(name="scores", daemon=True)
+        self.path = path
+        self.entries = queue.Queue()
+        self.machine = LEADERBOARD_MACHINE_ID or socket.gethostname()
+        # Caché de récords: se reemplaza entera, el juego la lee sin lock
+        self.top_scores = []
+        self.synced = 0
+        self.sync_errors = 0
+        self.last_error = None
+        # Una URL inválida deja solo los récords locales, que son lo principal
+        self.client = None
+        if url:
+            try:
+                self.client = LeaderboardClient(url)
+            except ValueError as e:
+                print(f"{e}: los puntajes se guardan solo localmente.")
+                self.last_error = str(e)
+        self.url = url if self.client else None
+        self.start()
+
+    def submit(self, score, wave, players, endless, outcome):
+        """Encola un puntaje (no bloquea)"""
+        self.entries.put({
+            "id": uuid.uuid4().hex,
+            "score": int(score),
+            "wave": int(wave),
+            "players": int(players),
+            "mode": "infinito" if endless else "campaña",
+            "outcome": int(outcome),
+            "played_at": time.time(),
+        })
+
+    def best(self):
+        """Mejor puntaje local conocido (0 si aún no hay)"""
+        top = self.top_scores
+        return top[0]["score"] if top else 0
+
+    def top(self):
+        return self.top_scores
+
+    def _sync(self, store, client):
+        """Envía un lote pendiente; retorna True si quedó todo enviado"""
+        entries = store.unsynced()
+        if not entries:
+            return True
+        for entry in entries:
+            entry["machine"] = self.machine
+        client.upload(entries)
+        store.mark_synced([entry["id"] for entry in entries])
+        self.synced += len(entries)
+        return len(entries) < LEADERBOARD_BATCH_SIZE
+
+    def run(self):
+        client = self.client
+        store = None
+        retry_delay = LEADERBOARD_RETRY_BASE_S
+        next_sync = 0.0 if client else None  # None = nada pendiente
+        try:
+            store = ScoreStore(self.path)
+            self.top_scores = store.top()
+            while True:
+                timeout = None if next_sync is None else max(next_sync - time.monotonic(), 0)
+                try:
+                    entry = self.entries.get(timeout=timeout)
+                except queue.Empty:
+                    entry = ()
+                if entry is _STOP:
+                    break
+                if entry:
+                    store.add(entry)
+                    self.top_scores = store.top()
+                    if client:
+                        next_sync = time.monotonic() if next_sync is None else next_sync
+                if next_sync is None or time.monotonic() < next_sync:
+                    continue
+                try:
+                    done = self._sync(store, client)
+                    retry_delay = LEADERBOARD_RETRY_BASE_S
+                    next_sync = None if done else time.monotonic()
+                except LeaderboardError as e:
+                    # Reintento con espera exponencial; los puntajes siguen en la base
+                    self.sync_errors += 1
+                    self.last_error = str(e)
+                    next_sync = time.monotonic() + retry_delay
+                    retry_delay = min(retry_delay * 2, LEADERBOARD_RETRY_MAX_S)
+        except sqlite3.Error as e:
+            print(f"No se pudo usar la base de puntajes {self.path}: {e}")
+            self.last_error = str(e)
+        finally:
+            if client:
+                client.close()
+            if store is not None:
+                store.close()
+
+    def close(self):
+        """Termina el hilo tras guardar los puntajes encolados"""
+        self.entries.put(_STOP)
+        self.join(timeout=SCORES_CLOSE_TIMEOUT_S)
+
+
+# -----------------------
+# Leaderboard local de prueba
+# -----------------------
+def make_server(port=0, fail_rate=0.0, drop_rate=0.0):
+    """Servidor mínimo que acepta POST con lotes de puntajes y GET con el top
+
+    Descarta puntajes repetidos por id, como haría un servidor real ante
+    reintentos. Con fail_rate responde 503 a esa fracción de envíos; con
+    drop_rate guarda el lote pero corta la conexión sin responder, como una
+    respuesta perdida en la red. Ambas tasas se pueden cambiar en el servidor
+    mientras corre. server.scores tiene los puntajes por id y server.batches
+    el tamaño de cada lote recibido.
+
+    Args:
+        port: puerto local (0 = uno libre, ver server.server_address)
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive
+
+        def _reply(self, status, payload):
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            server = self.server
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            if random.random() < server.fail_rate:
+                self._reply(503, {"error": "falla simulada"})
+                return
+            entries = json.loads(body)["scores"]
+            with server.lock:
+                new = [e for e in entries if e["id"] not in server.scores]
+                server.scores.update((e["id"], e) for e in new)
+                server.batches.append(len(entries))
+            if server.verbose:
+                print(f"+{len(new)} puntajes ({len(entries) - len(new)} repetidos), "
+                      f"total {len(server.scores)}")
+            if random.random() < server.drop_rate:
+                self.close_connection = True  # sin respuesta: el cliente reintenta
+                return
+            self._reply(200, {"accepted": len(new)})
+
+        def do_GET(self):
+            with self.server.lock:
+                top = sorted(self.server.scores.values(), key=lambda e: -e["score"])[:SCORES_TOP]
+            self._reply(200, {"scores": top})
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+    server.daemon_threads = True
+    server.scores = {}
+    server.batches = []
+    server.lock = threading.Lock()
+    server.fail_rate = fail_rate
+    server.drop_rate = drop_rate
+    server.verbose = False
+    return server
+
+
+def serve(port=8765, fail_rate=0.0, drop_rate=0.0):
+    """Corre el leaderboard de prueba hasta Ctrl+C (ver make_server)"""
+    server = make_server(port, fail_rate, drop_rate)
+    server.verbose = True
+    print(f"Leaderboard de prueba en http://127.0.0.1:{port}/scores "
+          f"(fallas: {fail_rate:.0%}, respuestas perdidas: {drop_rate:.0%})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def parse_args():
+    """Lee los argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Récords locales y leaderboard de prueba")
+    parser.add_argument("--serve", action="store_true", help="lanzar el leaderboard de prueba")
+    parser.add_argument("--port", type=int, default=8765, help="puerto del leaderboard de prueba")
+    parser.add_argument("--fail-rate", type=float, default=0.0,
+                        help="fracción de envíos que el servidor rechaza")
+    parser.add_argument("--drop-rate", type=float, default=0.0,
+                        help="fracción de envíos cuya respuesta se pierde (se corta la conexión)")
+    parser.add_argument("--db", default=SCORES_DB, help="base de puntajes local")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.serve:
+        serve(args.port, args.fail_rate, args.drop_rate)
+    else:
+        store = ScoreStore(args.db)
+        pending = len(store.unsynced(limit=-1))
+        for rank, entry in enumerate(store.top(), start=1):
+            played = time.strftime("%Y-%m-%d %H:%M", time.localtime(entry["played_at"]))
+            print(f"{rank:>2}. {entry['score']:>7}  oleada {entry['wave']:>3}  "
+                  f"{entry['mode']:<9} {entry['players']}J  {played}")
+        print(f"{pending} puntajes sin enviar al leaderboard")
+        store.close()
@@ -0,0 +1,285 @@
+"""
+Prueba de resistencia (soak) con el piloto automático
+
+Juega partidas sin parar, con o sin ventana. Cada cierto tiempo toma una
+muestra de memoria (RSS y tracemalloc), cantidad de entidades y percentiles
+del tiempo de frame. Al terminar ajusta una recta a cada serie y falla
+(código de salida 1) si la memoria o el tiempo de frame crecen más de lo
+permitido en config.py. Si tras el calentamiento no hay muestras suficientes
+para una tendencia el resultado es inconcluso (código de salida 2).
+
+Uso:
+    python soak.py --duration 12h
+    python soak.py --duration 10m --interval 10 --render --realtime
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from config import *
+
+
+def parse_duration(text):
+    """Convierte '12h', '30m', '90s' o un número de segundos a segundos"""
+    units = {"h": 3600, "m": 60, "s": 1}
+    if text and text[-1] in units:
+        return float(text[:-1]) * units[text[-1]]
+    return float(text)
+
+
+def parse_args():
+    """Lee los argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Prueba de resistencia con piloto automático")
+    parser.add_argument("--duration", type=parse_duration, default="1h",
+                        help="duración total, p. ej. 12h, 30m o 90s (por defecto 1h)")
+    parser.add_argument("--interval", type=float, default=SOAK_SAMPLE_INTERVAL_S,
+                        help="segundos entre muestras")
+    parser.add_argument("--render", action="store_true",
+                        help="abrir la ventana (por defecto se dibuja sin pantalla)")
+    parser.add_argument("--realtime", action="store_true",
+                        help="limitar a FPS en lugar de correr tan rápido como se pueda")
+    parser.add_argument("--endless", action="store_true", help="jugar en modo infinito")
+    parser.add_argument("--coop", action="store_true", help="dos naves con piloto automático")
+    parser.add_argument("--no-tracemalloc", action="store_true",
+                        help="no rastrear asignaciones (menos sobrecarga, sin top de líneas)")
+    parser.add_argument("--report", default="soak_report.json", help="archivo JSON de salida")
+    return parser.parse_args()
+
+
+def read_rss_mb():
+    """Memoria residente actual del proceso en MB"""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (OSError, ValueError, AttributeError):
+        # Sin /proc: el pico de RSS es la mejor aproximación disponible
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (2 ** 20 if sys.platform == "darwin" else 1024)
+
+
+def percentile(sorted_values, fraction):
+    """Percentil de una lista ya ordenada (0 si está vacía)"""
+    if not sorted_values:
+        return 0.0
+    index = min(int(fraction * len(sorted_values)), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def trend_per_hour(times_s, values):
+    """Pendiente por mínimos cuadrados, en unidades por hora"""
+    n = len(times_s)
+    mean_t = sum(times_s) / n
+    mean_v = sum(values) / n
+    var_t = sum((t - mean_t) ** 2 for t in times_s)
+    if var_t == 0:
+        return 0.0
+    cov = sum((t - mean_t) * (v - mean_v) for t, v in zip(times_s, values))
+    return cov / var_t * 3600
+
+
+class SoakRunner:
+    def __init__(self, game, interval_s, realtime=False, trace=True):
+        """Prepara la prueba sobre un juego con piloto automático
+
+        Args:
+            game: instancia de Game creada con autopilot=True
+            interval_s: segundos entre muestras
+            realtime: limitar a FPS
+            trace: tomar instantáneas de tracemalloc (debe estar iniciado)
+        """
+        self.game = game
+        self.interval_s = interval_s
+        self.realtime = realtime
+        self.trace = trace
+        self.samples = []
+        self.frame_times = []  # ms de los frames jugados desde la última muestra
+        self.frames = 0
+        self.waves = 0
+        self.runs = 0
+        self._baseline = None
+
+    def _entity_counts(self):
+        game = self.game
+        enemies = game.enemies
+        return {
+            "enemies": len(enemies.enemies) if enemies else 0,
+            "boss": 1 if enemies and enemies.boss else 0,
+            "player_bullets": len(game.player_bullets),
+            "enemy_bullets": len(game.enemy_bullets),
+            "powerups": len(game.powerup_manager.powerups),
+            "particles": game.particles.count,
+            "gc_objects": len(gc.get_objects()),
+        }
+
+    def _top_allocators(self):
+        """Líneas que más crecieron desde el final del calentamiento"""
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            (tracemalloc.Filter(False, tracemalloc.__file__),
+             tracemalloc.Filter(False, "<frozen importlib._bootstrap*>")))
+        if self._baseline is None:
+            if self.samples and self.samples[-1]["t_s"] >= SOAK_WARMUP_S:
+                self._baseline = snapshot
+            return []
+        stats = snapshot.compare_to(self._baseline, "lineno")[:SOAK_TOP_ALLOCATORS]
+        return [str(stat) for stat in stats]
+
+    def sample(self, elapsed_s):
+        """Toma una muestra y reinicia los tiempos de frame del intervalo"""
+        times = sorted(self.frame_times)
+        del self.frame_times[:]
+        traced, traced_peak = tracemalloc.get_traced_memory() if self.trace else (0, 0)
+        sample = {
+            "t_s": round(elapsed_s, 1),
+            "frames": self.frames,
+            "waves": self.waves,
+            "runs": self.runs,
+            "rss_mb": round(read_rss_mb(), 2),
+            "traced_mb": round(traced / 2 ** 20, 3),
+            "traced_peak_mb": round(traced_peak / 2 ** 20, 3),
+            "frame_ms": {
+                "p50": round(percentile(times, 0.50), 3),
+                "p95": round(percentile(times, 0.95), 3),
+                "p99": round(percentile(times, 0.99), 3),
+                "max": round(times[-1], 3) if times else 0.0,
+            },
+            "entities": self._entity_counts(),
+            "top_allocators": self._top_allocators() if self.trace else [],
+        }
+        self.samples.append(sample)
+        print(f"[{sample['t_s']:>8.0f}s] oleadas {self.waves:>5}  partidas {self.runs:>4}  "
+              f"RSS {sample['rss_mb']:7.1f} MB  traced {sample['traced_mb']:7.2f} MB  "
+              f"p95 {sample['frame_ms']['p95']:6.2f} ms  objetos {sample['entities']['gc_objects']}")
+        return sample
+
+    def run(self, duration_s):
+        """Juega durante duration_s segundos tomando muestras periódicas"""
+        game = self.game
+        start = time.perf_counter()
+        deadline = start + duration_s
+        next_sample = start
+        last_level = None
+        while game.running:
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+            if now >= next_sample:
+                self.sample(now - start)
+                # Tras un frame largo no se encadenan muestras atrasadas, y
+                # ninguna queda programada más allá del final
+                next_sample = min(max(next_sample + self.interval_s, now), deadline)
+
+            playing = game.state == STATE_PLAYING
+            frame_start = time.perf_counter()
+            game.step()
+            if playing:
+                self.frame_times.append((time.perf_counter() - frame_start) * 1000)
+            self.frames += 1
+
+            # Contar oleadas y partidas empezadas
+            if game.current_level != last_level:
+                if game.current_level == 1:
+                    self.runs += 1
+                if game.current_level:
+                    self.waves += 1
+                last_level = game.current_level
+            if self.realtime:
+                game.clock.tick(FPS)
+        # Muestra final con los frames del último intervalo
+        self.sample(time.perf_counter() - start)
+
+    def evaluate(self):
+        """Ajusta tendencias a las muestras tras el calentamiento
+
+        Returns:
+            tuple: (lista de fallos, tendencias por hora); las tendencias son
+                None si no hay muestras suficientes (resultado inconcluso)
+        """
+        samples = [s for s in self.samples if s["t_s"] >= SOAK_WARMUP_S]
+        if len(samples) < SOAK_MIN_TREND_SAMPLES:
+            return [f"muestras insuficientes: {len(samples)} después de {SOAK_WARMUP_S} s de "
+                    f"calentamiento (se necesitan {SOAK_MIN_TREND_SAMPLES})"], None
+        times = [s["t_s"] for s in samples]
+        p95 = [s["frame_ms"]["p95"] for s in samples]
+        median_p95 = sorted(p95)[len(p95) // 2] or 1e-6
+        trends = {
+            "rss_mb_per_hour": trend_per_hour(times, [s["rss_mb"] for s in samples]),
+            "traced_mb_per_hour": trend_per_hour(times, [s["traced_mb"] for s in samples]),
+            "frame_p95_slowdown_per_hour": trend_per_hour(times, p95) / median_p95,
+        }
+        failures = []
+        if trends["rss_mb_per_hour"] > SOAK_MAX_RSS_GROWTH_MB_PER_HOUR:
+            failures.append(f"RSS crece {trends['rss_mb_per_hour']:.2f} MB/h "
+                            f"(máximo {SOAK_MAX_RSS_GROWTH_MB_PER_HOUR})")
+        if self.trace and trends["traced_mb_per_hour"] > SOAK_MAX_TRACED_GROWTH_MB_PER_HOUR:
+            failures.append(f"memoria rastreada crece {trends['traced_mb_per_hour']:.2f} MB/h "
+                            f"(máximo {SOAK_MAX_TRACED_GROWTH_MB_PER_HOUR})")
+        if trends["frame_p95_slowdown_per_hour"] > SOAK_MAX_FRAME_SLOWDOWN_PER_HOUR:
+            failures.append(f"p95 del frame crece {trends['frame_p95_slowdown_per_hour']:.1%}/h "
+                            f"(máximo {SOAK_MAX_FRAME_SLOWDOWN_PER_HOUR:.0%})")
+        return failures, trends
+
+
+def main():
+    """Función principal"""
+    args = parse_args()
+    if not args.render:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    trace = not args.no_tracemalloc
+    if trace:
+        tracemalloc.start()
+
+    import pygame
+    from game import Game
+
+    game = Game(autopilot=True)
+    if not args.realtime:
+        # Sin límite de FPS los temporizadores siguen al número de frames
+        game.use_fixed_step()
+    game.coop = args.coop
+    game.endless = args.endless
+    runner = SoakRunner(game, args.interval, realtime=args.realtime, trace=trace)
+    try:
+        runner.run(args.duration)
+    except KeyboardInterrupt:
+        print("\nInterrumpido: se evalúan las muestras tomadas hasta ahora")
+    failures, trends = runner.evaluate()
+    pygame.quit()
+
+    report = {
+        "duration_s": args.duration,
+        "frames": runner.frames,
+        "waves": runner.waves,
+        "runs": runner.runs,
+        "trends": trends,
+        "failures": failures,
+        "samples": runner.samples,
+    }
+    with open(args.report, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"Reporte guardado en {args.report}")
+
+    if trends is None:
+        print(f"INCONCLUSO: {failures[0]}; alargar --duration o acortar --interval.")
+        return 2
+    if failures:
+        print("FALLO:")
+        for failure in failures:
+            print(f"  - {failure}")
+        if trace:
+            print("Líneas que más crecieron:")
+            for line in runner.samples[-1]["top_allocators"]:
+                print(f"  {line}")
+        return 1
+    print("OK: sin crecimiento de memoria ni de tiempo de frame")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
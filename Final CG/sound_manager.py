@@ -0,0 +1,120 @@
+"""
+Gestor de canales del mixer: límite de voces por sonido, robo de voces por
+prioridad, canal reservado para la música y agrupación de sonidos por tick
+"""
+import pygame
+from config import *
+
+
+class SoundManager:
+    def __init__(self, num_channels=AUDIO_NUM_CHANNELS):
+        """Inicializa el gestor de voces
+
+        Args:
+            num_channels: número total de canales del mixer (incluye el de música)
+        """
+        self.sounds = {}  # {nombre: (sound, max_voces, prioridad)}
+        self.played_this_tick = set()
+        self.channels = []
+        self.owners = []  # por canal: (nombre, prioridad, inicio) o None
+        self.music_channel = None
+
+        if not pygame.mixer.get_init():
+            return
+
+        pygame.mixer.set_num_channels(num_channels)
+        # El canal 0 queda reservado para la música: Sound.play() nunca lo usa
+        pygame.mixer.set_reserved(1)
+        self.music_channel = pygame.mixer.Channel(0)
+        self.channels = [pygame.mixer.Channel(i) for i in range(1, num_channels)]
+        self.owners = [None] * len(self.channels)
+
+    def is_available(self):
+        """Retorna True si el mixer está inicializado"""
+        return self.music_channel is not None
+
+    def register(self, name, sound, max_voices=None, priority=None):
+        """Registra un sonido con su límite de voces y prioridad
+
+        Si no se indican, se toman de SOUND_VOICE_LIMITS en config.py.
+        """
+        default_voices, default_priority = SOUND_VOICE_LIMITS.get(name, (2, 1))
+        if max_voices is None:
+            max_voices = default_voices
+        if priority is None:
+            priority = default_priority
+        self.sounds[name] = (sound, max_voices, priority)
+
+    def begin_tick(self):
+        """Marca el inicio de un tick: se vuelven a permitir todos los sonidos"""
+        self.played_this_tick.clear()
+
+    def play(self, name):
+        """Reproduce un sonido registrado respetando límites y prioridades
+
+        Returns:
+            bool: True si el sonido se reprodujo
+        """
+        if name in self.played_this_tick or name not in self.sounds or not self.channels:
+            return False
+
+        sound, max_voices, priority = self.sounds[name]
+        now = pygame.time.get_ticks()
+
+        free_index = -1
+        same_count = 0
+        oldest_same = -1
+        victim = -1
+        for i, channel in enumerate(self.channels):
+            owner = self.owners[i]
+            if owner is None or not channel.get_busy():
+                self.owners[i] = None
+                if free_index < 0:
+                    free_index = i
+                continue
+
+            owner_name, owner_priority, owner_start = owner
+            if owner_name == name:
+                same_count += 1
+                if oldest_same < 0 or owner_start < self.owners[oldest_same][2]:
+                    oldest_same = i
+
+            # Candidata a robo: menor prioridad y, a igual prioridad, la más antigua
+            if owner_priority <= priority:
+                if victim < 0:
+                    victim = i
+                else:
+                    _, victim_priority, victim_start = self.owners[victim]
+                    if (owner_priority, owner_start) < (victim_priority, victim_start):
+                        victim = i
+
+        if same_count >= max_voices:
+            # Límite por sonido alcanzado: reutilizar su voz más antigua
+            index = oldest_same
+        elif free_index >= 0:
+            index = free_index
+        elif victim >= 0:
+            index = victim
+        else:
+            return False
+
+        self.channels[index].play(sound)
+        self.owners[index] = (name, priority, now)
+        # Sonidos idénticos en el mismo tick se agrupan en una sola voz; si no
+        # sonó (sin canal libre), otro pedido del mismo tick puede intentarlo
+        self.played_this_tick.add(name)
+        return True
+
+    def play_music(self, sound, loops=-1):
+        """Reproduce la música en el canal reservado"""
+        if self.music_channel is None or sound is None:
+            return False
+        self.music_channel.play(sound, loops=loops)
+        return True
+
+    def stop_all(self):
+        """Detiene todas las voces, incluida la música"""
+        if not pygame.mixer.get_init():
+            return
+        pygame.mixer.stop()
+        self.owners = [None] * len(self.channels)
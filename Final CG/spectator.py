@@ -0,0 +1,609 @@
+"""
+Espectadores en red: instantáneas binarias del estado con deltas por UDP
+
+El juego serializa su estado (naves, formación o jefe, balas, power-ups,
+puntaje) en una instantánea binaria compacta: una cabecera y, por cada tipo
+de entidad, sus columnas (todas las x, luego todas las y...) como enteros
+pequeños. A cada espectador se le envía la diferencia, columna por
+columna, contra la última instantánea que confirmó (ACK), comprimida con
+zlib; como la formación y las balas se mueven lo mismo en cada tick, las
+diferencias son casi constantes y se comprimen muy bien. Si el espectador
+no confirmó nada reciente se le envía la instantánea completa.
+
+El cliente guarda las instantáneas recibidas, confirma cada una y dibuja el
+juego con un pequeño retraso, interpolando entre las dos que rodean el
+instante mostrado.
+
+Uso:
+    python main.py --spectate                  # el juego publica en SPECTATOR_PORT
+    python spectator.py --connect 192.168.0.10 # pantalla de espectador
+
+Los tiempos y el ancho de banda se miden con python benchmarks/bench_spectator.py.
+"""
+import argparse
+import socket
+import struct
+import sys
+import time
+import zlib
+from operator import attrgetter
+
+import numpy as np
+from config import *
+
+# Paquete del servidor: firma, secuencia, secuencia base (0 = completa), largo de la instantánea
+PACKET = struct.Struct("<4sIII")
+PACKET_MAGIC = b"SISP"
+# Mensajes del cliente: tipo y secuencia confirmada
+CLIENT_MSG = struct.Struct("<4sI")
+MSG_HELLO = b"HOLA"
+MSG_ACK = b"ACK!"
+
+# Secciones de la instantánea y sus columnas. Cada columna va entera antes
+# que la siguiente (todas las x, luego todas las y...), así el delta de una
+# columna es un bloque de valores casi iguales
+SECTIONS = (
+    ("players", (("x", np.int16), ("y", np.int16), ("lives", np.uint8), ("status", np.uint8))),
+    ("boss", (("x", np.int16), ("y", np.int16), ("health", np.uint16))),
+    ("enemies", (("x", np.int16), ("y", np.int16), ("type", np.uint8))),
+    ("powerups", (("x", np.int16), ("y", np.int16), ("type", np.uint8))),
+    ("enemy_bullets", (("x", np.int16), ("y", np.int16))),
+    ("player_bullets", (("x", np.int16), ("y", np.int16), ("owner", np.uint8))),
+)
+SECTION_NAMES = tuple(name for name, _ in SECTIONS)
+# Cabecera: ms de juego, puntaje, oleada, estado, banderas y la cantidad de cada sección
+SNAPSHOT_HEADER = struct.Struct("<IiHBB" + "H" * len(SECTIONS))
+FLAG_COOP = 1
+FLAG_ENDLESS = 2
+FLAG_PAUSED = 4
+
+PLAYER_ALIVE = 1
+PLAYER_SHIELD = 2
+PLAYER_DOUBLE_SHOT = 4
+
+ENEMY_TYPES = {"common": 0, "advanced": 1}
+POWERUP_TYPES = (POWERUP_DOUBLE_SHOT, POWERUP_SHIELD, POWERUP_EXTRA_LIFE)
+POWERUP_CODES = {powerup_type: code for code, powerup_type in enumerate(POWERUP_TYPES)}
+
+STATES = (STATE_SPLASH, STATE_MENU, STATE_INSTRUCTIONS, STATE_PLAYING,
+          STATE_LEVEL_TRANSITION, STATE_GAME_OVER)
+STATE_CODES = {state: code for code, state in enumerate(STATES)}
+
+
+# -----------------------
+# Instantáneas
+# -----------------------
+_get_x = attrgetter("x")
+_get_y = attrgetter("y")
+
+
+def _xy(items):
+    """Columnas x e y (int16) de items, en ese orden"""
+    n = len(items)
+    return (np.fromiter(map(_get_x, items), dtype=np.float64, count=n).astype(np.int16).tobytes()
+            + np.fromiter(map(_get_y, items), dtype=np.float64, count=n).astype(np.int16).tobytes())
+
+
+def _column(values, n, dtype=np.uint8):
+    return np.fromiter(values, dtype=dtype, count=n).tobytes()
+
+
+def serialize(game):
+    """Instantánea binaria del estado visible del juego"""
+    now = game.ticks()
+    enemies = game.enemies if game.state != STATE_MENU else None
+    boss = [enemies.boss] if enemies is not None and enemies.boss else []
+    playing = enemies is not None
+    formation = enemies.enemies if playing else []
+    players = game.players if playing else []
+    powerups = game.powerup_manager.powerups if playing else []
+    enemy_bullets = game.enemy_bullets if playing else []
+    player_bullets = game.player_bullets if playing else []
+
+    flags = ((FLAG_COOP if game.coop else 0) | (FLAG_ENDLESS if game.endless else 0)
+             | (FLAG_PAUSED if game.paused else 0))
+    n_players, n_enemies, n_powerups = len(players), len(formation), len(powerups)
+    parts = [
+        SNAPSHOT_HEADER.pack(now & 0xFFFFFFFF, game.score, game.current_level,
+                             STATE_CODES.get(game.state, 0), flags, n_players, len(boss),
+                             n_enemies, n_powerups, len(enemy_bullets), len(player_bullets)),
+        _xy(players),
+        _column((p.lives for p in players), n_players),
+        _column(((PLAYER_ALIVE if p.is_alive() else 0) | (PLAYER_SHIELD if p.has_shield else 0)
+                 | (PLAYER_DOUBLE_SHOT if p.double_shot_until > now else 0) for p in players),
+                n_players),
+        _xy(boss),
+        _column((b.health for b in boss), len(boss), np.uint16),
+        _xy(formation),
+        _column((ENEMY_TYPES.get(e.type, 0) for e in formation), n_enemies),
+        _xy(powerups),
+        _column((POWERUP_CODES.get(p.type, 0) for p in powerups), n_powerups),
+        _xy(enemy_bullets),
+        _xy(player_bullets),
+        _column((b.owner for b in player_bullets), len(player_bullets)),
+    ]
+    return b"".join(parts)
+
+
+def _split(data):
+    """Cabecera y columnas de una instantánea
+
+    Returns:
+        tuple: (valores de la cabecera, {sección: {columna: arreglo}}), los
+            arreglos son vistas de data
+    """
+    header = SNAPSHOT_HEADER.unpack_from(data)
+    offset = SNAPSHOT_HEADER.size
+    sections = {}
+    for (name, columns), n in zip(SECTIONS, header[5:]):
+        section = sections[name] = {}
+        for column, dtype in columns:
+            section[column] = np.frombuffer(data, dtype=dtype, count=n, offset=offset)
+            offset += n * np.dtype(dtype).itemsize
+    if offset != len(data):
+        raise ValueError("instantánea de largo inválido")
+    return header, sections
+
+
+def deserialize(data):
+    """Convierte una instantánea en un diccionario de arreglos NumPy"""
+    (ms, score, wave, state, flags, *_), sections = _split(data)
+    snapshot = {"ms": ms, "score": score, "wave": wave, "state": STATES[state], "flags": flags}
+    for name, section in sections.items():
+        section["x"] = section["x"].astype(np.float32)
+        section["y"] = section["y"].astype(np.float32)
+        snapshot[name] = section
+    boss = sections["boss"]
+    snapshot["boss"] = ((boss["x"][0], boss["y"][0], int(boss["health"][0]))
+                        if len(boss["x"]) else None)
+    return snapshot
+
+
+# -----------------------
+# Deltas
+# -----------------------
+def entity_ids(game):
+    """Identidad (id de Python) de las entidades de cada sección, en el orden de serialize()
+
+    No viaja en la instantánea: el servidor la guarda junto a cada una para
+    saber qué entidades de la base siguen vivas al calcular el delta.
+    """
+    enemies = game.enemies if game.state != STATE_MENU else None
+    playing = enemies is not None
+    sections = (
+        game.players if playing else [],
+        [enemies.boss] if playing and enemies.boss else [],
+        enemies.enemies if playing else [],
+        game.powerup_manager.powerups if playing else [],
+        game.enemy_bullets if playing else [],
+        game.player_bullets if playing else [],
+    )
+    return [np.fromiter(map(id, items), dtype=np.int64, count=len(items)) for items in sections]
+
+
+def survivors(ids, base_ids):
+    """Máscara de las entidades de la base que siguen en la instantánea
+
+    Las listas se compactan conservando el orden y lo nuevo se agrega al
+    final, así que las sobrevivientes son las primeras entidades de la
+    instantánea y aparecen en la base en el mismo orden. Se toma el prefijo
+    más largo que cumple eso; un id reutilizado por una entidad nueva solo
+    empeora la compresión, el delta sigue siendo exacto porque la máscara
+    viaja en el paquete.
+    """
+    keep = np.zeros(len(base_ids), dtype=bool)
+    if not len(ids) or not len(base_ids):
+        return keep
+    order = np.argsort(base_ids)
+    index = np.minimum(np.searchsorted(base_ids, ids, sorter=order), len(base_ids) - 1)
+    position = np.where(base_ids[order[index]] == ids, order[index], -1)
+    valid = position >= 0
+    valid[1:] &= position[1:] > position[:-1]
+    kept = len(ids) if valid.all() else int(np.argmin(valid))
+    keep[position[:kept]] = True
+    return keep
+
+
+def _aligned(column, keep, n):
+    """Valores de la base que corresponden a las n entidades nuevas (0 para las agregadas)"""
+    aligned = np.zeros(n, dtype=column.dtype)
+    kept = column[keep]
+    aligned[:len(kept)] = kept
+    return aligned
+
+
+def encode_packet(seq, snapshot, base_seq=0, base=None, ids=None, base_ids=None):
+    """Paquete con la instantánea completa o su diferencia contra base
+
+    El delta lleva, por sección, la máscara de sobrevivientes de la base y
+    la resta columna por columna (en el tipo de cada columna, con desborde)
+    contra esas sobrevivientes: lo que no cambió queda en cero y lo que se
+    movió igual queda como un valor repetido, que zlib comprime casi a nada.
+
+    Args:
+        ids, base_ids: entity_ids() de la instantánea y de la base; sin ellos
+            se alinea por posición
+    """
+    if base is None:
+        return PACKET.pack(PACKET_MAGIC, seq, 0, len(snapshot)) + zlib.compress(
+            snapshot, SPECTATOR_ZLIB_LEVEL)
+    _, sections = _split(snapshot)
+    _, base_sections = _split(base)
+    header_bytes = np.frombuffer(snapshot, dtype=np.uint8, count=SNAPSHOT_HEADER.size)
+    parts = [header_bytes - np.frombuffer(base, dtype=np.uint8, count=SNAPSHOT_HEADER.size)]
+    for i, name in enumerate(SECTION_NAMES):
+        section, base_section = sections[name], base_sections[name]
+        n, m = len(section["x"]), len(base_section["x"])
+        if ids is not None and base_ids is not None:
+            keep = survivors(ids[i], base_ids[i])
+        else:
+            keep = np.arange(m) < n
+        parts.append(np.packbits(keep))
+        for column, values in section.items():
+            parts.append(values - _aligned(base_section[column], keep, n))
+    payload = b"".join(part.tobytes() for part in parts)
+    return PACKET.pack(PACKET_MAGIC, seq, base_seq, len(snapshot)) + zlib.compress(
+        payload, SPECTATOR_ZLIB_LEVEL)
+
+
+def decode_packet(packet, history):
+    """Reconstruye la instantánea de un paquete
+
+    Args:
+        history: {secuencia: instantánea} ya recibidas, para resolver la base
+
+    Returns:
+        tuple: (secuencia, instantánea) o None si el paquete no es válido o
+            falta su base
+    """
+    if len(packet) < PACKET.size:
+        return None
+    magic, seq, base_seq, length = PACKET.unpack_from(packet)
+    if magic != PACKET_MAGIC:
+        return None
+    try:
+        payload = zlib.decompress(packet[PACKET.size:])
+        if not base_seq:
+            _split(payload)  # valida el largo
+            return (seq, payload) if len(payload) == length else None
+        base = history.get(base_seq)
+        if base is None:
+            return None
+        _, base_sections = _split(base)
+        header = (np.frombuffer(payload, dtype=np.uint8, count=SNAPSHOT_HEADER.size)
+                  + np.frombuffer(base, dtype=np.uint8, count=SNAPSHOT_HEADER.size)).tobytes()
+        counts = SNAPSHOT_HEADER.unpack(header)[5:]
+        offset = SNAPSHOT_HEADER.size
+        parts = [header]
+        for (name, columns), n in zip(SECTIONS, counts):
+            base_section = base_sections[name]
+            m = len(base_section["x"])
+            mask_bytes = (m + 7) // 8
+            keep = np.unpackbits(np.frombuffer(payload, dtype=np.uint8, count=mask_bytes,
+                                               offset=offset), count=m).astype(bool)
+            offset += mask_bytes
+            for column, dtype in columns:
+                diff = np.frombuffer(payload, dtype=dtype, count=n, offset=offset)
+                offset += diff.nbytes
+                parts.append((diff + _aligned(base_section[column], keep, n)).tobytes())
+    except (zlib.error, ValueError, struct.error):
+        return None
+    snapshot = b"".join(parts)
+    if offset != len(payload) or len(snapshot) != length:
+        return None
+    return seq, snapshot
+
+
+# -----------------------
+# Servidor (dentro del juego)
+# -----------------------
+class SpectatorServer:
+    def __init__(self, port=SPECTATOR_PORT, rate=SPECTATOR_RATE):
+        """Abre el socket UDP y espera espectadores
+
+        Args:
+            port: puerto UDP
+            rate: instantáneas por segundo de juego
+        """
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.setblocking(False)
+        self.socket.bind(("", port))
+        self.port = self.socket.getsockname()[1]
+        self.interval_ms = 1000 / rate
+        self.next_send_ms = None
+        self.clients = {}  # dirección -> [secuencia confirmada, último mensaje (monotónico)]
+        self.history = {}  # secuencia -> (instantánea, entity_ids)
+        self.seq = 0
+        self.bytes_sent = 0
+        self.packets_sent = 0
+        self.keyframes = 0
+        self.send_errors = 0
+
+    def _receive(self):
+        """Atiende los saludos y confirmaciones pendientes sin bloquear"""
+        now = time.monotonic()
+        while True:
+            try:
+                data, address = self.socket.recvfrom(64)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                continue  # p. ej. ICMP de un espectador que se fue
+            if len(data) != CLIENT_MSG.size:
+                continue
+            kind, seq = CLIENT_MSG.unpack(data)
+            client = self.clients.get(address)
+            if client is None:
+                if kind != MSG_HELLO:
+                    continue
+                client = self.clients[address] = [0, now]
+            client[1] = now
+            if kind == MSG_ACK and seq > client[0]:
+                client[0] = seq
+        # Olvidar a los que dejaron de responder
+        for address in [a for a, c in self.clients.items()
+                        if now - c[1] > SPECTATOR_CLIENT_TIMEOUT_S]:
+            del self.clients[address]
+
+    def update(self, game, now):
+        """Se llama una vez por frame; publica a SPECTATOR_RATE según el reloj del juego"""
+        self._receive()
+        if not self.clients:
+            return
+        if self.next_send_ms is not None and now < self.next_send_ms:
+            return
+        self.next_send_ms = max((self.next_send_ms or now) + self.interval_ms, now)
+
+        self.seq += 1
+        snapshot = serialize(game)
+        ids = entity_ids(game)
+        self.history[self.seq] = (snapshot, ids)
+        self.history.pop(self.seq - SPECTATOR_HISTORY, None)
+
+        packets = {}  # los espectadores con la misma base comparten paquete
+        for address, (acked, _) in self.clients.items():
+            base_seq = acked if acked in self.history else 0
+            packet = packets.get(base_seq)
+            if packet is None:
+                base, base_ids = self.history.get(base_seq, (None, None))
+                packet = encode_packet(self.seq, snapshot, base_seq, base, ids, base_ids)
+                packets[base_seq] = packet
+                if not base_seq:
+                    self.keyframes += 1
+            if len(packet) > SPECTATOR_MAX_PACKET:
+                self.send_errors += 1
+                continue
+            try:
+                self.socket.sendto(packet, address)
+                self.bytes_sent += len(packet)
+                self.packets_sent += 1
+            except OSError:
+                # Buffer lleno o red caída: se pierde esta instantánea, no el frame
+                self.send_errors += 1
+
+    def close(self):
+        self.socket.close()
+
+
+# -----------------------
+# Cliente
+# -----------------------
+class SpectatorClient:
+    def __init__(self, host, port=SPECTATOR_PORT):
+        self.server = (host, port)
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.setblocking(False)
+        self.history = {}  # secuencia -> instantánea en bytes
+        self.states = []  # (ms, instantánea decodificada), en orden
+        self.latest_seq = 0
+        self.latest_arrival = None  # reloj local al recibir la última
+        self.last_hello = None
+        self.bytes_received = 0
+        self.packets_received = 0
+        self.undecodable = 0
+
+    def _send(self, kind, seq=0):
+        try:
+            self.socket.sendto(CLIENT_MSG.pack(kind, seq), self.server)
+        except OSError:
+            pass
+
+    def poll(self):
+        """Saluda, recibe lo pendiente y confirma cada instantánea"""
+        now = time.monotonic()
+        if self.last_hello is None or now - self.last_hello >= SPECTATOR_HELLO_S:
+            self._send(MSG_HELLO)
+            self.last_hello = now
+        while True:
+            try:
+                packet, _ = self.socket.recvfrom(SPECTATOR_MAX_PACKET + PACKET.size)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                continue
+            self.bytes_received += len(packet)
+            self.packets_received += 1
+            decoded = decode_packet(packet, self.history)
+            if decoded is None:
+                self.undecodable += 1  # sin base: el servidor mandará una completa
+                continue
+            seq, snapshot = decoded
+            if seq <= self.latest_seq:
+                continue  # llegó desordenado y ya hay una más nueva
+            self.history[seq] = snapshot
+            if len(self.history) > SPECTATOR_HISTORY:
+                # Con paquetes perdidos hay huecos: se borran por antigüedad, no por número
+                for old in [old for old in self.history if old <= seq - SPECTATOR_HISTORY]:
+                    del self.history[old]
+            self._send(MSG_ACK, seq)
+            self.latest_seq = seq
+            self.latest_arrival = now
+            state = deserialize(snapshot)
+            self.states.append((state["ms"], state))
+            del self.states[:-SPECTATOR_BUFFERED_STATES]
+
+    def sample(self):
+        """Estado a mostrar: SPECTATOR_INTERP_DELAY_MS por detrás del último, interpolado"""
+        if not self.states:
+            return None
+        latest_ms = self.states[-1][0]
+        elapsed_ms = (time.monotonic() - self.latest_arrival) * 1000
+        render_ms = latest_ms + min(elapsed_ms, SPECTATOR_INTERP_DELAY_MS) - SPECTATOR_INTERP_DELAY_MS
+        for (ms_a, a), (ms_b, b) in zip(self.states, self.states[1:]):
+            if ms_a <= render_ms <= ms_b and ms_b > ms_a:
+                return interpolate(a, b, (render_ms - ms_a) / (ms_b - ms_a))
+        return self.states[0][1] if render_ms < self.states[0][0] else self.states[-1][1]
+
+    def close(self):
+        self.socket.close()
+
+
+def interpolate(a, b, t):
+    """Mezcla las posiciones de dos instantáneas (t=0 es a, t=1 es b)
+
+    Solo se interpolan las secciones con la misma cantidad de entidades; si
+    algo apareció o desapareció se muestra b tal cual.
+    """
+    result = dict(b)
+    for name in ("players", "enemies", "powerups", "enemy_bullets", "player_bullets"):
+        section_a, section_b = a[name], b[name]
+        if len(section_a["x"]) == len(section_b["x"]):
+            section = dict(section_b)
+            section["x"] = section_a["x"] + (section_b["x"] - section_a["x"]) * t
+            section["y"] = section_a["y"] + (section_b["y"] - section_a["y"]) * t
+            result[name] = section
+    if a["boss"] and b["boss"]:
+        result["boss"] = (a["boss"][0] + (b["boss"][0] - a["boss"][0]) * t,
+                          a["boss"][1] + (b["boss"][1] - a["boss"][1]) * t, b["boss"][2])
+    return result
+
+
+class SpectatorView:
+    """Dibuja una instantánea reutilizando las clases de entidades del juego"""
+
+    def __init__(self, screen):
+        import pygame
+        from capabilities import resolve_capabilities
+        from enemy import Boss, Enemy
+        from powerup import PowerUp
+        self.screen = screen
+        self.caps = resolve_capabilities()
+        self.boss = Boss(0, 0)
+        self.players = [self.caps.player_class(0, 0, i) for i in range(len(PLAYER_COLORS))]
+        # Objetos reutilizados por sección; solo se les cambia la posición
+        self.factories = {
+            "common": lambda: Enemy(0, 0, "common"),
+            "advanced": lambda: Enemy(0, 0, "advanced"),
+            "enemy_bullets": lambda: self.caps.bullet_class(0, 0, -1),
+            "player_bullets": lambda: self.caps.bullet_class(0, 0, 1),
+        }
+        for code, powerup_type in enumerate(POWERUP_TYPES):
+            self.factories[code] = lambda powerup_type=powerup_type: PowerUp(0, 0, powerup_type)
+        self.pools = {name: [] for name in self.factories}
+        self.font = pygame.font.Font(None, 32)
+        self.small_font = pygame.font.Font(None, 22)
+
+    def _draw_section(self, section, pools, owners=None):
+        """Dibuja las entidades de una sección; pools da el pool de cada una"""
+        used = {}
+        for i, (x, y, name) in enumerate(zip(section["x"], section["y"], pools)):
+            pool = self.pools[name]
+            index = used.get(name, 0)
+            used[name] = index + 1
+            if index == len(pool):
+                pool.append(self.factories[name]())
+            item = pool[index]
+            item.x = int(x)
+            item.y = int(y)
+            item.rect.x = item.x
+            item.rect.y = item.y
+            if owners is not None:
+                item.owner = int(owners[i])
+            item.draw(self.screen)
+
+    def draw(self, state, status):
+        screen = self.screen
+        screen.fill(DARK_BLUE)
+        if state is not None:
+            players = state["players"]
+            for player, x, y, flags in zip(self.players, players["x"], players["y"],
+                                           players["status"]):
+                if flags & PLAYER_ALIVE:
+                    player.x, player.y = int(x), int(y)
+                    player.rect.x, player.rect.y = player.x, player.y
+                    player.has_shield = bool(flags & PLAYER_SHIELD)
+                    player.draw(screen)
+            if state["boss"]:
+                x, y, health = state["boss"]
+                self.boss.x, self.boss.y, self.boss.health = int(x), int(y), health
+                self.boss.draw(screen)
+            section = state["enemies"]
+            self._draw_section(section, ("advanced" if code else "common" for code in section["type"]))
+            section = state["powerups"]
+            self._draw_section(section, (int(code) % len(POWERUP_TYPES) for code in section["type"]))
+            section = state["enemy_bullets"]
+            self._draw_section(section, ["enemy_bullets"] * len(section["x"]))
+            section = state["player_bullets"]
+            self._draw_section(section, ["player_bullets"] * len(section["x"]), section["owner"])
+
+            hud = self.font.render(f"PUNTOS: {state['score']}   OLEADA: {state['wave']}", True, YELLOW)
+            screen.blit(hud, (10, 10))
+            if state["state"] != STATE_PLAYING:
+                label = {STATE_LEVEL_TRANSITION: "SIGUIENTE OLEADA",
+                         STATE_GAME_OVER: "FIN DE PARTIDA"}.get(state["state"], "EN EL MENÚ")
+                text = self.font.render(label, True, NEON_PINK)
+                screen.blit(text, text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)))
+        else:
+            text = self.font.render("Esperando al juego...", True, WHITE)
+            screen.blit(text, text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)))
+        status_surface = self.small_font.render(status, True, GRAY)
+        screen.blit(status_surface, (10, SCREEN_HEIGHT - 25))
+
+
+def run_viewer(host, port):
+    """Ventana de espectador"""
+    import pygame
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption(f"Space Invaders - Espectador ({host}:{port})")
+    clock = pygame.time.Clock()
+    client = SpectatorClient(host, port)
+    view = SpectatorView(screen)
+    window_start, window_bytes, rate_kbps = time.monotonic(), 0, 0.0
+    running = True
+    try:
+        while running:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN
+                                                 and event.key == pygame.K_ESCAPE):
+                    running = False
+            client.poll()
+            now = time.monotonic()
+            if now - window_start >= 1.0:
+                rate_kbps = (client.bytes_received - window_bytes) / 1024 / (now - window_start)
+                window_start, window_bytes = now, client.bytes_received
+            status = (f"{rate_kbps:.1f} KB/s  paquetes {client.packets_received}  "
+                      f"sin base {client.undecodable}")
+            view.draw(client.sample(), status)
+            pygame.display.flip()
+            clock.tick(FPS)
+    finally:
+        client.close()
+        pygame.quit()
+
+
+def parse_args():
+    """Lee los argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Espectadores en red")
+    parser.add_argument("--connect", metavar="HOST", help="ver el juego que publica HOST")
+    parser.add_argument("--port", type=int, default=SPECTATOR_PORT, help="puerto UDP")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.connect:
+        run_viewer(args.connect, args.port)
+    else:
+        print("Indica --connect HOST")
+        sys.exit(1)
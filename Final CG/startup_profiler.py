@@ -0,0 +1,79 @@
+"""
+Perfilado del arranque: tiempo de importaciones e inicialización de subsistemas
+"""
+import json
+import platform
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+
+class StartupProfiler:
+    def __init__(self):
+        """Inicializa el perfilador (deshabilitado hasta llamar a enable)"""
+        self.enabled = False
+        self.stages = {}  # {nombre: (segundos, hilo)}
+        self.lock = threading.Lock()
+
+    def enable(self):
+        """Activa el registro de etapas"""
+        self.enabled = True
+
+    @contextmanager
+    def stage(self, name):
+        """Mide el tiempo de pared de una etapa del arranque
+
+        Se puede usar desde cualquier hilo; si el perfilador está
+        deshabilitado no registra nada.
+        """
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name, seconds):
+        """Registra la duración de una etapa"""
+        if not self.enabled:
+            return
+        with self.lock:
+            self.stages[name] = (seconds, threading.current_thread().name)
+
+    def sorted_stages(self):
+        """Retorna las etapas ordenadas de mayor a menor duración"""
+        with self.lock:
+            items = list(self.stages.items())
+        return sorted(items, key=lambda item: item[1][0], reverse=True)
+
+    def report(self):
+        """Imprime el desglose ordenado del arranque"""
+        stages = self.sorted_stages()
+        print("=" * 50)
+        print("PERFIL DE ARRANQUE")
+        print("=" * 50)
+        for name, (seconds, thread) in stages:
+            print(f"{name:<36} {seconds * 1000:>10.1f} ms   [{thread}]")
+        print("=" * 50)
+
+    def write_json(self, path):
+        """Escribe el desglose en formato JSON"""
+        data = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "stages": [
+                {"name": name, "ms": round(seconds * 1000, 3), "thread": thread}
+                for name, (seconds, thread) in self.sorted_stages()
+            ],
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+
+# Instancia compartida por todos los módulos del juego
+profiler = StartupProfiler()
@@ -0,0 +1,271 @@
+"""
+Telemetría de eventos de juego
+
+Cada evento (disparo, baja, impacto, power-up, oleada, fin de partida) es un
+registro binario de tamaño fijo. El juego solo agrega tuplas a una lista y
+cada TELEMETRY_HANDOFF_MS la entrega a una cola acotada; un hilo escritor empaqueta
+los registros por lotes en archivos gzip que rotan por tamaño. Si el
+escritor se atrasa y la cola se llena, el lote se descarta y se cuenta: el
+juego nunca espera al disco. Un registro que no se puede empaquetar (un campo
+fuera de rango) o una escritura que falla también se cuentan, y el escritor
+sigue con los demás.
+
+El costo en el hilo del juego se mide con python benchmarks/bench_telemetry.py.
+
+Uso:
+    python telemetry.py                     # resume telemetria/*.bin.gz
+    python telemetry.py archivo.bin.gz ...
+"""
+import glob
+import gzip
+import os
+import queue
+import struct
+import sys
+import threading
+import time
+
+from config import *
+
+# Tipos de evento. arg es el índice del jugador salvo donde se indica
+EV_RUN_START = 1  # value: número de jugadores
+EV_WAVE = 2  # value: número de oleada
+EV_SHOT = 3  # x, y: origen; value: balas disparadas
+EV_KILL = 4  # x, y: enemigo; value: puntos
+EV_BOSS_HIT = 5  # x, y: impacto; value: vida restante del jefe
+EV_BOSS_DEFEATED = 6  # x, y: jefe; value: puntos
+EV_PLAYER_HIT = 7  # x, y: bala; value: vidas restantes
+EV_POWERUP = 8  # x, y: jugador; value: código en POWERUP_CODES
+EV_GAME_OVER = 9  # arg: motivo (GAME_OVER_*); value: puntaje final
+EV_QUALITY = 10  # arg: nivel de calidad nuevo; value: tiempo de frame promedio (décimas de ms)
+
+EVENT_NAMES = {
+    EV_RUN_START: "inicio", EV_WAVE: "oleada", EV_SHOT: "disparo", EV_KILL: "baja",
+    EV_BOSS_HIT: "impacto_jefe", EV_BOSS_DEFEATED: "jefe_derrotado",
+    EV_PLAYER_HIT: "impacto_jugador", EV_POWERUP: "power_up", EV_GAME_OVER: "fin",
+    EV_QUALITY: "calidad",
+}
+
+GAME_OVER_LIVES = 0  # sin vidas
+GAME_OVER_INVASION = 1  # la formación llegó abajo
+GAME_OVER_VICTORY = 2  # campaña completada
+
+POWERUP_CODES = {POWERUP_DOUBLE_SHOT: 1, POWERUP_SHIELD: 2, POWERUP_EXTRA_LIFE: 3}
+
+# Registro: ms de juego, tipo, arg, x, y, valor (14 bytes)
+RECORD = struct.Struct("<IBBhhi")
+# Cabecera de cada archivo: firma, versión, hora de inicio (epoch)
+HEADER = struct.Struct("<4sBd")
+MAGIC = b"SITL"
+VERSION = 1
+
+_STOP = None  # marca de fin en la cola
+
+
+class TelemetryWriter(threading.Thread):
+    """Hilo que escribe los lotes de la cola en archivos gzip rotativos"""
+
+    def __init__(self, batches, directory):
+        super().__init__(name="telemetry-writer", daemon=True)
+        self.batches = batches
+        self.directory = directory
+        self.file = None
+        self.file_bytes = 0
+        self.files_written = 0
+        self.records = 0
+        self.errors = 0  # registros perdidos por un error de empaquetado o de escritura
+        self.last_error = None
+        self.session = time.strftime("%Y%m%d_%H%M%S")
+
+    def _open(self):
+        os.makedirs(self.directory, exist_ok=True)
+        self.files_written += 1
+        path = os.path.join(self.directory,
+                            f"telemetria_{self.session}_{self.files_written:04d}.bin.gz")
+        self.file = gzip.open(path, "wb", compresslevel=TELEMETRY_COMPRESSLEVEL)
+        self.file.write(HEADER.pack(MAGIC, VERSION, time.time()))
+        self.file_bytes = HEADER.size
+        self._prune()
+
+    def _prune(self):
+        """Borra los archivos más viejos por encima de TELEMETRY_MAX_FILES"""
+        files = sorted(glob.glob(os.path.join(self.directory, "telemetria_*.bin.gz")))
+        for path in files[:-TELEMETRY_MAX_FILES]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _error(self, lost, error):
+        """Cuenta registros perdidos; el primer error se avisa por consola"""
+        if self.errors == 0:
+            print(f"Telemetría: error en el escritor ({error!r}); se sigue con los demás registros.")
+        self.errors += lost
+        self.last_error = repr(error)
+
+    def _pack(self, batch):
+        """Empaqueta un lote; los registros inválidos se cuentan y se saltean"""
+        pack = RECORD.pack
+        try:
+            return [pack(*event) for event in batch]
+        except (struct.error, TypeError):
+            pass
+        packed = []
+        for event in batch:
+            try:
+                packed.append(pack(*event))
+            except (struct.error, TypeError) as e:
+                self._error(1, e)
+        return packed
+
+    def _write(self, pending):
+        try:
+            if self.file is None:
+                self._open()
+            data = b"".join(pending)
+            self.file.write(data)
+            self.file_bytes += len(data)
+            if self.file_bytes >= TELEMETRY_ROTATE_BYTES:
+                self.file.close()
+                self.file = None
+        except OSError as e:
+            # El lote se pierde; el próximo intenta con un archivo nuevo
+            self._error(len(pending), e)
+            self._close_file()
+
+    def _close_file(self):
+        if self.file is None:
+            return
+        try:
+            self.file.close()
+        except OSError:
+            pass
+        self.file = None
+
+    def run(self):
+        pending = []
+        pending_bytes = 0
+        last_write = time.monotonic()
+        running = True
+        try:
+            while running:
+                try:
+                    batch = self.batches.get(timeout=TELEMETRY_FLUSH_S)
+                except queue.Empty:
+                    batch = ()
+                if batch is _STOP:
+                    running = False
+                else:
+                    packed = self._pack(batch)
+                    pending.extend(packed)
+                    pending_bytes += len(packed) * RECORD.size
+                    self.records += len(packed)
+                # Escribir por lotes grandes, o al menos cada TELEMETRY_FLUSH_S
+                now = time.monotonic()
+                if pending and (not running or pending_bytes >= TELEMETRY_WRITE_BYTES
+                                or now - last_write >= TELEMETRY_FLUSH_S):
+                    self._write(pending)
+                    pending = []
+                    pending_bytes = 0
+                    last_write = now
+        finally:
+            self._close_file()
+
+
+class Telemetry:
+    def __init__(self, directory=TELEMETRY_DIR):
+        """Crea la cola y lanza el hilo escritor
+
+        Args:
+            directory: carpeta de los archivos de telemetría
+        """
+        self.batches = queue.Queue(maxsize=TELEMETRY_QUEUE_BATCHES)
+        self.pending = []  # eventos aún no entregados al escritor
+        self.last_handoff = None
+        self.dropped = 0
+        self.writer = TelemetryWriter(self.batches, directory)
+        self.writer.start()
+
+    def log(self, kind, now, arg=0, x=0, y=0, value=0):
+        """Registra un evento (solo agrega una tupla; se empaqueta en el escritor)"""
+        self.pending.append((int(now), kind, arg, int(x), int(y), int(value)))
+
+    def flush(self, now=None):
+        """Entrega los eventos al escritor sin esperar
+
+        Se llama una vez por frame; con now solo entrega cada TELEMETRY_HANDOFF_MS
+        (o con TELEMETRY_HANDOFF_EVENTS pendientes), así el escritor no
+        despierta ni compite por el GIL en cada frame.
+        """
+        if now is not None:
+            if self.last_handoff is None:
+                self.last_handoff = now
+            if (now - self.last_handoff < TELEMETRY_HANDOFF_MS
+                    and len(self.pending) < TELEMETRY_HANDOFF_EVENTS):
+                return
+            self.last_handoff = now
+        if not self.pending:
+            return
+        try:
+            self.batches.put_nowait(self.pending)
+        except queue.Full:
+            self.dropped += len(self.pending)
+        self.pending = []
+
+    def close(self):
+        """Escribe lo pendiente y cierra el archivo actual"""
+        self.flush()
+        try:
+            self.batches.put(_STOP, timeout=TELEMETRY_CLOSE_TIMEOUT_S)
+        except queue.Full:
+            pass
+        self.writer.join(timeout=TELEMETRY_CLOSE_TIMEOUT_S)
+        if self.dropped:
+            print(f"Telemetría: {self.dropped} eventos descartados por cola llena.")
+        if self.writer.errors:
+            print(f"Telemetría: {self.writer.errors} eventos perdidos por errores "
+                  f"(último: {self.writer.last_error}).")
+
+
+# -----------------------
+# Lectura
+# -----------------------
+def read_events(path):
+    """Lee un archivo de telemetría
+
+    Returns:
+        tuple: (hora de inicio epoch, lista de registros (ms, tipo, arg, x, y, valor))
+    """
+    with gzip.open(path, "rb") as f:
+        data = f.read()
+    magic, version, started = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path}: no es un archivo de telemetría v{VERSION}")
+    body = data[HEADER.size:]
+    usable = len(body) - len(body) % RECORD.size  # un archivo cortado a medias
+    return started, list(RECORD.iter_unpack(body[:usable]))
+
+
+def summarize(paths):
+    """Imprime la cantidad de eventos por tipo y las bajas por jugador"""
+    counts = {}
+    kills = {}
+    for path in paths:
+        _, events = read_events(path)
+        for _, kind, arg, _, _, _ in events:
+            counts[kind] = counts.get(kind, 0) + 1
+            if kind == EV_KILL:
+                kills[arg] = kills.get(arg, 0) + 1
+    print(f"{len(paths)} archivos, {sum(counts.values())} eventos")
+    for kind in sorted(counts):
+        print(f"  {EVENT_NAMES.get(kind, kind):<16} {counts[kind]:>8}")
+    for player in sorted(kills):
+        print(f"  bajas J{player + 1}: {kills[player]}")
+
+
+if __name__ == "__main__":
+    paths = sys.argv[1:] or sorted(glob.glob(os.path.join(TELEMETRY_DIR, "*.bin.gz")))
+    if not paths:
+        print(f"No hay archivos de telemetría en {TELEMETRY_DIR}/")
+        sys.exit(1)
+    summarize(paths)
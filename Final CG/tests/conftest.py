@@ -0,0 +1,31 @@
+"""
+Configuración común de las pruebas: sin ventana ni audio, con los módulos
+del juego importables desde la carpeta del proyecto
+"""
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest  # noqa: E402
+
+
+@pytest.fixture
+def make_game():
+    """Crea juegos sin ventana, con piloto automático y reloj fijo
+
+    rng (game_random.py) se siembra antes de cada juego para que las partidas sean reproducibles.
+    """
+    from game import Game
+    from game_random import rng
+
+    def make(seed=0, **kwargs):
+        rng.seed(seed)
+        kwargs.setdefault("autopilot", True)
+        game = Game(headless=True, **kwargs)
+        game.use_fixed_step(start_ms=0)
+        return game
+
+    return make
@@ -0,0 +1,48 @@
+"""
+Patrones del jefe: las fases siguen la vida restante y el tope de balas se respeta
+"""
+
+import numpy as np
+from config import *
+from game_random import rng
+from boss_patterns import PatternEmitter
+from enemy import Boss
+
+
+def run(emitter, boss, ms, active_bullets=0):
+    """Avanza el programa ms milisegundos; devuelve las voleas emitidas"""
+    volleys = []
+    for now in np.arange(0, ms, 1000 / FPS):
+        volley = emitter.update(boss, float(now), [], active_bullets)
+        if volley is not None:
+            volleys.append(volley)
+    return volleys
+
+
+def test_phase_follows_remaining_health():
+    emitter = PatternEmitter()
+    boss = Boss(300, 50)
+    assert emitter.phase(boss) is BOSS_PHASES[0]
+    boss.health = 1
+    assert emitter.phase(boss) is BOSS_PHASES[-1]
+
+
+def test_volleys_never_exceed_the_bullet_cap():
+    rng.seed(0)
+    emitter = PatternEmitter()
+    boss = Boss(300, 50)
+    boss.health = 1  # la fase más agresiva
+    volleys = run(emitter, boss, 20000, active_bullets=BOSS_MAX_BULLETS - 3)
+    assert volleys
+    assert all(len(x) <= 3 for x, y, vx, vy in volleys)
+    assert emitter.dropped > 0
+    assert run(PatternEmitter(), boss, 20000, active_bullets=BOSS_MAX_BULLETS) == []
+
+
+def test_bullets_leave_at_the_pattern_speed():
+    rng.seed(0)
+    emitter = PatternEmitter()
+    boss = Boss(300, 50)
+    speeds = {pattern["speed"] for pattern in BOSS_PATTERNS.values()}
+    for x, y, vx, vy in run(emitter, boss, 20000):
+        assert set(np.round(np.hypot(vx, vy), 6)) <= speeds
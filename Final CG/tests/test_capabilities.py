@@ -0,0 +1,81 @@
+"""
+Objetos nulos: el juego y los módulos que leen su estado funcionan con los
+sustitutos de capabilities.py, sin AttributeError
+"""
+import importlib
+import sys
+
+import pytest
+from config import *
+import game as game_module
+from capabilities import (Capabilities, NullBullet, NullEnemyGroup, NullParticleSystem,
+                          NullPlayer, NullPowerUpManager)
+from observation import symbolic_observation
+from rewind import RewindBuffer
+
+
+def public_names(obj):
+    return {name for name in dir(obj) if not name.startswith("_")}
+
+
+@pytest.mark.parametrize("real, null", [
+    (lambda: __import__("player").Player(10, 10, 1), lambda: NullPlayer(10, 10, 1)),
+    (lambda: __import__("enemy").EnemyGroup(1), lambda: NullEnemyGroup(1)),
+    (lambda: __import__("bullet").Bullet(1, 1), lambda: NullBullet(1, 1)),
+    (lambda: __import__("powerup").PowerUpManager(), lambda: NullPowerUpManager()),
+])
+def test_null_objects_expose_the_real_interface(real, null):
+    assert public_names(real()) <= public_names(null())
+
+
+def test_null_player_without_lives_is_dead():
+    assert not NullPlayer(0, 0).is_alive()
+
+
+def test_null_particle_system_interface():
+    from particles import ParticleSystem
+    methods = {name for name in public_names(ParticleSystem) if callable(getattr(ParticleSystem, name))}
+    assert methods | {"count"} <= public_names(NullParticleSystem())
+
+
+def test_game_runs_with_null_subsystems(make_game, monkeypatch):
+    monkeypatch.setattr(game_module, "resolve_capabilities", Capabilities)
+    game = make_game(seed=0)
+    game.rewind = rewind = RewindBuffer()
+    game.toggle_coop()
+    game.start_run()
+    for _ in range(120):
+        game.step()
+        game.draw()
+        if game.state == STATE_PLAYING:
+            symbolic_observation(game)
+    # Los jugadores nulos no tienen vidas: la partida termina sin errores
+    assert game.state == STATE_GAME_OVER
+    rewind.record(game, game.ticks())
+    rewind.restore(game, 0)
+
+
+# Módulos que el juego resuelve como opcionales (varios dependen de NumPy)
+OPTIONAL_MODULES = ("autopilot", "scores", "spectator", "rewind", "display", "boss_patterns",
+                    "quality", "dive_paths")
+
+
+def test_game_runs_without_optional_modules(monkeypatch):
+    import enemy
+    with monkeypatch.context() as patch:
+        for name in OPTIONAL_MODULES:
+            patch.setitem(sys.modules, name, None)  # import name -> ImportError
+        try:
+            importlib.reload(enemy)
+            assert enemy.DIVE_TABLES == ()
+            game = game_module.Game(autopilot=True)
+            missing = {name for name, reason in game.caps.missing}
+            assert missing == {f"{name}.py" for name in OPTIONAL_MODULES if name != "dive_paths"}
+            game.use_fixed_step(start_ms=0)
+            for _ in range(300):
+                game.step()
+            assert game.state in (STATE_PLAYING, STATE_LEVEL_TRANSITION)
+            game.close()
+        finally:
+            patch.undo()
+            importlib.reload(enemy)
@@ -0,0 +1,51 @@
+"""
+Cooperativo: cada jugador responde solo a sus teclas y sus balas llevan su índice
+"""
+import pygame
+from config import *
+
+
+class HeldKeys:
+    """Reemplazo de pygame.key.get_pressed() con un conjunto de teclas apretadas"""
+
+    def __init__(self, *names):
+        self.codes = {pygame.key.key_code(name) for name in names}
+
+    def __getitem__(self, code):
+        return code in self.codes
+
+
+def start_coop(make_game):
+    game = make_game(seed=0, autopilot=False)
+    game.toggle_coop()
+    game.start_run()
+    game.level_transition_start = game.ticks() - game.LEVEL_TRANSITION_MS - 1
+    game.update_level_transition()
+    assert game.state == STATE_PLAYING and len(game.players) == COOP_PLAYERS
+    game.enemy_bullets.clear()
+    return game
+
+
+def test_each_player_moves_with_its_own_keys(make_game, monkeypatch):
+    game = start_coop(make_game)
+    first, second = game.players
+    start = first.x, second.x
+    monkeypatch.setattr(pygame.key, "get_pressed", lambda: HeldKeys("left", "d"))
+    for _ in range(10):
+        game.update_playing()
+        game.sim_time_ms += game.fixed_step_ms
+    assert first.x == start[0] - 10 * first.speed
+    assert second.x == start[1] + 10 * second.speed
+
+
+def test_each_player_fires_with_its_own_key(make_game):
+    game = start_coop(make_game)
+    game.sim_time_ms += PLAYER_SHOT_COOLDOWN_MS + 1
+    pygame.event.clear()
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.key.key_code("w"), mod=0))
+    game.handle_events()
+    assert [(bullet.owner, bullet.x) for bullet in game.player_bullets] == [
+        (1, game.players[1].x + PLAYER_WIDTH // 2)]
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.key.key_code("space"), mod=0))
+    game.handle_events()
+    assert sorted(bullet.owner for bullet in game.player_bullets) == [0, 1]
@@ -0,0 +1,48 @@
+"""
+Picadas: las tablas recorren la trayectoria a paso constante y devuelven al
+enemigo exactamente a su lugar en la formación
+"""
+import math
+
+from config import *
+from game_random import rng
+from dive_paths import DIVE_TABLES, build_tables
+from enemy import EnemyGroup
+
+
+def test_every_table_ends_at_the_home_slot():
+    assert len(DIVE_TABLES) == 2 * len(DIVE_PATHS)
+    for xs, ys in DIVE_TABLES:
+        assert (xs[-1], ys[-1]) == (0, 0)
+
+
+def test_mirrored_tables_reflect_x():
+    for (xs, ys), (mirror_xs, mirror_ys) in zip(DIVE_TABLES[::2], DIVE_TABLES[1::2]):
+        assert mirror_xs == [-x for x in xs]
+        assert mirror_ys == ys
+
+
+def test_steps_follow_the_dive_speed():
+    for xs, ys in DIVE_TABLES:
+        steps = [math.hypot(x1 - x0, y1 - y0) for x0, y0, x1, y1 in zip(xs, ys, xs[1:], ys[1:])]
+        # Cada paso mide DIVE_SPEED a lo largo de la curva; la cuerda puede ser algo menor
+        assert all(step <= DIVE_SPEED + 1e-6 for step in steps)
+        assert all(step > DIVE_SPEED * 0.8 for step in steps[:-1])
+
+
+def test_build_tables_is_deterministic():
+    assert build_tables() == DIVE_TABLES
+
+
+def test_divers_return_to_the_marching_formation():
+    rng.seed(0)
+    config = dict(LEVEL_CONFIG[1], dive_chance=0.0)
+    group = EnemyGroup(level=1, config=config)
+    group.speed = 0.5
+    diver, neighbour = group.enemies[0], group.enemies[1]
+    offset = (neighbour.x - diver.x, neighbour.y - diver.y)
+    diver.start_dive(0)
+    for _ in range(len(DIVE_TABLES[0][0])):
+        group.update()
+    assert diver.dive == -1
+    assert (neighbour.x - diver.x, neighbour.y - diver.y) == offset
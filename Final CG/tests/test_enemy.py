@@ -0,0 +1,89 @@
+"""
+Formación: compactación en una pasada y colisiones al píxel
+"""
+
+import pygame
+import pytest
+from config import *
+from game_random import rng
+from enemy import Boss, Enemy, EnemyGroup
+
+
+def drawn_mask(sprite):
+    """Máscara de lo que sprite dibuja, calculada sin la tabla de colisión"""
+    surface = pygame.Surface((sprite.width, sprite.height), pygame.SRCALPHA)
+    sprite.template().draw(surface)
+    return pygame.mask.from_surface(surface)
+
+
+def test_compact_keeps_the_survivors_in_order():
+    rng.seed(0)
+    group = EnemyGroup(level=2)
+    enemies = list(group.enemies)
+    killed = enemies[::3] + enemies[1:2]
+    for enemy in killed:
+        group.remove_enemy(enemy)
+    assert group.remove_enemy(killed[0]) == 0  # ya estaba destruido
+    assert len(group.enemies) == len(enemies)  # remove_enemy solo marca
+    group.compact()
+    assert group.enemies == [enemy for enemy in enemies if enemy not in killed]
+    assert not group.needs_compact
+    assert group.bounds == group.enemies[0].rect.unionall([e.rect for e in group.enemies])
+
+
+def test_find_hit_skips_destroyed_enemies():
+    rng.seed(0)
+    group = EnemyGroup(level=1)
+    target = group.enemies[0]
+    rect = pygame.Rect(target.rect.centerx, target.rect.centery, BULLET_WIDTH, BULLET_HEIGHT)
+    assert group.find_hit(rect) is target
+    group.remove_enemy(target)
+    assert group.find_hit(rect) is None
+
+
+@pytest.mark.parametrize("sprite", [Enemy(100, 100, "common"), Enemy(100, 100, "advanced"),
+                                    Boss(100, 100)], ids=["common", "advanced", "boss"])
+@pytest.mark.parametrize("phase", [0, 1])
+def test_pixel_hits_match_the_drawn_sprite(sprite, phase):
+    sprite.animation_frame = phase * (15 if isinstance(sprite, Boss) else 10)
+    mask = drawn_mask(sprite)
+    bullet = pygame.Mask((BULLET_WIDTH, BULLET_HEIGHT), fill=True)
+    for y in range(sprite.rect.top - BULLET_HEIGHT + 1, sprite.rect.bottom, 2):
+        for x in range(sprite.rect.left - BULLET_WIDTH + 1, sprite.rect.right):
+            rect = pygame.Rect(x, y, BULLET_WIDTH, BULLET_HEIGHT)
+            expected = mask.overlap(bullet, (x - sprite.rect.x, y - sprite.rect.y)) is not None
+            assert sprite.touches(rect) == expected, (x, y)
+
+
+def test_animation_advances_in_update_not_in_draw():
+    rng.seed(0)
+    group = EnemyGroup(level=1)
+    group.dive_chance = 0
+    enemy = group.enemies[0]
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    for _ in range(10):
+        group.update()
+        frame = enemy.animation_frame
+        # Lo que se chequea en este frame es lo que se dibuja después
+        group.draw(screen)
+        assert enemy.animation_frame == frame
+    assert enemy.animation_frame == 10
+
+
+def test_find_hit_by_columns_matches_a_full_scan():
+    rng.seed(3)
+    group = EnemyGroup(level=3)
+    group.max_divers = 4
+    group.dive_chance = 1.0
+    for tick in range(200):
+        group.update()
+        if tick % 40 == 0:
+            group.remove_enemy(rng.choice(group.enemies))
+        for _ in range(20):
+            x = rng.randrange(-10, SCREEN_WIDTH + 10)
+            y = rng.randrange(0, SCREEN_HEIGHT)
+            rect = pygame.Rect(x, y, BULLET_WIDTH, BULLET_HEIGHT)
+            expected = next((e for e in group.enemies
+                             if e.alive and e.rect.colliderect(rect) and e.touches(rect)), None)
+            assert group.find_hit(rect) is expected
+        group.compact()
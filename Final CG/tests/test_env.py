@@ -0,0 +1,85 @@
+"""
+Entornos: episodios reproducibles, cierre independiente y errores de los procesos hijos
+"""
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+from env import SpaceInvadersEnv
+from observation import O_PLAYER, symbolic_observation
+from vector_env import VectorEnv, WorkerError
+
+
+def rollouts(envs, steps=300, seed=0):
+    """Episodios de varios entornos con step() intercalados, uno por entorno por turno"""
+    rng = np.random.default_rng(seed)
+    traces = [[env.reset()[0].copy()] for env in envs]
+    running = list(range(len(envs)))
+    for action in rng.integers(0, SpaceInvadersEnv.num_actions, steps):
+        for index in list(running):
+            obs, reward, terminated, truncated, info = envs[index].step(action)
+            traces[index].append((obs.copy(), reward, terminated, info["score"]))
+            if terminated or truncated:
+                running.remove(index)
+        if not running:
+            break
+    return traces
+
+
+def same(a, b):
+    if isinstance(a, np.ndarray):
+        return np.array_equal(a, b)
+    return all(np.array_equal(x, y) for x, y in zip(a, b))
+
+
+def test_same_seed_and_actions_give_the_same_episode():
+    alone = SpaceInvadersEnv(seed=3)
+    first, second, other = SpaceInvadersEnv(seed=3), SpaceInvadersEnv(seed=3), SpaceInvadersEnv(seed=8)
+    try:
+        # Intercalados: cada entorno usa su propio estado de rng, así que
+        # avanzar a los otros entre dos pasos no cambia el episodio
+        [expected] = rollouts([alone])
+        a, _, b = rollouts([first, other, second])
+        assert len(a) == len(b) == len(expected)
+        assert all(same(x, y) and same(x, z) for x, y, z in zip(a, b, expected))
+    finally:
+        for env in (alone, first, second, other):
+            env.close()
+
+
+def test_terminal_step_observes_the_game_over_state():
+    env = SpaceInvadersEnv(seed=0)
+    try:
+        obs, info = env.reset()
+        assert obs[O_PLAYER + 1] == 1.0
+        env.game.players[0].lives = 0
+        obs, reward, terminated, truncated, info = env.step(0)
+        assert terminated
+        assert obs[O_PLAYER + 1] == 0.0
+        assert np.array_equal(obs, symbolic_observation(env.game))
+    finally:
+        env.close()
+
+
+def test_closing_an_env_leaves_its_sibling_running():
+    # El hermano dibuja su observación: necesita pygame (fuentes y superficies)
+    closed = SpaceInvadersEnv(seed=0)
+    sibling = SpaceInvadersEnv(seed=1, obs_type="pixels")
+    closed.reset()
+    sibling.reset()
+    closed.close()
+    obs, reward, terminated, truncated, info = sibling.step(3)
+    assert obs.shape == sibling.observation_shape
+    sibling.close()
+
+
+def test_worker_failure_reports_its_traceback_and_frees_memory():
+    vector = VectorEnv(2, num_workers=1, unknown_option=True)
+    name = vector.buffer.name
+    try:
+        with pytest.raises(WorkerError, match="unknown_option"):
+            vector.reset()
+    finally:
+        vector.close()
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=name)
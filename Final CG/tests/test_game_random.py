@@ -0,0 +1,45 @@
+"""
+Generador del juego: la cuenta de palabras alcanza para reconstruir el estado
+"""
+import random
+
+from game_random import CountingRandom
+
+
+def draw(generator):
+    """Un poco de todo lo que usa el juego"""
+    generator.random()
+    generator.choice("abcdefg")
+    generator.randrange(-10, 800)
+    generator.uniform(0.5, 2.0)
+    generator.randint(0, 1 << 40)
+    generator.shuffle(list(range(9)))
+
+
+def test_skip_from_a_copy_reaches_the_same_state():
+    generator = CountingRandom(7)
+    draw(generator)
+    keyframe = generator.getstate()
+    for _ in range(50):
+        draw(generator)
+    copy = CountingRandom()
+    copy.setstate(keyframe)
+    copy.skip(generator.words - copy.words)
+    assert copy.getstate() == generator.getstate()
+    assert copy.random() == generator.random()
+
+
+def test_numbers_match_random_random():
+    generator, plain = CountingRandom(3), random.Random(3)
+    assert [generator.randrange(100) for _ in range(20)] == [plain.randrange(100) for _ in range(20)]
+    assert generator.uniform(0, 1) == plain.uniform(0, 1)
+
+
+def test_seed_and_setstate_change_the_generation():
+    generator = CountingRandom(1)
+    generation = generator.generation
+    generator.random()
+    generator.seed(2)
+    assert generator.words == 0 and generator.generation == generation + 1
+    generator.setstate(CountingRandom(5).getstate())
+    assert generator.generation == generation + 2
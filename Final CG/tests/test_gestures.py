@@ -0,0 +1,107 @@
+"""
+Motor de gestos con landmarks sintéticos: rasgos e histéresis, sin MediaPipe
+"""
+import math
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from config import *
+from gestures import (FINGER_MCPS, FINGER_TIPS, INDEX_TIP, MIDDLE_MCP, NUM_LANDMARKS, THUMB_TIP, WRIST,
+                      GestureEngine)
+
+PALM = 0.2  # distancia muñeca -> nudillos de la mano sintética
+ANGLES = (-0.3, -0.1, 0.1, 0.3)  # dirección de cada dedo respecto a la vertical
+
+
+def hand(extension, pinch=1.0):
+    """Landmarks (21, 3) de una mano con todos los dedos a la extensión dada
+
+    Args:
+        extension: distancia punta-muñeca / nudillo-muñeca (o una por dedo)
+        pinch: distancia pulgar-índice en unidades de palma
+    """
+    extensions = np.broadcast_to(np.asarray(extension, dtype=np.float32), (4,))
+    points = np.zeros((NUM_LANDMARKS, 3), dtype=np.float32)
+    points[WRIST, :2] = (0.5, 0.8)
+    for mcp, tip, angle, ext in zip(FINGER_MCPS, FINGER_TIPS, ANGLES, extensions):
+        direction = np.array([math.sin(angle), -math.cos(angle)], dtype=np.float32)
+        points[mcp, :2] = points[WRIST, :2] + direction * PALM
+        points[tip, :2] = points[WRIST, :2] + direction * PALM * ext
+    # El nudillo del medio define la escala: se alinea con la vertical
+    points[MIDDLE_MCP, :2] = (0.5, 0.8 - PALM)
+    points[THUMB_TIP, :2] = points[INDEX_TIP, :2] + (pinch * PALM, 0.0)
+    return points
+
+
+def feed(engine, points):
+    engine.landmarks[:] = points
+    engine.update()
+
+
+def test_features_from_synthetic_hand():
+    engine = GestureEngine()
+    feed(engine, hand([1.2, 1.5, 1.8, 2.0], pinch=0.5))
+    assert engine.palm_scale == pytest.approx(PALM, rel=1e-5)
+    assert engine.extension == pytest.approx([1.2, 1.5, 1.8, 2.0], rel=1e-4)
+    assert engine.pinch_distance == pytest.approx(0.5, rel=1e-4)
+
+
+def test_load_copies_mediapipe_landmarks():
+    points = hand(1.7, pinch=0.2)
+    result = SimpleNamespace(landmark=[SimpleNamespace(x=x, y=y, z=z) for x, y, z in points])
+    engine = GestureEngine()
+    engine.update(result)
+    assert np.array_equal(engine.landmarks, points)
+    assert engine.is_pinching and engine.is_open_palm and not engine.is_fist
+
+
+@pytest.mark.parametrize("attribute, make, enter, exit", [
+    ("is_fist", lambda v: hand(v), GESTURE_FIST_ENTER, GESTURE_FIST_EXIT),
+    ("is_pinching", lambda v: hand(1.3, pinch=v), GESTURE_PINCH_ENTER, GESTURE_PINCH_EXIT),
+    ("is_open_palm", lambda v: hand(v), GESTURE_OPEN_ENTER, GESTURE_OPEN_EXIT),
+])
+def test_enter_and_exit_thresholds(attribute, make, enter, exit):
+    engine = GestureEngine()
+    # De afuera, pasando por la banda entre umbrales, hasta adentro y de vuelta
+    inside = -1 if exit > enter else 1  # hacia dónde queda "adentro" del gesto
+    between = (enter + exit) / 2
+    feed(engine, make(exit - inside * 0.05))
+    assert not getattr(engine, attribute)
+    feed(engine, make(between))
+    assert not getattr(engine, attribute)  # la banda no alcanza para entrar
+    feed(engine, make(enter + inside * 0.05))
+    assert getattr(engine, attribute)
+    feed(engine, make(between))
+    assert getattr(engine, attribute)  # ni para salir
+    feed(engine, make(exit - inside * 0.05))
+    assert not getattr(engine, attribute)
+
+
+@pytest.mark.parametrize("attribute, make, enter, exit", [
+    ("is_fist", lambda v: hand(v), GESTURE_FIST_ENTER, GESTURE_FIST_EXIT),
+    ("is_pinching", lambda v: hand(1.3, pinch=v), GESTURE_PINCH_ENTER, GESTURE_PINCH_EXIT),
+    ("is_open_palm", lambda v: hand(v), GESTURE_OPEN_ENTER, GESTURE_OPEN_EXIT),
+])
+def test_noise_at_the_threshold_does_not_flicker(attribute, make, enter, exit):
+    rng = np.random.default_rng(0)
+    band = abs(exit - enter)
+    inside = -1 if exit > enter else 1
+    for center, start in ((enter, exit - inside * 0.05), (exit, enter + inside * 0.05)):
+        # Cerca del umbral de entrada se arranca afuera y cerca del de salida, adentro
+        engine = GestureEngine()
+        feed(engine, make(start))
+        states = [getattr(engine, attribute)]
+        for noise in rng.uniform(-0.4 * band, 0.4 * band, 200):
+            feed(engine, make(center + noise))
+            states.append(getattr(engine, attribute))
+        changes = sum(a != b for a, b in zip(states, states[1:]))
+        assert changes <= 1, (center, changes)
+
+
+def test_reset_forgets_the_gesture():
+    engine = GestureEngine()
+    feed(engine, hand(1.0, pinch=0.1))
+    assert engine.is_fist and engine.is_pinching
+    engine.reset()
+    assert not (engine.is_fist or engine.is_pinching or engine.is_open_palm)
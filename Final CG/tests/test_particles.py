@@ -0,0 +1,54 @@
+"""
+Partículas: el tope global se respeta y la compactación conserva las vivas
+"""
+import pygame
+from config import *
+from particles import ParticleSystem
+
+
+def test_emit_stops_at_the_cap_and_counts_the_rest():
+    particles = ParticleSystem(capacity=100, seed=0)
+    assert particles.emit(400, 300, 80, RED) == 80
+    assert particles.emit(400, 300, 80, RED) == 20
+    assert particles.count == 100 and particles.dropped == 60
+
+
+def test_update_keeps_only_live_particles_in_front():
+    particles = ParticleSystem(capacity=100, seed=0)
+    particles.emit(400, 300, 50, RED)
+    particles.emit(400, 300, 50, CYAN)
+    particles.life[:100:2] = 1  # la mitad expira en este frame
+    colors = particles.color[1:100:2].copy()
+    particles.update()
+    assert particles.count == 50
+    assert (particles.color[:50] == colors).all()
+    assert (particles.life[:50] > 0).all()
+
+
+def test_draw_handles_a_full_buffer():
+    particles = ParticleSystem(seed=0)
+    while particles.emit(400, 300, PARTICLE_BOSS_DEATH_BURST, YELLOW):
+        pass
+    assert particles.count == PARTICLE_MAX
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    particles.draw(screen)
+    assert screen.get_at((400, 300)) != (0, 0, 0, 255)
+
+
+def test_pixel_buffer_matches_the_sprites():
+    particles = ParticleSystem(capacity=400, seed=0)
+    for color in (RED, CYAN, YELLOW, ORANGE):
+        particles.emit(0, 0, 100, color)
+    # En una grilla sin solapamientos, con todas las vidas y varias en el borde
+    n = particles.count
+    particles.pos[:n, 0] = [-2 + (i % 40) * 7 for i in range(n)]
+    particles.pos[:n, 1] = [-1 + (i // 40) * 9 for i in range(n)]
+    particles.pos[:40:3, 1] = SCREEN_HEIGHT - 1
+    particles.life[:n] = [1 + i % PARTICLE_LIFETIME for i in range(n)]
+    pixels = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), depth=32)
+    sprites = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), depth=24)
+    for screen in (pixels, sprites):
+        screen.fill(DARK_BLUE)
+        particles.draw(screen)
+    assert not pixels.get_locked()
+    assert pygame.image.tobytes(pixels, "RGB") == pygame.image.tobytes(sprites, "RGB")
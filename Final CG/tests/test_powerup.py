@@ -0,0 +1,30 @@
+"""
+Power-ups: caída y recogida compactan la lista en el sitio sin cambiar el orden
+"""
+from config import *
+from powerup import PowerUp, PowerUpManager
+
+
+def test_update_drops_the_fallen_and_keeps_order():
+    manager = PowerUpManager()
+    powerups = [PowerUp(100 * i, SCREEN_HEIGHT - 1 if i % 2 else 100, POWERUP_SHIELD)
+                for i in range(6)]
+    manager.powerups.extend(powerups)
+    original = manager.powerups
+    manager.update(0)
+    assert manager.powerups is original  # compactada en el sitio
+    assert manager.powerups == powerups[::2]
+
+
+def test_check_collision_reports_player_index_and_keeps_the_rest():
+    manager = PowerUpManager()
+    types = (POWERUP_DOUBLE_SHOT, POWERUP_EXTRA_LIFE, POWERUP_SHIELD, POWERUP_SHIELD)
+    powerups = [PowerUp(100 + 150 * i, 300, kind) for i, kind in enumerate(types)]
+    manager.powerups.extend(powerups)
+    # Jugador 0 sobre el primero, jugador 1 sobre el tercero
+    rects = [powerups[0].rect.copy(), powerups[2].rect.copy()]
+    collected = manager.check_collision(rects, 1000)
+    assert collected == [(0, POWERUP_DOUBLE_SHOT), (1, POWERUP_SHIELD)]
+    assert manager.powerups == [powerups[1], powerups[3]]
+    assert manager.get_remaining_time(POWERUP_SHIELD, 1000) == POWERUP_DURATION // 1000
+    assert not manager.is_active(POWERUP_EXTRA_LIFE)
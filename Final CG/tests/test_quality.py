@@ -0,0 +1,103 @@
+"""
+Calidad automática: baja ante frames lentos, sube solo con margen sostenido
+y no oscila entre dos niveles
+"""
+from config import *
+from quality import FEATURES, QualityGovernor
+
+BUDGET = 1000 / FPS
+SLOW = BUDGET * 1.2  # sobre QUALITY_DOWN_RATIO
+FAST = BUDGET * 0.4  # bajo QUALITY_UP_RATIO
+STEADY = BUDGET * (QUALITY_DOWN_RATIO + QUALITY_UP_RATIO) / 2  # entre los dos umbrales
+# Lo que tarda en llenarse la ventana con frames lentos (la primera decisión)
+SLOW_WINDOW_MS = (QUALITY_WINDOW + 1) * SLOW
+# Con frames rápidos el reloj avanza al ritmo de los FPS
+FAST_WINDOW_MS = (QUALITY_WINDOW + 1) * BUDGET
+
+
+def feed(governor, frame_ms, duration_ms, now):
+    """Pasa frames de frame_ms durante duration_ms; devuelve el instante final y los cambios"""
+    changes = 0
+    end = now + duration_ms
+    while now < end:
+        changes += governor.update(frame_ms, now)
+        now += max(frame_ms, BUDGET)
+    return now, changes
+
+
+def governor_with_all_features():
+    governor = QualityGovernor()
+    governor.set_features(FEATURES)
+    return governor
+
+
+def test_waits_for_a_full_window_before_lowering():
+    governor = governor_with_all_features()
+    for frame in range(QUALITY_WINDOW):
+        assert not governor.update(SLOW, frame * SLOW)
+    assert governor.update(SLOW, QUALITY_WINDOW * SLOW)
+    assert governor.tier == 1
+
+
+def test_dead_band_between_thresholds_keeps_the_tier():
+    governor = governor_with_all_features()
+    now, _ = feed(governor, SLOW, SLOW_WINDOW_MS, 0)
+    tier = governor.tier
+    assert tier == 1
+    now, changes = feed(governor, STEADY, 60000, now)
+    assert changes == 0 and governor.tier == tier
+
+
+def test_raises_only_after_sustained_headroom():
+    governor = governor_with_all_features()
+    now, _ = feed(governor, SLOW, SLOW_WINDOW_MS, 0)
+    assert governor.tier == 1
+    now, changes = feed(governor, FAST, FAST_WINDOW_MS + QUALITY_UP_HOLD_MS - 200, now)
+    assert changes == 0
+    now, changes = feed(governor, FAST, 400, now)
+    assert changes == 1 and governor.tier == 0
+
+
+def test_failed_raise_doubles_the_wait():
+    governor = governor_with_all_features()
+    now, _ = feed(governor, SLOW, SLOW_WINDOW_MS, 0)
+    now, _ = feed(governor, FAST, FAST_WINDOW_MS + QUALITY_UP_HOLD_MS + 200, now)
+    assert governor.tier == 0
+    # El nivel alto vuelve a ser lento enseguida: la próxima subida espera el doble
+    now, _ = feed(governor, SLOW, SLOW_WINDOW_MS, now)
+    assert governor.tier == 1
+    assert governor.up_hold_ms == 2 * QUALITY_UP_HOLD_MS
+    # Oscilar sin fin solo duplica la espera hasta el tope
+    for _ in range(10):
+        now, _ = feed(governor, FAST, FAST_WINDOW_MS + governor.up_hold_ms + 200, now)
+        now, _ = feed(governor, SLOW, SLOW_WINDOW_MS, now)
+    assert governor.up_hold_ms == QUALITY_UP_HOLD_MAX_MS
+
+
+def test_skips_tiers_that_change_nothing_and_saturates():
+    governor = QualityGovernor()  # sin cámara: solo estrellas y brillo
+    now, _ = feed(governor, SLOW, 4 * SLOW_WINDOW_MS, 0)
+    assert governor.tier == 2  # SIN VISTA PREVIA y VISIÓN 1/2 no cambian nada sin cámara
+    assert governor.saturated
+    now, _ = feed(governor, FAST, FAST_WINDOW_MS + QUALITY_UP_HOLD_MS + 200, now)
+    assert not governor.saturated
+    assert governor.tier == 1
+
+
+def test_heavy_stretch_steps_down_and_back_without_oscillating():
+    """Carga sintética: 20 s liviano, 20 s pesado y 20 s liviano otra vez"""
+    governor = governor_with_all_features()
+    savings = (0.0, 1.5, 1.0, 0.5, 4.0)  # ms que ahorra entrar a cada nivel
+    frames = 60 * FPS
+    now = 0.0
+    path = [0]
+    for frame in range(frames):
+        base = 9.0 if frame < frames / 3 or frame >= frames * 2 / 3 else 20.0
+        cost = base - sum(savings[1:governor.tier + 1]) + (frame % 7 - 3) * 0.5
+        if governor.update(cost, now):
+            path.append(governor.tier)
+        now += max(cost, BUDGET)
+    lowest = path.index(max(path))
+    assert path[:lowest + 1] == sorted(path[:lowest + 1])  # baja sin volver a subir
+    assert path[lowest:] == sorted(path[lowest:], reverse=True)  # y después solo sube
+    assert path[-1] == 0
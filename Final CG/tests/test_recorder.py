@@ -0,0 +1,76 @@
+"""
+Anillo de frames de la grabación: vuelta del anillo, últimos frames en orden
+y descarte cuando un lector va atrasado (sin OpenCV)
+"""
+import pygame
+from recorder import FrameRing
+
+WIDTH, HEIGHT = 4, 3
+
+
+def frame(seq):
+    """Superficie de 32 bits cuyo canal rojo guarda el número de frame"""
+    surface = pygame.Surface((WIDTH, HEIGHT), depth=32)
+    surface.fill((seq % 256, 7, 9))
+    return surface
+
+
+def red(ring, seq):
+    """Canal rojo del frame seq tal como quedó en el anillo (BGRA)"""
+    pixels = ring.frames[seq % ring.slots]
+    assert (pixels[..., 2] == pixels[0, 0, 2]).all()
+    assert (pixels[..., :2] == (9, 7)).all()
+    return int(pixels[0, 0, 2])
+
+
+class Reader:
+    """Lector mínimo: solo su secuencia, como la que avanza VideoEncoder"""
+
+    def __init__(self, read_seq):
+        self.read_seq = read_seq
+
+
+def test_ring_wraps_and_keeps_the_last_frames_in_order():
+    ring = FrameRing(5, WIDTH, HEIGHT)
+    assert ring.oldest_seq() == 0
+    for seq in range(13):
+        assert ring.push(frame(seq))
+    assert ring.write_seq == 13
+    # Quedan los últimos slots - 1: la ranura siguiente es la que push() pisa
+    assert ring.oldest_seq() == 9
+    assert [red(ring, seq) for seq in range(ring.oldest_seq(), ring.write_seq)] == [9, 10, 11, 12]
+
+
+def test_before_filling_every_frame_is_readable():
+    ring = FrameRing(8, WIDTH, HEIGHT)
+    for seq in range(3):
+        ring.push(frame(seq))
+    assert ring.oldest_seq() == 0
+    assert [red(ring, seq) for seq in range(ring.write_seq)] == [0, 1, 2]
+
+
+def test_push_drops_frames_instead_of_overwriting_an_unread_one():
+    ring = FrameRing(4, WIDTH, HEIGHT)
+    reader = Reader(0)
+    ring.attach(reader)
+    pushed = [ring.push(frame(seq)) for seq in range(6)]
+    # El anillo entero está sin leer: los frames 4 y 5 se descartan
+    assert pushed == [True, True, True, True, False, False]
+    assert ring.write_seq == 4
+    assert [red(ring, seq) for seq in range(4)] == [0, 1, 2, 3]
+
+    reader.read_seq = 2  # el lector consumió dos frames: hay lugar para dos más
+    assert ring.push(frame(100)) and ring.push(frame(101))
+    assert not ring.push(frame(102))
+    assert [red(ring, seq) for seq in range(2, 6)] == [2, 3, 100, 101]
+
+    ring.detach(reader)
+    assert ring.push(frame(103))
+    assert ring.readers == []
+
+
+def test_push_releases_the_surface():
+    ring = FrameRing(2, WIDTH, HEIGHT)
+    surface = frame(1)
+    ring.push(surface)
+    assert not surface.get_locked()
@@ -0,0 +1,115 @@
+"""
+Rebobinado: restaurar un tick y volver a jugar reproduce la partida original
+"""
+import pygame
+from config import *
+from game_random import rng
+from rewind import RewindBuffer
+
+
+def fingerprint(game):
+    boss = game.enemies.boss
+    return (game.score, len(game.enemies.enemies), boss.health if boss else None,
+            tuple((round(b.x, 3), round(b.y, 3)) for b in game.enemy_bullets),
+            tuple((p.x, p.lives) for p in game.players))
+
+
+def play(game, rewind, ticks=None):
+    """Juega y devuelve la huella de cada tick guardado
+
+    Con ticks, sigue (pasando por las transiciones entre oleadas) hasta guardar
+    esa cantidad y estar jugando; sin ticks, hasta que se sale de STATE_PLAYING.
+    """
+    prints = []
+    while True:
+        if ticks is None and game.state != STATE_PLAYING:
+            return prints
+        if ticks is not None and len(prints) >= ticks and game.state == STATE_PLAYING:
+            return prints
+        records = rewind.records
+        game.step()
+        if rewind.records > records:
+            prints.append(fingerprint(game))
+
+
+def start_boss_fight(game, health):
+    """Avanza la campaña hasta el jefe y le deja poca vida"""
+    game.start_run()
+    while game.current_level < max(LEVEL_CONFIG):
+        game.next_wave()
+    while game.state != STATE_PLAYING:
+        game.step()
+    game.enemies.boss.health = health
+
+
+def test_scrub_and_resume_replays_identically(make_game):
+    game = make_game(seed=0)
+    game.rewind = rewind = RewindBuffer()
+    game.start_run()
+    while game.state != STATE_PLAYING:
+        game.step()
+    original = play(game, rewind, rewind.ticks * 2)
+
+    back = rewind.ticks // 2
+    rewind.handle_key(game, pygame.K_F6, 0)
+    rewind.step(game, -back)
+    rewind.handle_key(game, pygame.K_F6, 0)
+    replay = [fingerprint(game)]
+    while len(replay) <= back:
+        records = rewind.records
+        game.step()
+        if rewind.records > records:
+            replay.append(fingerprint(game))
+    assert replay == original[-back - 1:]
+
+
+def test_rewind_across_boss_defeat_brings_the_boss_back(make_game):
+    game = make_game(seed=3)
+    game.rewind = rewind = RewindBuffer()
+    start_boss_fight(game, health=4)
+    original = play(game, rewind)
+    assert game.enemies.boss is None, "el piloto automático no derrotó al jefe"
+    final = (game.score, game.state)
+
+    back = min(rewind.count - 1, 120)
+    rewind.restore(game, back)
+    assert game.enemies.boss is not None
+    assert fingerprint(game) == original[-back - 1]
+    # La pelea vuelve a terminar igual, en el mismo tick
+    replay = play(game, rewind)
+    assert replay == original[-back:]
+    assert (game.score, game.state) == final
+
+
+def test_restore_right_after_boss_defeat(make_game):
+    game = make_game(seed=3)
+    game.rewind = rewind = RewindBuffer()
+    start_boss_fight(game, health=4)
+    play(game, rewind)
+    rewind.restore(game, 5)
+    row = rewind._row(5)
+    assert game.enemies.boss is not None
+    assert game.enemies.boss.health == rewind.boss.columns["health"][row]
+    assert game.state == STATE_PLAYING
+
+
+def test_random_state_is_restored_between_keyframes(make_game):
+    game = make_game(seed=1)
+    game.rewind = rewind = RewindBuffer()
+    game.start_run()
+    while game.state != STATE_PLAYING:
+        game.step()
+    states = []
+    while len(states) < rewind.ticks:
+        records = rewind.records
+        game.step()
+        if rewind.records > records:
+            states.append(rng.getstate())
+    assert rewind.count == rewind.ticks
+    # Una copia completa cada REWIND_RANDOM_KEYFRAME_TICKS ticks, no una por tick
+    keyframes = len(set(rewind.random_key.tolist()))
+    assert keyframes <= rewind.ticks // REWIND_RANDOM_KEYFRAME_TICKS + 2
+    for back in (0, 1, REWIND_RANDOM_KEYFRAME_TICKS // 2, REWIND_RANDOM_KEYFRAME_TICKS + 7,
+                 rewind.ticks - 1):
+        rewind.restore(game, back)
+        assert rng.getstate() == states[-back - 1], back
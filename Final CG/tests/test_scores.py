@@ -0,0 +1,117 @@
+"""
+Puntajes: récords locales aunque la URL sea inválida y sincronización contra
+el leaderboard de prueba (lotes, reintentos y marcado único)
+"""
+import threading
+import time
+import uuid
+
+import pytest
+import scores
+from config import *
+from scores import ScoreKeeper, ScoreStore, make_server
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "tiempo agotado"
+        time.sleep(0.005)
+
+
+def entry(score, played_at):
+    return {"id": uuid.uuid4().hex, "score": score, "wave": 1, "players": 1,
+            "mode": "campaña", "outcome": 0, "played_at": played_at}
+
+
+@pytest.fixture
+def server(monkeypatch):
+    """Leaderboard de prueba en un puerto libre, con reintentos rápidos"""
+    monkeypatch.setattr(scores, "LEADERBOARD_RETRY_BASE_S", 0.02)
+    server = make_server(0)
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    server.url = f"http://127.0.0.1:{server.server_address[1]}/scores"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def db(tmp_path):
+    return str(tmp_path / "puntajes.db")
+
+
+def unsynced(db):
+    store = ScoreStore(db)
+    try:
+        return store.unsynced(limit=-1)
+    finally:
+        store.close()
+
+
+def test_invalid_url_still_saves_locally(db, capsys):
+    keeper = ScoreKeeper(db, "ftp://ejemplo/puntajes")
+    keeper.submit(1234, 3, 1, False, 0)
+    keeper.close()
+    assert not keeper.is_alive()
+    assert keeper.client is None and keeper.url is None
+    assert "no soportada" in keeper.last_error
+    assert keeper.best() == 1234
+    assert "solo localmente" in capsys.readouterr().out
+    store = ScoreStore(db)
+    assert [e["score"] for e in store.top()] == [1234]
+    store.close()
+
+
+def test_pending_scores_are_uploaded_in_batches(db, server):
+    store = ScoreStore(db)
+    pending = [entry(score, played_at=score) for score in range(120)]
+    for e in pending:
+        store.add(e)
+    store.close()
+
+    keeper = ScoreKeeper(db, server.url)
+    wait_for(lambda: keeper.synced == len(pending))
+    keeper.close()
+    assert server.batches == [LEADERBOARD_BATCH_SIZE, LEADERBOARD_BATCH_SIZE, 20]
+    assert set(server.scores) == {e["id"] for e in pending}
+    assert unsynced(db) == []
+
+
+def test_upload_is_retried_after_503(db, server):
+    server.fail_rate = 1.0
+    keeper = ScoreKeeper(db, server.url)
+    keeper.submit(500, 2, 1, False, 0)
+    wait_for(lambda: keeper.sync_errors >= 2)
+    assert keeper.last_error == "HTTP 503" and keeper.synced == 0
+    assert len(unsynced(db)) == 1
+    server.fail_rate = 0.0
+    wait_for(lambda: keeper.synced == 1)
+    keeper.close()
+    assert [e["score"] for e in server.scores.values()] == [500]
+    assert unsynced(db) == []
+
+
+def test_lost_response_is_retried_and_marked_synced_once(db, server):
+    server.drop_rate = 1.0
+    keeper = ScoreKeeper(db, server.url)
+    keeper.submit(700, 4, 2, True, 0)
+    wait_for(lambda: keeper.sync_errors >= 1)
+    # El servidor ya lo guardó, pero el cliente no lo sabe: sigue pendiente
+    assert len(server.scores) == 1 and len(unsynced(db)) == 1
+    server.drop_rate = 0.0
+    wait_for(lambda: keeper.synced == 1)
+    keeper.close()
+    assert len(server.batches) >= 2  # reenviado...
+    assert len(server.scores) == 1  # ...pero el servidor lo cuenta una vez
+    assert unsynced(db) == []
+
+    # Una sesión nueva no vuelve a enviar lo ya marcado
+    uploads = len(server.batches)
+    keeper = ScoreKeeper(db, server.url)
+    keeper.submit(800, 5, 1, False, 0)
+    wait_for(lambda: keeper.synced == 1)
+    keeper.close()
+    assert server.batches[uploads:] == [1]
+    assert sorted(e["score"] for e in server.scores.values()) == [700, 800]
@@ -0,0 +1,35 @@
+"""
+Prueba de resistencia: el muestreo respeta el final y sin muestras suficientes
+el resultado es inconcluso, no un éxito
+"""
+import soak
+from soak import SoakRunner
+
+
+def test_sampling_stops_at_the_deadline(make_game):
+    runner = SoakRunner(make_game(seed=0), interval_s=0.05, trace=False)
+    runner.run(0.3)
+    times = [sample["t_s"] for sample in runner.samples]
+    assert times == sorted(times)
+    assert 3 <= len(times) <= 8
+    # Solo la muestra final puede pasarse del final, y por un frame como mucho
+    assert all(t <= 0.3 for t in times[:-1])
+    assert times[-1] < 0.3 + 0.2
+
+
+def test_too_few_samples_is_inconclusive(make_game):
+    runner = SoakRunner(make_game(seed=0), interval_s=0.05, trace=False)
+    runner.run(0.2)
+    failures, trends = runner.evaluate()  # todo cae en el calentamiento por defecto
+    assert trends is None
+    assert failures and "insuficientes" in failures[0]
+
+
+def test_enough_samples_are_evaluated(make_game, monkeypatch):
+    monkeypatch.setattr(soak, "SOAK_WARMUP_S", 0)
+    monkeypatch.setattr(soak, "SOAK_MIN_TREND_SAMPLES", 3)
+    runner = SoakRunner(make_game(seed=0), interval_s=0.05, trace=False)
+    runner.run(0.3)
+    failures, trends = runner.evaluate()
+    assert trends is not None
+    assert set(trends) == {"rss_mb_per_hour", "traced_mb_per_hour", "frame_p95_slowdown_per_hour"}
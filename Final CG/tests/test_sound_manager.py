@@ -0,0 +1,54 @@
+"""
+Voces del mixer: agrupación por tick y robo por prioridad, con canales falsos
+"""
+from sound_manager import SoundManager
+
+
+class FakeChannel:
+    """Canal que solo recuerda si está sonando"""
+
+    def __init__(self):
+        self.busy = False
+
+    def get_busy(self):
+        return self.busy
+
+    def play(self, sound, loops=0):
+        self.busy = True
+
+
+def make_manager(num_channels):
+    manager = SoundManager()
+    manager.channels = [FakeChannel() for _ in range(num_channels)]
+    manager.owners = [None] * num_channels
+    manager.register("shoot", object(), max_voices=2, priority=0)
+    manager.register("explosion", object(), max_voices=2, priority=5)
+    return manager
+
+
+def test_same_sound_is_grouped_within_a_tick():
+    manager = make_manager(4)
+    manager.begin_tick()
+    assert manager.play("shoot")
+    assert not manager.play("shoot")
+    manager.begin_tick()
+    assert manager.play("shoot")
+
+
+def test_a_sound_that_did_not_start_can_retry_in_the_same_tick():
+    manager = make_manager(1)
+    manager.begin_tick()
+    assert manager.play("explosion")
+    manager.begin_tick()
+    # El único canal lo ocupa un sonido de más prioridad: no hay voz para el disparo
+    assert not manager.play("shoot")
+    manager.channels[0].busy = False
+    assert manager.play("shoot")
+
+
+def test_without_channels_nothing_is_marked():
+    manager = SoundManager()
+    manager.channels = []
+    manager.register("shoot", object())
+    assert not manager.play("shoot")
+    assert "shoot" not in manager.played_this_tick
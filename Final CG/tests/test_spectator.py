@@ -0,0 +1,44 @@
+"""
+Espectadores: la instantánea completa y los deltas (al día o atrasados)
+reconstruyen exactamente el estado serializado
+"""
+from spectator import decode_packet, deserialize, encode_packet, entity_ids, serialize
+
+
+def snapshots(game, count, every=4):
+    """Instantáneas e identificadores de una partida con el piloto automático"""
+    game.start_run()
+    taken = []
+    frame = 0
+    while len(taken) < count:
+        game.step()
+        frame += 1
+        if frame % every == 0 and game.enemies is not None:
+            taken.append((serialize(game), entity_ids(game)))
+    return taken
+
+
+def test_full_snapshot_round_trip(make_game):
+    game = make_game(seed=0)
+    (snapshot, _), = snapshots(game, 1)
+    assert decode_packet(encode_packet(1, snapshot), {}) == (1, snapshot)
+    state = deserialize(snapshot)
+    assert state is not None
+
+
+def test_deltas_rebuild_every_snapshot(make_game):
+    game = make_game(seed=0)
+    taken = snapshots(game, 300)
+    for lag in (1, 3):
+        for seq in range(lag + 1, len(taken) + 1):
+            snapshot, ids = taken[seq - 1]
+            base_snapshot, base_ids = taken[seq - 1 - lag]
+            packet = encode_packet(seq, snapshot, seq - lag, base_snapshot, ids, base_ids)
+            assert decode_packet(packet, {seq - lag: base_snapshot}) == (seq, snapshot), (lag, seq)
+
+
+def test_delta_without_its_base_is_undecodable(make_game):
+    game = make_game(seed=0)
+    (first, first_ids), (second, second_ids) = snapshots(game, 2)
+    packet = encode_packet(2, second, 1, first, second_ids, first_ids)
+    assert decode_packet(packet, {}) is None
@@ -0,0 +1,16 @@
+"""
+Arranque: el perfilado (--profile-startup) no toca la base de puntajes
+"""
+from config import *
+from capabilities import NullScoreKeeper
+from game import Game
+
+
+def test_profile_startup_uses_no_score_database(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    game = Game(profile_startup=True)
+    try:
+        assert isinstance(game.scores, NullScoreKeeper)
+        assert not (tmp_path / SCORES_DB).exists()
+    finally:
+        game.close()
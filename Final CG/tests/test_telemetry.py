@@ -0,0 +1,152 @@
+"""
+Telemetría: registros de ida y vuelta, rotación de archivos gzip, descarte
+con la cola llena sin frenar al juego y errores del escritor
+"""
+import glob
+import gzip
+import os
+import threading
+import time
+
+import pytest
+import telemetry
+from telemetry import (EV_KILL, EV_SHOT, HEADER, MAGIC, RECORD, VERSION, Telemetry, TelemetryWriter,
+                       read_events)
+
+
+def events(n, kind=EV_SHOT):
+    return [(ms, kind, ms % 2, ms % 800, ms % 600, ms * 10) for ms in range(n)]
+
+
+def read_all(directory):
+    """Registros de todos los archivos, en el orden en que se escribieron"""
+    records = []
+    for path in sorted(glob.glob(os.path.join(directory, "telemetria_*.bin.gz"))):
+        records += read_events(path)[1]
+    return records
+
+
+def log_all(telemetry_, records):
+    for ms, kind, arg, x, y, value in records:
+        telemetry_.log(kind, ms, arg, x, y, value)
+
+
+@pytest.fixture
+def blocked_writer(monkeypatch):
+    """Escritor que se queda en _write hasta que se abra la compuerta"""
+    gate = threading.Event()
+    write = TelemetryWriter._write
+
+    def slow_write(self, pending):
+        gate.wait()
+        write(self, pending)
+
+    monkeypatch.setattr(TelemetryWriter, "_write", slow_write)
+    monkeypatch.setattr(telemetry, "TELEMETRY_WRITE_BYTES", 1)
+    return gate
+
+
+def test_records_round_trip(tmp_path):
+    sent = events(500) + events(3, EV_KILL)
+    sink = Telemetry(str(tmp_path))
+    log_all(sink, sent)
+    sink.close()
+    [path] = glob.glob(str(tmp_path / "*.bin.gz"))
+    started, received = read_events(path)
+    assert received == sent
+    assert abs(started - time.time()) < 60
+    assert sink.writer.records == len(sent) and sink.dropped == 0
+
+
+def test_output_is_gzip_with_header(tmp_path):
+    sink = Telemetry(str(tmp_path))
+    log_all(sink, events(10))
+    sink.close()
+    [path] = glob.glob(str(tmp_path / "*.bin.gz"))
+    with open(path, "rb") as f:
+        assert f.read(2) == b"\x1f\x8b"
+    with gzip.open(path, "rb") as f:
+        data = f.read()
+    assert HEADER.unpack_from(data)[:2] == (MAGIC, VERSION)
+    assert len(data) == HEADER.size + 10 * RECORD.size
+
+
+def test_files_rotate_by_size_and_old_ones_are_pruned(tmp_path, monkeypatch):
+    monkeypatch.setattr(telemetry, "TELEMETRY_WRITE_BYTES", 1)
+    monkeypatch.setattr(telemetry, "TELEMETRY_ROTATE_BYTES", 20 * RECORD.size)
+    monkeypatch.setattr(telemetry, "TELEMETRY_MAX_FILES", 5)
+    sink = Telemetry(str(tmp_path))
+    sent = events(400)
+    for start in range(0, len(sent), 10):
+        log_all(sink, sent[start:start + 10])
+        sink.flush()
+    sink.close()
+    # Cada escritura es un lote de 10 y el archivo rota al llegar a 20 registros
+    assert sink.writer.files_written == 20
+    paths = sorted(glob.glob(str(tmp_path / "*.bin.gz")))
+    assert len(paths) == 5
+    assert [len(read_events(path)[1]) for path in paths] == [20] * 5
+    assert read_all(str(tmp_path)) == sent[-100:]
+
+
+def test_full_queue_drops_and_counts_without_blocking(tmp_path, monkeypatch, blocked_writer):
+    monkeypatch.setattr(telemetry, "TELEMETRY_QUEUE_BATCHES", 2)
+    sink = Telemetry(str(tmp_path))
+    batches = [events(5), events(6), events(7), events(8)]
+    # El primer lote queda en el escritor, trabado en _write; los dos siguientes llenan la cola
+    log_all(sink, batches[0])
+    sink.flush()
+    deadline = time.monotonic() + 5
+    while not sink.batches.empty() and time.monotonic() < deadline:
+        time.sleep(0.001)
+    for batch in batches[1:3]:
+        log_all(sink, batch)
+        sink.flush()
+    start = time.perf_counter()
+    log_all(sink, batches[3])
+    sink.flush()
+    elapsed = time.perf_counter() - start
+    assert elapsed < 0.05  # el juego no espera al escritor
+    assert sink.dropped == len(batches[3])
+
+    blocked_writer.set()
+    sink.close()
+    assert read_all(str(tmp_path)) == batches[0] + batches[1] + batches[2]
+
+
+def test_a_bad_record_is_counted_and_writing_goes_on(tmp_path, capsys):
+    sink = Telemetry(str(tmp_path))
+    log_all(sink, events(5))
+    sink.log(EV_KILL, 10, 0, 70000, 0, 1)  # x no entra en un int16
+    log_all(sink, events(5))
+    sink.flush()
+    log_all(sink, events(7))  # un lote posterior también se escribe
+    sink.close()
+    assert sink.writer.errors == 1 and sink.writer.last_error.startswith("error(")
+    assert sink.writer.is_alive() is False
+    assert read_all(str(tmp_path)) == events(5) + events(5) + events(7)
+    assert "1 eventos perdidos" in capsys.readouterr().out
+
+
+def test_write_failure_is_counted_and_the_next_batch_is_written(tmp_path, monkeypatch):
+    monkeypatch.setattr(telemetry, "TELEMETRY_WRITE_BYTES", 1)
+    opens = []
+    real_open = TelemetryWriter._open
+
+    def flaky_open(self):
+        opens.append(1)
+        if len(opens) == 1:
+            raise OSError("disco lleno")
+        real_open(self)
+
+    monkeypatch.setattr(TelemetryWriter, "_open", flaky_open)
+    sink = Telemetry(str(tmp_path))
+    log_all(sink, events(4))
+    sink.flush()
+    deadline = time.monotonic() + 5
+    while sink.writer.errors == 0 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    log_all(sink, events(6))
+    sink.close()
+    assert sink.writer.errors == 4
+    assert read_all(str(tmp_path)) == events(6)
@@ -0,0 +1,55 @@
+"""
+Oleadas: el modo infinito respeta sus topes y miles de oleadas seguidas no
+hacen crecer la memoria
+"""
+import gc
+import itertools
+import tracemalloc
+
+from config import *
+from waves import SCALED_FIELDS, campaign_waves, endless_waves
+
+
+def test_campaign_ends_after_the_last_level():
+    assert list(campaign_waves()) == [LEVEL_CONFIG[level] for level in sorted(LEVEL_CONFIG)]
+
+
+def test_endless_waves_stay_within_limits():
+    for number, config in enumerate(itertools.islice(endless_waves(), 500), start=1):
+        if number % ENDLESS_BOSS_EVERY == 0:
+            assert config.get("boss_fight", False)
+            continue
+        for field in SCALED_FIELDS:
+            low, high = sorted((LEVEL_CONFIG[1][field], ENDLESS_LIMITS[field]))
+            assert low <= config[field] <= high, (number, field)
+
+
+def advance(game):
+    """Pasa a la oleada siguiente sin esperar la pantalla de transición"""
+    game.next_wave()
+    game.level_transition_start = game.ticks() - game.LEVEL_TRANSITION_MS - 1
+    game.update_level_transition()
+    assert game.state == STATE_PLAYING
+
+
+def test_thousands_of_endless_waves_use_constant_memory(make_game):
+    game = make_game(seed=0)
+    game.endless = True
+    game.start_run()
+    for _ in range(50):  # calentamiento: formaciones de tamaño máximo y cachés llenas
+        advance(game)
+
+    tracemalloc.start()
+    try:
+        gc.collect()
+        baseline = tracemalloc.get_traced_memory()[0]
+        objects = len(gc.get_objects())
+        for _ in range(3000):
+            advance(game)
+        gc.collect()
+        growth_kb = (tracemalloc.get_traced_memory()[0] - baseline) / 1024
+    finally:
+        tracemalloc.stop()
+    assert game.current_level == 1 + 50 + 3000
+    assert growth_kb < 64, f"la memoria creció {growth_kb:.1f} KB en 3000 oleadas"
+    assert len(gc.get_objects()) - objects < 500
@@ -0,0 +1,234 @@
+"""
+Varios entornos en paralelo, repartidos en procesos
+
+Cada proceso hijo simula un bloque contiguo de SpaceInvadersEnv y escribe
+observaciones, recompensas y fin de episodio directamente en memoria
+compartida; por el Pipe solo viajan órdenes y acuses de pocos bytes. Los
+episodios terminados se reinician solos y la observación devuelta es ya la
+del episodio nuevo (como los entornos vectorizados de Gym).
+
+Los pasos por segundo se miden con python benchmarks/bench_vector_env.py.
+"""
+import multiprocessing as mp
+import os
+import traceback
+from multiprocessing import shared_memory
+
+import numpy as np
+from config import *
+from env import SpaceInvadersEnv, observation_spec
+
+# Órdenes del Pipe
+CMD_RESET = 0
+CMD_STEP = 1
+CMD_CLOSE = 2
+# Respuesta de un proceso que falló: (ERROR, traceback)
+ERROR = -1
+
+
+class WorkerError(RuntimeError):
+    """Un proceso hijo falló; el mensaje trae su traceback"""
+
+
+def _obs_kwargs(env_kwargs):
+    """Argumentos de env_kwargs que definen la forma de la observación"""
+    return {key: env_kwargs[key] for key in ("obs_type", "frame_scale") if key in env_kwargs}
+
+
+class SharedEnvBuffer:
+    """Vistas NumPy de los arreglos compartidos por todos los entornos"""
+
+    def __init__(self, num_envs, obs_shape, obs_dtype, name=None):
+        self.num_envs = num_envs
+        layout = (
+            ("observations", (num_envs,) + tuple(obs_shape), obs_dtype),
+            ("actions", (num_envs,), np.int32),
+            ("rewards", (num_envs,), np.float32),
+            ("terminated", (num_envs,), np.uint8),
+            ("truncated", (num_envs,), np.uint8),
+            ("episode_scores", (num_envs,), np.int64),  # puntaje del último episodio terminado
+        )
+        sizes = [int(np.prod(shape)) * np.dtype(dtype).itemsize for _, shape, dtype in layout]
+        create = name is None
+        self.shm = shared_memory.SharedMemory(name=name, create=create, size=sum(sizes))
+
+        offset = 0
+        self._fields = []
+        for (field, shape, dtype), size in zip(layout, sizes):
+            setattr(self, field, np.ndarray(shape, dtype=dtype, buffer=self.shm.buf, offset=offset))
+            self._fields.append(field)
+            offset += size
+        if create:
+            for field in self._fields:
+                getattr(self, field)[:] = 0
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def close(self):
+        """Suelta las vistas y cierra el bloque"""
+        for field in self._fields:
+            setattr(self, field, None)
+        self.shm.close()
+
+
+def _worker_main(connection, shm_name, num_envs, start, stop, seed, env_kwargs):
+    """Punto de entrada de un proceso: simula los entornos start..stop-1
+
+    Si algo falla, el traceback viaja por el Pipe como respuesta a la orden
+    en curso y el proceso termina.
+    """
+    buffer = None
+    envs = []
+    try:
+        buffer = SharedEnvBuffer(num_envs, *observation_spec(**_obs_kwargs(env_kwargs)), shm_name)
+        for index in range(start, stop):
+            envs.append(SpaceInvadersEnv(seed=seed + index, **env_kwargs))
+        observations = buffer.observations
+        actions = buffer.actions
+        while True:
+            command = connection.recv()
+            if command == CMD_CLOSE:
+                break
+            if command == CMD_RESET:
+                for index, env in enumerate(envs, start):
+                    observations[index] = env.reset()[0]
+            elif command == CMD_STEP:
+                for index, env in enumerate(envs, start):
+                    obs, reward, terminated, truncated, info = env.step(actions[index])
+                    buffer.rewards[index] = reward
+                    buffer.terminated[index] = terminated
+                    buffer.truncated[index] = truncated
+                    if terminated or truncated:
+                        buffer.episode_scores[index] = info["score"]
+                        obs = env.reset()[0]
+                    observations[index] = obs
+            connection.send(command)
+    except Exception:
+        try:
+            connection.send((ERROR, traceback.format_exc()))
+        except (BrokenPipeError, OSError):
+            pass
+    finally:
+        for env in envs:
+            env.close()
+        if buffer is not None:
+            buffer.close()
+        connection.close()
+
+
+class VectorEnv:
+    """N entornos que avanzan juntos con un arreglo de acciones"""
+
+    def __init__(self, num_envs, num_workers=None, seed=0, **env_kwargs):
+        """Lanza los procesos y reparte los entornos
+
+        Args:
+            num_envs: entornos en total
+            num_workers: procesos (por defecto uno por núcleo, sin pasar de num_envs)
+            seed: el entorno i usa seed + i
+            env_kwargs: argumentos de SpaceInvadersEnv
+        """
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        num_workers = max(1, min(num_workers, num_envs))
+        self.num_envs = num_envs
+        self.num_workers = num_workers
+        self.buffer = SharedEnvBuffer(num_envs, *observation_spec(**_obs_kwargs(env_kwargs)))
+
+        context = mp.get_context("spawn")
+        self.connections = []
+        self.processes = []
+        bounds = np.linspace(0, num_envs, num_workers + 1).astype(int)
+        try:
+            for start, stop in zip(bounds[:-1], bounds[1:]):
+                parent, child = context.Pipe()
+                process = context.Process(
+                    target=_worker_main,
+                    args=(child, self.buffer.name, num_envs, int(start), int(stop), seed, env_kwargs),
+                    daemon=True)
+                process.start()
+                child.close()
+                self.connections.append(parent)
+                self.processes.append(process)
+        except BaseException:
+            self.close()
+            raise
+
+    def _broadcast(self, command):
+        """Envía la orden a todos los procesos y espera sus acuses
+
+        Raises:
+            WorkerError: si algún proceso falló (con su traceback)
+        """
+        errors = []
+        sent = []
+        for worker, connection in enumerate(self.connections):
+            try:
+                connection.send(command)
+                sent.append((worker, connection))
+            except (BrokenPipeError, OSError) as e:
+                errors.append(f"proceso {worker}: {e!r}")
+        for worker, connection in sent:
+            try:
+                reply = connection.recv()
+            except EOFError:
+                errors.append(f"proceso {worker}: terminó sin responder")
+                continue
+            if isinstance(reply, tuple) and reply[0] == ERROR:
+                errors.append(f"proceso {worker}:\n{reply[1]}")
+        if errors:
+            raise WorkerError("\n".join(errors))
+
+    def reset(self):
+        """Reinicia todos los entornos
+
+        Returns:
+            numpy.ndarray: observaciones (num_envs, *forma de observation_spec), vista compartida
+        """
+        self._broadcast(CMD_RESET)
+        return self.buffer.observations
+
+    def step(self, actions):
+        """Avanza todos los entornos un paso
+
+        Los arreglos devueltos son vistas de la memoria compartida que el
+        siguiente step() sobrescribe; copiarlos si se van a guardar.
+
+        Returns:
+            tuple: (observaciones, recompensas, terminados, truncados)
+        """
+        self.buffer.actions[:] = actions
+        self._broadcast(CMD_STEP)
+        buffer = self.buffer
+        return buffer.observations, buffer.rewards, buffer.terminated, buffer.truncated
+
+    def close(self):
+        """Detiene los procesos y libera la memoria compartida"""
+        if self.buffer is None:
+            return
+        try:
+            for connection in self.connections:
+                try:
+                    connection.send(CMD_CLOSE)
+                except (BrokenPipeError, OSError):
+                    pass
+            for process in self.processes:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+            for connection in self.connections:
+                connection.close()
+        finally:
+            # El bloque se libera aunque cerrar los procesos falle
+            shm = self.buffer.shm
+            self.buffer.close()
+            shm.unlink()
+            self.buffer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
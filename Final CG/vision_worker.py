@@ -0,0 +1,285 @@
+"""
+Visión en un proceso separado
+
+El proceso hijo ejecuta HandDetector (OpenCV + MediaPipe) en su propio núcleo
+y publica frames reducidos y resultados en un buffer circular de memoria
+compartida con números de secuencia (sin pickling). El juego solo lee el
+resultado más reciente y relanza el proceso si se cae o deja de responder.
+"""
+import multiprocessing as mp
+import os
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+from config import *
+from gestures import NUM_LANDMARKS
+
+# Cabecera de control (int64)
+H_LATEST_SEQ = 0  # secuencia del último resultado publicado
+H_LATEST_SLOT = 1  # ranura donde está
+H_PARKED = 2  # 1 = sin inferencia
+H_STOP = 3  # 1 = el proceso debe terminar
+H_HEARTBEAT_MS = 4  # último latido del proceso (reloj monotónico en ms)
+H_READY = 5  # 1 = cámara y modelo cargados
+H_MAX_HANDS = 6  # manos que debe seguir el detector (1 o 2)
+H_INFERENCE_EVERY = 7  # inferencia en 1 de cada N frames de la cámara
+HEADER_SIZE = 8
+
+# Resultado por mano y ranura (float32): landmarks, posición y gestos
+R_HAND_X = NUM_LANDMARKS * 3
+R_FIST = R_HAND_X + 1
+R_PINCH = R_HAND_X + 2
+R_OPEN = R_HAND_X + 3
+R_DETECTED = R_HAND_X + 4
+RESULT_SIZE = R_HAND_X + 5
+
+
+def _monotonic_ms():
+    return int(time.monotonic() * 1000)
+
+
+class SharedVisionBuffer:
+    """Vistas NumPy sobre un bloque de memoria compartida
+
+    Cada ranura tiene su número de secuencia: el escritor lo pone en -1
+    mientras escribe y en el valor nuevo al terminar, de modo que el lector
+    detecta una lectura a medias comparando la secuencia antes y después.
+    """
+
+    def __init__(self, name=None, slots=VISION_RING_SLOTS):
+        self.slots = slots
+        frame_shape = (slots, VISION_FRAME_HEIGHT, VISION_FRAME_WIDTH, 3)
+        sizes = [
+            HEADER_SIZE * 8,
+            slots * 8,
+            slots * VISION_MAX_HANDS * RESULT_SIZE * 4,
+            int(np.prod(frame_shape)),
+        ]
+        create = name is None
+        self.shm = shared_memory.SharedMemory(name=name, create=create, size=sum(sizes))
+
+        offset = 0
+        self.header = np.ndarray((HEADER_SIZE,), dtype=np.int64, buffer=self.shm.buf, offset=offset)
+        offset += sizes[0]
+        self.slot_seq = np.ndarray((slots,), dtype=np.int64, buffer=self.shm.buf, offset=offset)
+        offset += sizes[1]
+        self.results = np.ndarray((slots, VISION_MAX_HANDS, RESULT_SIZE), dtype=np.float32,
+                                  buffer=self.shm.buf, offset=offset)
+        offset += sizes[2]
+        self.frames = np.ndarray(frame_shape, dtype=np.uint8, buffer=self.shm.buf, offset=offset)
+
+        if create:
+            self.header[:] = 0
+            self.slot_seq[:] = 0
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def close(self):
+        """Suelta las vistas y cierra el bloque"""
+        self.header = self.slot_seq = self.results = self.frames = None
+        self.shm.close()
+
+
+def _worker_main(shm_name, slots, cpu):
+    """Punto de entrada del proceso de visión"""
+    if cpu is not None and hasattr(os, "sched_setaffinity"):
+        try:
+            os.sched_setaffinity(0, {cpu})
+        except OSError:
+            pass
+
+    buffer = SharedVisionBuffer(shm_name, slots)
+    header = buffer.header
+    from hand_detector import HandDetector
+    detector = HandDetector(max_hands=max(1, int(header[H_MAX_HANDS])))
+    header[H_HEARTBEAT_MS] = _monotonic_ms()
+    header[H_READY] = 1
+
+    seq = int(header[H_LATEST_SEQ])
+    try:
+        while not header[H_STOP]:
+            header[H_HEARTBEAT_MS] = _monotonic_ms()
+            if header[H_PARKED]:
+                time.sleep(0.05)
+                continue
+            detector.set_max_hands(int(header[H_MAX_HANDS]))
+            detector.set_inference_interval(int(header[H_INFERENCE_EVERY]))
+
+            if detector.update() is None:
+                time.sleep(0.005)
+                continue
+
+            seq += 1
+            slot = seq % slots
+            buffer.slot_seq[slot] = -1  # escritura en curso
+            for track, result in zip(detector.tracks, buffer.results[slot]):
+                result[:R_HAND_X] = track.gestures.landmarks.ravel()
+                result[R_HAND_X] = track.hand_x
+                result[R_FIST] = track.gestures.is_fist
+                result[R_PINCH] = track.gestures.is_pinching
+                result[R_OPEN] = track.gestures.is_open_palm
+                result[R_DETECTED] = track.detected
+            buffer.frames[slot] = detector.preview
+            buffer.slot_seq[slot] = seq
+            header[H_LATEST_SLOT] = slot
+            header[H_LATEST_SEQ] = seq
+    finally:
+        detector.release()
+        buffer.close()
+
+
+class VisionProcess:
+    """Misma interfaz que HandDetector, con la inferencia en otro proceso"""
+
+    def __init__(self):
+        """Crea la memoria compartida, lanza el proceso y espera a que cargue"""
+        self.context = mp.get_context("spawn")
+        self.buffer = SharedVisionBuffer()
+        self.process = None
+        self.restarts = 0
+        self.restart_at = None
+
+        # Estado por mano (una fila por jugador)
+        self.hand_x = np.full(VISION_MAX_HANDS, 0.5, dtype=np.float32)
+        self.is_closed = np.zeros(VISION_MAX_HANDS, dtype=bool)
+        self.detected = np.zeros(VISION_MAX_HANDS, dtype=bool)
+        self.pinching = np.zeros(VISION_MAX_HANDS, dtype=bool)
+        self.open_palm = np.zeros(VISION_MAX_HANDS, dtype=bool)
+        self.landmarks = np.zeros((VISION_MAX_HANDS, NUM_LANDMARKS, 3), dtype=np.float32)
+        self.preview = np.zeros((VISION_FRAME_HEIGHT, VISION_FRAME_WIDTH, 3), dtype=np.uint8)
+        self.preview_surface = None
+        self.last_seq = 0
+        self._result = np.zeros((VISION_MAX_HANDS, RESULT_SIZE), dtype=np.float32)
+
+        self.buffer.header[H_MAX_HANDS] = 1
+        self.buffer.header[H_INFERENCE_EVERY] = 1
+        self._start()
+        deadline = time.monotonic() + VISION_STARTUP_TIMEOUT_S
+        while not self.buffer.header[H_READY]:
+            if not self.process.is_alive():
+                code = self.process.exitcode
+                self.release()
+                raise RuntimeError(f"el proceso de visión terminó al iniciar (código {code})")
+            if time.monotonic() > deadline:
+                self.release()
+                raise RuntimeError("el proceso de visión no respondió a tiempo")
+            time.sleep(0.05)
+
+    def _start(self):
+        cpu = VISION_WORKER_CPU
+        if cpu is None:
+            cpu = (os.cpu_count() or 1) - 1
+        header = self.buffer.header
+        header[H_STOP] = 0
+        header[H_READY] = 0
+        header[H_HEARTBEAT_MS] = _monotonic_ms()
+        self.process = self.context.Process(
+            target=_worker_main, args=(self.buffer.name, self.buffer.slots, cpu),
+            name="vision-worker", daemon=True)
+        self.process.start()
+
+    def _check_worker(self):
+        """Relanza el proceso si se cayó o dejó de enviar latidos"""
+        now = _monotonic_ms()
+        if self.restart_at is not None:
+            if now >= self.restart_at:
+                self.restart_at = None
+                self.restarts += 1
+                print(f"Reiniciando el proceso de visión (reinicio #{self.restarts})")
+                self._start()
+            return
+
+        header = self.buffer.header
+        hung = header[H_READY] and now - header[H_HEARTBEAT_MS] > VISION_HEARTBEAT_TIMEOUT_MS
+        if self.process.is_alive() and not hung:
+            return
+        if hung:
+            self.process.terminate()
+        self.process.join(timeout=0.1)
+        self.restart_at = now + VISION_RESTART_DELAY_MS
+
+    def update(self):
+        """Lee el resultado más reciente sin bloquear
+
+        Returns:
+            numpy.ndarray: vista previa RGB, o None si no hay resultado nuevo
+        """
+        self._check_worker()
+        buffer = self.buffer
+        seq = int(buffer.header[H_LATEST_SEQ])
+        if seq == self.last_seq:
+            return None
+        slot = int(buffer.header[H_LATEST_SLOT])
+        if buffer.slot_seq[slot] != seq:
+            return None  # la ranura se está reescribiendo; se usa la anterior
+        np.copyto(self._result, buffer.results[slot])
+        np.copyto(self.preview, buffer.frames[slot])
+        if buffer.slot_seq[slot] != seq:
+            return None  # lectura a medias: se descarta
+
+        self.last_seq = seq
+        result = self._result
+        self.landmarks.reshape(VISION_MAX_HANDS, -1)[:] = result[:, :R_HAND_X]
+        self.hand_x[:] = result[:, R_HAND_X]
+        self.is_closed[:] = result[:, R_FIST] != 0
+        self.detected[:] = result[:, R_DETECTED] != 0
+        self.pinching[:] = result[:, R_PINCH] != 0
+        self.open_palm[:] = result[:, R_OPEN] != 0
+        return self.preview
+
+    def set_parked(self, parked):
+        """Suspende (True) o reanuda (False) la inferencia en el proceso hijo"""
+        self.buffer.header[H_PARKED] = 1 if parked else 0
+
+    def set_max_hands(self, max_hands):
+        """Cambia el número de manos que sigue el proceso hijo"""
+        self.buffer.header[H_MAX_HANDS] = max(1, min(max_hands, VISION_MAX_HANDS))
+
+    def set_inference_interval(self, frames):
+        """Hace que el proceso hijo infiera en un frame de cada `frames` de la cámara"""
+        self.buffer.header[H_INFERENCE_EVERY] = max(int(frames), 1)
+
+    def get_position(self, index=0):
+        """Retorna la posición normalizada de la mano de un jugador (0-1)"""
+        return float(self.hand_x[index])
+
+    def is_hand_closed(self, index=0):
+        """Retorna True si la mano del jugador está cerrada (para disparar)"""
+        return bool(self.is_closed[index])
+
+    def is_detected(self, index=0):
+        """Retorna True si la mano del jugador se vio en el último frame"""
+        return bool(self.detected[index])
+
+    def is_pinching(self, index=0):
+        """Retorna True si el pulgar y el índice están juntos"""
+        return bool(self.pinching[index])
+
+    def is_open_palm(self, index=0):
+        """Retorna True si todos los dedos están extendidos"""
+        return bool(self.open_palm[index])
+
+    def get_preview_surface(self):
+        """Retorna una superficie de pygame que comparte memoria con la vista previa"""
+        if self.preview_surface is None:
+            import pygame
+            self.preview_surface = pygame.image.frombuffer(
+                self.preview, (VISION_FRAME_WIDTH, VISION_FRAME_HEIGHT), "RGB")
+        return self.preview_surface
+
+    def release(self):
+        """Detiene el proceso y libera la memoria compartida"""
+        if self.buffer is None:
+            return
+        self.buffer.header[H_STOP] = 1
+        if self.process is not None:
+            self.process.join(timeout=2)
+            if self.process.is_alive():
+                self.process.terminate()
+        shm = self.buffer.shm
+        self.buffer.close()
+        shm.unlink()
+        self.buffer = None
@@ -0,0 +1,56 @@
+"""
+Secuencias de oleadas: la campaña fija y el modo infinito
+
+Las oleadas se producen con generadores, una configuración a la vez: el juego
+pide la siguiente durante la transición y construye la formación a partir de
+ella, así que nunca hay más de una oleada en memoria.
+"""
+from config import *
+
+# Campos de LEVEL_CONFIG que crecen con cada oleada infinita
+SCALED_FIELDS = ("enemy_speed", "enemy_shoot_chance", "enemy_shoot_interval",
+                 "rows", "cols", "advanced_enemy_chance", "dive_chance", "max_divers")
+INTEGER_FIELDS = ("enemy_shoot_interval", "rows", "cols", "max_divers")
+
+
+def campaign_waves():
+    """Genera los niveles de LEVEL_CONFIG en orden y termina tras el último"""
+    for level in sorted(LEVEL_CONFIG):
+        yield LEVEL_CONFIG[level]
+
+
+def endless_waves():
+    """Genera oleadas sin fin
+
+    Las primeras son los niveles de formación de la campaña; después cada
+    oleada suma ENDLESS_GROWTH veces el incremento medio entre niveles de
+    LEVEL_CONFIG, hasta los topes de ENDLESS_LIMITS. Cada ENDLESS_BOSS_EVERY
+    oleadas aparece el jefe.
+    """
+    ordered = [LEVEL_CONFIG[level] for level in sorted(LEVEL_CONFIG)]
+    levels = [cfg for cfg in ordered if not cfg.get("boss_fight", False)]
+    boss_config = next((cfg for cfg in ordered if cfg.get("boss_fight", False)), None)
+    first, last = levels[0], levels[-1]
+    steps = max(len(levels) - 1, 1)
+    growth = {field: (last[field] - first[field]) / steps * ENDLESS_GROWTH
+              for field in SCALED_FIELDS}
+
+    wave = 0
+    while True:
+        wave += 1
+        if boss_config is not None and wave % ENDLESS_BOSS_EVERY == 0:
+            yield boss_config
+            continue
+        if wave <= len(levels):
+            yield levels[wave - 1]
+            continue
+
+        extra = wave - len(levels)
+        config = {"name": "Oleada Infinita", "difficulty": "Infinito"}
+        for field in SCALED_FIELDS:
+            value = last[field] + growth[field] * extra
+            limit = ENDLESS_LIMITS[field]
+            value = max(value, limit) if growth[field] < 0 else min(value, limit)
+            config[field] = int(round(value)) if field in INTEGER_FIELDS else value
+        yield config
+